@@ -1,5 +1,6 @@
 """One-shot admin and remote utility commands built on Typer."""
 
+from functools import partial
 from typing import Annotated
 from uuid import UUID
 
@@ -214,6 +215,55 @@ def key_for_secret(
     _print_payload(info)
 
 
+@app.command("explore")
+def explore(
+    world_id: str = typer.Argument(..., help="World identifier to explore."),
+    mode: Annotated[
+        str,
+        typer.Option(help="random, bfs or dfs."),
+    ] = "random",
+    runs: Annotated[int, typer.Option(help="Random walks to run.")] = 100,
+    seed: Annotated[int, typer.Option(help="Seed for the first random walk.")] = 0,
+    max_steps: Annotated[int, typer.Option(help="Step limit per random walk.")] = 200,
+    max_depth: Annotated[int, typer.Option(help="Depth limit for bfs/dfs.")] = 50,
+    max_states: Annotated[int, typer.Option(help="State limit for bfs/dfs.")] = 10_000,
+    workers: Annotated[int, typer.Option(help="Worker processes, 0 runs in-process.")] = 0,
+    show_choices: Annotated[bool, typer.Option(help="Include the choice histogram.")] = False,
+) -> None:
+    """Play a local world headlessly and report coverage and step latency."""
+
+    from tangl.service.world_registry import resolve_world
+    from tangl.story.exploration import exhaustive_walk, random_walks
+
+    world_factory = partial(resolve_world, world_id)
+    try:
+        if mode == "random":
+            report = random_walks(
+                world_factory,
+                runs=runs,
+                seed=seed,
+                max_steps=max_steps,
+                workers=workers,
+            )
+        else:
+            report = exhaustive_walk(
+                world_factory,
+                strategy=mode,
+                max_depth=max_depth,
+                max_states=max_states,
+                workers=workers,
+            )
+    except Exception as exc:  # noqa: BLE001
+        raise _fail(exc) from exc
+
+    payload = report.to_dict()
+    if not show_choices:
+        payload.pop("choice_counts")
+    _print_payload(payload)
+    if report.errors or report.dead_ends:
+        raise typer.Exit(code=1)
+
+
 def run() -> None:
     """Execute the Typer app as a console entry point."""
 
@@ -0,0 +1,285 @@
+"""HTTP caching for media files: strong ETags, conditional GETs and byte ranges.
+
+ETags are the hex content hash that :class:`MediaResourceInventoryTag`
+records for the same bytes, so a client-held tag stays valid across server
+restarts and identical files share one tag.  Hashes come from registry
+records when a :class:`MediaResourceRegistry` has been remembered, and are
+otherwise derived on first request the same way the inventory tag does and
+cached against the file's size and mtime.  Each request after the first
+therefore costs one ``stat``.  The caches are shared by worker threads and
+guarded by a lock; hashing happens outside it.
+
+Generated media is written under content-addressed names
+(``<base>-<fingerprint>.<ext>``, the first 12 hex digits of the spec
+fingerprint); those responses are marked ``immutable``
+so browsers skip revalidation entirely.  Everything else is sent with
+``no-cache`` and revalidates cheaply through ``If-None-Match``.
+
+Single ``Range`` requests get ``206`` partial responses so audio players can
+seek without downloading the whole file.
+
+Usage:
+    entry = media_cache.entry(path)
+    return media_cache.response(entry, request.headers)
+"""
+
+from __future__ import annotations
+
+import mimetypes
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from email.utils import formatdate
+from pathlib import Path
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response, StreamingResponse
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from tangl.utils.hashing import compute_data_hash, hashing_func
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# The story media writers' ``-<fingerprint[:12]>.<ext>`` suffix.  Requiring a
+# hex letter keeps dates and counters (``track-202401011234.wav``) revalidating.
+_CONTENT_ADDRESSED_NAME = re.compile(r"-(?=[0-9]*[a-f])[0-9a-f]{12}\.[A-Za-z0-9]+$")
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class MediaEntry:
+    """Validators and metadata for one media file at one ``(size, mtime)``."""
+
+    path: Path
+    etag: str
+    size: int
+    mtime_ns: int
+    media_type: str
+    immutable: bool
+
+    @property
+    def cache_control(self) -> str:
+        return IMMUTABLE_CACHE_CONTROL if self.immutable else REVALIDATE_CACHE_CONTROL
+
+    def headers(self) -> dict[str, str]:
+        return {
+            "etag": self.etag,
+            "cache-control": self.cache_control,
+            "accept-ranges": "bytes",
+            "last-modified": formatdate(self.mtime_ns / 1e9, usegmt=True),
+        }
+
+
+def is_content_addressed(path: Path) -> bool:
+    """Return ``True`` when ``path`` is named like generated story media."""
+    return _CONTENT_ADDRESSED_NAME.search(path.name) is not None
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` range into inclusive ``(start, end)``.
+
+    Returns ``None`` when the header is absent, malformed, or lists several
+    ranges (the full body is sent instead).  Raises ``ValueError`` when the
+    range cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = _RANGE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Unsatisfiable suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("Unsatisfiable range")
+    return start, end
+
+
+def _iter_file_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    with path.open("rb") as handle:
+        handle.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = handle.read(min(_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+class MediaDeliveryCache:
+    """Bounded caches of resolved paths and per-file validators."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._paths: OrderedDict[Any, Path] = OrderedDict()
+        self._entries: OrderedDict[Path, MediaEntry] = OrderedDict()
+        self._known_hashes: dict[Path, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    # Path resolution
+
+    def lookup_path(self, key: Any) -> Path | None:
+        with self._lock:
+            path = self._paths.get(key)
+            if path is not None:
+                self._paths.move_to_end(key)
+            return path
+
+    def store_path(self, key: Any, path: Path) -> Path:
+        with self._lock:
+            self._paths[key] = path
+            self._paths.move_to_end(key)
+            if len(self._paths) > self.maxsize:
+                self._paths.popitem(last=False)
+        return path
+
+    def forget_path(self, key: Any) -> None:
+        with self._lock:
+            self._paths.pop(key, None)
+
+    # Validators
+
+    def remember(self, path: Path, content_hash: bytes) -> None:
+        """Seed the ETag for ``path`` with a hash computed elsewhere."""
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return
+        known = (stat_result.st_size, stat_result.st_mtime_ns, content_hash.hex())
+        with self._lock:
+            self._known_hashes[path.resolve()] = known
+
+    def remember_registry(self, records: Iterable[Any]) -> None:
+        """Seed ETags from media records (e.g. a ``MediaResourceRegistry``'s values)."""
+        for record in records:
+            path = getattr(record, "path", None)
+            content_hash = getattr(record, "content_hash", None)
+            if isinstance(path, Path) and isinstance(content_hash, bytes):
+                self.remember(path, content_hash)
+
+    def entry(self, path: Path, stat_result: os.stat_result | None = None) -> MediaEntry:
+        """Return validators for ``path``, rehashing only when the file changed.
+
+        Raises ``OSError`` when the file cannot be read.
+        """
+        stat_result = stat_result or path.stat()
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and (cached.size, cached.mtime_ns) == (stat_result.st_size, stat_result.st_mtime_ns):
+                self._entries.move_to_end(path)
+                return cached
+            known = self._known_hashes.get(path) or self._known_hashes.get(path.resolve())
+
+        if known is not None and known[:2] == (stat_result.st_size, stat_result.st_mtime_ns):
+            digest = known[2]
+        else:
+            # Same derivation as ``MediaResourceInventoryTag.content_hash`` for a
+            # path-backed tag, so seeded and unseeded files agree.
+            digest = hashing_func(compute_data_hash(path)).hex()
+        entry = MediaEntry(
+            path=path,
+            etag=f'"{digest}"',
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            media_type=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            immutable=is_content_addressed(path),
+        )
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._paths.clear()
+            self._entries.clear()
+            self._known_hashes.clear()
+
+    # Responses
+
+    def response(self, entry: MediaEntry, request_headers: Mapping[str, str], *, head: bool = False) -> Response:
+        """Build a ``200``, ``206``, ``304`` or ``416`` response for ``entry``."""
+        headers = entry.headers()
+        if etag_matches(request_headers.get("if-none-match"), entry.etag):
+            return Response(status_code=304, headers=headers)
+
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if if_range is not None and if_range.strip() != entry.etag:
+            range_header = None
+        try:
+            byte_range = parse_range(range_header, entry.size)
+        except ValueError:
+            headers["content-range"] = f"bytes */{entry.size}"
+            return Response(status_code=416, headers=headers)
+
+        if byte_range is None:
+            return FileResponse(entry.path, headers=headers, media_type=entry.media_type)
+
+        start, end = byte_range
+        headers["content-range"] = f"bytes {start}-{end}/{entry.size}"
+        headers["content-length"] = str(end - start + 1)
+        body: Iterable[bytes] = () if head else _iter_file_range(entry.path, start, end)
+        return StreamingResponse(body, status_code=206, headers=headers, media_type=entry.media_type)
+
+
+media_cache = MediaDeliveryCache()
+
+
+class MediaStaticFiles(StaticFiles):
+    """``StaticFiles`` that serves through :data:`media_cache`."""
+
+    def __init__(self, *args: Any, cache: MediaDeliveryCache | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache = cache or media_cache
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        key = (id(self), path)
+        cached = self.cache.lookup_path(key)
+        if cached is not None:
+            try:
+                return str(cached), cached.stat()
+            except OSError:
+                self.cache.forget_path(key)
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None:
+            self.cache.store_path(key, Path(full_path))
+        return full_path, stat_result
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        if status_code != 200:
+            return super().file_response(full_path, stat_result, scope, status_code)
+        entry = self.cache.entry(Path(full_path), stat_result)
+        return self.cache.response(entry, Headers(scope=scope), head=scope["method"] == "HEAD")
@@ -3,9 +3,8 @@ from __future__ import annotations
 import logging
 
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-
 from tangl.config import get_sys_media_dir
+from tangl.rest.media_delivery import MediaStaticFiles
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +30,7 @@ def mount_system_media(app: FastAPI, mount_path: str = "/media/sys", *, force: b
 
     app.mount(
         mount_path,
-        StaticFiles(directory=str(sys_dir)),
+        MediaStaticFiles(directory=str(sys_dir)),
         name="media-sys",
     )
     logger.info("Mounted system media at %s from %s", mount_path, sys_dir)
@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 
-from fastapi import FastAPI, HTTPException
-from fastapi.staticfiles import StaticFiles
-from starlette.responses import FileResponse
+from fastapi import FastAPI, HTTPException, Request
+from starlette.responses import Response
 
 from tangl.config import get_story_media_dir, settings
 from tangl.info import __author__, __author_email__, __desc__, __title__, __url__, __version__
+from tangl.rest.media_delivery import MediaStaticFiles, media_cache
 from tangl.rest.media_mounts import mount_system_media
 from tangl.service.world_registry import WorldRegistry
 
@@ -37,9 +39,20 @@ app = FastAPI(
 )
 
 
-def mount_world_media(app: FastAPI, world_id: str, media_dir: Path) -> None:
-    """Mount static files for a world's media directory."""
+def mount_world_media(
+    app: FastAPI,
+    world_id: str,
+    media_dir: Path,
+    *,
+    media_records: Iterable[Any] = (),
+) -> None:
+    """Mount static files for a world's media directory.
 
+    ``media_records`` (e.g. the world's indexed media registry values) seed
+    ETags with content hashes that are already known.
+    """
+
+    media_cache.remember_registry(media_records)
     if not media_dir.exists():
         logger.warning("Media directory %s does not exist", media_dir)
         return
@@ -52,16 +65,33 @@ def mount_world_media(app: FastAPI, world_id: str, media_dir: Path) -> None:
 
     app.mount(
         mount_path,
-        StaticFiles(directory=str(media_dir)),
+        MediaStaticFiles(directory=str(media_dir)),
         name=f"media-world-{world_id}",
     )
     logger.info("Mounted media for world '%s' at /media/world/%s", world_id, world_id)
 
+def _world_media_records(world_registry: WorldRegistry, world_id: str) -> Iterable[Any]:
+    """Return the media records of an already-compiled world.
+
+    Uncompiled bundles contribute nothing; their files are hashed lazily on
+    first request rather than at startup.
+    """
+
+    world = world_registry.worlds.get(world_id)
+    resources = getattr(world, "resources", None)
+    return resources.registry.values() if resources is not None else ()
+
+
 def initialize_media_mounts(app: FastAPI, world_registry: WorldRegistry) -> None:
     """Mount media directories for all discovered worlds at startup."""
 
     for world_id, bundle in world_registry.bundles.items():
-        mount_world_media(app, world_id, bundle.media_dir)
+        mount_world_media(
+            app,
+            world_id,
+            bundle.media_dir,
+            media_records=_world_media_records(world_registry, world_id),
+        )
 
 
 def _is_within_root(root: Path, candidate: Path) -> bool:
@@ -70,8 +100,15 @@ def _is_within_root(root: Path, candidate: Path) -> bool:
 
 def _resolve_safe_story_media_path(story_id: str, filename: str) -> Path:
     global_root = get_story_media_dir()
+    if global_root is None:
+        raise HTTPException(status_code=404, detail="Story media not configured")
+    key = ("story", global_root, story_id, filename)
+    cached = media_cache.lookup_path(key)
+    if cached is not None:
+        return cached
+
     story_root = get_story_media_dir(story_id)
-    if global_root is None or story_root is None:
+    if story_root is None:
         raise HTTPException(status_code=404, detail="Story media not configured")
 
     global_root = global_root.resolve()
@@ -82,15 +119,24 @@ def _resolve_safe_story_media_path(story_id: str, filename: str) -> Path:
     candidate = (root / filename).resolve()
     if not _is_within_root(root, candidate):
         raise HTTPException(status_code=404, detail="Media not found")
-    if not candidate.exists() or not candidate.is_file():
+    if not candidate.is_file():
         raise HTTPException(status_code=404, detail="Media not found")
-    return candidate
+    return media_cache.store_path(key, candidate)
 
 
 @app.get("/story/{story_id}/{filename:path}")
-def get_story_media_file(story_id: str, filename: str) -> FileResponse:
-    """Serve story-scoped media files via a path-safe lookup."""
-    return FileResponse(_resolve_safe_story_media_path(story_id, filename))
+def get_story_media_file(story_id: str, filename: str, request: Request) -> Response:
+    """Serve story-scoped media files via a path-safe lookup.
+
+    Resolved paths and ETags are cached; a repeat request costs one ``stat``.
+    """
+    path = _resolve_safe_story_media_path(story_id, filename)
+    try:
+        entry = media_cache.entry(path)
+    except OSError:
+        media_cache.forget_path(("story", get_story_media_dir(), story_id, filename))
+        raise HTTPException(status_code=404, detail="Media not found") from None
+    return media_cache.response(entry, request.headers)
 
 
 mount_system_media(app, mount_path="/sys")
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Callable, Iterable
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import Response, StreamingResponse
 from markdown_it import MarkdownIt
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from tangl.config import get_story_media_dir, get_sys_media_dir
-from tangl.journal.fragments import MediaFragment, fragment_to_dto
+from tangl.journal.fragment_codec import encode_json, fragment_encoder
+from tangl.journal.fragments import MediaFragment
 from tangl.rest.dependencies_gateway import (
     get_service_manager,
     get_user_locks,
@@ -34,8 +49,10 @@ from tangl.service.world_registry import resolve_world
 from tangl.type_hints import UniqueLabel
 
 
+logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Story"])
 _MARKDOWN = MarkdownIt()
+_EDGE_REQUEST = TypeAdapter(EdgeResolutionRequest)
 
 
 def _serialize(value: Any) -> Any:
@@ -202,30 +219,28 @@ def _serialize_fragment(
     if isinstance(fragment, MediaFragment):
         return None
     if hasattr(fragment, "model_dump"):
-        return _serialize(fragment_to_dto(fragment))
+        return fragment_encoder.to_dto(fragment)
     if hasattr(fragment, "unstructure"):
         return _serialize(fragment.unstructure())
     return {"fragment_type": "unknown", "content": str(fragment)}
 
 
-def _serialize_runtime_envelope(
-    envelope: RuntimeEnvelope,
+def _fragment_serializer(
+    metadata: dict[str, Any],
     *,
-    render_profile: str = "raw",
-) -> dict[str, Any]:
-    profile_tokens = _normalize_profile_tokens(render_profile)
+    profile_tokens: set[str],
+) -> Callable[[Any], dict[str, Any] | None]:
+    """Bind media roots for one story's fragments; see :func:`_serialize_fragment`."""
+
     media_profile = _media_render_profile(profile_tokens)
-    envelope_payload = envelope.to_dto()
-    metadata = dict(envelope_payload.get("metadata") or {})
     world_id = str(metadata["world_id"]) if metadata.get("world_id") is not None else None
     story_id = str(metadata["ledger_id"]) if metadata.get("ledger_id") is not None else None
     world_media_root = _resolve_world_media_root(world_id)
     story_media_root = get_story_media_dir(story_id) if story_id is not None else None
     system_media_root = get_sys_media_dir()
 
-    fragments: list[dict[str, Any]] = []
-    for fragment in envelope.fragments:
-        payload = _serialize_fragment(
+    def serialize(fragment: Any) -> dict[str, Any] | None:
+        return _serialize_fragment(
             fragment,
             media_profile=media_profile,
             world_id=world_id,
@@ -234,17 +249,41 @@ def _serialize_runtime_envelope(
             story_media_root=story_media_root,
             system_media_root=system_media_root,
         )
-        if payload is not None:
-            fragments.append(payload)
 
-    payload = {
-        **envelope_payload,
-        "fragments": _normalize_choice_labels_in_fragments(fragments),
-    }
-    serialized = _serialize(payload)
+    return serialize
+
+
+def _serialize_runtime_envelope(
+    envelope: RuntimeEnvelope,
+    *,
+    render_profile: str = "raw",
+) -> dict[str, Any]:
+    profile_tokens = _normalize_profile_tokens(render_profile)
+    serialize_fragment = _fragment_serializer(
+        dict(envelope.metadata or {}),
+        profile_tokens=profile_tokens,
+    )
+    payload = envelope.to_dto(serialize_fragment)
+    payload["fragments"] = _normalize_choice_labels_in_fragments(payload["fragments"])
     if "html" in profile_tokens:
-        serialized = _transform_text_fields(serialized)
-    return serialized
+        payload = _transform_text_fields(payload)
+    return payload
+
+
+def _runtime_envelope_response(
+    envelope: RuntimeEnvelope,
+    *,
+    render_profile: str = "raw",
+) -> Response:
+    """Write the envelope DTO straight to JSON bytes.
+
+    The payload is already JSON-safe, so this skips FastAPI's response-model
+    validation and ``jsonable_encoder`` pass; ``response_model`` stays on the
+    routes for the OpenAPI schema.
+    """
+
+    payload = _serialize_runtime_envelope(envelope, render_profile=render_profile)
+    return Response(content=encode_json(payload), media_type="application/json")
 
 
 def _runtime_info_payload(
@@ -332,7 +371,7 @@ async def create_story(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=_bad_request_detail(exc)) from exc
 
-    return _serialize_runtime_envelope(envelope, render_profile=render_profile)
+    return _runtime_envelope_response(envelope, render_profile=render_profile)
 
 
 @router.get(
@@ -351,7 +390,7 @@ async def get_story_update(
         None,
         description="Inclusive starting step; defaults to 0 (full history).",
     ),
-) -> dict[str, Any]:
+) -> Response:
     """Return the runtime envelope with ordered fragments."""
 
     user_auth = resolve_user_auth(api_key, service_manager=service_manager)
@@ -368,7 +407,7 @@ async def get_story_update(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=_bad_request_detail(exc)) from exc
 
-    return _serialize_runtime_envelope(result, render_profile=render_profile)
+    return _runtime_envelope_response(result, render_profile=render_profile)
 
 
 @router.post(
@@ -402,7 +441,163 @@ async def do_story_action(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=_bad_request_detail(exc)) from exc
 
-    return _serialize_runtime_envelope(result, render_profile=render_profile)
+    return _runtime_envelope_response(result, render_profile=render_profile)
+
+
+async def _stream_story_action(
+    request: EdgeResolutionRequest,
+    *,
+    service_manager: ServiceManager,
+    user_locks: Any,
+    user_auth: UserAuthInfo,
+    render_profile: str,
+) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """Resolve ``request`` in a worker thread, yielding ``(event, data)`` as output appears.
+
+    Each ``fragment`` event is one serialized fragment, sent as soon as the
+    pipeline emits it.  Choice and media fragments are sent as they resolve,
+    not held back for the envelope.  The last event is ``envelope``, which is
+    the runtime envelope without its fragments, or ``error``.
+    """
+
+    profile_tokens = _normalize_profile_tokens(render_profile)
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue[tuple[str, dict[str, Any]] | None] = asyncio.Queue()
+    serializers: dict[tuple[Any, Any], Callable[[Any], dict[str, Any] | None]] = {}
+
+    def on_fragment(fragment: Any, metadata: dict[str, Any]) -> None:
+        key = (metadata.get("world_id"), metadata.get("ledger_id"))
+        if key not in serializers:
+            serializers[key] = _fragment_serializer(metadata, profile_tokens=profile_tokens)
+        payload = serializers[key](fragment)
+        if payload is None:
+            return
+        payload = _serialize(_normalize_choice_labels_in_fragments([payload])[0])
+        if "html" in profile_tokens:
+            payload = _transform_text_fields(payload)
+        loop.call_soon_threadsafe(events.put_nowait, ("fragment", payload))
+
+    def resolve() -> RuntimeEnvelope:
+        return _call_service_method(
+            service_manager,
+            "resolve_choice",
+            auth_context=user_auth,
+            user_id=user_auth.user_id,
+            user_auth=user_auth,
+            request=request,
+            fragment_observer=on_fragment,
+        )
+
+    async def run() -> None:
+        try:
+            async with user_locks[user_auth.user_id]:
+                envelope = await run_in_threadpool(resolve)
+            summary = _serialize_runtime_envelope(
+                envelope.model_copy(update={"fragments": []}),
+                render_profile=render_profile,
+            )
+            summary.pop("fragments", None)
+            events.put_nowait(("envelope", summary))
+        except HTTPException as exc:
+            events.put_nowait(("error", {"status_code": exc.status_code, "detail": exc.detail}))
+        except ValueError as exc:
+            events.put_nowait(("error", {"status_code": 400, "detail": _bad_request_detail(exc)}))
+        except Exception:
+            logger.exception("Streaming choice resolution failed")
+            events.put_nowait(("error", {"status_code": 500, "detail": "Internal Server Error"}))
+        finally:
+            events.put_nowait(None)
+
+    task = asyncio.create_task(run())
+    try:
+        while (event := await events.get()) is not None:
+            yield event
+    finally:
+        # a disconnected client must not leave the choice half-applied
+        await task
+
+
+def _sse_message(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/do/stream", response_class=StreamingResponse)
+async def stream_story_action(
+    request: EdgeResolutionRequest = Body(...),
+    service_manager: ServiceManager = Depends(get_service_manager),
+    user_locks=Depends(get_user_locks),
+    api_key: UniqueLabel = Header(
+        ..., alias="X-API-Key", examples=["example-api-key"]
+    ),
+    render_profile: str = Query(default="raw", description="Response rendering profile."),
+):
+    """Resolve a player choice, streaming fragments as Server-Sent Events.
+
+    Sends one ``fragment`` event per fragment as the story emits it, then a
+    final ``envelope`` event with the envelope metadata (or ``error``).
+    """
+
+    user_auth = resolve_user_auth(api_key, service_manager=service_manager)
+    events = _stream_story_action(
+        request,
+        service_manager=service_manager,
+        user_locks=user_locks,
+        user_auth=user_auth,
+        render_profile=render_profile,
+    )
+    return StreamingResponse(
+        (_sse_message(event, data) async for event, data in events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.websocket("/ws")
+async def story_socket(
+    websocket: WebSocket,
+    service_manager: ServiceManager = Depends(get_service_manager),
+    user_locks=Depends(get_user_locks),
+    api_key: str | None = Header(None, alias="X-API-Key"),
+    api_key_query: str | None = Query(
+        None,
+        alias="api_key",
+        description="API key for clients that cannot set handshake headers.",
+    ),
+    render_profile: str = Query(default="raw", description="Response rendering profile."),
+):
+    """Resolve player choices over a WebSocket.
+
+    Each client message is an edge-resolution request as for ``/do``.  The
+    server answers with ``{"event": "fragment", "data": ...}`` messages as
+    fragments are emitted, then one ``envelope`` (or ``error``) message.
+    """
+
+    try:
+        user_auth = resolve_user_auth(api_key or api_key_query or "", service_manager=service_manager)
+    except HTTPException:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_json()
+            try:
+                request = _EDGE_REQUEST.validate_python(message)
+            except ValidationError as exc:
+                detail = {"status_code": 422, "detail": exc.errors(include_url=False)}
+                await websocket.send_text(json.dumps({"event": "error", "data": detail}, default=str))
+                continue
+            async for event, data in _stream_story_action(
+                request,
+                service_manager=service_manager,
+                user_locks=user_locks,
+                user_auth=user_auth,
+                render_profile=render_profile,
+            ):
+                await websocket.send_text(json.dumps({"event": event, "data": data}, default=str))
+    except WebSocketDisconnect:
+        return
 
 
 @router.get("/info")
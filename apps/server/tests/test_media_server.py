@@ -5,6 +5,8 @@ from fastapi.testclient import TestClient
 from fastapi import HTTPException
 
 from tangl.rest import media_server
+from tangl.media.media_resource import MediaResourceInventoryTag
+from tangl.rest.media_delivery import MediaDeliveryCache, is_content_addressed
 from tangl.service.world_registry import WorldRegistry
 
 
@@ -98,3 +100,98 @@ def test_story_media_server_rejects_story_root_outside_global_root(
 
     with pytest.raises(HTTPException, match="Story media not configured"):
         media_server._resolve_safe_story_media_path("story-1", "avatar.svg")
+
+
+def _story_media(monkeypatch, tmp_path: Path, filename: str, payload: bytes) -> Path:
+    story_root = tmp_path / "story_media"
+    story_dir = story_root / "story-1"
+    story_dir.mkdir(parents=True)
+    (story_dir / filename).write_bytes(payload)
+    monkeypatch.setattr(
+        media_server,
+        "get_story_media_dir",
+        lambda story_id=None: story_root if story_id is None else story_root / str(story_id),
+    )
+    return story_dir / filename
+
+
+def test_story_media_server_etag_and_conditional_get(client: TestClient, monkeypatch, tmp_path: Path) -> None:
+
+    path = _story_media(monkeypatch, tmp_path, "narration-0123456789ab.mp3", b"ID3" + bytes(range(256)))
+    url = "http://test/media/story/story-1/narration-0123456789ab.mp3"
+
+    response = client.get(url)
+    etag = response.headers["etag"]
+    assert etag == f'"{MediaResourceInventoryTag(path=path).content_hash.hex()}"'
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["accept-ranges"] == "bytes"
+
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
+def test_story_media_server_serves_byte_ranges(client: TestClient, monkeypatch, tmp_path: Path) -> None:
+    payload = bytes(range(200))
+    _story_media(monkeypatch, tmp_path, "line.wav", payload)
+    url = "http://test/media/story/story-1/line.wav"
+
+    response = client.get(url, headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.content == payload[10:20]
+    assert response.headers["content-range"] == "bytes 10-19/200"
+    assert response.headers["cache-control"] == "no-cache"
+
+    assert client.get(url, headers={"Range": "bytes=-5"}).content == payload[-5:]
+    assert client.get(url, headers={"Range": "bytes=500-"}).status_code == 416
+
+    stale = client.get(url, headers={"Range": "bytes=0-3", "If-Range": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == payload
+
+
+def test_world_media_mount_sends_validators(media_client: TestClient) -> None:
+    url = "http://test/media/world/media_mvp/test_image.svg"
+    etag = media_client.get(url).headers["etag"]
+
+    assert media_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert media_client.get(url, headers={"Range": "bytes=0-3"}).status_code == 206
+
+
+def test_seeded_and_unseeded_media_etags_agree() -> None:
+    path = _media_mvp_bundle().media_dir / "test_image.svg"
+    seeded = MediaDeliveryCache()
+    seeded.remember_registry([MediaResourceInventoryTag(path=path)])
+
+    assert seeded.entry(path).etag == MediaDeliveryCache().entry(path).etag
+
+
+def test_initialize_media_mounts_seeds_etags_from_compiled_worlds_only(monkeypatch) -> None:
+    registry = WorldRegistry([_media_mvp_bundle().bundle_root.parent])
+    registry.bundles = {"media_mvp": registry.bundles["media_mvp"]}
+    seeded = []
+    monkeypatch.setattr(media_server.media_cache, "remember_registry", seeded.extend)
+
+    media_server.initialize_media_mounts(media_server.app, registry)
+    assert seeded == []
+
+    registry.get_world("media_mvp")
+    media_server.initialize_media_mounts(media_server.app, registry)
+    assert [record.path.name for record in seeded] == ["test_image.svg"]
+
+
+@pytest.mark.parametrize(
+    ("name", "immutable"),
+    [
+        ("narration-0123456789ab.mp3", True),
+        ("portrait-3fa2c9e01b7d.png", True),
+        ("track-202401011234.wav", False),
+        ("track-20240101123456.wav", False),
+        ("cover-0123456789abcdef.png", False),
+        ("0123456789ab.png", False),
+        ("test_image.svg", False),
+    ],
+)
+def test_only_generated_media_names_are_immutable(name: str, immutable: bool) -> None:
+    assert is_content_addressed(Path(name)) is immutable
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import sys
 from collections.abc import Iterator
 from pathlib import Path
 
@@ -649,3 +651,96 @@ def projected_story_client(
         World.clear_instances()
         reset_service_manager_for_testing()
         reset_service_state_for_testing()
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict[str, object]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_story_do_stream_sends_fragments_before_envelope(
+    story_client: tuple[TestClient, dict[str, str], str],
+) -> None:
+    client, headers, world_label = story_client
+
+    create = client.post(
+        "story/story/create",
+        params={"world_id": world_label, "init_mode": "EAGER"},
+        headers=headers,
+    )
+    choice = _first_choice_fragment(create.json())
+
+    with client.stream(
+        "POST",
+        "story/do/stream",
+        json={"edge_id": choice["edge_id"]},
+        headers=headers,
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.read().decode())
+
+    kinds = [event for event, _ in events]
+    assert kinds[-1] == "envelope"
+    assert set(kinds[:-1]) == {"fragment"}
+    assert any(data.get("content") == "End" for _, data in events[:-1])
+    envelope = events[-1][1]
+    assert "fragments" not in envelope
+    assert envelope["step"] > create.json()["step"]
+    assert envelope["metadata"]["ledger_id"]
+
+
+def test_story_do_stream_ends_with_error_on_unexpected_failure(
+    story_client: tuple[TestClient, dict[str, str], str],
+    monkeypatch,
+) -> None:
+    client, headers, world_label = story_client
+
+    create = client.post(
+        "story/story/create",
+        params={"world_id": world_label, "init_mode": "EAGER"},
+        headers=headers,
+    )
+    choice = _first_choice_fragment(create.json())
+
+    def broken_service_method(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(sys.modules["tangl.rest.routers.story_router"], "_call_service_method", broken_service_method)
+    with client.stream(
+        "POST",
+        "story/do/stream",
+        json={"edge_id": choice["edge_id"]},
+        headers=headers,
+    ) as response:
+        events = _parse_sse(response.read().decode())
+
+    assert events == [("error", {"status_code": 500, "detail": "Internal Server Error"})]
+
+
+def test_story_websocket_streams_choice_resolution(
+    story_client: tuple[TestClient, dict[str, str], str],
+) -> None:
+    client, headers, world_label = story_client
+
+    create = client.post(
+        "story/story/create",
+        params={"world_id": world_label, "init_mode": "EAGER"},
+        headers=headers,
+    )
+    choice = _first_choice_fragment(create.json())
+
+    with client.websocket_connect("/api/v2/story/ws", headers=headers) as socket:
+        socket.send_json({"edge_id": "not-a-uuid"})
+        assert socket.receive_json()["event"] == "error"
+
+        socket.send_json({"edge_id": choice["edge_id"]})
+        messages = [socket.receive_json()]
+        while messages[-1]["event"] == "fragment":
+            messages.append(socket.receive_json())
+
+    assert messages[-1]["event"] == "envelope"
+    assert any(message["data"].get("content") == "End" for message in messages[:-1])
@@ -459,6 +459,7 @@ export interface ChoiceUIHints {
   direction?: string | null
   time_delta?: unknown
   cost_previews?: CostPreview[]
+  success_chance?: number | null
   [key: string]: unknown
 }
 
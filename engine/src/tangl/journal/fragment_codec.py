@@ -0,0 +1,204 @@
+"""Specialized DTO encoders for journal fragments.
+
+:func:`~tangl.journal.fragments.fragment_to_dto` is the reference projection:
+it re-reads field metadata and runs a full pydantic dump for every fragment.
+Transports that serialize whole envelopes per request use
+:class:`FragmentEncoder` instead.  It compiles one plan per fragment (or
+nested model) class -- which attributes to read, under which keys, which DTO
+renames apply -- and encodes instances with plain attribute reads and a
+type-dispatched value encoder that handles UUIDs, enums, paths, sets and
+nested models natively.
+
+Output matches ``fragment_to_dto``.  Classes whose dump pydantic customizes
+(field or model serializers, computed fields) are not planned and fall back
+to the reference path.
+
+Usage:
+    payload = fragment_encoder.to_dto(fragment)
+    body = encode_json({"fragments": [payload]})
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from tangl.core import BaseFragment
+from tangl.journal.fragments import fragment_to_dto
+from tangl.type_hints import UnstructuredData
+
+
+@dataclass(frozen=True)
+class ModelPlan:
+    """Compiled dump layout for one model class."""
+
+    fields: tuple[tuple[str, str], ...]
+    """``(attribute, output key)`` pairs in declaration order."""
+    renames: tuple[tuple[str, str], ...] = ()
+    """DTO-only ``(key, dto alias)`` renames applied after the dump."""
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _serializer_customized(cls: type[BaseModel]) -> bool:
+    decorators = cls.__pydantic_decorators__
+    return bool(decorators.field_serializers or decorators.model_serializers or cls.model_computed_fields)
+
+
+class FragmentEncoder:
+    """Per-class compiled encoders producing JSON-safe fragment DTOs."""
+
+    def __init__(self) -> None:
+        self._model_plans: dict[type, ModelPlan | None] = {}
+        self._dto_plans: dict[type, ModelPlan | None] = {}
+        self._value_encoders: dict[type, Callable[[Any], Any]] = {
+            str: _identity,
+            int: _identity,
+            float: _identity,
+            bool: _identity,
+            type(None): _identity,
+            UUID: str,
+            list: self._encode_sequence,
+            tuple: self._encode_sequence,
+            set: self._encode_sequence,
+            frozenset: self._encode_sequence,
+            dict: self._encode_mapping,
+        }
+
+    # Plans
+
+    def model_plan(self, cls: type[BaseModel]) -> ModelPlan | None:
+        """Plan for a plain ``model_dump(by_alias=True, exclude_none=True)``."""
+        try:
+            return self._model_plans[cls]
+        except KeyError:
+            pass
+        plan = None
+        if not _serializer_customized(cls):
+            plan = ModelPlan(
+                fields=tuple(
+                    (name, info.serialization_alias or info.alias or name)
+                    for name, info in cls.model_fields.items()
+                    if not info.exclude
+                )
+            )
+        self._model_plans[cls] = plan
+        return plan
+
+    def dto_plan(self, cls: type[BaseFragment]) -> ModelPlan | None:
+        """Plan for :func:`~tangl.journal.fragments.fragment_to_dto` on ``cls``."""
+        try:
+            return self._dto_plans[cls]
+        except KeyError:
+            pass
+        plan = self.model_plan(cls)
+        if plan is not None:
+            excluded = {"step", *cls._match_fields(dto_exclude=True)}
+            plan = ModelPlan(
+                fields=tuple(item for item in plan.fields if item[0] not in excluded),
+                renames=tuple(
+                    (name, cls.model_fields[name].json_schema_extra["dto_alias"])
+                    for name in cls._match_fields(dto=True)
+                ),
+            )
+        self._dto_plans[cls] = plan
+        return plan
+
+    # Encoding
+
+    def to_dto(self, fragment: BaseFragment) -> UnstructuredData:
+        """Return the client DTO for ``fragment``; equal to ``fragment_to_dto``."""
+        plan = self.dto_plan(type(fragment))
+        if plan is None:
+            return fragment_to_dto(fragment)
+
+        payload = self._dump(fragment, plan)
+        payload["fragment_type"] = self.encode_value(fragment.fragment_type)
+        payload.pop("step", None)
+        if payload.get("type") == payload["fragment_type"]:
+            payload.pop("type")
+        if payload.get("tags") == []:
+            payload.pop("tags")
+        for field_name, dto_alias in plan.renames:
+            if field_name in payload:
+                payload[dto_alias] = payload.pop(field_name)
+        return payload
+
+    def encode_model(self, model: BaseModel) -> dict[str, Any]:
+        """JSON-safe ``model_dump(by_alias=True, exclude_none=True)``."""
+        plan = self.model_plan(type(model))
+        if plan is None:
+            return to_jsonable_python(model, by_alias=True, exclude_none=True)
+        return self._dump(model, plan)
+
+    def encode_value(self, value: Any) -> Any:
+        """JSON-safe form of one field value."""
+        encoder = self._value_encoders.get(type(value))
+        if encoder is None:
+            encoder = self._value_encoders[type(value)] = self._resolve_encoder(type(value))
+        return encoder(value)
+
+    def _dump(self, model: BaseModel, plan: ModelPlan) -> dict[str, Any]:
+        encode = self.encode_value
+        values = model.__dict__
+        data: dict[str, Any] = {}
+        for attribute, key in plan.fields:
+            value = values[attribute]
+            if value is not None:
+                data[key] = encode(value)
+        extra = model.__pydantic_extra__
+        if extra:
+            for key, value in extra.items():
+                if value is not None:
+                    data[key] = encode(value)
+        return data
+
+    def _resolve_encoder(self, cls: type) -> Callable[[Any], Any]:
+        if issubclass(cls, Enum):
+            return lambda value: self.encode_value(value.value)
+        if issubclass(cls, BaseModel):
+            return self.encode_model
+        if issubclass(cls, PurePath):
+            return str
+        for base in (str, int, float, list, tuple, set, frozenset, dict):
+            if issubclass(cls, base):
+                return self._value_encoders[base]
+        return to_jsonable_python
+
+    def _encode_sequence(self, value: Any) -> list[Any]:
+        encode = self.encode_value
+        return [encode(item) for item in value]
+
+    def _encode_mapping(self, value: dict[Any, Any]) -> dict[str, Any]:
+        encode = self.encode_value
+        return {
+            key if isinstance(key, str) else str(encode(key)): encode(item)
+            for key, item in value.items()
+        }
+
+
+fragment_encoder = FragmentEncoder()
+
+
+def encode_json(value: Any) -> bytes:
+    """Compact UTF-8 JSON bytes, encoding stray values through :data:`fragment_encoder`."""
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=fragment_encoder.encode_value,
+    ).encode("utf-8")
+
+
+__all__ = ["FragmentEncoder", "ModelPlan", "encode_json", "fragment_encoder"]
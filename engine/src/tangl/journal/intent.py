@@ -170,6 +170,7 @@ class UIHints(IntentModel):
     direction: str | None = None
     time_delta: Any = None
     cost_previews: list[CostPreview] = Field(default_factory=list)
+    success_chance: float | None = None
 
 
 __all__ = [
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 # todo: could generate these from pattern
 
-from .helpers.pattern import conjugate as pattern_conjugate
+from .inflection import inflections
 
 @dataclass
 class Conjugates:
@@ -30,15 +30,15 @@ class Conjugates:
     @classmethod
     def from_pattern(cls, verb_inf):
         infinitive = verb_inf
-        participle = pattern_conjugate(verb_inf, tense="past")
-        progressive = pattern_conjugate(verb_inf, aspect="progressive")
+        participle = inflections.conjugate(verb_inf, tense="past")
+        progressive = inflections.conjugate(verb_inf, aspect="progressive")
 
-        _1s = pattern_conjugate(verb_inf, PoV._1s)
-        _2s = pattern_conjugate(verb_inf, PoV._2s)
-        _3s = pattern_conjugate(verb_inf, PoV._3s)
-        _1p = pattern_conjugate(verb_inf, PoV._1p)
-        _2p = pattern_conjugate(verb_inf, PoV._2p)
-        _3p = pattern_conjugate(verb_inf, PoV._3p)
+        _1s = inflections.conjugate(verb_inf, PoV._1s)
+        _2s = inflections.conjugate(verb_inf, PoV._2s)
+        _3s = inflections.conjugate(verb_inf, PoV._3s)
+        _1p = inflections.conjugate(verb_inf, PoV._1p)
+        _2p = inflections.conjugate(verb_inf, PoV._2p)
+        _3p = inflections.conjugate(verb_inf, PoV._3p)
 
         source = "pattern"
 
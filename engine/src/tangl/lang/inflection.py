@@ -0,0 +1,100 @@
+"""Memoized inflection tables for pronouns and verb conjugation.
+
+:class:`~tangl.lang.pronoun.Pronoun` derives each pronoun by matching enums,
+and :func:`~tangl.lang.helpers.pattern.conjugate` goes through a hashed shelf
+lookup (or the rule fallbacks) on every call.  :class:`InflectionTable`
+remembers each answer under its grammatical key, so prose that inflects the
+same few words over and over pays for each form once per process.
+
+Usage:
+    inflections.pronoun(PT.S, PoV._3s, Gens.XX)   # "she"
+    inflections.conjugate("run", PoV._3s)          # "runs"
+    inflections.warm_from_vocabulary()             # prefill known synset verbs
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable
+from typing import Any
+
+from .gens import Gens
+from .helpers.pattern import conjugate
+from .pov import PoV
+from .pronoun import PT, Pronoun
+
+
+class InflectionTable:
+    """Pronoun and verb forms keyed by their grammatical coordinates.
+
+    Pronouns are keyed by ``(pronoun type, PoV, Gens)`` and verbs by
+    ``(lemma, PoV, tense, aspect)``.  Misses are computed by the rule sources
+    and kept for the life of the table.
+    """
+
+    def __init__(self) -> None:
+        self._pronouns: dict[tuple[Any, Any, Any], str] = {}
+        self._verbs: dict[tuple[str, Any, str, str], str] = {}
+
+    def pronoun(self, pt: PT, pov: PoV, gens: Gens) -> str:
+        key = pt, pov, gens
+        try:
+            return self._pronouns[key]
+        except KeyError:
+            form = self._pronouns[key] = Pronoun.pronoun(pt, pov, gens)
+            return form
+
+    def conjugate(
+        self,
+        lemma: str,
+        pov: PoV = PoV._3s,
+        tense: str = "present",
+        aspect: str = "imperfective",
+    ) -> str:
+        key = lemma, pov, tense, aspect
+        try:
+            return self._verbs[key]
+        except KeyError:
+            form = self._verbs[key] = conjugate(lemma, pov, tense=tense, aspect=aspect)
+            return form
+
+    def warm_pronouns(self) -> None:
+        for pt, pov, gens in itertools.product(PT, PoV, Gens):
+            self.pronoun(pt, pov, gens)
+
+    def warm_verbs(self, lemmas: Iterable[str]) -> int:
+        """Prefill the person, past and progressive forms of ``lemmas``.
+
+        Returns the number of forms added.
+        """
+        known = len(self._verbs)
+        for lemma in lemmas:
+            for pov in PoV:
+                self.conjugate(lemma, pov)
+            self.conjugate(lemma, tense="past")
+            self.conjugate(lemma, aspect="progressive")
+        return len(self._verbs) - known
+
+    def warm_from_vocabulary(self) -> int:
+        """Prefill every pronoun and the verbs of all registered verb synsets."""
+        from .pos import PartOfSpeech
+        from .thesaurus import Synset
+
+        self.warm_pronouns()
+        lemmas = {
+            word
+            for synset in Synset.all_instances()
+            if synset.pos is PartOfSpeech.VB
+            for word in synset.synonyms_
+        }
+        return self.warm_verbs(sorted(lemmas))
+
+    def clear(self) -> None:
+        self._pronouns.clear()
+        self._verbs.clear()
+
+    def __len__(self) -> int:
+        return len(self._pronouns) + len(self._verbs)
+
+
+inflections = InflectionTable()
@@ -217,16 +217,18 @@ class Pronoun:
         """
         Provides jinja filters like {{ ref | her }} and {{ ref | Her }}
         for IsGendered refs.
+
+        Each filter closes over its two possible answers, so rendering is a
+        single lookup on ``is_xx``.
         """
 
         def get_func(pt: PT, pov: PoV, cap: bool = False):
+            forms = {True: cls.pronoun(pt, pov, Gens.XX), False: cls.pronoun(pt, pov, Gens.XY)}
+            if cap:
+                forms = {is_xx: pronoun.capitalize() for is_xx, pronoun in forms.items()}
 
             def get_pronoun_for(obj: IsGendered):
-                gens = Gens.XX if obj.is_xx else Gens.XY
-                pronoun = Pronoun.pronoun(pt, pov, gens)
-                if cap:
-                    pronoun = pronoun.capitalize()
-                return pronoun
+                return forms[bool(obj.is_xx)]
 
             return get_pronoun_for
 
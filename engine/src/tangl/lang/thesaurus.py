@@ -9,12 +9,13 @@ from pprint import pprint, pformat
 
 import jinja2
 import pydantic
+from pydantic import PrivateAttr
 import yaml
 
 from tangl.core import Singleton
 from .pos import PartOfSpeech
 from .pov import PoV
-from .helpers.pattern import conjugate
+from .inflection import inflections
 from .helpers.adjective_to_adverb import adjective_to_adverb
 
 logger = logging.getLogger(__name__)
@@ -52,7 +53,7 @@ class Synset(Singleton):
             raise TypeError(f"{self.label} is not a verb!")
 
         return {
-            conjugate(s, pov, tense=tense, aspect=aspect)
+            inflections.conjugate(s, pov, tense=tense, aspect=aspect)
             for s in self.synonyms_
         }
 
@@ -74,14 +75,32 @@ class Synset(Singleton):
             # return { adjective_to_adverb(s) for s in self.synonyms_ } - {None}
         raise TypeError(f"{self.label} is not an adjective or adverb")
 
+    @functools.cached_property
+    def forms(self) -> dict[str, frozenset[str]]:
+        """
+        Lower-cased surface forms by inflection: ``base`` for every synset,
+        plus ``vbz``/``vbn``/``vbg`` for verbs and ``rb`` for adjectives.
+        """
+        forms = {"base": frozenset(s.lower() for s in self.synonyms_)}
+        if self.pos is PartOfSpeech.VB:
+            forms["vbz"] = frozenset(s.lower() for s in self.synonyms_conjugated())
+            forms["vbn"] = frozenset(s.lower() for s in self.synonyms_vbn())
+            forms["vbg"] = frozenset(s.lower() for s in self.synonyms_vbg())
+        elif self.pos is PartOfSpeech.JJ:
+            forms["rb"] = frozenset(s.lower() for s in self.synonyms_rb())
+        return forms
+
+    @functools.cached_property
+    def surface_forms(self) -> dict[str, str]:
+        """Map each matchable surface form to its form name (base forms win)."""
+        surface = {}
+        for name, words in reversed(self.forms.items()):
+            surface.update(dict.fromkeys(words, name))
+        return surface
+
     @functools.cached_property
     def re_pattern(self) -> re.Pattern:
-        # pattern = r"(?<=\W)({k})(?=\W|$)".format( k=k )
-        # rex = fr"(?<=\W)({['|'.join(self.synonyms)]})(?=\W|$)"
-        parts = [re.escape(s) for s in self.synonyms_]
-        # word-boundary-ish: allow start, non-word, end
-        rex = r"(?<!\w)(" + "|".join(parts) + r")(?!\w)"
-        return re.compile(rex, re.IGNORECASE)
+        return _word_pattern(self.surface_forms)
 
     def substitution(self, match: re.Match):
         return "{{" + f"Synset[{self.label}].replace({match[0]})" + "}}"
@@ -90,13 +109,52 @@ class Synset(Singleton):
         return self.re_pattern.sub(self.substitution, s)
 
     def replace(self, match: str):
-        return random.choice(list(self.synonyms_))
+        # answer in the same inflection as the matched word
+        form = self.surface_forms.get(match.lower(), "base")
+        return random.choice(list(self.forms[form]))
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """
+    Regex alternation over ``words`` factored into a prefix trie.
+
+    ``re`` tries alternatives in order at every position; sharing prefixes
+    means each character is tested once per trie level instead of once per
+    word, and greedy optional tails prefer the longest phrase.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return "(?:" + body + ")?"
+        return body
+
+    return emit(trie)
+
+
+def _word_pattern(words: Iterable[str]) -> re.Pattern:
+    # word-boundary-ish: allow start, non-word, end
+    body = _trie_regex(word for word in words if word) or "(?!)"
+    return re.compile(r"(?<!\w)(" + body + r")(?!\w)", re.IGNORECASE)
 
 
 class Thesaurus(Singleton):
 
     synsets: list[Synset]
 
+    # (synset ids, combined pattern, surface form -> synset)
+    _matcher: tuple[tuple[int, ...], re.Pattern, dict[str, Synset]] | None = PrivateAttr(default=None)
+
     @classmethod
     def from_resources(cls, label: str, resource_module: str, resource_fn: str) -> Thesaurus:
         synsets = cls.load_resources(resource_module, resource_fn)
@@ -141,10 +199,31 @@ class Thesaurus(Singleton):
             if s.pos in [PartOfSpeech.RB, PartOfSpeech.JJ]:
                 yield s
 
+    def matcher(self) -> tuple[re.Pattern, dict[str, Synset]]:
+        """
+        One pattern over every surface form of every synset, rebuilt when
+        the synset list changes.  A word listed by several synsets belongs
+        to the first.
+        """
+        signature = tuple(id(syn) for syn in self.synsets)
+        if self._matcher is None or self._matcher[0] != signature:
+            lookup: dict[str, Synset] = {}
+            for syn in self.synsets:
+                for word in syn.surface_forms:
+                    lookup.setdefault(word, syn)
+            self._matcher = signature, _word_pattern(lookup), lookup
+        return self._matcher[1], self._matcher[2]
+
     def prepare(self, s: str):
-        for syn in self.synsets:
-            s = syn.re_sub(s)
-        print(s)
+        """Wrap every synonym in ``s`` in a replacement template, in one pass."""
+        pattern, lookup = self.matcher()
+
+        def substitute(match: re.Match) -> str:
+            syn = lookup.get(match[0].lower())
+            return syn.substitution(match) if syn is not None else match[0]
+
+        s = pattern.sub(substitute, s)
+        logger.debug(s)
         return s
 
     # todo: Need to inject this as a post-processor in rejinja/render_str and then render again
@@ -12,6 +12,7 @@ from .codec import (
     StoryCodec,
 )
 from .compiler import WorldCompiler
+from .incremental import IncrementalWorldCompiler
 from .manifest import StorySourceSpec, UniqueLabel, WorldManifest
 
 __all__ = [
@@ -27,5 +28,6 @@ __all__ = [
     "NearNativeYamlCodec",
     "CodecRegistry",
     "WorldCompiler",
+    "IncrementalWorldCompiler",
     "WorldManifest",
 ]
@@ -191,16 +191,36 @@ class NearNativeYamlCodec:
         script_paths: list[Path],
         story_key: str | None,
     ) -> DecodeResult:
+        return self.merge(
+            bundle=bundle,
+            scripts=[(script_path, self.load_script(script_path)) for script_path in script_paths],
+            story_key=story_key,
+        )
+
+    @staticmethod
+    def load_script(script_path: Path) -> dict[str, Any]:
+        """Parse one script file into its top-level mapping."""
+        with open(script_path, encoding="utf-8") as file_obj:
+            data = yaml.safe_load(file_obj) or {}
+        if not isinstance(data, dict):
+            msg = f"Script file {script_path} must decode to a mapping"
+            raise ValueError(msg)
+        return data
+
+    def merge(
+        self,
+        *,
+        bundle: WorldBundle,
+        scripts: list[tuple[Path, dict[str, Any]]],
+        story_key: str | None,
+    ) -> DecodeResult:
+        """Merge parsed script files, in order, into one decode result."""
         merged: dict[str, Any] = {}
         refs: list[SourceRef] = []
         warnings: list[str] = []
+        script_paths = [script_path for script_path, _data in scripts]
 
-        for script_path in script_paths:
-            with open(script_path, encoding="utf-8") as file_obj:
-                data = yaml.safe_load(file_obj) or {}
-            if not isinstance(data, dict):
-                msg = f"Script file {script_path} must decode to a mapping"
-                raise ValueError(msg)
+        for script_path, data in scripts:
             collisions = sorted(set(merged.keys()) & set(data.keys()))
             if collisions:
                 warnings.append(
@@ -3,10 +3,12 @@ from __future__ import annotations
 import json
 import re
 import unicodedata
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
+from io import StringIO
 from pathlib import Path
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 from tangl.loaders.codec import (
     DecodeResult,
@@ -62,6 +64,26 @@ _IF_BRANCH_RE = re.compile(
 )
 _SET_MACRO_RE = re.compile(r"<<\s*set\b(?P<body>.*?)>>", re.DOTALL | re.IGNORECASE)
 _VAR_RE = re.compile(r"\$([A-Za-z_]\w*)")
+_UNSUPPORTED_OPERATOR_RE = re.compile(r"\b(contains|matches|to|into)\b", re.IGNORECASE)
+# Twine operator words and their Python spellings, tried in order at each word.
+_OPERATOR_REPLACEMENTS = (
+    (r"is\s+not", "!="),
+    (r"isnot", "!="),
+    (r"eq", "=="),
+    (r"neq", "!="),
+    (r"gte", ">="),
+    (r"lte", "<="),
+    (r"gt", ">"),
+    (r"lt", "<"),
+    (r"is", "=="),
+    (r"true", "True"),
+    (r"false", "False"),
+    (r"null", "None"),
+)
+_OPERATOR_RE = re.compile(
+    "|".join(rf"\b({pattern})\b" for pattern, _ in _OPERATOR_REPLACEMENTS),
+    re.IGNORECASE,
+)
 _CONSUMED_SPECIAL_PASSAGES = frozenset({"StoryTitle", "StoryData"})
 _UNSUPPORTED_SPECIAL_PASSAGES = frozenset(
     {
@@ -158,13 +180,13 @@ class TwineCodec:
             for script_path in script_paths
         ]
 
-        parsed_passages: list[RawPassage] = []
-        ordinal = 0
-        for script_path in script_paths:
-            source = script_path.read_text(encoding="utf-8")
-            passages = _parse_twee(source=source, path=script_path, start_ordinal=ordinal)
-            parsed_passages.extend(passages)
-            ordinal += len(passages)
+        # First pass: headers only, plus the bodies metadata extraction reads.
+        parsed_passages = list(
+            _stream_twee_files(
+                script_paths,
+                keep_body=lambda name, _ordinal: name in _CONSUMED_SPECIAL_PASSAGES,
+            )
+        )
 
         warnings: list[str] = []
         loss_records: list[LossRecord] = []
@@ -200,24 +222,26 @@ class TwineCodec:
         start_passage_name = metadata.start_name or (content_passages[0].name if content_passages else None)
         seeded_story_locals: dict[str, Any] = {}
         passage_state: list[dict[str, Any]] = []
-        for passage in content_passages:
-            slug = slug_map[passage.name]
-            content, actions, generated_blocks, effects, body_losses = _process_passage_body(
-                passage=passage,
-                slug_map=slug_map,
-                used_labels=used_labels,
+        # Second pass: re-read bodies of surviving passages only, lowering each
+        # as it is read.  Surviving ordinals ascend, so the order matches
+        # ``content_passages``.
+        content_ordinals = {passage.ordinal for passage in content_passages}
+        streamed_passages = (
+            passage
+            for passage in _stream_twee_files(
+                script_paths,
+                keep_body=lambda _name, ordinal: ordinal in content_ordinals,
             )
-            loss_records.extend(body_losses)
-            block_data: dict[str, Any] = {
-                "content": content,
-                "actions": actions,
-            }
-            if effects:
-                block_data["effects"] = effects
-                if passage.name == start_passage_name:
-                    _seed_story_locals_from_effects(story_locals=seeded_story_locals, effects=effects)
-            if passage.tags:
-                block_data["tags"] = list(passage.tags)
+            if passage.ordinal in content_ordinals
+        )
+        for passage, slug, block_data, generated_blocks in _lower_passages(
+            streamed_passages,
+            slug_map=slug_map,
+            used_labels=used_labels,
+            loss_records=loss_records,
+        ):
+            if passage.name == start_passage_name and "effects" in block_data:
+                _seed_story_locals_from_effects(story_locals=seeded_story_locals, effects=block_data["effects"])
             blocks[slug] = block_data
             blocks.update(generated_blocks)
             passage_state.append(
@@ -706,33 +730,75 @@ def _render_link(action: dict[str, Any], *, name_by_key: dict[str, str]) -> str:
 
 
 def _parse_twee(*, source: str, path: Path, start_ordinal: int) -> list[RawPassage]:
-    matches = list(_HEADER_RE.finditer(source))
-    if not matches:
-        return []
-
-    passages: list[RawPassage] = []
-    for index, match in enumerate(matches):
-        body_start = match.end()
-        body_end = matches[index + 1].start() if index + 1 < len(matches) else len(source)
-        body = source[body_start:body_end].strip()
-
-        tags_raw = (match.group("tags") or "").strip()
-        tags = [tag for tag in tags_raw.split() if tag]
-        meta, header_meta_valid = _parse_header_meta(match.group("meta"))
-
-        passages.append(
-            RawPassage(
-                name=match.group("name").strip(),
-                tags=tags,
-                meta=meta,
-                body=body,
-                path=str(path),
-                ordinal=start_ordinal + index,
-                header_meta_valid=header_meta_valid,
-            )
-        )
+    return list(_iter_twee_passages(StringIO(source), path=path, start_ordinal=start_ordinal))
 
-    return passages
+
+def _stream_twee_files(
+    script_paths: Iterable[Path],
+    *,
+    keep_body: Callable[[str, int], bool] | None = None,
+) -> Iterator[RawPassage]:
+    """Stream passages from each script in turn with one running ordinal."""
+    ordinal = 0
+    for script_path in script_paths:
+        with script_path.open(encoding="utf-8") as handle:
+            for passage in _iter_twee_passages(
+                handle,
+                path=script_path,
+                start_ordinal=ordinal,
+                keep_body=keep_body,
+            ):
+                yield passage
+                ordinal = passage.ordinal + 1
+
+
+def _iter_twee_passages(
+    handle: TextIO,
+    *,
+    path: Path,
+    start_ordinal: int,
+    keep_body: Callable[[str, int], bool] | None = None,
+) -> Iterator[RawPassage]:
+    """Tokenize Twee source line by line, yielding each passage once its body ends.
+
+    Only one passage body is buffered at a time.  When ``keep_body`` is given,
+    body lines are buffered only for passages it accepts (called with the
+    passage name and ordinal); other passages are yielded with an empty body.
+    """
+    header: re.Match[str] | None = None
+    ordinal = start_ordinal - 1
+    keep = False
+    body_lines: list[str] = []
+
+    for line in handle:
+        match = _HEADER_RE.match(line) if line.startswith("::") else None
+        if match is None:
+            if keep:
+                body_lines.append(line)
+            continue
+        if header is not None:
+            yield _raw_passage(header, body="".join(body_lines).strip(), path=path, ordinal=ordinal)
+        header = match
+        ordinal += 1
+        keep = keep_body is None or keep_body(match.group("name").strip(), ordinal)
+        body_lines = []
+
+    if header is not None:
+        yield _raw_passage(header, body="".join(body_lines).strip(), path=path, ordinal=ordinal)
+
+
+def _raw_passage(header: re.Match[str], *, body: str, path: Path, ordinal: int) -> RawPassage:
+    tags_raw = (header.group("tags") or "").strip()
+    meta, header_meta_valid = _parse_header_meta(header.group("meta"))
+    return RawPassage(
+        name=header.group("name").strip(),
+        tags=[tag for tag in tags_raw.split() if tag],
+        meta=meta,
+        body=body,
+        path=str(path),
+        ordinal=ordinal,
+        header_meta_valid=header_meta_valid,
+    )
 
 
 def _parse_header_meta(raw_meta: str | None) -> tuple[dict[str, Any], bool]:
@@ -875,6 +941,35 @@ def _assign_slugs(passages: list[RawPassage]) -> tuple[dict[str, str], list[Loss
     return slug_map, loss_records
 
 
+def _lower_passages(
+    passages: Iterable[RawPassage],
+    *,
+    slug_map: dict[str, str],
+    used_labels: set[str],
+    loss_records: list[LossRecord],
+) -> Iterator[tuple[RawPassage, str, dict[str, Any], dict[str, dict[str, Any]]]]:
+    """Lower passages one at a time into ``(passage, slug, block, generated blocks)``.
+
+    Body loss records are appended to ``loss_records`` as each passage is lowered.
+    """
+    for passage in passages:
+        content, actions, generated_blocks, effects, body_losses = _process_passage_body(
+            passage=passage,
+            slug_map=slug_map,
+            used_labels=used_labels,
+        )
+        loss_records.extend(body_losses)
+        block_data: dict[str, Any] = {
+            "content": content,
+            "actions": actions,
+        }
+        if effects:
+            block_data["effects"] = effects
+        if passage.tags:
+            block_data["tags"] = list(passage.tags)
+        yield passage, slug_map[passage.name], block_data, generated_blocks
+
+
 def _process_passage_body(
     *,
     passage: RawPassage,
@@ -1275,30 +1370,14 @@ def _translate_twine_expression(raw: str) -> str | None:
     if not expr:
         return None
 
-    if re.search(r"\b(contains|matches|to|into)\b", expr, flags=re.IGNORECASE):
+    if _UNSUPPORTED_OPERATOR_RE.search(expr):
         return None
 
     expr = _VAR_RE.sub(
         lambda match: f"self.graph.locals.get('{match.group(1)}')",
         expr,
     )
-
-    replacements = (
-        (r"\bis\s+not\b", "!="),
-        (r"\bisnot\b", "!="),
-        (r"\beq\b", "=="),
-        (r"\bneq\b", "!="),
-        (r"\bgte\b", ">="),
-        (r"\blte\b", "<="),
-        (r"\bgt\b", ">"),
-        (r"\blt\b", "<"),
-        (r"\bis\b", "=="),
-        (r"\btrue\b", "True"),
-        (r"\bfalse\b", "False"),
-        (r"\bnull\b", "None"),
-    )
-    for pattern, replacement in replacements:
-        expr = re.sub(pattern, replacement, expr, flags=re.IGNORECASE)
+    expr = _OPERATOR_RE.sub(lambda match: _OPERATOR_REPLACEMENTS[match.lastindex - 1][1], expr)
 
     return expr.strip() or None
 
@@ -102,51 +102,69 @@ class WorldCompiler:
         bundle: WorldBundle,
         story_key: str | None = None,
     ) -> World:
-        base_metadata = bundle.manifest.metadata.copy()
-
         domain_adjuncts, assets_facet, resources_facet = self._build_world_facets(bundle)
         decode_result = self._decode_story_data(
             bundle=bundle,
             story_key=story_key,
             local_codecs=domain_adjuncts.story_codecs if domain_adjuncts is not None else {},
         )
+        story_bundle = self._compile_story(
+            bundle=bundle,
+            story_key=story_key,
+            decode_result=decode_result,
+        )
+        world = WorldBuilder().build(
+            label=bundle.manifest.story_label(story_key),
+            bundle=story_bundle,
+            assets=assets_facet,
+            resources=resources_facet,
+            dispatch=domain_adjuncts.dispatch_registry if domain_adjuncts is not None else None,
+            extra_authorities=domain_adjuncts.get_authorities() if domain_adjuncts is not None else None,
+            class_registry=domain_adjuncts.class_registry if domain_adjuncts is not None else None,
+            modules=domain_adjuncts.modules if domain_adjuncts is not None else None,
+            story_info_projector=(
+                domain_adjuncts.get_story_info_projector() if domain_adjuncts is not None else None
+            ),
+        )
+        return world
+
+    def _compile_story(
+        self,
+        *,
+        bundle: WorldBundle,
+        story_key: str | None,
+        decode_result: DecodeResult,
+        story_compiler: StoryCompiler | None = None,
+    ) -> StoryTemplateBundle:
+        """Stamp manifest metadata onto decoded script data and compile it."""
+
         self._propagate_loss_records(decode_result)
         script_data = decode_result.story_data
         codec_id = str(decode_result.codec_state.get("codec_id") or bundle.get_story_codec(story_key))
 
-        script_metadata = script_data.setdefault("metadata", {})
-        for key, value in base_metadata.items():
+        # Copy rather than update in place: decoded data may be cached by callers.
+        script_metadata = dict(script_data.get("metadata") or {})
+        script_data["metadata"] = script_metadata
+        for key, value in bundle.manifest.metadata.items():
             script_metadata.setdefault(key, value)
         script_metadata.setdefault("codec_id", codec_id)
         if decode_result.warnings:
-            script_metadata.setdefault("codec_warnings", [])
-            script_metadata["codec_warnings"].extend(decode_result.warnings)
+            script_metadata["codec_warnings"] = [
+                *script_metadata.get("codec_warnings", []),
+                *decode_result.warnings,
+            ]
 
         default_title = script_metadata.get("title") or script_data.get("label") or bundle.manifest.label
         if story_key is not None and default_title == bundle.manifest.label:
             default_title = bundle.manifest.story_label(story_key)
         script_metadata.setdefault("title", default_title)
 
-        story_bundle = self.story_compiler.compile(
+        return (story_compiler or self.story_compiler).compile(
             script_data,
             source_map=decode_result.source_map,
             codec_state=decode_result.codec_state,
             codec_id=codec_id,
         )
-        world = WorldBuilder().build(
-            label=bundle.manifest.story_label(story_key),
-            bundle=story_bundle,
-            assets=assets_facet,
-            resources=resources_facet,
-            dispatch=domain_adjuncts.dispatch_registry if domain_adjuncts is not None else None,
-            extra_authorities=domain_adjuncts.get_authorities() if domain_adjuncts is not None else None,
-            class_registry=domain_adjuncts.class_registry if domain_adjuncts is not None else None,
-            modules=domain_adjuncts.modules if domain_adjuncts is not None else None,
-            story_info_projector=(
-                domain_adjuncts.get_story_info_projector() if domain_adjuncts is not None else None
-            ),
-        )
-        return world
 
     def compile_anthology(
         self,
@@ -156,8 +174,6 @@ class WorldCompiler:
             msg = f"{bundle.manifest.label} is not an anthology"
             raise ValueError(msg)
 
-        base_metadata = bundle.manifest.metadata.copy()
-
         (
             world_domain_adjuncts,
             world_assets_facet,
@@ -175,28 +191,10 @@ class WorldCompiler:
                     else {}
                 ),
             )
-            self._propagate_loss_records(decode_result)
-            script_data = decode_result.story_data
-            codec_id = str(decode_result.codec_state.get("codec_id") or bundle.get_story_codec(story_key))
-
-            script_metadata = script_data.setdefault("metadata", {})
-            for key, value in base_metadata.items():
-                script_metadata.setdefault(key, value)
-            script_metadata.setdefault("codec_id", codec_id)
-            if decode_result.warnings:
-                script_metadata.setdefault("codec_warnings", [])
-                script_metadata["codec_warnings"].extend(decode_result.warnings)
-
-            default_title = script_metadata.get("title") or script_data.get("label") or bundle.manifest.label
-            if default_title == bundle.manifest.label:
-                default_title = bundle.manifest.story_label(story_key)
-            script_metadata.setdefault("title", default_title)
-
-            story_bundle = self.story_compiler.compile(
-                script_data,
-                source_map=decode_result.source_map,
-                codec_state=decode_result.codec_state,
-                codec_id=codec_id,
+            story_bundle = self._compile_story(
+                bundle=bundle,
+                story_key=story_key,
+                decode_result=decode_result,
             )
             world = WorldBuilder().build(
                 label=bundle.manifest.story_label(story_key),
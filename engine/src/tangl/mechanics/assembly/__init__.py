@@ -2,13 +2,21 @@
 Composable loadout containers built on :class:`tangl.core.Selector`.
 """
 
-from .base import ComponentManager, HasResourceCost, HasSlottedContainer, SlottedContainer
+from .base import (
+    AssignmentPreview,
+    ComponentManager,
+    HasResourceCost,
+    HasSlottedContainer,
+    SlottedContainer,
+)
 from .budget import BudgetTracker, ResourceBudget
 from .component import Component, ComponentFacet, Connector, ConnectorPolarity
 from .connection import ConnectionGroupManager
 from .slot import Slot, SlotGroup
+from .solver import LoadoutSolution, LoadoutSolver, solve_loadout
 
 __all__ = [
+    "AssignmentPreview",
     "Component",
     "ComponentFacet",
     "ComponentManager",
@@ -17,9 +25,12 @@ __all__ = [
     "ConnectorPolarity",
     "HasResourceCost",
     "HasSlottedContainer",
+    "LoadoutSolution",
+    "LoadoutSolver",
     "SlottedContainer",
     "BudgetTracker",
     "ResourceBudget",
     "Slot",
     "SlotGroup",
+    "solve_loadout",
 ]
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
 from inspect import isclass
 from numbers import Real
-from typing import Any, ClassVar, Generic, Optional, Protocol, TypeVar, cast
+from typing import Any, ClassVar, Generic, Iterable, Optional, Protocol, TypeVar, cast
 from uuid import UUID
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
@@ -27,12 +28,30 @@ class HasResourceCost(Protocol):
         ...
 
 
+@dataclass(frozen=True)
+class AssignmentPreview:
+    """Outcome of a hypothetical assignment, as reported by :meth:`SlottedContainer.preview_assignments`."""
+
+    slot_name: str
+    component: Any
+    allowed: bool
+    reason: str = ""
+    replaces: tuple[Any, ...] = ()
+    costs: dict[str, float] = field(default_factory=dict)
+    remaining: dict[str, float] = field(default_factory=dict)
+
+
 class SlottedContainer(BaseModel, Generic[CT]):
     """Generic container that assigns components into named slots.
 
     Slots declare selector criteria so eligibility is resolved through
     :class:`tangl.core.Selector`. Subclasses define ``slots`` and may enable
     resource tracking via ``tracked_resources``.
+
+    Aggregates and budget consumption are running totals: each is computed
+    from :meth:`all_components` on first use and then adjusted as components
+    are added to or removed from slots.  Call :meth:`refresh_aggregates`
+    after editing an assigned component's attributes in place.
     """
 
     slots: ClassVar[dict[str, Slot]] = {}
@@ -46,6 +65,11 @@ class SlottedContainer(BaseModel, Generic[CT]):
     )
     owner: Any = Field(default=None, exclude=True)
 
+    _aggregate_totals: dict[str, float] = PrivateAttr(default_factory=dict)
+    _cost_totals: dict[str, float] = PrivateAttr(default_factory=dict)
+    _tag_counts: dict[str, Counter] = PrivateAttr(default_factory=dict)
+    _budgets_synced: bool = PrivateAttr(default=False)
+
     def _slot_names(self) -> list[str]:
         return list(self.assignments)
 
@@ -60,13 +84,58 @@ class SlottedContainer(BaseModel, Generic[CT]):
 
     def _add_to_slot(self, slot_name: str, component: CT) -> None:
         self.assignments[slot_name].append(component)
+        self._track_component(component, 1)
 
     def _remove_from_slot(self, slot_name: str, component: CT) -> bool:
         if component not in self.assignments.get(slot_name, []):
             return False
         self.assignments[slot_name].remove(component)
+        self._track_component(component, -1)
         return True
 
+    def _track_component(self, component: CT, sign: int) -> None:
+        """Fold one added (``sign=1``) or removed (``sign=-1``) component into the running totals.
+
+        Float totals and budgets are only ever extended, so they stay equal to
+        a fresh left-to-right sum over the slots.  Subtracting a removed
+        component would leave rounding residue (``0.1 + 0.2 - 0.2 != 0.1``),
+        so removal drops them for recomputation instead; tag counts are exact.
+        """
+        if sign < 0:
+            self._aggregate_totals.clear()
+            self._cost_totals.clear()
+            self._budgets_synced = False
+        try:
+            if self.budgets:
+                if self._budgets_synced:
+                    self.budgets.charge(component)
+                else:
+                    self._sync_budgets()
+            for name in self._aggregate_totals:
+                self._aggregate_totals[name] += self._aggregate_value(component, name)
+            for name in self._cost_totals:
+                self._cost_totals[name] += self._cost_value(component, name)
+            for name, counts in self._tag_counts.items():
+                for tag in self._tag_values(component, name):
+                    counts[tag] += sign
+                    if counts[tag] <= 0:
+                        del counts[tag]
+        except TypeError:
+            # let the next query walk the components and raise in context
+            self.refresh_aggregates()
+
+    def _sync_budgets(self) -> None:
+        if self.budgets and not self._budgets_synced:
+            self.budgets.recalculate(self.all_components())
+            self._budgets_synced = True
+
+    def refresh_aggregates(self) -> None:
+        """Drop running totals so the next query recomputes them from the slots."""
+        self._aggregate_totals.clear()
+        self._cost_totals.clear()
+        self._tag_counts.clear()
+        self._budgets_synced = False
+
     @model_validator(mode="after")
     def _initialize_budgets(self) -> "SlottedContainer[CT]":
         if self.tracked_resources and not self.budgets:
@@ -86,13 +155,8 @@ class SlottedContainer(BaseModel, Generic[CT]):
 
         self._add_to_slot(slot_name, component)
 
-        if self.budgets:
-            self.budgets.recalculate(self.all_components())
-
     def unassign(self, slot_name: str, component: CT) -> None:
-        if self._remove_from_slot(slot_name, component):
-            if self.budgets:
-                self.budgets.recalculate(self.all_components())
+        self._remove_from_slot(slot_name, component)
 
     def get_slot(self, slot_name: str) -> list[CT]:
         return self._slot_components(slot_name)
@@ -168,6 +232,52 @@ class SlottedContainer(BaseModel, Generic[CT]):
                 break
         return materialized
 
+    @staticmethod
+    def _aggregate_value(component: CT, name: str) -> float:
+        value = getattr(component, name, None)
+        if value is None:
+            return 0.0
+        if not isinstance(value, Real) or isinstance(value, bool):
+            raise TypeError(
+                f"Aggregate '{name}' expected numeric values, got {type(value).__name__}"
+            )
+        return float(value)
+
+    @staticmethod
+    def _cost_value(component: CT, name: str) -> float:
+        if not hasattr(component, "get_cost"):
+            return 0.0
+        value = getattr(component, "get_cost")(name)
+        if value is None:
+            return 0.0
+        if not isinstance(value, Real) or isinstance(value, bool):
+            raise TypeError(
+                f"Aggregate cost '{name}' expected numeric values, got {type(value).__name__}"
+            )
+        return float(value)
+
+    @staticmethod
+    def _is_tag_value(value: object) -> bool:
+        return isinstance(value, (Enum, str, int))
+
+    @classmethod
+    def _tag_values(cls, component: CT, name: str) -> set[Tag]:
+        value = getattr(component, name, None)
+        if value is None:
+            return set()
+        if cls._is_tag_value(value):
+            return {value}
+        if not isinstance(value, (list, tuple, set, frozenset)):
+            raise TypeError(
+                f"Aggregate tags '{name}' expected a tag or tag collection, got {type(value).__name__}"
+            )
+        for item in value:
+            if not cls._is_tag_value(item):
+                raise TypeError(
+                    f"Aggregate tags '{name}' expected Tag entries, got {type(item).__name__}"
+                )
+        return set(value)
+
     def get_aggregate(self, name: str, default: float = 0.0) -> float:
         """Sum one direct numeric attribute across assigned components.
 
@@ -175,17 +285,11 @@ class SlottedContainer(BaseModel, Generic[CT]):
         the container. Missing or ``None`` values contribute nothing.
         """
 
-        total = float(default)
-        for component in self.all_components():
-            value = getattr(component, name, None)
-            if value is None:
-                continue
-            if not isinstance(value, Real) or isinstance(value, bool):
-                raise TypeError(
-                    f"Aggregate '{name}' expected numeric values, got {type(value).__name__}"
-                )
-            total += float(value)
-        return total
+        if name not in self._aggregate_totals:
+            self._aggregate_totals[name] = sum(
+                self._aggregate_value(component, name) for component in self.all_components()
+            )
+        return float(default) + self._aggregate_totals[name]
 
     def get_aggregate_cost(self, name: str, default: float = 0.0) -> float:
         """Sum one named resource cost across assigned components.
@@ -194,23 +298,21 @@ class SlottedContainer(BaseModel, Generic[CT]):
         the container. Components without ``get_cost`` contribute nothing.
         """
 
-        total = float(default)
-        for component in self.all_components():
-            if not hasattr(component, "get_cost"):
-                continue
-            value = getattr(component, "get_cost")(name)
-            if value is None:
-                continue
-            if not isinstance(value, Real) or isinstance(value, bool):
-                raise TypeError(
-                    f"Aggregate cost '{name}' expected numeric values, got {type(value).__name__}"
-                )
-            total += float(value)
-        return total
+        if name not in self._cost_totals:
+            self._cost_totals[name] = sum(
+                self._cost_value(component, name) for component in self.all_components()
+            )
+        return float(default) + self._cost_totals[name]
 
-    @staticmethod
-    def _is_tag_value(value: object) -> bool:
-        return isinstance(value, (Enum, str, int))
+    def get_aggregate_tag_counts(self, name: str = "tags") -> Counter:
+        """Count how many assigned components carry each tag of one attribute."""
+
+        if name not in self._tag_counts:
+            counts: Counter = Counter()
+            for component in self.all_components():
+                counts.update(self._tag_values(component, name))
+            self._tag_counts[name] = counts
+        return Counter(self._tag_counts[name])
 
     def get_aggregate_tags(self, name: str = "tags") -> set[Tag]:
         """Union one tag or tag collection attribute across assigned components.
@@ -219,25 +321,8 @@ class SlottedContainer(BaseModel, Generic[CT]):
         the container. Missing or ``None`` values contribute nothing.
         """
 
-        tags: set[Tag] = set()
-        for component in self.all_components():
-            value = getattr(component, name, None)
-            if value is None:
-                continue
-            if self._is_tag_value(value):
-                tags.add(value)
-                continue
-            if not isinstance(value, (list, tuple, set, frozenset)):
-                raise TypeError(
-                    f"Aggregate tags '{name}' expected a tag or tag collection, got {type(value).__name__}"
-                )
-            for item in value:
-                if not self._is_tag_value(item):
-                    raise TypeError(
-                        f"Aggregate tags '{name}' expected Tag entries, got {type(item).__name__}"
-                    )
-                tags.add(item)
-        return tags
+        self.get_aggregate_tag_counts(name)
+        return set(self._tag_counts[name])
 
     def can_assign(self, slot_name: str, component: CT) -> tuple[bool, str]:
         if slot_name not in self.slots:
@@ -264,6 +349,7 @@ class SlottedContainer(BaseModel, Generic[CT]):
             return False, f"Slot full ({current_count}/{slot.max_count})"
 
         if self.budgets and hasattr(component, "get_cost"):
+            self._sync_budgets()
             for name, budget in self.budgets.budgets.items():
                 cost = getattr(component, "get_cost")(name)
                 if not budget.can_afford(cost):
@@ -271,6 +357,79 @@ class SlottedContainer(BaseModel, Generic[CT]):
 
         return True, ""
 
+    def preview_assignments(
+        self,
+        candidates: Iterable[tuple[str, CT]],
+        *,
+        allow_replace: bool = False,
+    ) -> list[AssignmentPreview]:
+        """Evaluate many hypothetical assignments against the current loadout.
+
+        Each candidate is judged on its own, as if it were the only change,
+        with the same rules as :meth:`can_assign`.  With ``allow_replace`` a
+        full single-component slot is treated as a swap: the occupant's costs
+        are released before the candidate's are charged.  Slot state and
+        budget consumption are looked up once per slot rather than once per
+        candidate, which suits shop and loadout screens.
+        """
+
+        self._sync_budgets()
+        budgets = self.budgets.budgets if self.budgets else {}
+        slot_state: dict[str, tuple[str, list[CT]]] = {}
+
+        def state_for(slot_name: str) -> tuple[str, list[CT]]:
+            if slot_name not in slot_state:
+                if slot_name not in self.slots:
+                    slot_state[slot_name] = (f"No such slot: {slot_name}", [])
+                elif not self.is_slot_enabled(slot_name):
+                    slot_state[slot_name] = (f"Slot disabled: {slot_name}", [])
+                else:
+                    missing = [
+                        prerequisite
+                        for prerequisite in self.slots[slot_name].prerequisite_slots
+                        if not self._has_slot_components(prerequisite)
+                    ]
+                    reason = f"Missing prerequisite slots: {', '.join(missing)}" if missing else ""
+                    slot_state[slot_name] = (reason, list(self.get_slot(slot_name)))
+            return slot_state[slot_name]
+
+        previews: list[AssignmentPreview] = []
+        for slot_name, component in candidates:
+            costs = {name: self._cost_value(component, name) for name in budgets}
+            reason, occupants = state_for(slot_name)
+            replaces: tuple[CT, ...] = ()
+            if not reason:
+                slot = self.slots[slot_name]
+                selects, select_reason = slot.selects_for(component)
+                if not selects:
+                    reason = select_reason
+                elif len(occupants) >= slot.max_count:
+                    if allow_replace and slot.max_count == 1:
+                        replaces = tuple(occupants)
+                    else:
+                        reason = f"Slot full ({len(occupants)}/{slot.max_count})"
+
+            remaining: dict[str, float] = {}
+            for name, budget in budgets.items():
+                released = sum(self._cost_value(occupant, name) for occupant in replaces)
+                consumed = budget.consumed - released + costs[name]
+                remaining[name] = budget.capacity - consumed
+                if not reason and consumed > budget.capacity:
+                    reason = f"Insufficient {name}: need {costs[name]}, have {budget.available + released}"
+
+            previews.append(
+                AssignmentPreview(
+                    slot_name=slot_name,
+                    component=component,
+                    allowed=not reason,
+                    reason=reason,
+                    replaces=replaces,
+                    costs=costs,
+                    remaining=remaining,
+                )
+            )
+        return previews
+
     def is_slot_enabled(self, slot_name: str) -> bool:
         if slot_name not in self.slots:
             raise KeyError(f"No such slot: {slot_name}")
@@ -306,6 +465,7 @@ class SlottedContainer(BaseModel, Generic[CT]):
                 errors.append(f"Group '{group.name}': {total} > {group.max_total} (max)")
 
         if self.budgets:
+            self._sync_budgets()
             errors.extend(self.budgets.get_errors())
 
         errors.extend(self._validate_custom())
@@ -404,6 +564,7 @@ class ComponentManager(Unstructurable, SlottedContainer[CT], Generic[CT]):
         self._validate_component_registry(component)
         self.assignment_ids.setdefault(slot_name, []).append(component.uid)
         self._component_cache[component.uid] = component
+        self._track_component(component, 1)
 
     def _remove_from_slot(self, slot_name: str, component: CT) -> bool:
         component_ids = self.assignment_ids.get(slot_name)
@@ -415,6 +576,7 @@ class ComponentManager(Unstructurable, SlottedContainer[CT], Generic[CT]):
         if not any(component.uid in ids for ids in self.assignment_ids.values()):
             self._component_cache.pop(component.uid, None)
         self._holder_labels.get(slot_name, {}).pop(component.uid, None)
+        self._track_component(component, -1)
         return True
 
     @classmethod
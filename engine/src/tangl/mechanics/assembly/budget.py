@@ -36,6 +36,17 @@ class BudgetTracker(BaseModel):
     def add_budget(self, name: str, capacity: float) -> None:
         self.budgets[name] = ResourceBudget(name=name, capacity=capacity)
 
+    def charge(self, component: Entity) -> None:
+        """Add one newly assigned component's costs to consumption.
+
+        Releases go through :meth:`recalculate`, which sums in the same order
+        and so reproduces these totals exactly.
+        """
+        if not hasattr(component, "get_cost"):
+            return
+        for budget in self.budgets.values():
+            budget.consumed += float(getattr(component, "get_cost")(budget.name))
+
     def recalculate(self, components: Iterable[Entity]) -> None:
         for budget in self.budgets.values():
             total = 0.0
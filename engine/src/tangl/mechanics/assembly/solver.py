@@ -0,0 +1,309 @@
+"""Branch-and-bound auto-loadout for :class:`SlottedContainer`.
+
+Given a catalog of candidate components, :class:`LoadoutSolver` fills a
+container's empty capacity so that slot selectors, slot capacities,
+prerequisites, slot-group maxima and resource budgets all hold, required
+slots and group minima are met, optional ``required_tags`` are covered, and
+an additive objective (a numeric component attribute, or a per-component
+scoring callable) is maximized.
+
+Components already assigned stay in place and count toward every limit.
+The search visits slots in prerequisite order and prunes on:
+
+* budgets - a component that no longer fits is never tried;
+* score - an optimistic bound (the best remaining scores per open slot,
+  ignoring budgets) must beat the incumbent;
+* tags - the remaining candidates must still be able to supply every
+  missing required tag.
+
+Searches stop at ``time_limit`` seconds and return the best loadout found
+so far with ``optimal=False``.  Each catalog component is used at most once;
+list duplicates to allow several copies.  Container-specific
+``_validate_custom`` rules are not consulted.
+
+Usage:
+    solver = LoadoutSolver(catalog, maximize="defense_bonus", required_tags={"light"})
+    for npc in guards:
+        solver.solve(npc.loadout).apply(npc.loadout)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import accumulate
+import time
+from typing import Any, Callable, Iterable, Mapping
+
+from tangl.type_hints import Tag
+
+from .base import SlottedContainer
+from .slot import Slot
+
+Objective = str | Callable[[Any], float] | None
+
+
+@dataclass(frozen=True)
+class LoadoutSolution:
+    """Components to add per slot, and how the search went."""
+
+    assignments: dict[str, tuple[Any, ...]] = field(default_factory=dict)
+    score: float = 0.0
+    feasible: bool = False
+    optimal: bool = False
+    explored: int = 0
+
+    def apply(self, container: SlottedContainer) -> None:
+        """Assign the solution's components to ``container`` in slot order."""
+        if not self.feasible:
+            raise ValueError("No feasible loadout to apply")
+        for slot_name, components in self.assignments.items():
+            for component in components:
+                container.assign(slot_name, component)
+
+
+class _Timeout(Exception):
+    pass
+
+
+@dataclass
+class _SlotPlan:
+    name: str
+    slot: Slot
+    candidates: list[Any]
+    scores: list[float]
+    prefix: list[float]
+    tag_suffix: list[frozenset[Tag]]
+    capacity: int
+    existing: int
+    groups: list[int]
+
+    def optimistic(self, start: int, count: int) -> float:
+        """Best possible gain from this slot's candidates at or after ``start``."""
+        stop = min(len(self.candidates), start + self.capacity - count)
+        return self.prefix[stop] - self.prefix[start] if stop > start else 0.0
+
+
+class LoadoutSolver:
+    """Reusable solver; slot candidate lists are computed once per container class."""
+
+    def __init__(
+        self,
+        catalog: Iterable[Any],
+        *,
+        maximize: Objective = None,
+        required_tags: Iterable[Tag] = (),
+        tag_attribute: str = "tags",
+        time_limit: float = 0.25,
+    ) -> None:
+        self.catalog = list(catalog)
+        self.maximize = maximize
+        self.required_tags = frozenset(required_tags)
+        self.tag_attribute = tag_attribute
+        self.time_limit = time_limit
+        self._candidates: dict[int, dict[str, list[Any]]] = {}
+
+    def score(self, component: Any) -> float:
+        if self.maximize is None:
+            return 0.0
+        if callable(self.maximize):
+            return float(self.maximize(component))
+        return SlottedContainer._aggregate_value(component, self.maximize)
+
+    def _slot_candidates(self, slots: Mapping[str, Slot]) -> dict[str, list[Any]]:
+        key = id(slots)
+        if key not in self._candidates:
+            by_slot = {}
+            for name, slot in slots.items():
+                candidates = [component for component in self.catalog if slot.selects_for(component)[0]]
+                candidates.sort(key=self.score, reverse=True)
+                by_slot[name] = candidates
+            self._candidates[key] = by_slot
+        return self._candidates[key]
+
+    @staticmethod
+    def _slot_order(container: SlottedContainer) -> list[str]:
+        order: list[str] = []
+        visiting: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in order or name in visiting or name not in container.slots:
+                return
+            visiting.add(name)
+            for prerequisite in container.slots[name].prerequisite_slots:
+                visit(prerequisite)
+            visiting.discard(name)
+            order.append(name)
+
+        for name in container.slots:
+            visit(name)
+        return order
+
+    def solve(self, container: SlottedContainer) -> LoadoutSolution:
+        """Find the best additions to ``container`` without modifying it."""
+        candidates = self._slot_candidates(container.slots)
+        groups = container.slot_groups
+        group_counts = [sum(container._slot_count(name) for name in group.slot_names) for group in groups]
+        in_use = {id(component) for component in container.all_components()}
+
+        container._sync_budgets()
+        budgets = container.budgets.budgets if container.budgets else {}
+        remaining = {name: budget.capacity - budget.consumed for name, budget in budgets.items()}
+        costs: dict[int, dict[str, float]] = {}
+
+        def cost_of(component: Any) -> dict[str, float]:
+            if id(component) not in costs:
+                costs[id(component)] = {name: container._cost_value(component, name) for name in budgets}
+            return costs[id(component)]
+
+        plans: list[_SlotPlan] = []
+        for name in self._slot_order(container):
+            slot = container.slots[name]
+            existing = container._slot_count(name)
+            pool = (
+                [component for component in candidates[name] if id(component) not in in_use]
+                if container.is_slot_enabled(name)
+                else []
+            )
+            scores = [self.score(component) for component in pool]
+            tag_suffix: list[frozenset[Tag]] = [frozenset()] * (len(pool) + 1)
+            for index in range(len(pool) - 1, -1, -1):
+                tag_suffix[index] = tag_suffix[index + 1] | container._tag_values(pool[index], self.tag_attribute)
+            plans.append(
+                _SlotPlan(
+                    name=name,
+                    slot=slot,
+                    candidates=pool,
+                    scores=scores,
+                    prefix=[0.0, *accumulate(max(score, 0.0) for score in scores)],
+                    tag_suffix=tag_suffix,
+                    capacity=max(slot.max_count - existing, 0),
+                    existing=existing,
+                    groups=[index for index, group in enumerate(groups) if name in group.slot_names],
+                )
+            )
+
+        # optimistic gain and reachable tags from slot i onward
+        tail_bound = [0.0] * (len(plans) + 1)
+        tail_tags: list[frozenset[Tag]] = [frozenset()] * (len(plans) + 1)
+        for index in range(len(plans) - 1, -1, -1):
+            tail_bound[index] = tail_bound[index + 1] + plans[index].optimistic(0, 0)
+            tail_tags[index] = tail_tags[index + 1] | plans[index].tag_suffix[0]
+
+        base_score = sum(self.score(component) for component in container.all_components())
+        base_tags = container.get_aggregate_tags(self.tag_attribute) if self.required_tags else set()
+        exhaustive = self.maximize is not None
+        deadline = time.perf_counter() + self.time_limit
+        counts = {plan.name: plan.existing for plan in plans}
+        chosen: dict[str, list[Any]] = {plan.name: [] for plan in plans}
+        used: set[int] = set()
+        best: dict[str, Any] = {"score": float("-inf"), "assignments": None}
+        explored = 0
+
+        def leaf_ok() -> bool:
+            for plan in plans:
+                if plan.slot.required and counts[plan.name] == 0 and container.is_slot_enabled(plan.name):
+                    return False
+            return all(
+                group.min_total is None or group_counts[index] >= group.min_total
+                for index, group in enumerate(groups)
+            )
+
+        def search(slot_index: int, start: int, score: float, tags: frozenset[Tag]) -> None:
+            nonlocal explored
+            explored += 1
+            if explored % 256 == 0 and time.perf_counter() > deadline:
+                raise _Timeout
+            if not exhaustive and best["assignments"] is not None:
+                return
+            missing = self.required_tags - tags
+            if slot_index == len(plans):
+                if not missing and leaf_ok() and score > best["score"]:
+                    best["score"] = score
+                    best["assignments"] = {name: tuple(items) for name, items in chosen.items() if items}
+                return
+
+            plan = plans[slot_index]
+            count = counts[plan.name]
+            reachable = plan.tag_suffix[start] | tail_tags[slot_index + 1]
+            if missing and not missing <= reachable:
+                return
+            if exhaustive:
+                bound = score + plan.optimistic(start, count - plan.existing) + tail_bound[slot_index + 1]
+                if bound <= best["score"]:
+                    return
+
+            prerequisites_met = all(counts.get(name, 0) > 0 for name in plan.slot.prerequisite_slots)
+            if prerequisites_met and count < plan.slot.max_count:
+                for index in range(start, len(plan.candidates)):
+                    component = plan.candidates[index]
+                    if id(component) in used:
+                        continue
+                    component_costs = cost_of(component)
+                    if any(component_costs[name] > remaining[name] + 1e-9 for name in remaining):
+                        continue
+                    if any(
+                        groups[group].max_total is not None and group_counts[group] >= groups[group].max_total
+                        for group in plan.groups
+                    ):
+                        break
+                    used.add(id(component))
+                    chosen[plan.name].append(component)
+                    counts[plan.name] += 1
+                    for name, cost in component_costs.items():
+                        remaining[name] -= cost
+                    for group in plan.groups:
+                        group_counts[group] += 1
+                    try:
+                        search(
+                            slot_index,
+                            index + 1,
+                            score + plan.scores[index],
+                            tags | container._tag_values(component, self.tag_attribute) if self.required_tags else tags,
+                        )
+                    finally:
+                        for group in plan.groups:
+                            group_counts[group] -= 1
+                        for name, cost in component_costs.items():
+                            remaining[name] += cost
+                        counts[plan.name] -= 1
+                        chosen[plan.name].pop()
+                        used.discard(id(component))
+
+            if plan.slot.required and counts[plan.name] == 0 and container.is_slot_enabled(plan.name):
+                return
+            search(slot_index + 1, 0, score, tags)
+
+        finished = True
+        try:
+            search(0, 0, base_score, frozenset(base_tags))
+        except _Timeout:
+            finished = False
+
+        if best["assignments"] is None:
+            return LoadoutSolution(explored=explored, optimal=finished)
+        return LoadoutSolution(
+            assignments=best["assignments"],
+            score=best["score"],
+            feasible=True,
+            optimal=finished,
+            explored=explored,
+        )
+
+
+def solve_loadout(
+    container: SlottedContainer,
+    catalog: Iterable[Any],
+    *,
+    maximize: Objective = None,
+    required_tags: Iterable[Tag] = (),
+    tag_attribute: str = "tags",
+    time_limit: float = 0.25,
+) -> LoadoutSolution:
+    """One-shot :class:`LoadoutSolver` run; see the module docs."""
+    return LoadoutSolver(
+        catalog,
+        maximize=maximize,
+        required_tags=required_tags,
+        tag_attribute=tag_attribute,
+        time_limit=time_limit,
+    ).solve(container)
@@ -10,7 +10,9 @@ Key Features
 ------------
 * Resource-backed :class:`Region`, :class:`Country`, :class:`Subtype`, and
   :class:`NameBank` models.
-* :class:`DemographicSampler` for controlled profile sampling.
+* :class:`DemographicSampler` for controlled profile sampling, with cached
+  alias tables for weighted draws and :meth:`~DemographicSampler.sample_many`
+  for crowds.
 * :class:`HasDemographics` facet for publishing actor identity into local
   namespaces.
 """
@@ -20,9 +22,10 @@ __title__ = "StoryTangl DemographicForge"
 
 from .data_models import Country, NameBank, Region, Subtype, load_demographic_distributions
 from .demographic import DemographicData, HasDemographic, HasDemographics
-from .sampler import DemographicSampler
+from .sampler import AliasTable, DemographicSampler
 
 __all__ = [
+    "AliasTable",
     "Country",
     "DemographicData",
     "DemographicSampler",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import logging
 import re
+from typing import ClassVar
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -41,8 +42,22 @@ SUBTYPE_NAMEBANK_REQUIRED = {"usa", "zaf"}
 class Region(Singleton):
     """
     Regions are collections of countries
+
+    ``registry_revision`` is bumped whenever a region is registered or the
+    instances are cleared, so cached region tables can check it in O(1).
     """
+    registry_revision: ClassVar[int] = 0
+
     label_: str = Field(..., alias='label')
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        Region.registry_revision += 1
+
+    @classmethod
+    def clear_instances(cls) -> None:
+        super().clear_instances()
+        Region.registry_revision += 1
     name: str
     demonym: str
 
@@ -1,6 +1,6 @@
 import random
 import logging
-from typing import Any
+from typing import Any, ClassVar, Generic, Sequence, TypeVar
 
 from tangl.lang.gens import Gens as Gender
 from tangl.lang.age_range import AgeRange
@@ -10,6 +10,51 @@ from .demographic import DemographicData
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
+T = TypeVar("T")
+
+
+class AliasTable(Generic[T]):
+    """
+    Vose alias table for O(1) weighted draws from a fixed population.
+
+    Building costs O(n); each :meth:`sample` then uses a single ``rng.random()``
+    call, whose integer part picks a column and whose fraction decides between
+    the column's item and its alias.  All-zero weights fall back to uniform.
+    """
+
+    __slots__ = ("items", "_prob", "_alias")
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if not items:
+            raise IndexError('Cannot build an alias table with no items')
+        n = len(items)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights] if total > 0 else [1.0] * n
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            lo, hi = small.pop(), large.pop()
+            prob[lo] = scaled[lo]
+            alias[lo] = hi
+            scaled[hi] += scaled[lo] - 1.0
+            (small if scaled[hi] < 1.0 else large).append(hi)
+        self.items = list(items)
+        self._prob = prob
+        self._alias = alias
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rng: Any = None) -> T:
+        u = (rng or random).random() * len(self.items)
+        i = int(u)
+        if i >= len(self.items):
+            i = len(self.items) - 1
+        return self.items[i] if u - i < self._prob[i] else self.items[self._alias[i]]
+
+
 class DemographicSampler:
     """
     Samples region, country, subtype, gender, and name
@@ -23,21 +68,103 @@ class DemographicSampler:
     - `sample_subtype(country) -> Subtype`
     - `sample_country(region) -> Country`
     - `sample_region() -> Region`
+    - `sample_many(n) -> list[DemographicData]`
+
+    Weighted draws use :class:`AliasTable` instances cached per region list,
+    region and ethnic mix, and name bank lookups are cached per country and
+    subtype.  Caches notice newly registered or cleared regions and added or
+    removed countries and mix entries; call :meth:`reset_tables` after editing
+    populations, weights or a region's country set in place.
     """
 
+    _region_table: ClassVar[tuple | None] = None
+    _country_tables: ClassVar[dict[int, tuple]] = {}
+    _subtype_tables: ClassVar[dict[int, tuple]] = {}
+    _namebanks: ClassVar[dict[tuple[int, str | None], tuple]] = {}
+    _country_regions: ClassVar[dict[int, tuple]] = {}
+
+    @classmethod
+    def reset_tables(cls) -> None:
+        """Drop cached alias tables and lookups."""
+        cls._region_table = None
+        cls._country_tables.clear()
+        cls._subtype_tables.clear()
+        cls._namebanks.clear()
+        cls._country_regions.clear()
+
+    @classmethod
+    def build_tables(cls) -> None:
+        """Precompute tables for every loaded region, country and ethnic mix."""
+        cls.reset_tables()
+        for region in cls._regions()[0]:
+            if region.countries:
+                cls._country_table(region)
+            for eth_mix in [region.eth_mix, *(country.eth_mix for country in region.countries)]:
+                if eth_mix:
+                    cls._subtype_table(eth_mix)
+
+    @classmethod
+    def _regions(cls) -> tuple[list[Region], AliasTable[Region] | None]:
+        cached = cls._region_table
+        if cached is None or cached[0] != Region.registry_revision:
+            regions = list(Region.all_instances())
+            table = AliasTable(regions, [r.population for r in regions]) if regions else None
+            cached = cls._region_table = (Region.registry_revision, regions, table)
+        return cached[1], cached[2]
+
+    @classmethod
+    def _country_table(cls, region: Region) -> tuple[list[Country], AliasTable[Country]]:
+        cached = cls._country_tables.get(id(region))
+        if cached is None or cached[0] is not region or cached[1] != len(region.countries):
+            countries = sorted(
+                region.countries,
+                key=lambda country: getattr(country, "label", "") or getattr(country, "name", ""),
+            )
+            if not countries:
+                raise IndexError('No countries found')
+            table = AliasTable(countries, [c.population for c in countries])
+            cached = cls._country_tables[id(region)] = (region, len(countries), countries, table)
+        return cached[2], cached[3]
+
+    @classmethod
+    def _subtype_table(cls, eth_mix: dict[Subtype, int]) -> AliasTable[Subtype]:
+        cached = cls._subtype_tables.get(id(eth_mix))
+        if cached is None or cached[0] is not eth_mix or cached[1] != len(eth_mix):
+            table = AliasTable([*eth_mix.keys()], [*eth_mix.values()])
+            cached = cls._subtype_tables[id(eth_mix)] = (eth_mix, len(eth_mix), table)
+        return cached[2]
+
+    @classmethod
+    def _country_region(cls, country: Country) -> Region | None:
+        cached = cls._country_regions.get(id(country))
+        if cached is None or cached[0] is not country or country not in cached[1].countries:
+            region = country.region
+            if region is None:
+                return None
+            cached = cls._country_regions[id(country)] = (country, region)
+        return cached[1]
+
+    @classmethod
+    def _namebank(cls, country: Country, subtype: Subtype | None) -> NameBank:
+        key = (id(country), getattr(subtype, "label", subtype))
+        cached = cls._namebanks.get(key)
+        if cached is None or cached[0] is not country:
+            cached = cls._namebanks[key] = (country, country.namebank(subtype))
+        return cached[1]
+
     @staticmethod
     def _rand(rng: Any = None) -> Any:
         return rng or random
 
     @classmethod
     def sample_region(cls, weighted: bool = False, rng: Any = None) -> Region:
-        regions = list(Region.all_instances())  # type: list[Region]
+        regions, table = cls._regions()
         if not regions:
             raise IndexError('No regions found')
         rand = cls._rand(rng)
         if weighted:
             # Population weighted dist
-            return rand.choices(regions, weights=[r.population for r in regions], k=1)[0]
+            return table.sample(rand)
         else:
             # Uniform dist
             return rand.choice(regions)
@@ -54,19 +181,12 @@ class DemographicSampler:
     def sample_country(cls, region: Region = None, weighted: bool = True, rng: Any = None) -> Country:
         region = cls._normalize_region(region, weighted=weighted, rng=rng)
 
-        countries = sorted(
-            region.countries,
-            key=lambda country: getattr(country, "label", "") or getattr(country, "name", ""),
-        )
-
-        if not countries:
-            raise IndexError('No countries found')
+        countries, table = cls._country_table(region)
 
         rand = cls._rand(rng)
         if weighted:
             # Population weighted dist
-            logger.debug(countries)
-            return rand.choices(countries, weights=[c.population for c in countries], k=1)[0]
+            return table.sample(rand)
         else:
             # Uniform dist
             return rand.choice(countries)
@@ -99,11 +219,7 @@ class DemographicSampler:
         else:
             country = cls._normalize_country(country, weighted=weighted, rng=rng)
             eth_mix = country.eth_mix
-        rand = cls._rand(rng)
-        subtype = rand.choices(
-            [*eth_mix.keys()],
-            weights=[*eth_mix.values()], k=1)[0]
-        return subtype
+        return cls._subtype_table(eth_mix).sample(cls._rand(rng))
 
     @classmethod
     def _normalize_subtype(
@@ -219,7 +335,7 @@ class DemographicSampler:
         )
 
         if region is None and country is not None:
-            region = country.region
+            region = cls._country_region(country)
         region = cls._normalize_region(region, weighted=weighted, rng=rng)
         country = cls._normalize_country(country, region=region, weighted=weighted, rng=rng)
         subtype = cls._normalize_subtype(
@@ -232,7 +348,7 @@ class DemographicSampler:
         gender = cls._normalize_gender(gender, weighted=weighted, rng=rng)
         age_range = cls._normalize_age_range(age_range, weighted=weighted, rng=rng)
 
-        nb = country.namebank(subtype)
+        nb = cls._namebank(country, subtype)
         given_name, family_name = cls.sample_namebank(nb, gender=gender, rng=rng)
 
         return DemographicData(
@@ -243,3 +359,39 @@ class DemographicSampler:
             subtype=subtype,
             gender=gender,
             age_range=age_range)
+
+    @classmethod
+    def sample_many(
+        cls,
+        n: int,
+        region: Region = None,
+        country: Country = None,
+        subtype: Subtype = None,
+        gender: Gender = None,
+        age_range: AgeRange = None,
+        weighted: bool = True,
+        rng: Any = None,
+    ) -> list[DemographicData]:
+        """
+        Sample ``n`` profiles for a crowd or roster.
+
+        ``rng`` may be a seed, giving the same batch for the same seed.  Any
+        fixed arguments apply to every profile, as in :meth:`sample_demographic`.
+        """
+        if isinstance(rng, int):
+            rng = random.Random(rng)
+        return [
+            cls.sample_demographic(
+                region=region,
+                country=country,
+                subtype=subtype,
+                gender=gender,
+                age_range=age_range,
+                weighted=weighted,
+                rng=rng,
+            )
+            for _ in range(n)
+        ]
+
+
+DemographicSampler.build_tables()
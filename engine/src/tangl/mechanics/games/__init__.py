@@ -28,6 +28,8 @@ opponent_strategies : StrategyRegistry
     Named strategies for opponent move selection.
 scoring_strategies : StrategyRegistry
     Named strategies for terminal condition evaluation.
+player_policies : StrategyRegistry
+    Named player move pickers for headless tournaments.
 
 Example
 -------
@@ -111,6 +113,22 @@ from .repertoire import (
 )
 from .picking_game import PickingGame, PickingGameHandler, PickingMove
 from .kim_game import KimGame, KimGameHandler, KimMove
+from .search import (
+    GameTreeSearch,
+    SearchModel,
+    SearchNode,
+    search_best_move,
+    search_hints,
+    search_models,
+)
+from .tournament import (
+    MatchupStats,
+    TournamentReport,
+    play_game,
+    play_matchup,
+    player_policies,
+    run_tournament,
+)
 from tangl.mechanics.credentials import (
     ContrabandItem,
     CredentialDefect,
@@ -137,6 +155,7 @@ from .credentials_game import (
     CredentialsMove,
     derive_defects,
     derive_disposition,
+    disposition_from_defects,
     disposition_penalty,
     default_penalty_matrix,
     DISPOSITION_PENALTY,
@@ -152,11 +171,17 @@ from .credentials_factory import (
     sample_failure_mode,
 )
 from .credentials_roster import (
+    PreparedCase,
+    PreparedRoster,
+    RosterCache,
     ScenarioOffer,
     ShiftSpec,
     generate_roster,
     make_offer,
     materialize,
+    prepare_offer,
+    prepare_roster,
+    roster_cache,
 )
 
 
@@ -229,6 +254,7 @@ __all__ = [
     "CredentialCaseResult",
     "derive_defects",
     "derive_disposition",
+    "disposition_from_defects",
     "disposition_penalty",
     "default_penalty_matrix",
     "DISPOSITION_PENALTY",
@@ -254,11 +280,31 @@ __all__ = [
     "apply_failure",
     "applicable_modes",
     "sample_failure_mode",
+    "PreparedCase",
+    "PreparedRoster",
+    "RosterCache",
     "ScenarioOffer",
     "ShiftSpec",
     "generate_roster",
     "make_offer",
     "materialize",
+    "prepare_offer",
+    "prepare_roster",
+    "roster_cache",
+    # Search
+    "GameTreeSearch",
+    "SearchModel",
+    "SearchNode",
+    "search_best_move",
+    "search_hints",
+    "search_models",
+    # Tournaments
+    "MatchupStats",
+    "TournamentReport",
+    "play_game",
+    "play_matchup",
+    "player_policies",
+    "run_tournament",
     # Dispatch
     "HasGame",
     "generate_game_journal",
@@ -7,6 +7,8 @@ deterministic reveal and draw policy configured on the game state.
 """
 from __future__ import annotations
 
+from collections import Counter
+from dataclasses import dataclass
 from enum import Enum
 import random
 from typing import ClassVar
@@ -20,6 +22,7 @@ from tangl.vm.ctx import VmPhaseCtx
 from .enums import GameResult, RoundResult
 from .game import Game
 from .handler import GameHandler
+from .search import SearchModel, SearchNode, search_models
 
 
 class BlackjackMove(Enum):
@@ -356,3 +359,91 @@ class BlackjackGameHandler(GameHandler[BlackjackGame]):
         game.score["opponent"] = 1
         detail["outcome"] = "push"
         return RoundResult.DRAW
+
+
+# (phase, player hard total, player aces, dealer hard total, dealer aces,
+#  unseen counts for ranks 1..10 with faces folded into 10)
+BlackjackState = tuple[str, int, int, int, int, tuple[int, ...]]
+
+
+def _soft_total(hard: int, aces: int) -> int:
+    return hard + 10 if aces and hard <= 11 else hard
+
+
+@dataclass(frozen=True)
+class BlackjackSearchModel(SearchModel[BlackjackState, BlackjackMove]):
+    """
+    Hit/stand expectimax from the player's point of view.
+
+    The player sees their hand and the dealer's upcard; every other card
+    (deck plus hole card) is equally likely to come next, so states carry
+    only rank counts.  The dealer draws to ``dealer_stand_at`` as the handler
+    does, and a hit that reaches 21 stands automatically.
+    """
+
+    dealer_stand_at: int = 17
+
+    def node(self, state: BlackjackState) -> SearchNode:
+        phase, _, _, dealer_hard, dealer_aces, counts = state
+        if phase == "player":
+            return SearchNode.PLAYER
+        if phase == "dealer":
+            if _soft_total(dealer_hard, dealer_aces) >= self.dealer_stand_at or not any(counts):
+                return SearchNode.TERMINAL
+            return SearchNode.CHANCE
+        if phase == "hit":
+            return SearchNode.CHANCE if any(counts) else SearchNode.TERMINAL
+        return SearchNode.TERMINAL
+
+    def moves(self, state: BlackjackState) -> list[BlackjackMove]:
+        if _soft_total(state[1], state[2]) >= 21:
+            return [BlackjackMove.STAND]
+        return [BlackjackMove.HIT, BlackjackMove.STAND]
+
+    def apply(self, state: BlackjackState, move: BlackjackMove) -> BlackjackState:
+        return ("hit" if move is BlackjackMove.HIT else "dealer", *state[1:])
+
+    def outcomes(self, state: BlackjackState) -> list[tuple[float, BlackjackState]]:
+        phase, player_hard, player_aces, dealer_hard, dealer_aces, counts = state
+        remaining = sum(counts)
+        results = []
+        for index, count in enumerate(counts):
+            if not count:
+                continue
+            rank = index + 1
+            left = counts[:index] + (count - 1,) + counts[index + 1:]
+            ace = 1 if rank == 1 else 0
+            if phase == "hit":
+                total = _soft_total(player_hard + rank, player_aces + ace)
+                next_phase = "bust" if total > 21 else "dealer" if total == 21 else "player"
+                outcome = (next_phase, player_hard + rank, player_aces + ace, dealer_hard, dealer_aces, left)
+            else:
+                outcome = ("dealer", player_hard, player_aces, dealer_hard + rank, dealer_aces + ace, left)
+            results.append((count / remaining, outcome))
+        return results
+
+    def value(self, state: BlackjackState) -> float:
+        phase, player_hard, player_aces, dealer_hard, dealer_aces, _ = state
+        if phase == "bust":
+            return -1.0
+        if phase != "dealer":
+            return 0.0
+        player = _soft_total(player_hard, player_aces)
+        dealer = _soft_total(dealer_hard, dealer_aces)
+        if dealer > 21 or player > dealer:
+            return 1.0
+        return -1.0 if dealer > player else 0.0
+
+
+def _hard_total(cards: list[PlayingCard]) -> tuple[int, int]:
+    return sum(min(card.rank, 10) for card in cards), sum(1 for card in cards if card.rank == 1)
+
+
+@search_models.register(BlackjackGame)
+def _blackjack_search_state(game: BlackjackGame) -> tuple[BlackjackSearchModel, BlackjackState]:
+    model = BlackjackSearchModel(dealer_stand_at=game.dealer_stand_at)
+    upcard = game.dealer_hand[:1]
+    unseen = Counter(min(card.rank, 10) for card in [*game.card_deck, *game.dealer_hand[1:]])
+    counts = tuple(unseen.get(rank, 0) for rank in range(1, 11))
+    phase = "player" if not (game.result.is_terminal or game.player_stood) and game.player_hand else "over"
+    return model, (phase, *_hard_total(game.player_hand), *_hard_total(upcard), counts)
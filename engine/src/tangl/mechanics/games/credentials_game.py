@@ -710,12 +710,29 @@ def derive_disposition(
 ) -> CredentialDisposition:
     """Fold structured defects into the three available checkpoint outcomes."""
 
-    defects = derive_defects(packet, restrictions, finding_status)
+    return disposition_from_defects(derive_defects(packet, restrictions, finding_status))
+
+
+def disposition_from_defects(defects: list[CredentialDefect]) -> CredentialDisposition:
+    """Fold an already-derived defect list; any crime arrests, anything else denies."""
+
     if any(defect.failure_class is FailureClass.CRIME for defect in defects):
         return CredentialDisposition.ARREST
     return CredentialDisposition.DENY if defects else CredentialDisposition.PASS
 
 
+def _packet_fingerprint(packet: AssemblyCredentialPacketManager) -> tuple:
+    """The packet state assessment reads that can change after materialization."""
+
+    return (
+        packet.region,
+        packet.purpose,
+        packet.bearer_id,
+        tuple((slot, tuple(ids)) for slot, ids in packet.assignment_ids.items()),
+        tuple((item.indication, item.concealed) for item in packet.possessions),
+    )
+
+
 class CredentialPresentationProfile(BaseModelPlus):
     """Authored wording for the existing credential mediation grammar."""
 
@@ -959,6 +976,10 @@ class CredentialsGame(PickingGame):
     )
     catalog_ref: str | None = None
     presentation: CredentialPresentationProfile = Field(default_factory=CredentialPresentationProfile)
+    # Key of a prepared roster (see ``prepare_roster``). When set, detached
+    # offers are taken from the roster cache instead of being rebuilt.
+    roster_scenario: str | None = None
+    roster_seed: int | None = None
 
     # --- Per-case working state (reset by advance_case) ----------------------
     case_index: int = Field(default=0, json_schema_extra={"reset_field": True})
@@ -1009,6 +1030,7 @@ class CredentialsGame(PickingGame):
         },
     )
     _component_manager_owner: object | None = PrivateAttr(default=None)
+    _defect_memo: dict[tuple, list[CredentialDefect]] = PrivateAttr(default_factory=dict)
 
     def bind_component_managers(self, owner: object) -> None:
         """Bind assembly packet managers in already materialized cases to ``owner``."""
@@ -1052,6 +1074,10 @@ class CredentialsGame(PickingGame):
 
         while len(self.materialized) <= case_index:
             offer = self.offers[len(self.materialized)]
+            cached = self._prepared_case(len(self.materialized), offer)
+            if cached is not None:
+                self.materialized.append(cached)
+                continue
             self.materialized.append(
                 materialize(
                     offer,
@@ -1067,6 +1093,60 @@ class CredentialsGame(PickingGame):
             )
         return self.materialized[case_index]
 
+    def _prepared_case(self, case_index: int, offer: ScenarioOffer) -> CredentialCase | None:
+        """Copy a cached detached case for ``offer``, seeding its defect memo.
+
+        Graph-owned shifts register packet components and subjects in the story
+        graph as they arrive, so only detached shifts reuse prepared cases.
+        """
+
+        if (
+            self.roster_scenario is None
+            or self.roster_seed is None
+            or self.has_component_manager_owner
+            or self.catalog_ref is not None
+        ):
+            return None
+        from .credentials_roster import roster_cache
+
+        prepared = roster_cache.get(self.roster_scenario, self.roster_seed, case_index)
+        if (
+            prepared is None
+            or prepared.offer != offer
+            or prepared.rules != self.restriction_map
+            or prepared.presentation != self.presentation
+        ):
+            return None
+        case = prepared.fresh_case()
+        self._defect_memo[self._defect_key(case, {})] = list(prepared.defects)
+        return case
+
+    def _defect_key(self, case: CredentialCase, finding_status: dict[str, str]) -> tuple:
+        return (
+            _packet_fingerprint(case.packet_manager),
+            tuple((rule.region, rule.indication, rule.level) for rule in self.restriction_map.rules),
+            self.restriction_map.default_level,
+            tuple(sorted(finding_status.items())),
+        )
+
+    def case_defects(self, case: CredentialCase | None = None) -> list[CredentialDefect]:
+        """Memoized :func:`derive_defects` for ``case`` (default: the active case).
+
+        Keyed on the packet's slot assignments and possessions, the day's rules,
+        and the current ``finding_status``, so mediation moves and rule edits
+        are picked up without explicit invalidation.
+        """
+
+        case = case if case is not None else self.active_case
+        key = self._defect_key(case, self.finding_status)
+        defects = self._defect_memo.get(key)
+        if defects is None:
+            if len(self._defect_memo) >= 256:
+                self._defect_memo.clear()
+            defects = derive_defects(case.packet_manager, self.restriction_map, self.finding_status)
+            self._defect_memo[key] = defects
+        return list(defects)
+
     # ----- active case access ----------------------------------------------
     def _total_cases(self) -> int:
         """Number of candidates this shift: sampled offers if any, else roster."""
@@ -1195,7 +1275,7 @@ class CredentialsGame(PickingGame):
             )
         if case.correct_disposition is not None:
             return case.correct_disposition
-        return derive_disposition(case.packet_manager, self.restriction_map, self.finding_status)
+        return disposition_from_defects(self.case_defects(case))
 
     # ----- roster advancement ----------------------------------------------
     def advance_case(self) -> None:
@@ -1224,6 +1304,7 @@ class CredentialsGame(PickingGame):
         self.packet_findings = {}
         self.committed_decision = None
         self.finding_status = {}
+        self._defect_memo.clear()
 
     def to_namespace(self) -> dict[str, object]:
         namespace = super().to_namespace()
@@ -1848,10 +1929,7 @@ class CredentialsGameHandler(PickingGameHandler[CredentialsGame]):
             game.finding_status[FindingKey.ID] = Finding.CLEARED
             detail["outcome"] = "id_request_complied"
             detail["component_id"] = str(id_card.uid)
-            game.presentation.render_case(
-                case,
-                derive_defects(manager, game.restriction_map, game.finding_status),
-            )
+            game.presentation.render_case(case, game.case_defects(case))
         else:
             game.finding_status[FindingKey.ID] = Finding.REFUSED
             detail["outcome"] = "id_request_refused"
@@ -1919,11 +1997,7 @@ class CredentialsGameHandler(PickingGameHandler[CredentialsGame]):
         mismatch = any(
             defect.kind is CredentialDefectKind.SUBJECT_MISMATCH
             and defect.source_id == id_card.uid
-            for defect in derive_defects(
-                game.active_case.packet_manager,
-                game.restriction_map,
-                game.finding_status,
-            )
+            for defect in game.case_defects()
         )
         if mismatch:
             game.finding_status[FindingKey.ID] = Finding.CONFIRMED
@@ -12,13 +12,22 @@ This is the compact exercise of the legacy procedural-candidate strategy: sample
 by origin / pace, pick an appropriate failure mode per sample, and don't
 materialize until called. Multi-day shifts and live roster editing are just
 repeated generation and ordinary list edits on the offers; no extra machinery.
+
+For large or replayed shifts, :func:`prepare_roster` does the sampling and the
+detached materialization ahead of time on a background thread and keeps the
+results in :data:`roster_cache`, keyed by ``(scenario, seed, case index)``. A
+game built from :meth:`PreparedRoster.game_kwargs` copies cached cases instead
+of rebuilding them.
 """
 from __future__ import annotations
 
 import random
+import threading
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import Field
@@ -43,9 +52,10 @@ from .credentials_game import (
     CredentialCase,
     CredentialCaseResult,
     CredentialDisposition,
+    CredentialPresentationProfile,
     CredentialsGame,
     derive_defects,
-    derive_disposition,
+    disposition_from_defects,
 )
 
 # A target disposition is just a CredentialDisposition: PASS = allow,
@@ -333,6 +343,25 @@ def materialize(
     overrides like whitelist are applied for the game's ``expected_disposition``).
     """
 
+    return _materialize(
+        offer,
+        rules,
+        owner=owner,
+        catalog=catalog,
+        narrative_renderer=narrative_renderer,
+    )[0]
+
+
+def _materialize(
+    offer: ScenarioOffer,
+    rules: Restrictions,
+    *,
+    owner: object | None = None,
+    catalog: TokenCatalog[CredentialDefinition] | None = None,
+    narrative_renderer: (
+        Callable[[CredentialCase, list[CredentialDefect]], CredentialCase] | None
+    ) = None,
+) -> tuple[CredentialCase, list[CredentialDefect], CredentialDisposition]:
     case = build_valid(
         offer.region,
         offer.purpose,
@@ -356,13 +385,204 @@ def materialize(
         case.hidden_facts = offer.hidden_facts_override
     if offer.packet_hidden_facts_override is not None:
         case.packet_hidden_facts = offer.packet_hidden_facts_override
-    actual = derive_disposition(case.packet_manager, rules)
+    # Overrides above are narrative only; the packet still derives as it did.
+    actual = disposition_from_defects(defects)
     if actual is not offer.target_disposition:
         raise ValueError(
             f"Offer for {offer.candidate_name!r} targets {offer.target_disposition.value!r}, "
             f"but its materialized packet derives {actual.value!r}."
         )
-    return case
+    return case, defects, actual
+
+
+@dataclass(frozen=True)
+class PreparedCase:
+    """A detached, verified candidate with its pristine assessment.
+
+    ``defects`` and ``disposition`` are for an empty ``finding_status``. The
+    stored case is never handed out; :meth:`fresh_case` returns a copy so a
+    replay cannot see another run's mediation.
+    """
+
+    offer: ScenarioOffer
+    case: CredentialCase
+    defects: tuple[CredentialDefect, ...]
+    disposition: CredentialDisposition
+    rules: Restrictions
+    presentation: CredentialPresentationProfile
+
+    def fresh_case(self) -> CredentialCase:
+        return self.case.model_copy(deep=True)
+
+
+def prepare_offer(
+    offer: ScenarioOffer,
+    rules: Restrictions,
+    *,
+    presentation: CredentialPresentationProfile | None = None,
+) -> PreparedCase:
+    """Materialize ``offer`` without a graph owner and record its assessment."""
+
+    presentation = presentation or CredentialPresentationProfile()
+    case, defects, disposition = _materialize(
+        offer,
+        rules,
+        narrative_renderer=presentation.render_case,
+    )
+    return PreparedCase(
+        offer=offer,
+        case=case,
+        defects=tuple(defects),
+        disposition=disposition,
+        rules=rules,
+        presentation=presentation,
+    )
+
+
+class RosterCache:
+    """Bounded, thread-safe store of sampled offers and prepared cases.
+
+    Offers are keyed by ``(scenario, seed)`` and cases by ``(scenario, seed,
+    index)``; ``scenario`` must identify the :class:`ShiftSpec` the offers came
+    from. The least recently used cases are dropped past ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._offers: OrderedDict[tuple[str, int], list[ScenarioOffer]] = OrderedDict()
+        self._cases: OrderedDict[tuple[str, int, int], PreparedCase] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cases)
+
+    def offers(self, scenario: str, seed: int) -> list[ScenarioOffer] | None:
+        with self._lock:
+            offers = self._offers.get((scenario, seed))
+            if offers is not None:
+                self._offers.move_to_end((scenario, seed))
+            return offers
+
+    def store_offers(self, scenario: str, seed: int, offers: list[ScenarioOffer]) -> None:
+        with self._lock:
+            self._offers[(scenario, seed)] = offers
+            while len(self._offers) > max(self.maxsize // 16, 1):
+                self._offers.popitem(last=False)
+
+    def get(self, scenario: str, seed: int, index: int) -> PreparedCase | None:
+        with self._lock:
+            prepared = self._cases.get((scenario, seed, index))
+            if prepared is not None:
+                self._cases.move_to_end((scenario, seed, index))
+            return prepared
+
+    def put(self, scenario: str, seed: int, index: int, prepared: PreparedCase) -> None:
+        with self._lock:
+            self._cases[(scenario, seed, index)] = prepared
+            while len(self._cases) > self.maxsize:
+                self._cases.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._offers.clear()
+            self._cases.clear()
+
+
+roster_cache = RosterCache()
+"""Process-wide cache read by :class:`CredentialsGame` for prepared rosters."""
+
+
+@dataclass
+class PreparedRoster:
+    """Offers for one shift plus futures for their prepared cases."""
+
+    scenario: str
+    seed: int
+    offers: list[ScenarioOffer]
+    futures: list[Future[PreparedCase]]
+
+    @property
+    def done(self) -> bool:
+        return all(future.done() for future in self.futures)
+
+    def case(self, index: int) -> PreparedCase:
+        """Block until case ``index`` is prepared and return it."""
+        return self.futures[index].result()
+
+    def wait(self) -> list[PreparedCase]:
+        return [future.result() for future in self.futures]
+
+    def game_kwargs(self) -> dict[str, Any]:
+        """Fields that point a :class:`CredentialsGame` at this roster."""
+        return {
+            "offers": [offer.model_copy(deep=True) for offer in self.offers],
+            "roster_scenario": self.scenario,
+            "roster_seed": self.seed,
+        }
+
+
+def prepare_roster(
+    spec: ShiftSpec,
+    *,
+    scenario: str,
+    presentation: CredentialPresentationProfile | None = None,
+    cache: RosterCache | None = None,
+    executor: Executor | None = None,
+    background: bool = True,
+) -> PreparedRoster:
+    """Sample ``spec`` and prepare every case, reusing anything already cached.
+
+    ``spec.seed`` is required: it is half of the cache key. Cases not in the
+    cache are prepared on ``executor``, else on one short-lived background
+    thread in roster order, or inline when ``background`` is false. Only
+    detached shifts use the prepared cases; eligibility is checked in
+    :meth:`CredentialsGame._prepared_case`. Graph-owned shifts (the in-story
+    shifts whose first turn stalls on materialization) register components in
+    the story graph and still materialize every case themselves.
+    """
+
+    if spec.seed is None:
+        raise ValueError("prepare_roster needs a seeded ShiftSpec")
+    cache = cache if cache is not None else roster_cache
+    presentation = presentation or CredentialPresentationProfile()
+
+    offers = cache.offers(scenario, spec.seed)
+    if offers is None:
+        offers = generate_roster(spec)
+        cache.store_offers(scenario, spec.seed, offers)
+
+    def build(index: int, offer: ScenarioOffer) -> PreparedCase:
+        prepared = prepare_offer(offer, spec.rules, presentation=presentation)
+        cache.put(scenario, spec.seed, index, prepared)
+        return prepared
+
+    def run(jobs: list[tuple[int, ScenarioOffer, Future[PreparedCase]]]) -> None:
+        for index, offer, future in jobs:
+            try:
+                future.set_result(build(index, offer))
+            except Exception as exc:  # surfaced by future.result()
+                future.set_exception(exc)
+
+    futures: list[Future[PreparedCase]] = []
+    pending: list[tuple[int, ScenarioOffer, Future[PreparedCase]]] = []
+    for index, offer in enumerate(offers):
+        prepared = cache.get(scenario, spec.seed, index)
+        if prepared is not None and prepared.rules == spec.rules and prepared.presentation == presentation:
+            future: Future[PreparedCase] = Future()
+            future.set_result(prepared)
+        elif background and executor is not None:
+            future = executor.submit(build, index, offer)
+        else:
+            future = Future()
+            pending.append((index, offer, future))
+        futures.append(future)
+
+    if pending and background:
+        # One short-lived worker, in roster order, so case 0 is ready first.
+        threading.Thread(target=run, args=(pending,), name="credentials-roster", daemon=True).start()
+    elif pending:
+        run(pending)
+    return PreparedRoster(scenario=scenario, seed=spec.seed, offers=list(offers), futures=futures)
 
 
 # Resolve the ``offers: list["ScenarioOffer"]`` forward reference on the game now
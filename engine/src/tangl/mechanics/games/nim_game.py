@@ -7,6 +7,7 @@ slot, and one terminal rule toggle for whether taking the last token wins.
 from __future__ import annotations
 
 import random
+from dataclasses import dataclass
 from typing import ClassVar
 
 from pydantic import Field
@@ -18,6 +19,7 @@ from tangl.vm.ctx import VmPhaseCtx
 from .enums import RoundResult
 from .game import Game
 from .handler import GameHandler
+from .search import SearchModel, SearchNode, search_models, shared_search
 from .strategies import opponent_strategies
 
 _QUANTITY_SELECTOR_MOVE = 0
@@ -232,3 +234,60 @@ def _nim_safe(game: NimGame, **ctx) -> int:
     if preferred in moves:
         return preferred
     return min(moves)
+
+
+NimState = tuple[int, SearchNode]
+
+
+@dataclass(frozen=True)
+class NimSearchModel(SearchModel[NimState, int]):
+    """Alternating one-heap Nim: ``(heap, side to move)``."""
+
+    min_take: int = 1
+    max_take: int = 3
+    last_token_wins: bool = True
+
+    def node(self, state: NimState) -> SearchNode:
+        heap, turn = state
+        if heap < max(self.min_take, 1):
+            return SearchNode.TERMINAL
+        return turn
+
+    def moves(self, state: NimState) -> list[int]:
+        return list(range(self.min_take, min(self.max_take, state[0]) + 1))
+
+    def apply(self, state: NimState, move: int) -> NimState:
+        heap, turn = state
+        return heap - move, SearchNode.OPPONENT if turn is SearchNode.PLAYER else SearchNode.PLAYER
+
+    def value(self, state: NimState) -> float:
+        heap, turn = state
+        if heap > 0:
+            # stranded below min_take; nobody takes the last token
+            return 0.0
+        player_took_last = turn is SearchNode.OPPONENT
+        return 1.0 if player_took_last == self.last_token_wins else -1.0
+
+
+@search_models.register(NimGame)
+def _nim_search_state(game: NimGame) -> tuple[NimSearchModel, NimState]:
+    model = NimSearchModel(game.min_take, game.max_take, game.last_token_wins)
+    return model, (game.heap_size, SearchNode.PLAYER)
+
+
+@opponent_strategies.register("nim_search")
+def _nim_search(game: NimGame, **ctx) -> int:
+    """Solved play; exact as ``opponent_revision_strategy``, where the player's take is known.
+
+    As a pre-selection (before the player moves) it assumes the player's best take.
+    """
+    model, state = _nim_search_state(game)
+    search = shared_search(model)
+    player_take = ctx.get("player_move")
+    if player_take is None:
+        player_take = search.best_move(state)
+    if player_take is not None:
+        reply = search.best_move((game.heap_size - player_take, SearchNode.OPPONENT))
+        if reply is not None:
+            return reply
+    return min(game.get_available_moves(), default=None)
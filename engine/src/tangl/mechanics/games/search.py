@@ -0,0 +1,212 @@
+"""
+Game-tree search over compact game states.
+
+Handlers mutate a full :class:`Game` entity, which is too heavy to copy at
+every node of a search.  A :class:`SearchModel` instead describes a game as
+small hashable states (usually tuples) with pure transitions, and
+:class:`GameTreeSearch` solves it with memoized minimax (opponent nodes) and
+expectimax (chance nodes).  Values are from the player's side: ``1`` a sure
+win, ``-1`` a sure loss, ``0`` a draw or an even chance.
+
+Every solved state goes into a transposition table keyed by the state
+itself, so transpositions (different move orders reaching the same heap, the
+same remaining cards) are evaluated once, and a search reused across turns
+keeps everything it has already solved.
+
+A game opts in by registering a model factory for its game class:
+
+    @search_models.register(NimGame)
+    def _nim_model(game: NimGame) -> tuple[SearchModel, tuple]:
+        return NimSearchModel(...), (game.heap_size, SearchNode.PLAYER)
+
+after which :func:`search_hints` gives exact move evaluations for a live
+game, the ``"search"`` player policy plays it in tournaments, and the game
+module can register a search-backed opponent strategy.
+
+Usage:
+    hints = search_hints(game)         # {move: value} for the player
+    best = max(hints, key=hints.get)
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Generic, TypeVar
+
+from .game import Game
+
+S = TypeVar("S", bound=Hashable)
+M = TypeVar("M")
+
+
+class SearchNode(Enum):
+    """Who acts at a search state."""
+
+    PLAYER = "player"  # maximizes
+    OPPONENT = "opponent"  # minimizes
+    CHANCE = "chance"  # averages over weighted outcomes
+    TERMINAL = "terminal"
+
+
+class SearchModel(ABC, Generic[S, M]):
+    """
+    Pure, hashable description of a game for tree search.
+
+    States must be hashable and cheap to build; transitions return new
+    states rather than mutating.  Models themselves should be hashable
+    (frozen dataclasses work) so searches can be shared between games with
+    the same rules.
+    """
+
+    @abstractmethod
+    def node(self, state: S) -> SearchNode:
+        """Who acts at ``state``."""
+
+    @abstractmethod
+    def moves(self, state: S) -> list[M]:
+        """Moves available at a player or opponent state."""
+
+    @abstractmethod
+    def apply(self, state: S, move: M) -> S:
+        """State after ``move``."""
+
+    def outcomes(self, state: S) -> list[tuple[float, S]]:
+        """Weighted successors of a chance state; weights should sum to 1."""
+        raise NotImplementedError(f"{type(self).__name__} has no chance states")
+
+    @abstractmethod
+    def value(self, state: S) -> float:
+        """Player payoff at a terminal state."""
+
+    def heuristic(self, state: S) -> float:
+        """Estimate for non-terminal states cut off by a depth limit."""
+        return 0.0
+
+
+class GameTreeSearch(Generic[S, M]):
+    """
+    Memoized minimax/expectimax over a :class:`SearchModel`.
+
+    With ``max_depth=None`` values are exact and every solved state is
+    cached.  With a depth limit, cut-off states score
+    :meth:`SearchModel.heuristic` and only exact values are kept in the
+    table, so a deeper search later never reads a shallow estimate.
+    """
+
+    def __init__(self, model: SearchModel[S, M], *, max_depth: int | None = None) -> None:
+        self.model = model
+        self.max_depth = max_depth
+        self.table: dict[S, float] = {}
+        self.nodes = 0
+        self.hits = 0
+
+    def value(self, state: S) -> float:
+        """Player-side value of ``state``."""
+        return self._search(state, self.max_depth)[0]
+
+    def evaluate(self, state: S) -> dict[M, float]:
+        """Value of each move at a player or opponent state (player-side)."""
+        depth = None if self.max_depth is None else self.max_depth - 1
+        return {
+            move: self._search(self.model.apply(state, move), depth)[0]
+            for move in self.model.moves(state)
+        }
+
+    def best_move(self, state: S) -> M | None:
+        """The strongest move for whichever side acts at ``state``."""
+        scores = self.evaluate(state)
+        if not scores:
+            return None
+        if self.model.node(state) is SearchNode.OPPONENT:
+            return min(scores, key=scores.__getitem__)
+        return max(scores, key=scores.__getitem__)
+
+    def _search(self, state: S, depth: int | None) -> tuple[float, bool]:
+        """Return ``(value, exact)``."""
+        cached = self.table.get(state)
+        if cached is not None:
+            self.hits += 1
+            return cached, True
+        self.nodes += 1
+
+        model = self.model
+        node = model.node(state)
+        if node is SearchNode.TERMINAL:
+            value, exact = model.value(state), True
+        elif depth is not None and depth <= 0:
+            return model.heuristic(state), False
+        else:
+            child_depth = None if depth is None else depth - 1
+            if node is SearchNode.CHANCE:
+                value, exact = 0.0, True
+                for weight, outcome in model.outcomes(state):
+                    child, child_exact = self._search(outcome, child_depth)
+                    value += weight * child
+                    exact = exact and child_exact
+            else:
+                results = [self._search(model.apply(state, move), child_depth) for move in model.moves(state)]
+                if not results:
+                    value, exact = model.value(state), True
+                else:
+                    pick = max if node is SearchNode.PLAYER else min
+                    value = pick(result[0] for result in results)
+                    exact = all(result[1] for result in results)
+
+        if exact:
+            self.table[state] = value
+        return value, exact
+
+
+class SearchModelRegistry:
+    """Maps game classes to ``game -> (model, state)`` factories."""
+
+    def __init__(self) -> None:
+        self._factories: dict[type[Game], Callable[[Any], tuple[SearchModel, Hashable]]] = {}
+
+    def register(self, game_cls: type[Game]):
+        def decorator(func: Callable[[Any], tuple[SearchModel, Hashable]]):
+            self._factories[game_cls] = func
+            return func
+
+        return decorator
+
+    def get(self, game_cls: type[Game]) -> Callable[[Any], tuple[SearchModel, Hashable]] | None:
+        for klass in game_cls.__mro__:
+            factory = self._factories.get(klass)
+            if factory is not None:
+                return factory
+        return None
+
+    def model_for(self, game: Game) -> tuple[SearchModel, Hashable]:
+        """Return ``(model, state)`` for a live game; raises ``KeyError`` if unsupported."""
+        factory = self.get(type(game))
+        if factory is None:
+            raise KeyError(f"No search model registered for {type(game).__name__}")
+        return factory(game)
+
+
+search_models = SearchModelRegistry()
+
+
+@lru_cache(maxsize=64)
+def shared_search(model: SearchModel) -> GameTreeSearch:
+    """One exact search (and transposition table) per distinct model."""
+    return GameTreeSearch(model)
+
+
+def search_hints(game: Game) -> dict[Any, float]:
+    """Exact player-side value of each move available in ``game``."""
+    model, state = search_models.model_for(game)
+    if model.node(state) is not SearchNode.PLAYER:
+        return {}
+    return shared_search(model).evaluate(state)
+
+
+def search_best_move(game: Game) -> Any:
+    """The player's strongest move in ``game``, or ``None`` when it has none."""
+    model, state = search_models.model_for(game)
+    if model.node(state) is not SearchNode.PLAYER:
+        return None
+    return shared_search(model).best_move(state)
@@ -0,0 +1,285 @@
+"""
+Headless self-play tournaments for game balance tuning.
+
+Runs ``GameHandler.setup`` / ``receive_move`` loops directly, with no story
+graph or VM, so a strategy pairing can be played thousands of times per
+second.
+
+Player-side moves come from a *player policy*.  Policy names are looked up
+in :data:`player_policies` first; any other name is treated as an opponent
+strategy and played from the player's seat.  That works for strategies that
+only read shared game state (``rps_rock``, ``nim_safe``); strategies that
+read ``history`` from the opponent's perspective (``rps_tit_for_tat``) see
+their own previous move instead of their rival's.
+
+Each game is seeded: the global :mod:`random` state (which opponent
+strategies use), the player policy's RNG and any ``shuffle_seed`` field on
+the game are all derived from the seed, so a tournament is reproducible with or without a process pool.
+
+Usage:
+    report = run_tournament(
+        RpsGameHandler,
+        strategies=["rps_random", "rps_rock", "rps_cycle"],
+        seeds=1000,
+        workers=4,
+    )
+    report.get("rps_rock", "rps_cycle").win_rate
+"""
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+import multiprocessing
+import random
+import time
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from .enums import GameResult
+from .game import Game
+from .handler import GameHandler
+from .search import search_best_move
+from .strategies import StrategyRegistry, opponent_strategies
+
+
+player_policies: StrategyRegistry = StrategyRegistry(label="player_policies")
+"""
+Registry for tournament player move selection.
+
+Policies should have signature:
+    (game: Game, handler: GameHandler, rng: random.Random) -> Move
+"""
+
+
+@player_policies.register("random")
+def _player_random(game: Game, handler: GameHandler, rng: random.Random) -> Any:
+    """Uniformly random available move."""
+    return rng.choice(handler.get_available_moves(game))
+
+
+@player_policies.register("first")
+def _player_first(game: Game, handler: GameHandler, rng: random.Random) -> Any:
+    """Always the first available move."""
+    return handler.get_available_moves(game)[0]
+
+
+@player_policies.register("last")
+def _player_last(game: Game, handler: GameHandler, rng: random.Random) -> Any:
+    """Always the last available move."""
+    return handler.get_available_moves(game)[-1]
+
+
+@player_policies.register("search")
+def _player_search(game: Game, handler: GameHandler, rng: random.Random) -> Any:
+    """Solved play via the game's registered search model."""
+    move = search_best_move(game)
+    return move if move is not None else handler.get_available_moves(game)[0]
+
+
+def resolve_player_policy(name: str) -> Callable[[Game, GameHandler, random.Random], Any]:
+    """Return the player policy for ``name``, adapting opponent strategies."""
+    policy = player_policies.get(name)
+    if policy is not None:
+        return policy
+    strategy = opponent_strategies.get(name)
+    if strategy is None:
+        raise KeyError(f"No player policy or opponent strategy named: {name}")
+
+    def _from_opponent_strategy(game: Game, handler: GameHandler, rng: random.Random) -> Any:
+        moves = handler.get_available_moves(game)
+        move = strategy(game)
+        # fall back when the strategy's move is not legal for the player
+        return move if move in moves else rng.choice(moves)
+
+    return _from_opponent_strategy
+
+
+@dataclass(frozen=True)
+class MatchupStats:
+    """Aggregated results of one player policy against one opponent strategy."""
+
+    player: str
+    opponent: str
+    games: int = 0
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    unfinished: int = 0
+    rounds: int = 0
+    length_histogram: dict[int, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def loss_rate(self) -> float:
+        return self.losses / self.games if self.games else 0.0
+
+    @property
+    def draw_rate(self) -> float:
+        return self.draws / self.games if self.games else 0.0
+
+    @property
+    def mean_length(self) -> float:
+        return self.rounds / self.games if self.games else 0.0
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.rounds / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass(frozen=True)
+class TournamentReport:
+    """Every matchup of a tournament, in player-major order."""
+
+    game: str
+    matchups: list[MatchupStats]
+    elapsed: float = 0.0
+
+    def get(self, player: str, opponent: str) -> MatchupStats:
+        for matchup in self.matchups:
+            if matchup.player == player and matchup.opponent == opponent:
+                return matchup
+        raise KeyError((player, opponent))
+
+    @property
+    def games(self) -> int:
+        return sum(matchup.games for matchup in self.matchups)
+
+    @property
+    def rounds(self) -> int:
+        return sum(matchup.rounds for matchup in self.matchups)
+
+    @property
+    def rounds_per_second(self) -> float:
+        """Wall-clock throughput, including any pool overhead."""
+        return self.rounds / self.elapsed if self.elapsed else 0.0
+
+    def win_rates(self) -> dict[tuple[str, str], float]:
+        return {(m.player, m.opponent): m.win_rate for m in self.matchups}
+
+
+def play_game(
+    handler: GameHandler,
+    game: Game,
+    policy: Callable[[Game, GameHandler, random.Random], Any],
+    *,
+    rng: random.Random,
+    max_rounds: int = 1_000,
+) -> tuple[GameResult, int]:
+    """Play ``game`` to a terminal result (or ``max_rounds``) and return ``(result, rounds)``."""
+    handler.setup(game)
+    while not game.is_terminal and game.round < max_rounds:
+        if not handler.get_available_moves(game):
+            break
+        handler.receive_move(game, policy(game, handler, rng))
+    return game.result, game.round
+
+
+def play_matchup(
+    handler_cls: type[GameHandler],
+    player: str,
+    opponent: str,
+    seeds: Iterable[int],
+    *,
+    game_kwargs: Mapping[str, Any] | None = None,
+    max_rounds: int = 1_000,
+) -> MatchupStats:
+    """Play one game per seed for a single pairing."""
+    handler = handler_cls()
+    policy = resolve_player_policy(player)
+    kwargs = {**(game_kwargs or {}), "opponent_strategy": opponent}
+    # games with their own RNG seed (nim, blackjack) follow the tournament seed
+    # unless the caller pinned one
+    seeds_game = "shuffle_seed" in handler_cls.game_cls.model_fields and "shuffle_seed" not in kwargs
+    outcomes: Counter[GameResult] = Counter()
+    lengths: Counter[int] = Counter()
+    rounds = 0
+    games = 0
+
+    saved_state = random.getstate()
+    started = time.perf_counter()
+    try:
+        for seed in seeds:
+            random.seed(seed)
+            if seeds_game:
+                kwargs["shuffle_seed"] = seed
+            game = handler_cls.game_cls(**kwargs)
+            result, length = play_game(
+                handler,
+                game,
+                policy,
+                rng=random.Random(seed),
+                max_rounds=max_rounds,
+            )
+            outcomes[result] += 1
+            lengths[length] += 1
+            rounds += length
+            games += 1
+    finally:
+        random.setstate(saved_state)
+
+    return MatchupStats(
+        player=player,
+        opponent=opponent,
+        games=games,
+        wins=outcomes[GameResult.WIN],
+        losses=outcomes[GameResult.LOSE],
+        draws=outcomes[GameResult.DRAW],
+        unfinished=outcomes[GameResult.IN_PROCESS],
+        rounds=rounds,
+        length_histogram=dict(sorted(lengths.items())),
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def run_tournament(
+    handler_cls: type[GameHandler],
+    *,
+    strategies: Sequence[str],
+    player_strategies: Sequence[str] | None = None,
+    seeds: Iterable[int] | int = 100,
+    game_kwargs: Mapping[str, Any] | None = None,
+    workers: int = 1,
+    max_rounds: int = 1_000,
+) -> TournamentReport:
+    """
+    Play every player policy against every opponent strategy.
+
+    ``player_strategies`` defaults to ``strategies``, giving a full
+    round-robin including self-play.  ``seeds`` may be a count, meaning
+    ``range(seeds)``; each pairing plays one game per seed.  With
+    ``workers > 1`` pairings are spread over a process pool, so
+    ``handler_cls`` and ``game_kwargs`` must be picklable.
+    """
+    seeds = list(range(seeds)) if isinstance(seeds, int) else list(seeds)
+    pairings = list(product(player_strategies or strategies, strategies))
+    jobs = [(handler_cls, player, opponent, seeds, game_kwargs, max_rounds) for player, opponent in pairings]
+
+    started = time.perf_counter()
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context()) as pool:
+            matchups = list(pool.map(_play_job, jobs))
+    else:
+        matchups = [_play_job(job) for job in jobs]
+
+    return TournamentReport(
+        game=handler_cls.game_cls.__name__,
+        matchups=matchups,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def _play_job(job: tuple) -> MatchupStats:
+    handler_cls, player, opponent, seeds, game_kwargs, max_rounds = job
+    return play_matchup(
+        handler_cls,
+        player,
+        opponent,
+        seeds,
+        game_kwargs=game_kwargs,
+        max_rounds=max_rounds,
+    )
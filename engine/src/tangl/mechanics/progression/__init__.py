@@ -18,7 +18,7 @@ from .handlers.linear import LinearStatHandler
 from .handlers.logint import LogIntStatHandler
 from .handlers.probit import ProbitStatHandler
 from .measures import Quality
-from .outcomes import Outcome, sample_outcome
+from .outcomes import Outcome, outcome_distribution, sample_outcome
 from .effects import (
     SituationalEffect,
     aggregate_modifiers,
@@ -37,10 +37,13 @@ from .stats.stat import Stat
 from .context.stat_context import StatContext
 from .tasks import ResolutionSnapshot, Task, compute_delta, inspect_resolution, resolve_task
 from .challenges import (
+    ChallengeOdds,
     ChallengePayout,
     ChallengeResult,
     StatChallenge,
     StatRequirement,
+    challenge_odds,
+    challenge_odds_many,
     resolve_challenge,
 )
 from .story_blocks import HasStatChallenge, HasTraining
@@ -49,6 +52,7 @@ __all__ = [
     "Quality",
     "Outcome",
     "sample_outcome",
+    "outcome_distribution",
     "Stat",
     "StatHandler",
     "ProbitStatHandler",
@@ -81,6 +85,9 @@ __all__ = [
     "ChallengePayout",
     "ChallengeResult",
     "resolve_challenge",
+    "ChallengeOdds",
+    "challenge_odds",
+    "challenge_odds_many",
     "project_quality",
     "project_quality_label",
     "project_outcome_label",
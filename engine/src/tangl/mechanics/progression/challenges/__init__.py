@@ -2,12 +2,18 @@ from __future__ import annotations
 
 from .challenge import ChallengePayout, StatChallenge, StatRequirement
 from .result import ChallengeResult
-from .resolution import resolve_challenge
+from .odds import ChallengeOdds, challenge_odds, challenge_odds_many
+from .resolution import PreparedChallenge, prepare_challenge, resolve_challenge
 
 __all__ = [
+    "ChallengeOdds",
     "ChallengePayout",
     "ChallengeResult",
+    "PreparedChallenge",
     "StatChallenge",
     "StatRequirement",
+    "challenge_odds",
+    "challenge_odds_many",
+    "prepare_challenge",
     "resolve_challenge",
 ]
@@ -0,0 +1,147 @@
+"""Roll-free previews of stat challenge outcomes.
+
+:func:`resolve_challenge` samples one roll and mutates wallets and stats.
+Choice hints only need the odds, and :func:`~tangl.mechanics.progression.outcomes.sample_outcome`
+maps a uniform roll onto outcome bands, so the full distribution is exact
+and cheap: one handler ``likelihood`` call per challenge.  Donor effects and
+tags are gathered once per batch instead of once per challenge.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from ..definition.stat_system import StatSystemDefinition
+from ..effects import EffectDonor, SituationalEffect, TagDonor, gather_donor_effects, gather_donor_tags
+from ..entity.has_stats import HasStats
+from ..outcomes import Outcome, outcome_distribution
+from .challenge import StatChallenge
+from .resolution import PreparedChallenge, prepare_challenge
+
+
+@dataclass(frozen=True)
+class ChallengeOdds:
+    """Outcome probabilities and expected wallet movement for one challenge."""
+
+    challenge_name: str | None
+    domain: str | None
+    success_likelihood: float
+    probabilities: dict[Outcome, float]
+    cost: dict[str, int] = field(default_factory=dict)
+    expected_payout: dict[str, float] = field(default_factory=dict)
+    unmet_requirements: frozenset[str] = frozenset()
+
+    @property
+    def available(self) -> bool:
+        return not self.unmet_requirements
+
+    @property
+    def success_chance(self) -> float:
+        """Probability of at least a basic success."""
+        return self.probabilities.get(Outcome.SUCCESS, 0.0) + self.probabilities.get(
+            Outcome.MAJOR_SUCCESS, 0.0
+        )
+
+    @property
+    def expected_wallet_delta(self) -> dict[str, float]:
+        """Expected payout minus the (certain) cost, per currency."""
+        delta = dict(self.expected_payout)
+        for currency, amount in self.cost.items():
+            delta[currency] = delta.get(currency, 0.0) - amount
+        return delta
+
+
+def odds_from_prepared(prepared: PreparedChallenge) -> ChallengeOdds:
+    """Summarize an already-prepared challenge without rolling."""
+    challenge = prepared.challenge
+    if prepared.unmet:
+        return ChallengeOdds(
+            challenge_name=challenge.name,
+            domain=prepared.domain,
+            success_likelihood=0.0,
+            probabilities={},
+            cost=dict(prepared.cost),
+            unmet_requirements=frozenset(prepared.unmet),
+        )
+
+    snapshot = prepared.snapshot
+    likelihood = snapshot.handler.likelihood(snapshot.delta)
+    if prepared.forced_outcome is not None:
+        probabilities = {outcome: 0.0 for outcome in Outcome}
+        probabilities[prepared.forced_outcome] = 1.0
+    else:
+        probabilities = outcome_distribution(likelihood)
+
+    expected: dict[str, float] = {}
+    for outcome, probability in probabilities.items():
+        if not probability:
+            continue
+        for currency, amount in prepared.payout_for(outcome).items():
+            expected[currency] = expected.get(currency, 0.0) + probability * amount
+
+    return ChallengeOdds(
+        challenge_name=challenge.name,
+        domain=prepared.domain,
+        success_likelihood=likelihood,
+        probabilities=probabilities,
+        cost=dict(prepared.cost),
+        expected_payout=expected,
+    )
+
+
+def challenge_odds(
+    challenge: StatChallenge,
+    entity: HasStats,
+    *,
+    system: StatSystemDefinition | None = None,
+    effects: Iterable[SituationalEffect] = (),
+    context_tags: Iterable[str] | None = None,
+    effect_donors: Iterable[EffectDonor] = (),
+    tag_donors: Iterable[TagDonor] = (),
+    defender: HasStats | None = None,
+) -> ChallengeOdds:
+    """Preview one challenge with the same inputs :func:`resolve_challenge` takes."""
+    return challenge_odds_many(
+        [challenge],
+        entity,
+        system=system,
+        effects=effects,
+        context_tags=context_tags,
+        effect_donors=effect_donors,
+        tag_donors=tag_donors,
+        defender=defender,
+    )[0]
+
+
+def challenge_odds_many(
+    challenges: Iterable[StatChallenge],
+    entity: HasStats,
+    *,
+    system: StatSystemDefinition | None = None,
+    effects: Iterable[SituationalEffect] = (),
+    context_tags: Iterable[str] | None = None,
+    effect_donors: Iterable[EffectDonor] = (),
+    tag_donors: Iterable[TagDonor] = (),
+    defender: HasStats | None = None,
+) -> list[ChallengeOdds]:
+    """Preview many challenges for one entity, sharing the donor effect stack."""
+    effects = list(effects)
+    context_tags = set(context_tags or ())
+    donor_effects = gather_donor_effects(effect_donors)
+    donor_tags = gather_donor_tags(tag_donors)
+    return [
+        odds_from_prepared(
+            prepare_challenge(
+                challenge,
+                entity,
+                system=system,
+                effects=effects,
+                context_tags=context_tags,
+                defender=defender,
+                donor_effects=donor_effects,
+                donor_tags=donor_tags,
+            )
+        )
+        for challenge in challenges
+    ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
 from math import ceil
 
 from ..definition.stat_system import StatSystemDefinition
@@ -14,7 +15,8 @@ from ..effects import (
 from ..entity.has_stats import HasStats
 from ..growth import GrowthHandler
 from ..handlers import ProbitStatHandler, StatHandler, get_handler_cls
-from ..tasks import inspect_resolution, resolve_task
+from ..outcomes import Outcome
+from ..tasks import ResolutionSnapshot, Task, inspect_resolution, resolve_task
 from ..tasks.resolution import HasWalletLike
 from .challenge import StatChallenge
 from .result import ChallengeResult
@@ -110,26 +112,66 @@ def _scale_wallet(
     return scaled
 
 
-def resolve_challenge(
+@dataclass(frozen=True)
+class PreparedChallenge:
+    """Everything about a challenge that does not depend on the roll.
+
+    Built once by :func:`prepare_challenge` and shared by
+    :func:`resolve_challenge` and the odds preview.
+    """
+
+    challenge: StatChallenge
+    system: StatSystemDefinition
+    domain: str | None
+    handler: type[StatHandler]
+    tags: set[str]
+    effects: list[SituationalEffect]
+    tag_effects: list[SituationalEffect]
+    unmet: set[str]
+    cost: dict[str, int]
+    task: Task | None = None
+    snapshot: ResolutionSnapshot | None = None
+    forced_outcome: Outcome | None = None
+
+    def payout_for(self, outcome: Outcome) -> dict[str, int]:
+        """Return the remapped and scaled payout for one outcome."""
+        reward_remaps = [
+            effect.reward_currency_remap
+            for effect in self.tag_effects
+            if effect.reward_currency_remap
+        ]
+        return _scale_wallet(
+            _remap_wallet(self.challenge.payout.reward_for(outcome), reward_remaps),
+            _sum_modifier(self.tag_effects, "reward_modifier"),
+        )
+
+
+def prepare_challenge(
     challenge: StatChallenge,
     entity: HasStats,
     *,
     system: StatSystemDefinition | None = None,
-    wallet: HasWalletLike | None = None,
     effects: Iterable[SituationalEffect] = (),
     context_tags: Iterable[str] | None = None,
     effect_donors: Iterable[EffectDonor] = (),
     tag_donors: Iterable[TagDonor] = (),
     defender: HasStats | None = None,
-    roll: float | None = None,
-    growth_handler: GrowthHandler | None = None,
-    apply_growth: bool = True,
-) -> ChallengeResult:
-    """Resolve one authored stat challenge end to end."""
+    donor_effects: list[SituationalEffect] | None = None,
+    donor_tags: set[str] | None = None,
+) -> PreparedChallenge:
+    """Resolve domain, handler, effects, cost and delta for one challenge.
+
+    ``donor_effects`` / ``donor_tags`` accept already-gathered donor output so
+    callers previewing many challenges against one entity gather it once.
+    When requirements are unmet the returned preparation stops before the
+    task and snapshot, which stay ``None``.
+    """
     system = system or entity.stat_system
 
-    donor_effects = gather_donor_effects(effect_donors)
-    donor_tags = gather_donor_tags(tag_donors)
+    if donor_effects is None:
+        donor_effects = gather_donor_effects(effect_donors)
+    if donor_tags is None:
+        donor_tags = gather_donor_tags(tag_donors)
     effective_tags = set(challenge.tags)
     effective_tags.update(context_tags or ())
     effective_tags.update(donor_tags)
@@ -142,27 +184,34 @@ def resolve_challenge(
         tags=effective_tags,
     )
     handler = _resolve_handler(entity, system=system, domain=effective_domain)
-
-    unmet = challenge.unmet_requirements(entity, handler=handler)
-    if unmet:
-        raise ValueError(f"Challenge requirements not satisfied: {sorted(unmet)}")
-
     tag_effects = _tag_eligible_effects(all_effects, tags=effective_tags)
-    cost_remaps = [effect.cost_currency_remap for effect in tag_effects if effect.cost_currency_remap]
-    reward_remaps = [
-        effect.reward_currency_remap
-        for effect in tag_effects
-        if effect.reward_currency_remap
-    ]
 
+    cost_remaps = [effect.cost_currency_remap for effect in tag_effects if effect.cost_currency_remap]
     effective_cost = _scale_wallet(
         _remap_wallet(challenge.cost, cost_remaps),
         _sum_modifier(tag_effects, "cost_modifier"),
         debit_safe=True,
     )
-
-    if effective_cost and wallet is None:
-        raise ValueError("Challenge cost requires a wallet-like target")
+    # Most-severe wins so a prohibition beats a blessing.
+    forced = [
+        effect.forced_outcome
+        for effect in tag_effects
+        if effect.forced_outcome is not None
+    ]
+    prepared = PreparedChallenge(
+        challenge=challenge,
+        system=system,
+        domain=effective_domain,
+        handler=handler,
+        tags=effective_tags,
+        effects=all_effects,
+        tag_effects=tag_effects,
+        unmet=set(challenge.unmet_requirements(entity, handler=handler)),
+        cost=effective_cost,
+        forced_outcome=min(forced) if forced else None,
+    )
+    if prepared.unmet:
+        return prepared
 
     difficulty = challenge.normalized_difficulty(handler=handler, domain=effective_domain)
     if defender is not None:
@@ -176,7 +225,6 @@ def resolve_challenge(
         cost=effective_cost,
         tags=effective_tags,
     )
-
     snapshot = inspect_resolution(
         task,
         entity,
@@ -185,13 +233,51 @@ def resolve_challenge(
         context_tags=effective_tags,
         handler=handler,
     )
-    outcome = resolve_task(
-        task,
+    return replace(prepared, task=task, snapshot=snapshot)
+
+
+def resolve_challenge(
+    challenge: StatChallenge,
+    entity: HasStats,
+    *,
+    system: StatSystemDefinition | None = None,
+    wallet: HasWalletLike | None = None,
+    effects: Iterable[SituationalEffect] = (),
+    context_tags: Iterable[str] | None = None,
+    effect_donors: Iterable[EffectDonor] = (),
+    tag_donors: Iterable[TagDonor] = (),
+    defender: HasStats | None = None,
+    roll: float | None = None,
+    growth_handler: GrowthHandler | None = None,
+    apply_growth: bool = True,
+) -> ChallengeResult:
+    """Resolve one authored stat challenge end to end."""
+    prepared = prepare_challenge(
+        challenge,
         entity,
         system=system,
-        effects=all_effects,
-        context_tags=effective_tags,
-        handler=handler,
+        effects=effects,
+        context_tags=context_tags,
+        effect_donors=effect_donors,
+        tag_donors=tag_donors,
+        defender=defender,
+    )
+    if prepared.unmet:
+        raise ValueError(f"Challenge requirements not satisfied: {sorted(prepared.unmet)}")
+
+    effective_cost = prepared.cost
+    if effective_cost and wallet is None:
+        raise ValueError("Challenge cost requires a wallet-like target")
+
+    tag_effects = prepared.tag_effects
+    snapshot = prepared.snapshot
+    outcome = resolve_task(
+        prepared.task,
+        entity,
+        system=prepared.system,
+        effects=prepared.effects,
+        context_tags=prepared.tags,
+        handler=prepared.handler,
         wallet=wallet,
         auto_spend=True,
         auto_reward=False,
@@ -200,20 +286,11 @@ def resolve_challenge(
 
     # A situational ``forced_outcome`` is a hard authored override of the
     # roll. Cost is still paid (the attempt happened); payout and growth
-    # follow the forced outcome. Most-severe wins so a prohibition beats a
-    # blessing.
-    forced = [
-        effect.forced_outcome
-        for effect in tag_effects
-        if effect.forced_outcome is not None
-    ]
-    if forced:
-        outcome = min(forced)
+    # follow the forced outcome.
+    if prepared.forced_outcome is not None:
+        outcome = prepared.forced_outcome
 
-    payout = _scale_wallet(
-        _remap_wallet(challenge.payout.reward_for(outcome), reward_remaps),
-        _sum_modifier(tag_effects, "reward_modifier"),
-    )
+    payout = prepared.payout_for(outcome)
     if wallet is not None and payout:
         wallet.earn(payout)
 
@@ -228,7 +305,7 @@ def resolve_challenge(
 
     result = ChallengeResult(
         challenge_name=challenge.name,
-        domain=effective_domain,
+        domain=prepared.domain,
         effective_competency=snapshot.effective_competency,
         effective_difficulty=snapshot.effective_difficulty,
         delta=snapshot.delta,
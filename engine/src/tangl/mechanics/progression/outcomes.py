@@ -57,3 +57,27 @@ def sample_outcome(
     if roll < high:
         return Outcome.FAILURE
     return Outcome.DISASTER
+
+
+def outcome_distribution(
+    p_success: float,
+    *,
+    margin: float = 0.15,
+) -> dict[Outcome, float]:
+    """
+    Exact outcome probabilities for :func:`sample_outcome` under a uniform roll.
+
+    Each band of the roll carved out by ``sample_outcome`` maps to one
+    outcome, so the probabilities are just the clipped band widths.
+    """
+    if not 0.0 <= p_success <= 1.0:
+        raise ValueError(f"p_success must be in [0, 1], got {p_success!r}")
+
+    low = max(0.0, p_success - margin)
+    high = min(1.0, p_success + margin)
+    return {
+        Outcome.MAJOR_SUCCESS: low,
+        Outcome.SUCCESS: p_success - low,
+        Outcome.FAILURE: high - p_success,
+        Outcome.DISASTER: 1.0 - high,
+    }
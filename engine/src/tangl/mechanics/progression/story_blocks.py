@@ -21,18 +21,21 @@ bespoke actor lookup.
 
 from typing import Any, ClassVar
 
+from tangl.core.behavior import Priority
 from tangl.vm import (
+    on_compose_journal,
     on_gather_ns,
     on_journal,
     on_update,
 )
 
-from .challenges import StatChallenge, resolve_challenge
-from .effects.donors import EffectDonor, TagDonor
+from .challenges import StatChallenge, prepare_challenge, resolve_challenge
+from .challenges.odds import odds_from_prepared
+from .effects.donors import EffectDonor, TagDonor, gather_donor_effects, gather_donor_tags
 from .entity.has_stats import HasStats
 from .entity.has_wallet import HasWallet
 from .growth import GrowthHandler, LinearGrowthHandler
-from .outcomes import Outcome
+from .outcomes import Outcome, sample_outcome
 
 
 class HasStatChallenge:
@@ -167,6 +170,63 @@ def journal_stat_challenge(
     return [ContentFragment(content=f"{name}: {quality}.")]
 
 
+@on_compose_journal(priority=Priority.LATE)
+def annotate_challenge_choices(*, caller, ctx, fragments, **_kw):
+    """Put the success chance of challenge blocks on the choices that lead there.
+
+    Donor effects and tags are gathered once for all choices in the step.
+    Blocks with a pinned ``_roll`` report the certain result of that roll
+    (``1.0`` or ``0.0``) rather than the odds of a fresh one.
+    """
+    from tangl.journal.fragments import ChoiceFragment
+    from tangl.journal.intent import UIHints
+
+    graph = getattr(caller, "graph", None)
+    if graph is None:
+        return None
+    targets: dict[int, HasStatChallenge] = {}
+    for index, fragment in enumerate(fragments):
+        if not isinstance(fragment, ChoiceFragment) or not fragment.available:
+            continue
+        edge = graph.get(fragment.edge_id)
+        successor = getattr(edge, "successor", None)
+        if isinstance(successor, HasStatChallenge):
+            targets[index] = successor
+    if not targets:
+        return None
+    actor = _actor(caller, ctx)
+    if actor is None:
+        return None
+
+    effect_donors, tag_donors = _donors(actor)
+    donor_effects = gather_donor_effects(effect_donors)
+    donor_tags = gather_donor_tags(tag_donors)
+    composed = list(fragments)
+    for index, block in targets.items():
+        prepared = prepare_challenge(
+            block._challenge,
+            actor,
+            context_tags=getattr(block, "tags", None),
+            donor_effects=donor_effects,
+            donor_tags=donor_tags,
+        )
+        odds = odds_from_prepared(prepared)
+        if not odds.available:
+            continue
+        success_chance = odds.success_chance
+        if block._roll is not None:
+            outcome = prepared.forced_outcome
+            if outcome is None:
+                outcome = sample_outcome(odds.success_likelihood, roll=block._roll)
+            success_chance = 1.0 if outcome >= Outcome.SUCCESS else 0.0
+        fragment = composed[index]
+        hints = fragment.ui_hints or UIHints()
+        composed[index] = fragment.model_copy(
+            update={"ui_hints": hints.model_copy(update={"success_chance": round(success_chance, 3)})}
+        )
+    return composed
+
+
 @on_update(wants_caller_kind=HasTraining, wants_exact_kind=False)
 def apply_training(
     cursor: HasTraining | None = None,
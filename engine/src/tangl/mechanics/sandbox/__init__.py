@@ -52,6 +52,7 @@ from .handlers import (
     project_sandbox_wait,
     sandbox_player_assets,
     sandbox_present_mobs,
+    sandbox_presence_timeline,
     sandbox_projection_state,
     sandbox_scopes,
 )
@@ -63,7 +64,7 @@ from .location import (
     SandboxLocation,
     normalize_sandbox_direction,
 )
-from .schedule import Schedule, ScheduleEntry, ScheduledEvent, ScheduledPresence
+from .schedule import Schedule, ScheduleEntry, ScheduleIndex, ScheduledEvent, ScheduledPresence
 from .scope import SandboxInventory, SandboxScope
 from .time import (
     SandboxClockPolicy,
@@ -126,6 +127,7 @@ __all__ = [
     "SandboxVisibilityRule",
     "Schedule",
     "ScheduleEntry",
+    "ScheduleIndex",
     "ScheduledEvent",
     "ScheduledPresence",
     "SwitchableFacet",
@@ -150,6 +152,7 @@ __all__ = [
     "project_sandbox_wait",
     "sandbox_player_assets",
     "sandbox_present_mobs",
+    "sandbox_presence_timeline",
     "sandbox_projection_state",
     "sandbox_scopes",
 ]
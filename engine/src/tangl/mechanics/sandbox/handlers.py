@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
-from typing import Any, Protocol, cast, runtime_checkable
+from typing import Any, Protocol, TypeVar, cast, runtime_checkable
 
 from tangl.core import Graph, Selector, Token
 from tangl.core.behavior import Priority
@@ -33,19 +33,24 @@ from .location import (
     normalize_sandbox_direction,
 )
 from .mob import SandboxMob
-from .schedule import ScheduledEvent, ScheduledPresence
+from .schedule import ScheduledEvent
 from .scope import SandboxScope
 from .time import (
     SandboxClockPolicy,
     SandboxTickEvent,
     SandboxTickResult,
     SandboxTimeCost,
+    WorldTime,
     advance_world_turn,
     current_world_time,
+    get_world_turn,
 )
 from .visibility import SandboxProjectionState, SandboxVisibilityRule
 
 
+_T = TypeVar("_T")
+
+
 @runtime_checkable
 class SandboxEventProvider(Protocol):
     """Concept provider that can donate sandbox events."""
@@ -446,7 +451,7 @@ def _scheduled_event_contributions(
                 for event in fixture.scheduled_events
             )
     if not projection_state.suppress_location_description:
-        for mob in _present_mobs(location):
+        for mob in _present_mobs(location, ctx):
             mob_label = mob.get_label()
             contributions.extend(
                 ScheduledEventContribution(
@@ -495,20 +500,16 @@ def _scheduled_event_contributions(
     return contributions
 
 
-def _scheduled_presence(location: SandboxLocation) -> list[ScheduledPresence]:
-    presence: list[ScheduledPresence] = []
-    for scope in reversed(_sandbox_scopes(location)):
-        presence.extend(scope.scheduled_presence)
-    return presence
+def _actors_present(location: SandboxLocation, ctx: VmPhaseCtx | None = None) -> list[str]:
+    return _projection_memo(location, ctx, "actors", lambda: _compute_actors_present(location))
 
 
-def _actors_present(location: SandboxLocation) -> list[str]:
+def _compute_actors_present(location: SandboxLocation) -> list[str]:
     world_time = current_world_time(location)
     location_label = location.get_label()
     actors: list[str] = []
-    for entry in _scheduled_presence(location):
-        if entry.matches(world_time, location=location_label):
-            actors.append(entry.actor)
+    for scope in reversed(_sandbox_scopes(location)):
+        actors.extend(entry.actor for entry in scope.presence_index.placed(world_time, location_label))
     for mob in _sandbox_mobs(location):
         mob_label = mob.get_label()
         if mob_label and mob.present_at(location_label, world_time):
@@ -523,7 +524,11 @@ def _sandbox_mobs(location: SandboxLocation) -> list[SandboxMob]:
     return mobs
 
 
-def _present_mobs(location: SandboxLocation) -> list[SandboxMob]:
+def _present_mobs(location: SandboxLocation, ctx: VmPhaseCtx | None = None) -> list[SandboxMob]:
+    return _projection_memo(location, ctx, "mobs", lambda: _compute_present_mobs(location))
+
+
+def _compute_present_mobs(location: SandboxLocation) -> list[SandboxMob]:
     world_time = current_world_time(location)
     location_label = location.get_label()
     return [
@@ -538,6 +543,31 @@ def sandbox_present_mobs(location: SandboxLocation) -> list[SandboxMob]:
     return _present_mobs(location)
 
 
+def sandbox_presence_timeline(
+    scope: SandboxScope,
+    turns: Iterable[int],
+) -> dict[int, dict[str, list[str]]]:
+    """Return who is where at each world turn, as ``{turn: {location: [actor]}}``.
+
+    Combines the scope's scheduled presence with its mobs' schedules.
+    Presence declared without a location is omitted.
+    """
+    timeline: dict[int, dict[str, list[str]]] = {}
+    for turn in turns:
+        world_time = WorldTime.from_turn(turn)
+        where: dict[str, list[str]] = {}
+        for entry in scope.presence_index.at(world_time):
+            if entry.location is not None:
+                where.setdefault(entry.location, []).append(entry.actor)
+        for mob in scope.mobs:
+            mob_label = mob.get_label()
+            mob_location = mob.scheduled_location(world_time)
+            if mob_label and mob_location:
+                where.setdefault(mob_location, []).append(mob_label)
+        timeline[turn] = where
+    return timeline
+
+
 def _mob_by_label(location: SandboxLocation, label: str) -> SandboxMob | None:
     for mob in _sandbox_mobs(location):
         if mob.get_label() == label:
@@ -670,6 +700,7 @@ def _sandbox_time_advance(
                 charged_assets=charged_assets,
             )
         )
+    _bump_projection_revision(location)
     _inject_tick_fragments(ctx, location, result)
     return result
 
@@ -703,7 +734,7 @@ def _asset_observable(location: SandboxLocation, asset: Token, ctx: VmPhaseCtx)
         and not _projection_state(location, ctx).suppress_asset_affordances
     ):
         return True
-    return any(asset in mob.assets.values() for mob in _present_mobs(location))
+    return any(asset in mob.assets.values() for mob in _present_mobs(location, ctx))
 
 
 def _charge_event_text(asset: Token, charge: ChargeFacet) -> str:
@@ -829,7 +860,52 @@ def _visibility_ns(location: SandboxLocation, ctx: VmPhaseCtx) -> dict[str, Any]
     return ns
 
 
+def _bump_projection_revision(location: SandboxLocation) -> None:
+    """Invalidate memoized projections after a sandbox-owned mutation.
+
+    The revision lives on the location's time owner, so one story's
+    mutations never touch another story's entries.
+    """
+    _time_owner(location)._projection_revision += 1
+
+
+def _projection_memo(
+    location: SandboxLocation,
+    ctx: VmPhaseCtx | None,
+    name: str,
+    compute: Callable[[], _T],
+) -> _T:
+    """Share ``compute()`` across the phase handlers of one pipeline pass.
+
+    Keyed by location, world turn and the time owner's mutation revision.
+    Authored effects may mutate anything during UPDATE, so UPDATE always
+    recomputes and the phases before and after it never share an entry.
+    """
+    memo = getattr(ctx, "memo", None)
+    phase = getattr(ctx, "current_phase", None)
+    if memo is None or phase == ResolutionPhase.UPDATE:
+        return compute()
+    key = (
+        "sandbox_projection",
+        name,
+        location.uid,
+        get_world_turn(location),
+        _time_owner(location)._projection_revision,
+        phase is not None and phase > ResolutionPhase.UPDATE,
+    )
+    return memo(key, compute)
+
+
 def _projection_state(location: SandboxLocation, ctx: VmPhaseCtx) -> SandboxProjectionState:
+    return _projection_memo(
+        location,
+        ctx,
+        "state",
+        lambda: _compute_projection_state(location, ctx),
+    )
+
+
+def _compute_projection_state(location: SandboxLocation, ctx: VmPhaseCtx) -> SandboxProjectionState:
     state = SandboxProjectionState()
     ns = _visibility_ns(location, ctx)
     for rule in _visibility_rules(location):
@@ -853,6 +929,15 @@ def _target_visited(target: TraversableNode) -> bool:
 
 
 def _concept_providers(location: SandboxLocation, ctx: VmPhaseCtx) -> list[Any]:
+    return _projection_memo(
+        location,
+        ctx,
+        "providers",
+        lambda: _compute_concept_providers(location, ctx),
+    )
+
+
+def _compute_concept_providers(location: SandboxLocation, ctx: VmPhaseCtx) -> list[Any]:
     ns = ctx.get_ns(location)
     providers = list(ns.values())
     for key in ("roles", "settings"):
@@ -930,18 +1015,29 @@ def _player_asset_container(
     return asset.container
 
 
+def _transfer_asset(
+    location: SandboxLocation,
+    giver: HasAssets,
+    receiver: HasAssets,
+    asset_label: str,
+) -> Token:
+    asset = AssetTransactionManager().give_asset(giver, receiver, asset_label)
+    _bump_projection_revision(location)
+    return asset
+
+
 def _take_asset(location: SandboxLocation, asset_label: str) -> Token:
     player_assets = _player_asset_holder(location)
     if player_assets is None:
         raise ValueError("sandbox location has no player asset holder")
-    return AssetTransactionManager().give_asset(location, player_assets, asset_label)
+    return _transfer_asset(location, location, player_assets, asset_label)
 
 
 def _drop_asset(location: SandboxLocation, asset_label: str) -> Token:
     player_assets = _player_asset_holder(location)
     if player_assets is None:
         raise ValueError("sandbox location has no player asset holder")
-    return AssetTransactionManager().give_asset(player_assets, location, asset_label)
+    return _transfer_asset(location, player_assets, location, asset_label)
 
 
 def _put_asset_in_fixture(
@@ -953,7 +1049,7 @@ def _put_asset_in_fixture(
     if player_assets is None:
         raise ValueError("sandbox location has no player asset holder")
     fixture = location.fixture_by_label(fixture_label)
-    return AssetTransactionManager().give_asset(player_assets, fixture, asset_label)
+    return _transfer_asset(location, player_assets, fixture, asset_label)
 
 
 def _take_asset_from_fixture(
@@ -965,7 +1061,7 @@ def _take_asset_from_fixture(
     if player_assets is None:
         raise ValueError("sandbox location has no player asset holder")
     fixture = location.fixture_by_label(fixture_label)
-    return AssetTransactionManager().give_asset(fixture, player_assets, asset_label)
+    return _transfer_asset(location, fixture, player_assets, asset_label)
 
 
 def _asset_container_can_receive(
@@ -989,7 +1085,7 @@ def _put_asset_in_asset_container(
     container = _player_asset_container(location, container_label)
     if container is None:
         raise ValueError(f"Asset {container_label!r} is not a container")
-    return AssetTransactionManager().give_asset(player_assets, container, asset_label)
+    return _transfer_asset(location, player_assets, container, asset_label)
 
 
 def _take_asset_from_asset_container(
@@ -1003,7 +1099,7 @@ def _take_asset_from_asset_container(
     container = _player_asset_container(location, container_label)
     if container is None:
         raise ValueError(f"Asset {container_label!r} is not a container")
-    return AssetTransactionManager().give_asset(container, player_assets, asset_label)
+    return _transfer_asset(location, container, player_assets, asset_label)
 
 
 def _set_asset_container_open(
@@ -1021,6 +1117,7 @@ def _set_asset_container_open(
         container.open()
     else:
         container.close()
+    _bump_projection_revision(location)
     return asset
 
 
@@ -1041,6 +1138,7 @@ def _set_asset_lit(location: SandboxLocation, asset_label: str, lit: bool) -> To
         surface.switchable.switch_on(surface)
     else:
         asset.switchable.switch_off(asset)
+    _bump_projection_revision(location)
     return asset
 
 
@@ -1053,6 +1151,7 @@ def _set_mob_state(
     mob = _mob_by_label(location, mob_label)
     if mob is None:
         raise KeyError(mob_label)
+    _bump_projection_revision(location)
     return mob.set_state_value(state_key, value)
 
 
@@ -1101,7 +1200,7 @@ def _give_asset_to_mob(
     player_assets = _player_asset_holder(location)
     if player_assets is None:
         raise ValueError("sandbox location has no player asset holder")
-    return AssetTransactionManager().give_asset(player_assets, mob, asset_label)
+    return _transfer_asset(location, player_assets, mob, asset_label)
 
 
 def _take_asset_from_mob(
@@ -1119,7 +1218,7 @@ def _take_asset_from_mob(
     player_assets = _player_asset_holder(location)
     if player_assets is None:
         raise ValueError("sandbox location has no player asset holder")
-    return AssetTransactionManager().give_asset(mob, player_assets, asset_label)
+    return _transfer_asset(location, mob, player_assets, asset_label)
 
 
 @on_gather_ns(
@@ -2001,7 +2100,7 @@ def project_sandbox_mob_actions(*, caller, ctx, **_kw):
         return None
 
     player_assets = _player_asset_holder(caller)
-    for mob in _present_mobs(caller):
+    for mob in _present_mobs(caller, ctx):
         if player_assets is not None:
             _project_mob_asset_actions(
                 caller,
@@ -2146,7 +2245,7 @@ def project_sandbox_scheduled_events(*, caller, ctx, **_kw):
 
     world_time = current_world_time(caller)
     location_label = caller.get_label()
-    actors_present = _actors_present(caller)
+    actors_present = _actors_present(caller, ctx)
     for index, contribution in enumerate(_scheduled_event_contributions(caller, ctx)):
         event = contribution.event
         if not event.matches(
@@ -2291,7 +2390,7 @@ def compose_sandbox_mob_journal(*, caller, ctx, fragments, **_kw):
 
     additions = [
         ContentFragment(content=mob.present_text, source_id=mob.uid)
-        for mob in _present_mobs(caller)
+        for mob in _present_mobs(caller, ctx)
         if mob.present_text
     ]
     if not additions:
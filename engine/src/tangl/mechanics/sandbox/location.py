@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from tangl.core import Token, contribute_ns
 from tangl.story import MenuBlock
@@ -233,6 +233,8 @@ class SandboxLocation(HasAssets, MenuBlock):
     wait_text: str | None = None
     wait_turn_delta: int | None = None
 
+    _projection_revision: int = PrivateAttr(default=0)
+
     def fixture_by_label(self, label: str) -> SandboxFixture:
         """Return the named local fixture."""
         for fixture in self.fixtures:
@@ -41,8 +41,8 @@ class SandboxMob(HasAssets, Actor):
         """Return the mob location implied by its current schedule."""
         if world_time is None:
             return self.location
-        for entry in self.schedule.entries:
-            if entry.location is not None and entry.matches_time(world_time):
+        for entry in self.schedule.index.at(world_time):
+            if entry.location is not None:
                 return entry.location
         return self.location
 
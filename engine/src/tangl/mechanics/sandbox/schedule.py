@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from collections import defaultdict
+from heapq import merge
+from typing import Iterable, Sequence
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from tangl.core.runtime_op import Effect, Predicate
 
@@ -39,6 +41,16 @@ class ScheduleEntry(BaseModel):
             and (self.year is None or world_time.year == self.year)
         )
 
+    def matches_place(self, world_time: WorldTime, location: str | None = None) -> bool:
+        """Return whether the entry's time and location gates both pass."""
+        if self.location is not None and self.location != location:
+            return False
+        return self.matches_time(world_time)
+
+    def matches_actors(self, actors_present: Iterable[str]) -> bool:
+        """Return whether the entry's actor gate passes."""
+        return self.actor is None or self.actor in set(actors_present)
+
     def matches(
         self,
         world_time: WorldTime,
@@ -47,16 +59,121 @@ class ScheduleEntry(BaseModel):
         actors_present: Iterable[str] = (),
     ) -> bool:
         """Return whether this entry applies in the supplied context."""
-        if not self.matches_time(world_time):
-            return False
+        return self.matches_place(world_time, location) and self.matches_actors(actors_present)
 
-        if self.location is not None and self.location != location:
-            return False
 
-        if self.actor is not None and self.actor not in set(actors_present):
-            return False
+TimeKey = tuple[int, int, int, int, int, int]
 
-        return True
+
+def _time_key(world_time: WorldTime) -> TimeKey:
+    return (
+        world_time.period,
+        world_time.day,
+        world_time.day_of_month,
+        world_time.month,
+        world_time.season,
+        world_time.year,
+    )
+
+
+class ScheduleIndex:
+    """Entries bucketed by period and weekday, with per-time lookup caching.
+
+    Lookups only test the entries whose ``period``/``day`` gates could pass
+    (the exact bucket plus the wildcard buckets), and the result for each
+    distinct calendar time is cached grouped by location, so repeated
+    projections within a period cost one dict lookup per location.  Results
+    keep authored order.
+
+    The index snapshots ``entries``.  Owners holding a cached index check
+    :meth:`covers`, which notices appends and removals in O(1); replacing an
+    entry in place or editing its fields needs an explicit invalidation.
+    """
+
+    max_cached_times = 256
+
+    def __init__(self, entries: Sequence[ScheduleEntry] = ()) -> None:
+        self._source = entries
+        self.entries: tuple[ScheduleEntry, ...] = tuple(entries)
+        self._order = {id(entry): order for order, entry in enumerate(self.entries)}
+        self._buckets: dict[tuple[int | None, int | None], list[int]] = defaultdict(list)
+        for order, entry in enumerate(self.entries):
+            self._buckets[(entry.period, entry.day)].append(order)
+        self._by_time: dict[TimeKey, dict[str | None, tuple[ScheduleEntry, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def covers(self, entries: Sequence[ScheduleEntry]) -> bool:
+        """Return whether this index was built from ``entries`` at its current length."""
+        return entries is self._source and len(entries) == len(self.entries)
+
+    def _sorted(self, entries: Iterable[ScheduleEntry]) -> list[ScheduleEntry]:
+        return sorted(entries, key=lambda entry: self._order[id(entry)])
+
+    def _at(self, world_time: WorldTime) -> dict[str | None, tuple[ScheduleEntry, ...]]:
+        key = _time_key(world_time)
+        by_location = self._by_time.get(key)
+        if by_location is not None:
+            return by_location
+
+        period, day = world_time.period, world_time.day
+        orders = merge(
+            *(
+                self._buckets.get(bucket, ())
+                for bucket in ((period, day), (period, None), (None, day), (None, None))
+            )
+        )
+        grouped: dict[str | None, list[ScheduleEntry]] = defaultdict(list)
+        for order in orders:
+            entry = self.entries[order]
+            if entry.matches_time(world_time):
+                grouped[entry.location].append(entry)
+
+        if len(self._by_time) >= self.max_cached_times:
+            self._by_time.clear()
+        by_location = {location: tuple(items) for location, items in grouped.items()}
+        self._by_time[key] = by_location
+        return by_location
+
+    def at(self, world_time: WorldTime) -> list[ScheduleEntry]:
+        """Return every entry whose calendar gates match, at any location."""
+        return self._sorted(entry for items in self._at(world_time).values() for entry in items)
+
+    def placed(self, world_time: WorldTime, location: str | None = None) -> list[ScheduleEntry]:
+        """Return entries whose time and location gates match, ignoring actors."""
+        by_location = self._at(world_time)
+        local = by_location.get(location, ())
+        anywhere = by_location.get(None, ()) if location is not None else ()
+        if not anywhere:
+            return list(local)
+        if not local:
+            return list(anywhere)
+        return self._sorted((*local, *anywhere))
+
+    def matching(
+        self,
+        world_time: WorldTime,
+        *,
+        location: str | None = None,
+        actors_present: Iterable[str] = (),
+    ) -> list[ScheduleEntry]:
+        """Return entries matching the supplied time and context."""
+        present = set(actors_present)
+        return [entry for entry in self.placed(world_time, location) if entry.matches_actors(present)]
+
+    def timeline(
+        self,
+        times: Iterable[WorldTime],
+    ) -> dict[int, dict[str | None, list[ScheduleEntry]]]:
+        """Return matching entries per world turn, grouped by location.
+
+        Entries without a location are grouped under ``None``.
+        """
+        return {
+            world_time.turn: {location: list(items) for location, items in self._at(world_time).items()}
+            for world_time in times
+        }
 
 
 class Schedule(BaseModel):
@@ -64,6 +181,19 @@ class Schedule(BaseModel):
 
     entries: list[ScheduleEntry] = Field(default_factory=list)
 
+    _index: ScheduleIndex | None = PrivateAttr(default=None)
+
+    @property
+    def index(self) -> ScheduleIndex:
+        """Return the lookup index, rebuilt when ``entries`` is reassigned, grows or shrinks."""
+        if self._index is None or not self._index.covers(self.entries):
+            self._index = ScheduleIndex(self.entries)
+        return self._index
+
+    def invalidate(self) -> None:
+        """Rebuild the index on next access after replacing or editing entries in place."""
+        self._index = None
+
     def matching(
         self,
         world_time: WorldTime,
@@ -72,16 +202,15 @@ class Schedule(BaseModel):
         actors_present: Iterable[str] = (),
     ) -> list[ScheduleEntry]:
         """Return entries matching the supplied time and context."""
-        present = tuple(actors_present)
-        return [
-            entry
-            for entry in self.entries
-            if entry.matches(
-                world_time,
-                location=location,
-                actors_present=present,
-            )
-        ]
+        return self.index.matching(
+            world_time,
+            location=location,
+            actors_present=actors_present,
+        )
+
+    def timeline(self, times: Iterable[WorldTime]) -> dict[int, dict[str | None, list[ScheduleEntry]]]:
+        """Return matching entries per world turn, grouped by location."""
+        return self.index.timeline(times)
 
 
 class ScheduledEvent(ScheduleEntry):
@@ -131,18 +260,6 @@ class ScheduledPresence(ScheduleEntry):
 
     actor: str
 
-    def matches(
-        self,
-        world_time: WorldTime,
-        *,
-        location: str | None = None,
-        actors_present: Iterable[str] = (),
-    ) -> bool:
-        """Return whether this declaration places its actor in the context."""
-        payload = self.model_copy(update={"actor": None})
-        return ScheduleEntry.matches(
-            payload,
-            world_time,
-            location=location,
-            actors_present=actors_present,
-        )
+    def matches_actors(self, actors_present: Iterable[str]) -> bool:
+        """Presence declares its actor rather than requiring one."""
+        return True
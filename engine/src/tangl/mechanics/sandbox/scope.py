@@ -4,14 +4,14 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from tangl.core import contribute_ns
 from tangl.story.concepts.asset import HasAssets
 from tangl.vm import TraversableNode
 
 from .mob import SandboxMob
-from .schedule import ScheduledEvent, ScheduledPresence
+from .schedule import ScheduleIndex, ScheduledEvent, ScheduledPresence
 from .time import SandboxClockPolicy
 from .visibility import SandboxVisibilityRule
 
@@ -33,6 +33,20 @@ class SandboxScope(TraversableNode):
     wait_text: str | None = "Wait"
     wait_turn_delta: int | None = 1
 
+    _presence_index: ScheduleIndex | None = PrivateAttr(default=None)
+    _projection_revision: int = PrivateAttr(default=0)
+
+    @property
+    def presence_index(self) -> ScheduleIndex:
+        """Return the lookup index over ``scheduled_presence``."""
+        if self._presence_index is None or not self._presence_index.covers(self.scheduled_presence):
+            self._presence_index = ScheduleIndex(self.scheduled_presence)
+        return self._presence_index
+
+    def invalidate_presence_index(self) -> None:
+        """Rebuild the presence index after replacing or editing entries in place."""
+        self._presence_index = None
+
     @contribute_ns
     def provide_sandbox_scope_symbols(self) -> dict[str, Any]:
         """Publish scope metadata to descendant namespaces."""
@@ -13,16 +13,28 @@ from .queueing import (
     QueueStationState,
     QueueTraceEvent,
 )
+from .replication import (
+    QueueReplicationSummary,
+    jitter_arrivals,
+    run_replication,
+    run_replications,
+    sweep_stations,
+)
 
 __all__ = [
     "EventCalendar",
     "QueueMetrics",
     "QueueMove",
     "QueuePatient",
+    "QueueReplicationSummary",
     "QueueSimulation",
     "QueueSimulationHandler",
     "QueueStationSpec",
     "QueueStationState",
     "QueueTraceEvent",
     "SimulationEvent",
+    "jitter_arrivals",
+    "run_replication",
+    "run_replications",
+    "sweep_stations",
 ]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import heapq
 from typing import Any
+from uuid import UUID
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from tangl.core import Entity, Registry, Selector
 from tangl.core.bases import BaseModelPlus, HasOrder
@@ -24,30 +26,91 @@ class SimulationEvent(HasOrder, Entity):
 
 
 class EventCalendar(BaseModelPlus):
-    """Tiny future-event list backed by core `Registry` selection and sorting."""
+    """Future-event list backed by a core `Registry` and a binary heap.
+
+    The registry is the serialized form and the source of truth.  The heap of
+    ``(at_turn, seq, uid)`` keys is derived from it: built on first use, and
+    rebuilt when the calendar is given a different registry or the registry
+    size no longer matches, so a deserialized calendar still pops in order.
+
+    Mutate through :meth:`push`, :meth:`pop_next` and :meth:`cancel`.  Any
+    other edit -- registry ``add``/``remove`` pairs, or changing an event's
+    ``at_turn``/``seq`` in place -- must be followed by :meth:`invalidate`.
+    """
 
     registry: Registry[SimulationEvent] = Field(default_factory=Registry)
 
+    _heap: list[tuple[int, int, UUID]] | None = PrivateAttr(default=None)
+    _heap_registry: Registry | None = PrivateAttr(default=None)
+    _heap_size: int = PrivateAttr(default=0)
+
+    def _ensure_heap(self) -> list[tuple[int, int, UUID]]:
+        if (
+            self._heap is None
+            or self._heap_registry is not self.registry
+            or self._heap_size != len(self.registry.members)
+        ):
+            self._heap = [(*event.sort_key(), event.uid) for event in self.registry.members.values()]
+            heapq.heapify(self._heap)
+            self._heap_registry = self.registry
+            self._heap_size = len(self._heap)
+        return self._heap
+
+    def invalidate(self) -> None:
+        """Rebuild the heap on next access after direct registry or event edits."""
+        self._heap = None
+
+    def _head(self) -> SimulationEvent | None:
+        """Return the earliest live event, discarding cancelled heap entries."""
+        heap = self._ensure_heap()
+        members = self.registry.members
+        while heap:
+            at_turn, seq, uid = heap[0]
+            event = members.get(uid)
+            if event is None:
+                heapq.heappop(heap)  # cancelled
+                continue
+            if event.at_turn == at_turn and event.seq == seq:
+                return event
+            self.invalidate()  # head was edited in place
+            return self._head()
+        return None
+
     def push(self, event: SimulationEvent) -> SimulationEvent:
         """Add one event and return it for caller bookkeeping."""
+        heap = self._ensure_heap()
         self.registry.add(event)
+        heapq.heappush(heap, (*event.sort_key(), event.uid))
+        self._heap_size += 1
+        return event
+
+    def cancel(self, uid: UUID) -> SimulationEvent | None:
+        """Remove a pending event by uid and return it, or ``None`` if absent."""
+        event = self.registry.get(uid)
+        if event is None:
+            return None
+        self._ensure_heap()
+        self.registry.remove(uid)
+        self._heap_size -= 1  # its heap entry is discarded when it surfaces
         return event
 
     def peek_next(self) -> SimulationEvent | None:
         """Return the next event without mutating the calendar."""
-        return self.registry.find_one(sort_key=lambda event: event.sort_key())
+        return self._head()
 
     def pop_next(self) -> SimulationEvent | None:
         """Remove and return the next event."""
-        event = self.peek_next()
+        event = self._head()
         if event is None:
             return None
+        heapq.heappop(self._heap)
+        self._heap_size -= 1
         self.registry.remove(event.uid)
         return event
 
     def peek_turn(self) -> int | None:
         """Return the next event turn, or ``None`` when empty."""
-        event = self.peek_next()
+        event = self._head()
         return event.at_turn if event is not None else None
 
     def events(self) -> list[SimulationEvent]:
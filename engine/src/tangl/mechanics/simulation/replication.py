@@ -0,0 +1,165 @@
+"""Batch replications of queueing simulations.
+
+One :class:`QueueSimulation` run is deterministic.  Replications vary the
+arrival schedule per seed so designers can see how a station layout behaves
+across many plausible days rather than the one authored day, and sweeps
+repeat that for each candidate capacity / service-time configuration.
+
+Runs are independent, so they fan out over a process pool when ``workers``
+is greater than one.  Each run skips the story layer entirely and drives the
+handler directly.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+from itertools import product
+import multiprocessing
+import random
+from statistics import fmean, median, pstdev
+from typing import Iterable, Mapping
+
+from pydantic import Field
+
+from tangl.core.bases import BaseModelPlus
+
+from .queueing import QueueMetrics, QueueMove, QueueSimulation, QueueSimulationHandler, QueueStationSpec
+
+
+class QueueReplicationSummary(BaseModelPlus):
+    """Metrics from many seeded runs of one queue configuration."""
+
+    seeds: list[int] = Field(default_factory=list)
+    runs: list[QueueMetrics] = Field(default_factory=list)
+
+    def distribution(self, metric: str) -> list[float]:
+        """Return one scalar metric across runs, in seed order."""
+        return [float(getattr(run, metric)) for run in self.runs]
+
+    def utilization(self, station: str) -> list[float]:
+        """Return one station's utilization across runs, in seed order."""
+        return [run.utilization.get(station, 0.0) for run in self.runs]
+
+    def bottleneck_counts(self) -> dict[str, int]:
+        """Return how often each station was the bottleneck."""
+        return dict(Counter(run.bottleneck for run in self.runs if run.bottleneck))
+
+    def describe(self, metric: str) -> dict[str, float]:
+        """Return mean, spread and range for one scalar metric."""
+        values = self.distribution(metric)
+        if not values:
+            return {"mean": 0.0, "stdev": 0.0, "median": 0.0, "min": 0.0, "max": 0.0}
+        return {
+            "mean": fmean(values),
+            "stdev": pstdev(values),
+            "median": median(values),
+            "min": min(values),
+            "max": max(values),
+        }
+
+
+def jitter_arrivals(arrivals: Mapping[str, int], rng: random.Random, spread: int) -> dict[str, int]:
+    """Shift each arrival by up to ``spread`` turns either way, clamped at zero."""
+    if spread <= 0:
+        return dict(arrivals)
+    return {label: max(0, turn + rng.randint(-spread, spread)) for label, turn in arrivals.items()}
+
+
+def run_replication(
+    base: QueueSimulation,
+    seed: int,
+    *,
+    arrival_spread: int = 0,
+    station_specs: Mapping[str, QueueStationSpec] | None = None,
+) -> QueueMetrics:
+    """Run one seeded replication of ``base`` to completion and return its metrics."""
+    specs = dict(station_specs if station_specs is not None else base.station_specs)
+    arrivals = jitter_arrivals(base.patient_arrivals, random.Random(seed), arrival_spread)
+    # every patient arrives once and completes once per station on its route
+    needed_events = len(arrivals) * (len(specs) + 1)
+    game = base.model_copy(
+        update={
+            "patient_arrivals": arrivals,
+            "station_specs": specs,
+            "max_run_events": max(base.max_run_events, needed_events),
+        },
+        deep=True,
+    )
+    handler = QueueSimulationHandler()
+    handler.setup(game)
+    handler.receive_move(game, QueueMove("run_until_complete"))
+    return game.metrics
+
+
+def run_replications(
+    base: QueueSimulation,
+    seeds: Iterable[int] | int,
+    *,
+    arrival_spread: int = 0,
+    station_specs: Mapping[str, QueueStationSpec] | None = None,
+    workers: int = 1,
+) -> QueueReplicationSummary:
+    """Run ``base`` once per seed and collect the metrics.
+
+    ``seeds`` may be an iterable of seeds or a count, meaning ``range(seeds)``.
+    Results are in seed order regardless of ``workers``.
+    """
+    seeds = list(range(seeds)) if isinstance(seeds, int) else list(seeds)
+    runs = _map_jobs([(base, seed, arrival_spread, station_specs) for seed in seeds], workers)
+    return QueueReplicationSummary(seeds=seeds, runs=runs)
+
+
+def sweep_stations(
+    base: QueueSimulation,
+    seeds: Iterable[int] | int,
+    *,
+    capacity: Mapping[str, Iterable[int]] | None = None,
+    service_turns: Mapping[str, Iterable[int]] | None = None,
+    arrival_spread: int = 0,
+    workers: int = 1,
+) -> dict[tuple[tuple[str, int, int], ...], QueueReplicationSummary]:
+    """Replicate ``base`` for every combination of station capacities and service turns.
+
+    Stations not named in ``capacity`` or ``service_turns`` keep their
+    authored value.  Results are keyed by ``((station, capacity,
+    service_turns), ...)`` in station order.
+    """
+    seeds = list(range(seeds)) if isinstance(seeds, int) else list(seeds)
+    capacity = capacity or {}
+    service_turns = service_turns or {}
+    axes = [
+        [
+            (label, cap, turns)
+            for cap in capacity.get(label, [spec.capacity])
+            for turns in service_turns.get(label, [spec.service_turns])
+        ]
+        for label, spec in base.station_specs.items()
+    ]
+    configs = [tuple(choice) for choice in product(*axes)]
+
+    jobs = []
+    for config in configs:
+        specs = {
+            label: base.station_specs[label].model_copy(update={"capacity": cap, "service_turns": turns})
+            for label, cap, turns in config
+        }
+        jobs.extend((base, seed, arrival_spread, specs) for seed in seeds)
+    runs = _map_jobs(jobs, workers)
+
+    return {
+        config: QueueReplicationSummary(seeds=seeds, runs=runs[i * len(seeds):(i + 1) * len(seeds)])
+        for i, config in enumerate(configs)
+    }
+
+
+def _map_jobs(jobs: list, workers: int) -> list[QueueMetrics]:
+    if workers <= 1 or len(jobs) <= 1:
+        return [_run_job(job) for job in jobs]
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context()) as pool:
+        return list(pool.map(_run_job, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
+
+
+def _run_job(job: tuple[QueueSimulation, int, int, Mapping[str, QueueStationSpec] | None]) -> QueueMetrics:
+    base, seed, arrival_spread, station_specs = job
+    return run_replication(base, seed, arrival_spread=arrival_spread, station_specs=station_specs)
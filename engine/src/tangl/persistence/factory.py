@@ -158,7 +158,7 @@ class PersistenceManagerFactory:
         if not (settings and settings.service.apis.redis.enabled):
             raise ImportError
         return manager_cls(
-            storage=RedisStorage(url=url),
+            storage=RedisStorage(url=url, ping=True),
             serializer=PickleSerializationHandler
         )
 
@@ -189,7 +189,7 @@ class PersistenceManagerFactory:
         if not settings.service.apis.redis.enabled:
             raise ImportError
         return manager_cls(
-            storage=RedisStorage(url=url),
+            storage=RedisStorage(url=url, ping=True),
             serializer=JsonSerializationHandler,
             structuring=structuring
         )
@@ -45,6 +45,48 @@ class PersistenceManager(Mapping[UUID, HasUid]):
         else:
             raise ValueError("Must have either uid or data param")
 
+        return self._unflatten(flat)
+
+    def get(self, uid: UUID, default: HasUid = None) -> HasUid | None:
+        """
+        Load ``uid`` with a single storage read, or return ``default`` if it is
+        missing.  Prefer this to an ``in`` check followed by ``load``, which
+        costs two round trips on remote backends.
+        """
+        if isinstance(uid, str) and is_valid_uuid( uid ):
+            uid = UUID(uid)
+        try:
+            flat = self.storage[uid]
+        except KeyError:
+            return default
+        if flat is None:
+            # mongo returns None rather than raising
+            return default
+        return self._unflatten(flat)
+
+    def load_many(self, uids: list[UUID]) -> list[HasUid | None]:
+        """
+        Load several records, using the storage's batched ``get_many`` when it
+        has one.  Missing records come back as ``None``.
+        """
+        if hasattr(self.storage, "get_many"):
+            flats = self.storage.get_many(uids)
+            return [None if flat is None else self._unflatten(flat) for flat in flats]
+        return [self.get(uid) for uid in uids]
+
+    def save_many(self, items: list[HasUid]):
+        """
+        Save several records, using the storage's batched ``set_many`` when it
+        has one.
+        """
+        if not hasattr(self.storage, "set_many"):
+            for structured in items:
+                self.save(structured)
+            return
+        self.storage.set_many({self._key_for(structured): self._flatten(structured)
+                               for structured in items})
+
+    def _unflatten(self, flat: FlatData) -> HasUid:
         if self.serializer:
             unstructured = self.serializer.deserialize( flat )
         else:
@@ -58,6 +100,14 @@ class PersistenceManager(Mapping[UUID, HasUid]):
         return structured
 
     def save(self, structured: HasUid):
+        flat = self._flatten(structured)
+
+        if self.storage is not None:
+            self.storage[self._key_for(structured)] = flat
+        else:
+            return flat
+
+    def _flatten(self, structured: HasUid) -> FlatData:
         # stash the incoming classes
         if structured.__class__.__name__ not in self.kind_map:
             self.kind_map[structured.__class__.__name__] = structured.__class__
@@ -71,17 +121,15 @@ class PersistenceManager(Mapping[UUID, HasUid]):
             flat = self.serializer.serialize( unstructured )
         else:
             flat = unstructured
+        return flat
 
-        if self.storage is not None:
-            if hasattr(structured, 'uid'):
-                uid = structured.uid
-            elif isinstance(structured, dict) and 'uid' in structured:
-                uid = structured['uid']
-            else:
-                raise KeyError(f"Unable to infer key for {structured}")
-            self.storage[uid] = flat
-        else:
-            return flat
+    @staticmethod
+    def _key_for(structured: HasUid) -> UUID:
+        if hasattr(structured, 'uid'):
+            return structured.uid
+        elif isinstance(structured, dict) and 'uid' in structured:
+            return structured['uid']
+        raise KeyError(f"Unable to infer key for {structured}")
 
     def remove(self, uid: UUID):
         del self.storage[uid]
@@ -93,9 +141,9 @@ class PersistenceManager(Mapping[UUID, HasUid]):
         """
         # todo: service layer can deal with locking the context if it's in a threaded environment
 
-        if uid not in self:
+        structured = self.get(uid)
+        if structured is None:
             raise KeyError(f"Unable to find {uid}")
-        structured = self.load(uid)
         yield structured
         if write_back:
             self.save(structured)
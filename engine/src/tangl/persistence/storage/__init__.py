@@ -2,5 +2,5 @@ from .protocol import StorageProtocol
 from .in_memory_storage import InMemoryStorage
 from .file_storage import FileStorage
 from .sqlite_storage import SQLiteStorage
-from .redis_storage import RedisStorage
+from .redis_storage import RedisStorage, AsyncRedisStorage
 from .mongo_storage import MongoStorage
@@ -1,10 +1,83 @@
+# tangl/persistence/storage/file_storage.py
+"""
+File-backed key-value storage for the persistence layer.
+
+Records live in a hashed two-level directory tree so no single directory
+grows with the number of saves::
+
+    base_path/
+      .pkl-manifest.log      # append-only key journal
+      .pkl-manifest.lock     # serializes journal appends and compaction
+      3f/a2/<key>.pkl
+      9c/07/<key>.pkl
+
+Writes go to a temp file in the target shard and are moved into place with
+:func:`os.replace`, so a crash mid-write leaves the previous record intact.
+
+The manifest journal records ``+key``/``-key`` lines and backs ``len()`` and
+iteration without walking the tree.  It is replayed incrementally, so
+several processes sharing a directory see each other's additions.  Appends
+and compaction hold an exclusive ``flock`` on the lock file, so compacting
+never drops another process's lines; where ``fcntl`` is unavailable only
+threads within one process are serialized.  Records
+written by the older flat layout (``base_path/<key>.ext``) are moved into
+their shards the first time a directory is opened without a manifest.
+
+Usage:
+    storage = FileStorage(base_path="data/user", ext="pkl", binary_rw=True)
+    storage[uuid] = pickled_bytes
+    data = storage[uuid]
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
 from pathlib import Path
+from typing import Iterator
+from uuid import UUID
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
 
 from tangl.type_hints import FlatData
 
+
 class FileStorage:
+    """
+    File-backed key-value storage implementing StorageProtocol.
+
+    Args:
+        base_path: Root directory, created if missing.
+        ext: File extension for records; also names the manifest, so several
+             storages with different extensions can share one directory.
+        binary_rw: Read and write bytes rather than text.
+        shard_depth: Number of two-hex-digit directory levels, 0 for flat.
+        fsync: Flush records to disk before the rename.  Protects against
+               power loss as well as process crashes, at some write cost.
+        mmap_threshold: For binary storage, return records at least this
+               many bytes long as a read-only ``memoryview`` over a memory
+               map instead of copying them into ``bytes``.  The mapping stays
+               open until the view is released (``view.release()`` or garbage
+               collection); overwriting or deleting the record meanwhile does
+               not change it, since writes replace the file rather than edit
+               it.  ``None`` disables it.
+    """
 
-    def __init__( self, base_path: str | Path = "~/tmp/persist", ext: str = 'txt', binary_rw: bool = False ):
+    manifest_compact_slack = 1024
+
+    def __init__( self,
+                  base_path: str | Path = "~/tmp/persist",
+                  ext: str = 'txt',
+                  binary_rw: bool = False,
+                  shard_depth: int = 2,
+                  fsync: bool = False,
+                  mmap_threshold: int | None = None ):
         base_path = Path(base_path).expanduser()
         # ensure bp exists
         if not base_path.is_dir():  # pragma: no cover
@@ -12,43 +85,213 @@ class FileStorage:
         self.base_path = base_path
         self.ext = ext
         self.binary_rw = binary_rw
+        self.shard_depth = shard_depth
+        self.fsync = fsync
+        self.mmap_threshold = mmap_threshold
+
+        self.manifest_path = base_path / f".{ext}-manifest.log"
+        self.manifest_lock_path = base_path / f".{ext}-manifest.lock"
+        self._lock = threading.RLock()
+        self._file_locked = False
+        self._keys: set[str] = set()
+        self._journal_lines = 0
+        self._manifest_offset = 0
+        self._manifest_inode: int | None = None
+
+        if self.manifest_path.exists():
+            self._sync_manifest()
+        else:
+            with self._manifest_lock():
+                self._rebuild_manifest()
+
+    # Layout
 
     def get_fn(self, key):
         return f"{key}.{self.ext}"
 
+    def get_shard(self, key) -> Path:
+        if not self.shard_depth:
+            return self.base_path
+        digest = hashlib.blake2b(str(key).encode("utf-8"), digest_size=self.shard_depth).hexdigest()
+        return self.base_path.joinpath(*(digest[i:i+2] for i in range(0, 2 * self.shard_depth, 2)))
+
+    def get_path(self, key) -> Path:
+        return self.get_shard(key) / self.get_fn(key)
+
+    @staticmethod
+    def _key_for_name(name: str) -> UUID | str:
+        try:
+            return UUID(name)
+        except ValueError:
+            return name
+
+    # Manifest journal
+
+    @contextmanager
+    def _manifest_lock(self):
+        """Hold the thread lock and, where supported, an exclusive file lock.
+
+        Re-entrant: a second ``flock`` from this process would deadlock.
+        """
+        with self._lock:
+            if fcntl is None or self._file_locked:
+                yield
+                return
+            with open(self.manifest_lock_path, "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                self._file_locked = True
+                try:
+                    yield
+                finally:
+                    self._file_locked = False
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _append_manifest(self, lines: list[str]):
+        with self._manifest_lock():
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write("".join(f"{line}\n" for line in lines))
+            self._sync_manifest()
+            if self._journal_lines > 2 * len(self._keys) + self.manifest_compact_slack:
+                self._write_manifest()
+
+    def _sync_manifest(self):
+        """Replay journal lines appended since the last sync."""
+        with self._lock:
+            try:
+                stat = self.manifest_path.stat()
+            except FileNotFoundError:
+                with self._manifest_lock():
+                    self._rebuild_manifest()
+                return
+            if stat.st_ino != self._manifest_inode or stat.st_size < self._manifest_offset:
+                # compacted or replaced, start over
+                self._keys.clear()
+                self._journal_lines = 0
+                self._manifest_offset = 0
+                self._manifest_inode = stat.st_ino
+            if stat.st_size == self._manifest_offset:
+                return
+            with open(self.manifest_path, "rb") as f:
+                f.seek(self._manifest_offset)
+                chunk = f.read()
+            # ignore a trailing partial line from a concurrent writer
+            complete = chunk.rfind(b"\n") + 1
+            for line in chunk[:complete].decode("utf-8").splitlines():
+                op, name = line[:1], line[1:]
+                if op == "+":
+                    self._keys.add(name)
+                elif op == "-":
+                    self._keys.discard(name)
+                self._journal_lines += 1
+            self._manifest_offset += complete
+
+    def _write_manifest(self):
+        """Atomically replace the journal with one ``+key`` line per live key.
+
+        Callers hold :meth:`_manifest_lock` and have replayed the journal.
+        """
+        with self._lock:
+            self._atomic_write(self.manifest_path,
+                               "".join(f"+{name}\n" for name in sorted(self._keys)),
+                               binary=False)
+            stat = self.manifest_path.stat()
+            self._manifest_inode = stat.st_ino
+            self._manifest_offset = stat.st_size
+            self._journal_lines = len(self._keys)
+
+    def _rebuild_manifest(self):
+        """Index records on disk, adopting any legacy flat-layout files."""
+        with self._lock:
+            suffix = f".{self.ext}"
+            self._keys.clear()
+            if self.shard_depth:
+                for fp in self.base_path.glob(f"*{suffix}"):
+                    if fp.is_file() and not fp.name.startswith("."):
+                        target = self.get_path(fp.name[:-len(suffix)])
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(fp, target)
+            pattern = "/".join(["??"] * self.shard_depth + [f"*{suffix}"])
+            for fp in self.base_path.glob(pattern):
+                if fp.is_file() and not fp.name.startswith("."):
+                    self._keys.add(fp.name[:-len(suffix)])
+            self._write_manifest()
+
+    def rebuild_index(self):
+        """Re-derive the manifest from the files on disk."""
+        with self._manifest_lock():
+            self._rebuild_manifest()
+
+    # Record I/O
+
+    def _atomic_write(self, fp: Path, value: FlatData, binary: bool):
+        fd, tmp = tempfile.mkstemp(dir=fp.parent, prefix=".tmp-", suffix=f".{self.ext}")
+        try:
+            with os.fdopen(fd, "wb" if binary else "w", **({} if binary else {"encoding": "utf-8"})) as f:
+                f.write(value)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, fp)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
     def __setitem__(self, key, value: FlatData):
-        fp = self.base_path / self.get_fn(key)
-        flags = "wb" if self.binary_rw else "w"
-        with open(fp, flags) as f:
-            f.write(value)
+        fp = self.get_path(key)
+        try:
+            self._atomic_write(fp, value, self.binary_rw)
+        except FileNotFoundError:
+            fp.parent.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(fp, value, self.binary_rw)
+        with self._lock:
+            self._sync_manifest()
+            if str(key) not in self._keys:
+                self._append_manifest([f"+{key}"])
 
     def __getitem__(self, key) -> FlatData:
-        fp = self.base_path / self.get_fn(key)
-        if not fp.exists():
-            raise KeyError(f"No such key {key}")
-        flags = "rb" if self.binary_rw else "r"
-        with open(fp, flags) as f:
-            value = f.read()
-            return value
+        fp = self.get_path(key)
+        try:
+            f = open(fp, "rb") if self.binary_rw else open(fp, "r", encoding="utf-8")
+        except FileNotFoundError:
+            raise KeyError(f"No such key {key}") from None
+        with f:
+            if self.binary_rw and self.mmap_threshold is not None:
+                size = os.fstat(f.fileno()).st_size
+                if size and size >= self.mmap_threshold:
+                    # the map outlives the file handle and closes with the view
+                    return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            return f.read()
 
     def __contains__(self, key):
-        fp = self.base_path / self.get_fn(key)
-        if not fp.exists():
-            return False
-        return True
+        # The file is the source of truth, the manifest may lag other writers
+        return self.get_path(key).is_file()
 
     def __delitem__(self, key):
-        fp = self.base_path / self.get_fn(key)
-        if not fp.exists():
-            raise KeyError(f"No such key {key}")
-        fp.unlink()
+        fp = self.get_path(key)
+        try:
+            fp.unlink()
+        except FileNotFoundError:
+            raise KeyError(f"No such key {key}") from None
+        self._append_manifest([f"-{key}"])
 
     def __len__(self) -> int:
-        return sum(1 for item in self.base_path.iterdir() if item.is_file())
+        self._sync_manifest()
+        return len(self._keys)
 
-    def __iter__(self):
-        return iter(self.base_path.iterdir())
+    def __iter__(self) -> Iterator[UUID | str]:
+        self._sync_manifest()
+        return iter([self._key_for_name(name) for name in self._keys])
 
     def __bool__(self) -> bool:
         return len(self) != 0
 
+    def clear(self):
+        with self._manifest_lock():
+            self._sync_manifest()
+            for name in list(self._keys):
+                self.get_path(name).unlink(missing_ok=True)
+            self._keys.clear()
+            self._write_manifest()
+
+    def keys(self) -> Iterator[UUID | str]:
+        return iter(self)
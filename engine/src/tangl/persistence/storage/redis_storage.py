@@ -1,4 +1,29 @@
+# tangl/persistence/storage/redis_storage.py
+"""
+Redis-backed key-value storage for the persistence layer.
+
+Clients are drawn from a process-wide connection pool keyed by ``(url, db)``,
+so constructing a storage is cheap and does not issue a round trip unless
+``ping=True`` is requested.  Bulk access goes through ``MGET`` and
+pipelines, and large values can optionally be stored zlib-compressed.
+
+:class:`AsyncRedisStorage` mirrors the same key/value layout over
+``redis.asyncio`` for callers that run inside an event loop.
+
+Usage:
+    storage = RedisStorage(url="redis://localhost:6379/0", compress_threshold=64_000)
+    storage[uuid] = pickled_bytes
+    data = storage.get(uuid)            # single GET, None if missing
+    many = storage.get_many([uid1, uid2])
+
+    # any redis-py compatible client, e.g. ``fakeredis.FakeRedis()`` in tests
+    storage = RedisStorage(client=client)
+"""
+from __future__ import annotations
+
 import logging
+import zlib
+from typing import Iterable, Iterator, Mapping
 from uuid import UUID
 
 try:
@@ -7,52 +32,162 @@ except ImportError:
     settings = {}
 
 try:
-    from redis import Redis
+    from redis import Redis, ConnectionPool
     from redis.exceptions import ConnectionError
     HAS_REDIS = True
 except ImportError:
-    Redis = object
+    Redis = ConnectionPool = object
     ConnectionError = RuntimeError
     HAS_REDIS = False
     if settings:
         settings.service.apis.redis.enabled = False
 
+try:
+    from redis.asyncio import Redis as AsyncRedis, ConnectionPool as AsyncConnectionPool
+    HAS_ASYNC_REDIS = True
+except ImportError:
+    AsyncRedis = AsyncConnectionPool = object
+    HAS_ASYNC_REDIS = False
+
 from tangl.type_hints import FlatData
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
-class RedisStorage:
-
-    def __init__(self, url = None, db = None):
-        if not settings.service.apis.redis.enabled:
-            raise RuntimeError("Redis backend not enabled")
-        if not HAS_REDIS:
-            raise ImportError
-
-        url = url or settings.service.apis.redis.url
-        token = settings.service.apis.redis.token
-        parts = url.split("/")
-        if parts[-1].isdigit():
-            nominal_db = int(parts[-1])
-            url = "/".join( parts[:-1] )
-        else:
-            # db not in url, use 0
-            nominal_db = 0
-        db = db or nominal_db
-        logger.debug( f"url={url}, token={token}, db={db}" )
-        self.redis = Redis.from_url(url, password=token, db=db)  # type: Redis
-
-        try:
-            # The 'ping' command is issued here
-            self.ping()
-            print("Redis connection is alive.")
-        except (AssertionError, ConnectionError) as e:
-            print(f"Unable to connect to Redis: {e}")
-            settings.service.apis.redis.enabled = False
-            raise ConnectionError("Unable to connect to redis")
-
-        logger.debug( self.redis )
+#: Prefix marking a zlib-compressed value.  Pickle payloads start with
+#: ``0x80`` and json/yaml payloads with printable text, so a leading NUL
+#: never collides with an uncompressed record.
+COMPRESSED_MAGIC = b"\x00tz1"
+
+_POOLS: dict[tuple[str, int], ConnectionPool] = {}
+_ASYNC_POOLS: dict[tuple[str, int], AsyncConnectionPool] = {}
+
+
+def _redis_setting(name: str, default=None):
+    if not settings:
+        return default
+    return settings.get(f"service.apis.redis.{name}", default)
+
+
+def _split_url(url: str | None, db: int | None) -> tuple[str, int]:
+    """Return ``(base_url, db)``, honoring a trailing ``/<db>`` in the url."""
+    url = url or _redis_setting("url")
+    parts = url.split("/")
+    if parts[-1].isdigit():
+        nominal_db = int(parts[-1])
+        url = "/".join(parts[:-1])
+    else:
+        # db not in url, use 0
+        nominal_db = 0
+    if db is None:
+        db = nominal_db
+    return url, db
+
+
+def get_connection_pool(url: str = None, db: int = None) -> ConnectionPool:
+    """Return the shared connection pool for ``(url, db)``, creating it once."""
+    url, db = _split_url(url, db)
+    pool = _POOLS.get((url, db))
+    if pool is None:
+        token = _redis_setting("token")
+        logger.debug(f"new redis pool url={url}, db={db}")
+        pool = ConnectionPool.from_url(
+            url, password=token, db=db,
+            max_connections=_redis_setting("max_connections"),
+        )
+        _POOLS[(url, db)] = pool
+    return pool
+
+
+def get_async_connection_pool(url: str = None, db: int = None) -> AsyncConnectionPool:
+    """Return the shared asyncio connection pool for ``(url, db)``."""
+    url, db = _split_url(url, db)
+    pool = _ASYNC_POOLS.get((url, db))
+    if pool is None:
+        token = _redis_setting("token")
+        logger.debug(f"new async redis pool url={url}, db={db}")
+        pool = AsyncConnectionPool.from_url(
+            url, password=token, db=db,
+            max_connections=_redis_setting("max_connections"),
+        )
+        _ASYNC_POOLS[(url, db)] = pool
+    return pool
+
+
+class _RedisCodec:
+    """Key and value encoding shared by the sync and async backends."""
+
+    compress_threshold: int | None = None
+    compress_level: int = 6
+
+    @staticmethod
+    def get_key(key: UUID):
+        if isinstance(key, UUID):
+            return key.bytes
+        return key
+
+    def _encode_value(self, value: FlatData) -> FlatData:
+        if self.compress_threshold is None:
+            return value
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        if len(value) < self.compress_threshold:
+            return value
+        return COMPRESSED_MAGIC + zlib.compress(value, self.compress_level)
+
+    @staticmethod
+    def _decode_value(value: bytes | None) -> bytes | None:
+        # Always check the marker so data written with compression stays
+        # readable after the threshold is disabled.
+        if value is not None and value[:len(COMPRESSED_MAGIC)] == COMPRESSED_MAGIC:
+            return zlib.decompress(value[len(COMPRESSED_MAGIC):])
+        return value
+
+
+class RedisStorage(_RedisCodec):
+    """
+    Redis-backed key-value storage implementing StorageProtocol.
+
+    Keys are UUIDs (stored as their 16 raw bytes), values are FlatData and
+    are always returned as bytes.
+
+    Args:
+        url: Redis url; a trailing ``/<db>`` selects the database.
+        db: Database index, overrides the url.
+        client: A pre-built redis-py compatible client.  When given, url/db
+                and the ``service.apis.redis.enabled`` gate are ignored.
+        compress_threshold: Values at least this many bytes long are stored
+                zlib-compressed.  ``None`` disables compression.
+        ping: Check the connection once at construction.
+    """
+
+    def __init__(self,
+                 url: str = None,
+                 db: int = None,
+                 *,
+                 client: Redis = None,
+                 compress_threshold: int | None = None,
+                 ping: bool = False):
+        if client is None:
+            if not settings.service.apis.redis.enabled:
+                raise RuntimeError("Redis backend not enabled")
+            if not HAS_REDIS:
+                raise ImportError
+            client = Redis(connection_pool=get_connection_pool(url, db))
+        self.redis = client  # type: Redis
+
+        if compress_threshold is None:
+            compress_threshold = _redis_setting("compress_threshold")
+        self.compress_threshold = compress_threshold or None
+
+        if ping:
+            try:
+                self.ping()
+            except (AssertionError, ConnectionError) as e:
+                logger.error(f"Unable to connect to Redis: {e}")
+                if settings:
+                    settings.service.apis.redis.enabled = False
+                raise ConnectionError("Unable to connect to redis") from e
 
     def clear(self):
         self.redis.flushdb()
@@ -60,37 +195,132 @@ class RedisStorage:
     def ping(self) -> bool:
         return self.redis.ping()
 
-    def get_key(self, key: UUID):
-        if isinstance(key, UUID):
-            return key.bytes
-        return key
+    # Single key access
+
+    def get(self, key: UUID, default: FlatData = None) -> FlatData | None:
+        """Fetch one value in a single round trip, ``default`` if missing."""
+        value = self._decode_value(self.redis.get(self.get_key(key)))
+        return default if value is None else value
 
     def __contains__(self, key: UUID) -> bool:
         key = self.get_key(key)
         return self.redis.exists(key) > 0
 
     def __getitem__(self, key: UUID) -> FlatData:
-        key = self.get_key(key)
-        value = self.redis.get(key)
+        value = self.get(key)
         if value is None:
-            raise KeyError
+            raise KeyError(f"No such key {key}")
         return value
 
     def __setitem__(self, key: UUID, value: FlatData):
         key = self.get_key(key)
-        return self.redis.set(key, value)
+        return self.redis.set(key, self._encode_value(value))
 
     def __delitem__(self, key):
         key = self.get_key(key)
-        if not self.redis.exists(key):
-            raise KeyError
-        self.redis.delete(key)
+        # DEL reports how many keys it removed, no separate EXISTS needed
+        if not self.redis.delete(key):
+            raise KeyError(f"No such key {key}")
+
+    # Bulk access
+
+    def get_many(self, keys: Iterable[UUID]) -> list[FlatData | None]:
+        """Fetch several values with one ``MGET``, ``None`` for missing keys."""
+        keys = [self.get_key(k) for k in keys]
+        if not keys:
+            return []
+        return [self._decode_value(v) for v in self.redis.mget(keys)]
+
+    def set_many(self, items: Mapping[UUID, FlatData]):
+        """Write several values in one pipelined transaction."""
+        with self.redis.pipeline() as pipe:
+            for key, value in items.items():
+                pipe.set(self.get_key(key), self._encode_value(value))
+            pipe.execute()
+
+    def delete_many(self, keys: Iterable[UUID]) -> int:
+        """Remove several keys, returning the number actually deleted."""
+        keys = [self.get_key(k) for k in keys]
+        if not keys:
+            return 0
+        return self.redis.delete(*keys)
 
     def __len__(self):
         return self.redis.dbsize()
 
-    def __iter__(self):
-        return iter(self.redis.keys("*"))
+    def __iter__(self) -> Iterator[bytes]:
+        # SCAN is incremental, KEYS would block the server on a large db
+        return self.redis.scan_iter()
 
     def __bool__(self) -> bool:
         return len(self) != 0
+
+
+class AsyncRedisStorage(_RedisCodec):
+    """
+    Asyncio counterpart of :class:`RedisStorage`.
+
+    Shares the key layout and compression format, so both classes can read
+    each other's records.  Async code cannot implement the mapping dunders,
+    so access goes through explicit coroutine methods.
+    """
+
+    def __init__(self,
+                 url: str = None,
+                 db: int = None,
+                 *,
+                 client: AsyncRedis = None,
+                 compress_threshold: int | None = None):
+        if client is None:
+            if not settings.service.apis.redis.enabled:
+                raise RuntimeError("Redis backend not enabled")
+            if not HAS_ASYNC_REDIS:
+                raise ImportError
+            client = AsyncRedis(connection_pool=get_async_connection_pool(url, db))
+        self.redis = client  # type: AsyncRedis
+
+        if compress_threshold is None:
+            compress_threshold = _redis_setting("compress_threshold")
+        self.compress_threshold = compress_threshold or None
+
+    async def ping(self) -> bool:
+        return await self.redis.ping()
+
+    async def clear(self):
+        await self.redis.flushdb()
+
+    async def contains(self, key: UUID) -> bool:
+        return await self.redis.exists(self.get_key(key)) > 0
+
+    async def get(self, key: UUID, default: FlatData = None) -> FlatData | None:
+        value = self._decode_value(await self.redis.get(self.get_key(key)))
+        return default if value is None else value
+
+    async def set(self, key: UUID, value: FlatData):
+        return await self.redis.set(self.get_key(key), self._encode_value(value))
+
+    async def delete(self, key: UUID):
+        key = self.get_key(key)
+        if not await self.redis.delete(key):
+            raise KeyError(f"No such key {key}")
+
+    async def get_many(self, keys: Iterable[UUID]) -> list[FlatData | None]:
+        keys = [self.get_key(k) for k in keys]
+        if not keys:
+            return []
+        return [self._decode_value(v) for v in await self.redis.mget(keys)]
+
+    async def set_many(self, items: Mapping[UUID, FlatData]):
+        async with self.redis.pipeline() as pipe:
+            for key, value in items.items():
+                pipe.set(self.get_key(key), self._encode_value(value))
+            await pipe.execute()
+
+    async def length(self) -> int:
+        return await self.redis.dbsize()
+
+    async def keys(self) -> list[bytes]:
+        return [key async for key in self.redis.scan_iter()]
+
+    async def aclose(self):
+        await self.redis.aclose()
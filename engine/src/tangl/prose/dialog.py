@@ -8,12 +8,18 @@ Dialog blocks follow a lightweight Obsidian-style admonition syntax::
 
 Leading ``>`` markers denote dialog paragraphs; non-dialog paragraphs are
 emitted as narration micro-blocks.
+
+Parsing is split from binding so each half can be reused.  Content compiles
+once into a tuple of :class:`DialogLine` records, cached by content, and
+each distinct ``(speaker label, dialog class)`` pair resolves once into a
+:class:`DialogSpeaker` that every line by that speaker shares.
 """
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Mapping
+from functools import lru_cache
+from typing import Any, Mapping, MutableMapping
 from uuid import UUID
 
 from tangl.journal.fragments import AttributedFragment, ContentFragment, PresentationHints
@@ -22,6 +28,30 @@ from tangl.utils.sanitize_str import sanitize_str
 from .mu_block import MuBlock, MuBlockHandler
 
 
+@dataclass(slots=True, frozen=True)
+class DialogLine:
+    """One parsed dialog or narration paragraph, before speaker binding."""
+
+    text: str
+    label: str | None = None
+    dialog_class: str = "narration"
+
+
+@dataclass(slots=True, frozen=True)
+class DialogSpeaker:
+    """Speaker metadata resolved for one ``(label, dialog_class)`` pair."""
+
+    dialog_mode: str
+    attitude: str | None
+    speaker_key: str | None
+    speaker_id: str | None
+    speaker_label: str | None
+    speaker_name: str
+    presentation_hints: PresentationHints
+    media_payload: Any
+    tags: frozenset[str]
+
+
 @dataclass(slots=True)
 class DialogSpeakerBinding:
     """Resolved speaker binding for a dialog micro-block."""
@@ -147,6 +177,89 @@ def _speaker_binding(label: str | None, ns: Mapping[str, Any] | None) -> DialogS
     return None
 
 
+def _dialog_tags(
+    *,
+    dialog_class: str,
+    dialog_mode: str | None,
+    speaker: str | None,
+    speaker_key: str | None,
+    attitude: str | None,
+) -> list[str]:
+    tags: list[str] = []
+    if dialog_class_tag := _tag_value(dialog_class):
+        tags.append(f"dialog_class:{dialog_class_tag}")
+    if dialog_mode_tag := _tag_value(dialog_mode or "narration"):
+        tags.append(f"dialog_mode:{dialog_mode_tag}")
+    if speaker_tag := _tag_value(speaker):
+        tags.append(f"speaker:{speaker_tag}")
+    if speaker_key_tag := _tag_value(speaker_key):
+        tags.append(f"speaker_key:{speaker_key_tag}")
+    if attitude_tag := _tag_value(attitude):
+        tags.append(f"attitude:{attitude_tag}")
+    return tags
+
+
+def resolve_dialog_speaker(
+    label: str | None,
+    dialog_class: str,
+    *,
+    ns: Mapping[str, Any] | None = None,
+    ctx: Any = None,
+) -> DialogSpeaker:
+    """Resolve speaker identity, styling and media for one dialog voice."""
+    dialog_mode, attitude = _split_dialog_class(dialog_class)
+    speaker_key = speaker_id = speaker_label = speaker_name = None
+    media_payload = None
+    style_dict: dict[str, str] = {}
+
+    binding = _speaker_binding(label, ns)
+    if binding is not None:
+        subject = binding.subject
+        speaker_key = binding.key
+        speaker_name = _speaker_display_name(subject, label)
+        media_payload = _speaker_media_payload(
+            subject,
+            dialog_class=dialog_class,
+            attitude=attitude,
+            ctx=ctx,
+        )
+
+        uid = getattr(subject, "uid", None)
+        if uid is not None:
+            speaker_id = str(uid)
+
+        get_label = getattr(subject, "get_label", None)
+        if callable(get_label):
+            subject_label = get_label()
+            if isinstance(subject_label, str) and subject_label.strip():
+                speaker_label = subject_label.strip()
+
+        style_dict = _speaker_style_dict(subject, dialog_class=dialog_class)
+
+    tags = _dialog_tags(
+        dialog_class=dialog_class,
+        dialog_mode=dialog_mode,
+        speaker=speaker_label or label,
+        speaker_key=speaker_key,
+        attitude=attitude,
+    )
+    return DialogSpeaker(
+        dialog_mode=dialog_mode,
+        attitude=attitude,
+        speaker_key=speaker_key,
+        speaker_id=speaker_id,
+        speaker_label=speaker_label,
+        speaker_name=speaker_name or _normalized_text(label) or "narrator",
+        presentation_hints=PresentationHints(
+            style_name=(dialog_mode or "narration").lower(),
+            style_tags=["dialog", *tags],
+            style_dict=style_dict,
+        ),
+        media_payload=media_payload,
+        tags=frozenset(tags),
+    )
+
+
 @dataclass(slots=True)
 class DialogMuBlock(MuBlock):
     """Dialog utterance with optional speaker metadata."""
@@ -160,79 +273,41 @@ class DialogMuBlock(MuBlock):
     speaker_name: str | None = None
     presentation_hints: PresentationHints | None = None
     media_payload: Any = None
+    speaker_tags: frozenset[str] | None = None
 
     def bind(self, *, ns: Mapping[str, Any] | None = None, ctx: Any = None) -> "DialogMuBlock":
         """Resolve speaker metadata against the current render namespace."""
-        self.speaker_key = None
-        self.speaker_id = None
-        self.speaker_label = None
-        self.speaker_name = None
-        self.presentation_hints = None
-        self.media_payload = None
-
-        dialog_mode, attitude = _split_dialog_class(self.dialog_class)
-        self.dialog_mode = dialog_mode
-        self.attitude = attitude
-
-        binding = _speaker_binding(self.label, ns)
-        style_dict: dict[str, str] = {}
-        if binding is not None:
-            subject = binding.subject
-            self.speaker_key = binding.key
-            self.speaker_name = _speaker_display_name(subject, self.label)
-            self.media_payload = _speaker_media_payload(
-                subject,
-                dialog_class=self.dialog_class,
-                attitude=attitude,
-                ctx=ctx,
-            )
-
-            uid = getattr(subject, "uid", None)
-            if uid is not None:
-                self.speaker_id = str(uid)
-
-            get_label = getattr(subject, "get_label", None)
-            if callable(get_label):
-                label = get_label()
-                if isinstance(label, str) and label.strip():
-                    self.speaker_label = label.strip()
-
-            style_dict = _speaker_style_dict(subject, dialog_class=self.dialog_class)
-
-        if not self.speaker_name:
-            self.speaker_name = _normalized_text(self.label) or "narrator"
-
-        style_tags = ["dialog"]
-        if dialog_class_tag := _tag_value(self.dialog_class):
-            style_tags.append(f"dialog_class:{dialog_class_tag}")
-        if dialog_mode_tag := _tag_value(self.dialog_mode or "narration"):
-            style_tags.append(f"dialog_mode:{dialog_mode_tag}")
-        if speaker_tag := _tag_value(self.speaker_label or self.label):
-            style_tags.append(f"speaker:{speaker_tag}")
-        if speaker_key_tag := _tag_value(self.speaker_key):
-            style_tags.append(f"speaker_key:{speaker_key_tag}")
-        if attitude_tag := _tag_value(self.attitude):
-            style_tags.append(f"attitude:{attitude_tag}")
-
-        self.presentation_hints = PresentationHints(
-            style_name=(self.dialog_mode or "narration").lower(),
-            style_tags=style_tags,
-            style_dict=style_dict,
+        return self.apply_speaker(
+            resolve_dialog_speaker(self.label, self.dialog_class, ns=ns, ctx=ctx)
         )
+
+    def apply_speaker(self, speaker: DialogSpeaker) -> "DialogMuBlock":
+        """Adopt metadata resolved (possibly for another line) by the same speaker."""
+        self.dialog_mode = speaker.dialog_mode
+        self.attitude = speaker.attitude
+        self.speaker_key = speaker.speaker_key
+        self.speaker_id = speaker.speaker_id
+        self.speaker_label = speaker.speaker_label
+        self.speaker_name = speaker.speaker_name
+        self.presentation_hints = speaker.presentation_hints
+        media_payload = speaker.media_payload
+        self.media_payload = dict(media_payload) if isinstance(media_payload, dict) else media_payload
+        self.speaker_tags = speaker.tags
         return self
 
     def to_fragment(self) -> AttributedFragment:
-        tags: set[str] = set()
-        if dialog_class_tag := _tag_value(self.dialog_class):
-            tags.add(f"dialog_class:{dialog_class_tag}")
-        if dialog_mode_tag := _tag_value(self.dialog_mode or "narration"):
-            tags.add(f"dialog_mode:{dialog_mode_tag}")
-        if speaker_tag := _tag_value(self.speaker_label or self.label):
-            tags.add(f"speaker:{speaker_tag}")
-        if speaker_key_tag := _tag_value(self.speaker_key):
-            tags.add(f"speaker_key:{speaker_key_tag}")
-        if attitude_tag := _tag_value(self.attitude):
-            tags.add(f"attitude:{attitude_tag}")
+        if self.speaker_tags is not None:
+            tags = set(self.speaker_tags)
+        else:
+            tags = set(
+                _dialog_tags(
+                    dialog_class=self.dialog_class,
+                    dialog_mode=self.dialog_mode,
+                    speaker=self.speaker_label or self.label,
+                    speaker_key=self.speaker_key,
+                    attitude=self.attitude,
+                )
+            )
 
         return AttributedFragment(
             content=self.text,
@@ -252,6 +327,38 @@ class DialogMuBlock(MuBlock):
         )
 
 
+_HEADER_RE = re.compile(r">\s*\[!([\w\.-]+)\s*]\s*(\w.*)?")
+_PREFIX_RE = re.compile(r"^>\s*")
+
+
+@lru_cache(maxsize=1024)
+def compile_dialog(text: str) -> tuple[DialogLine, ...]:
+    """Parse dialog markup into immutable lines, cached by content.
+
+    Raises ``ValueError`` for a ``>`` paragraph without a valid header.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return ()
+    return tuple(
+        _parse_dialog_paragraph(paragraph) if paragraph.startswith(">") else DialogLine(text=paragraph.strip())
+        for paragraph in re.split(r"\n{2,}", stripped)
+    )
+
+
+def _parse_dialog_paragraph(paragraph: str) -> DialogLine:
+    lines = [line for line in paragraph.split("\n") if line.strip()]
+    header = lines[0]
+    header_match = _HEADER_RE.match(header)
+    if header_match is None:
+        raise ValueError(f"Invalid dialog syntax: {header}")
+
+    dialog_class = header_match.group(1).strip()
+    label = header_match.group(2).strip() if header_match.group(2) else None
+    body_lines = (_PREFIX_RE.sub("", line).strip() for line in lines[1:])
+    return DialogLine(text=" ".join(filter(None, body_lines)), label=label, dialog_class=dialog_class)
+
+
 class DialogHandler(MuBlockHandler):
     """Parse and render dialog micro-blocks."""
 
@@ -265,53 +372,34 @@ class DialogHandler(MuBlockHandler):
     def parse(
         cls, text: str, *, source_id: UUID | None = None, **_: object
     ) -> list[DialogMuBlock]:
-        paragraphs = re.split(r"\n{2,}", text.strip()) if text.strip() else []
-        mu_blocks: list[DialogMuBlock] = []
-
-        for paragraph in paragraphs:
-            if paragraph.startswith(">"):
-                mu_blocks.append(
-                    cls._parse_dialog_paragraph(paragraph, source_id=source_id)
-                )
-            else:
-                mu_blocks.append(
-                    DialogMuBlock(
-                        text=paragraph.strip(),
-                        label=None,
-                        dialog_class="narration",
-                        source_id=source_id,
-                    )
-                )
+        """Build bound micro-blocks for ``text``.
 
+        ``speakers`` may carry resolved :class:`DialogSpeaker` records keyed
+        by ``(label, dialog_class)`` across calls; resolution is shared per
+        call regardless.
+        """
         ns = _.get("ns")
         render_ctx = _.get("ctx")
-        return [mu_block.bind(ns=ns, ctx=render_ctx) for mu_block in mu_blocks]
+        speakers: MutableMapping[tuple[str | None, str], DialogSpeaker] | None = _.get("speakers")
+        if speakers is None:
+            speakers = {}
 
-    @classmethod
-    def _parse_dialog_paragraph(
-        cls, paragraph: str, *, source_id: UUID | None
-    ) -> DialogMuBlock:
-        lines = [line for line in paragraph.split("\n") if line.strip()]
-        header = lines[0]
-        header_match = re.match(r">\s*\[!([\w\.-]+)\s*]\s*(\w.*)?", header)
-        if header_match is None:
-            raise ValueError(f"Invalid dialog syntax: {header}")
-
-        dialog_class = header_match.group(1).strip()
-        label = header_match.group(2).strip() if header_match.group(2) else None
-        body_lines = (cls._strip_dialog_prefix(line) for line in lines[1:])
-        body_text = " ".join(filter(None, body_lines))
-
-        return DialogMuBlock(
-            text=body_text,
-            label=label,
-            dialog_class=dialog_class,
-            source_id=source_id,
-        )
-
-    @staticmethod
-    def _strip_dialog_prefix(line: str) -> str:
-        return re.sub(r"^>\s*", "", line).strip()
+        mu_blocks: list[DialogMuBlock] = []
+        for line in compile_dialog(text):
+            key = (line.label, line.dialog_class)
+            speaker = speakers.get(key)
+            if speaker is None:
+                speaker = speakers[key] = resolve_dialog_speaker(
+                    line.label, line.dialog_class, ns=ns, ctx=render_ctx
+                )
+            mu_block = DialogMuBlock(
+                text=line.text,
+                label=line.label,
+                dialog_class=line.dialog_class,
+                source_id=source_id,
+            )
+            mu_blocks.append(mu_block.apply_speaker(speaker))
+        return mu_blocks
 
     @classmethod
     def render(cls, mu_blocks: list[MuBlock]) -> list[ContentFragment]:
@@ -8,11 +8,12 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
+from functools import cache
 from typing import Protocol, TypeAlias, cast
 
 import jinja2
 
-from tangl.utils.rejinja import RecursiveTemplate
+from tangl.utils.rejinja import RecursiveTemplate, template_cache
 from tangl.vm.ctx import VmPhaseCtx
 
 Scope: TypeAlias = dict[str, object]
@@ -48,7 +49,9 @@ def _render_as_filter(
     return render_as(target, aspect, content=content, bindings=bindings)
 
 
+@cache
 def _default_environment() -> jinja2.Environment:
+    # shared so compiled templates are reused across sessions
     return jinja2.Environment(undefined=jinja2.StrictUndefined)
 
 
@@ -91,6 +94,9 @@ class TextRenderSession:
     ------------
     Renders through :class:`RecursiveTemplate`, provides child ``subject``
     bindings, and bounds recursive output across nested child renders.
+    Compiled templates come from the process-wide
+    :data:`tangl.utils.rejinja.template_cache`; sessions without an explicit
+    ``environment`` share one default environment so their entries are reused.
 
     API
     ---
@@ -224,7 +230,8 @@ class TextRenderSession:
                 state.frames.add(frame)
                 frames.append(frame)
 
-                template = self.environment.from_string(
+                template = template_cache.get_template(
+                    self.environment,
                     current,
                     template_class=RecursiveTemplate,
                 )
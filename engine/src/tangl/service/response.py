@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Annotated, Any, Literal, Mapping, Optional, Self, TypeAlias
+from typing import Annotated, Any, Callable, Literal, Mapping, Optional, Self, TypeAlias
 from uuid import UUID, uuid4
 
 from pydantic import (
@@ -23,11 +23,11 @@ from pydantic import (
 from tangl.core import BaseFragment
 from tangl.info import __url__
 from tangl.journal.intent import KvRow, PrimitiveValue
+from tangl.journal.fragment_codec import fragment_encoder
 from tangl.journal.fragments import (
     KvFragment,
     MediaFragment,
     PresentationHints,
-    fragment_to_dto,
 )
 from tangl.service.user.user import User
 
@@ -177,8 +177,15 @@ class RuntimeEnvelope(InfoModel):
             "grammar": GrammarHint.model_validate(metadata["grammar"]),
         }
 
-    def to_dto(self) -> dict[str, Any]:
-        """Return the transport DTO projection for client-facing envelopes."""
+    def to_dto(
+        self,
+        fragment_dto: Callable[[BaseFragment], dict[str, Any] | None] = fragment_encoder.to_dto,
+    ) -> dict[str, Any]:
+        """Return the transport DTO projection for client-facing envelopes.
+
+        ``fragment_dto`` projects each fragment; transports that shape media
+        pass their own, and fragments it maps to ``None`` are dropped.
+        """
 
         base_payload = self.model_dump(
             mode="json",
@@ -190,7 +197,9 @@ class RuntimeEnvelope(InfoModel):
         for field_name in ("cursor_id", "step"):
             if field_name in base_payload:
                 payload[field_name] = base_payload.pop(field_name)
-        payload["fragments"] = [fragment_to_dto(fragment) for fragment in self.fragments]
+        payload["fragments"] = [
+            dto for dto in (fragment_dto(fragment) for fragment in self.fragments) if dto is not None
+        ]
         payload.update(base_payload)
         return payload
 
@@ -6,7 +6,7 @@ from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator, TYPE_CHECKING
+from typing import Any, Callable, Iterator, TYPE_CHECKING
 from uuid import UUID
 
 import yaml
@@ -169,18 +169,18 @@ class ServiceManager:
 
     def _load_user(self, user_id: UUID) -> User:
         persistence = self._require_persistence()
-        if user_id not in persistence:
+        user = persistence.get(user_id)
+        if user is None:
             raise ValueError(f"User {user_id} not found")
-        user = persistence.load(user_id)
         if not isinstance(user, User):
             raise TypeError(f"Expected User for {user_id}, got {type(user).__name__}")
         return user
 
     def _load_ledger(self, ledger_id: UUID) -> Ledger:
         persistence = self._require_persistence()
-        if ledger_id not in persistence:
+        ledger = persistence.get(ledger_id)
+        if ledger is None:
             raise ValueError(f"Ledger {ledger_id} not found")
-        ledger = persistence.load(ledger_id)
         if not isinstance(ledger, Ledger):
             raise TypeError(f"Expected Ledger for {ledger_id}, got {type(ledger).__name__}")
         return ledger
@@ -207,13 +207,10 @@ class ServiceManager:
     ) -> Iterator[User]:
         """Open one persisted user resource."""
 
-        persistence = self._require_persistence()
-        if user_id not in persistence:
-            raise ValueError(f"User {user_id} not found")
-        with persistence.open(user_id, write_back=write_back) as user:
-            if not isinstance(user, User):
-                raise TypeError(f"Expected User for {user_id}, got {type(user).__name__}")
-            yield user
+        user = self._load_user(user_id)
+        yield user
+        if write_back:
+            self._save(user)
 
     @contextmanager
     def open_ledger(
@@ -224,13 +221,10 @@ class ServiceManager:
     ) -> Iterator[Ledger]:
         """Open one persisted ledger resource."""
 
-        persistence = self._require_persistence()
-        if ledger_id not in persistence:
-            raise ValueError(f"Ledger {ledger_id} not found")
-        with persistence.open(ledger_id, write_back=write_back) as ledger:
-            if not isinstance(ledger, Ledger):
-                raise TypeError(f"Expected Ledger for {ledger_id}, got {type(ledger).__name__}")
-            yield ledger
+        ledger = self._load_ledger(ledger_id)
+        yield ledger
+        if write_back:
+            self._save(ledger)
 
     def open_world(self, world_id: str, /) -> World:
         """Resolve one world by id."""
@@ -362,28 +356,42 @@ class ServiceManager:
         )
 
     @staticmethod
-    def _prime_initial_update(ledger: Ledger) -> None:
-        """Seed entry JOURNAL output for a freshly created ledger."""
+    @contextmanager
+    def _observe_fragments(
+        ledger: Ledger,
+        observer: Callable[[BaseFragment, dict[str, Any]], None] | None,
+    ) -> Iterator[None]:
+        """Relay fragments to ``observer`` as the ledger's frames emit them.
+
+        The observer also receives the envelope's ``world_id``/``ledger_id``
+        metadata, so it can resolve media without waiting for the envelope.
+        """
 
-        if ledger.get_journal():
+        if observer is None:
+            yield
             return
 
-        frame = ledger.get_frame()
-        frame.goto_node(ledger.cursor)
+        metadata: dict[str, Any] = {"ledger_id": str(ledger.uid)}
+        world_id = ServiceManager._resolve_world_id(ledger)
+        if world_id is not None:
+            metadata["world_id"] = world_id
 
-        prev_id = ledger.cursor_history[-1] if ledger.cursor_history else None
-        for node_id in frame.cursor_trace:
-            if prev_id is not None and node_id == prev_id:
-                ledger.reentrant_steps += 1
-            prev_id = node_id
+        def relay(record: Any) -> None:
+            fragment = Ledger._coerce_fragment_record(record)
+            if fragment is not None:
+                observer(fragment, metadata)
 
-        ledger.cursor_steps += frame.cursor_steps
-        ledger.cursor_id = frame.cursor.uid
-        ledger.cursor_history.extend(frame.cursor_trace)
-        ledger.call_stack_ids = [edge.uid for edge in frame.return_stack]
-        ledger.last_redirect = frame.last_redirect
-        ledger.redirect_trace = list(frame.redirect_trace)
-        ledger.save_snapshot(cadence=ledger.checkpoint_cadence)
+        ledger.record_observer = relay
+        try:
+            yield
+        finally:
+            ledger.record_observer = None
+
+    @staticmethod
+    def _prime_initial_update(ledger: Ledger) -> None:
+        """Seed entry JOURNAL output for a freshly created ledger."""
+
+        ledger.prime_entry()
 
     @service_method(
         access=ServiceAccess.CLIENT,
@@ -456,8 +464,14 @@ class ServiceManager:
         user_id: UUID | None = None,
         ledger_id: UUID | None = None,
         user_auth: "UserAuthInfo | None" = None,
+        fragment_observer: Callable[[BaseFragment, dict[str, Any]], None] | None = None,
     ) -> RuntimeEnvelope:
-        """Resolve a direct or query-selected edge and return the newest envelope."""
+        """Resolve a direct or query-selected edge and return the newest envelope.
+
+        ``fragment_observer`` is called with each fragment as soon as the
+        pipeline emits it, before the envelope is built; streaming transports
+        use it to forward journal output early.
+        """
 
         with self.open_session(
             user_id=user_id,
@@ -507,7 +521,8 @@ class ServiceManager:
                 edge_id = request.edge_id
 
             try:
-                session.ledger.resolve_choice(edge_id, choice_payload=request.payload)
+                with self._observe_fragments(session.ledger, fragment_observer):
+                    session.ledger.resolve_choice(edge_id, choice_payload=request.payload)
             except ValueError as exc:
                 if isinstance(request, DirectEdgeRequest):
                     raise
@@ -67,8 +67,10 @@ from .episode import Action, Block, MenuBlock, Scene
 from .fabula import (
     AuthoredRef,
     CompileIssue,
+    CompilePatch,
     CompileSeverity,
     GraphInitializationError,
+    IncrementalStoryCompiler,
     InitMode,
     InitReport,
     ResolutionError,
@@ -101,6 +103,7 @@ from .analysis import (
     project_story_graph,
     project_world_graph,
     projected_graph_to_dict,
+    refresh_runtime,
     render_basic_svg,
     render_dot,
     report_to_dict,
@@ -108,6 +111,7 @@ from .analysis import (
     structural_selector,
     to_dot,
 )
+from .exploration import ExplorationReport, exhaustive_walk, random_walks
 from .story_graph import StoryGraph
 from .dispatch import (
     do_find_edges,
@@ -138,11 +142,14 @@ __all__ = [
     "ScriptGraphReport",
     "ChoiceFragment",
     "CompileIssue",
+    "CompilePatch",
     "CompileSeverity",
     "ContentFragment",
     "EntityKnowledge",
+    "ExplorationReport",
     "GraphInitializationError",
     "HasNarratorKnowledge",
+    "IncrementalStoryCompiler",
     "InitMode",
     "InitReport",
     "Location",
@@ -170,6 +177,7 @@ __all__ = [
     "do_render_text",
     "episode_only_selector",
     "episode_plus_concepts_selector",
+    "exhaustive_walk",
     "focus_runtime_window",
     "get_narrator_key",
     "mark_node_styles",
@@ -181,7 +189,9 @@ __all__ = [
     "on_render_text",
     "project_story_graph",
     "project_world_graph",
+    "random_walks",
     "projected_graph_to_dict",
+    "refresh_runtime",
     "render_basic_svg",
     "render_dot",
     "report_to_dict",
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field, replace
 from html import escape
 import json
 from pathlib import Path
 import subprocess
 from typing import Any, Callable, Iterable, Mapping
+import weakref
 
 from tangl.core import Edge, EntityTemplate, Node, Selector, TemplateRegistry
 from tangl.media.media_resource import MediaDep, MediaResourceInventoryTag as MediaRIT
@@ -18,7 +19,6 @@ from tangl.vm import (
     TraversableEdge,
     TraversableNode,
 )
-from tangl.vm.traversal import get_visit_count
 
 from .concepts import Actor, Location, Role, Setting
 from .episode import Action, Block, Scene
@@ -78,6 +78,13 @@ class ProjectedGraph:
     _source_edges_by_id: dict[str, Any] = field(default_factory=dict, repr=False)
     _projected_node_id_by_source_id: dict[str, str] = field(default_factory=dict, repr=False)
     _origin_source_nodes_by_id: dict[str, Any] = field(default_factory=dict, repr=False)
+    # Lazily built adjacency index, dropped whenever nodes or edges change.
+    _index: _ProjectedGraphIndex | None = field(default=None, repr=False, compare=False)
+    # Runtime overlay bookkeeping for incremental ``refresh_runtime`` calls.
+    _runtime: _RuntimeOverlayState | None = field(default=None, repr=False, compare=False)
+    # Set while a projection pipeline owns the graph, so processors may
+    # update it in place instead of copying.
+    _owned: bool = field(default=False, repr=False, compare=False)
 
 
 @dataclass(slots=True)
@@ -120,6 +127,25 @@ class _ProjectedGraphIndex:
             groups_for_node=dict(groups_for_node),
         )
 
+    def add_group(self, group: ProjectedGroup) -> None:
+        self.group_by_id[group.id] = group
+        for node_id in group.member_node_ids:
+            memberships = self.groups_for_node.setdefault(node_id, [])
+            memberships.append(group.id)
+            memberships.sort()
+
+
+@dataclass(slots=True)
+class _RuntimeOverlayState:
+    ledger_id: Any
+    history_len: int
+    last_entry: Any
+    current_projected_id: str
+    source_uid_by_node_id: dict[str, Any]
+    node_id_by_source_uid: dict[Any, str]
+    visit_counts: Counter
+    first_visit: dict[Any, int]
+
 
 @dataclass(slots=True)
 class ScriptGraphNode:
@@ -150,7 +176,8 @@ class ScriptGraphReport:
 class _ProjectionContext:
     graph: StoryGraph
     template_registry: TemplateRegistry | None
-    template_by_hash: dict[bytes, EntityTemplate]
+    # Only needed for entities without lineage, so hashed on first use.
+    template_by_hash: dict[bytes, EntityTemplate] | None = None
 
 
 @dataclass(slots=True)
@@ -175,6 +202,10 @@ class _EdgeSeed:
     edge_role: str
 
 
+_PROJECTION_STORIES: weakref.WeakKeyDictionary[World, dict[str, tuple[int, StoryGraph]]] = (
+    weakref.WeakKeyDictionary()
+)
+
 _GATE_COLORS: dict[str | None, str] = {
     "INPUT": "#f5d90a",
     "OUTPUT": "#3ac47d",
@@ -249,9 +280,15 @@ def project_story_graph(
         edge_candidates=edge_candidates,
     )
 
+    # The pipeline owns this graph until it is returned, so built-in
+    # processors update it in place and share one adjacency index.
+    projected._owned = True
     for processor in processors:
         projected = processor(projected)
-    return _sorted_projected_graph(projected)
+    projected = _writable(projected)
+    _sort_projected_graph(projected)
+    projected._owned = False
+    return projected
 
 
 def project_world_graph(
@@ -263,7 +300,7 @@ def project_world_graph(
     processors: Iterable[ProjectedGraphProcessor] = (),
     story_label: str = "projection_inspection",
 ) -> ProjectedGraph:
-    """Project one world by first creating an eager frozen inspection story."""
+    """Project one world through its cached eager frozen inspection story."""
 
     graph = _make_projection_story(world=world, story_label=story_label)
     return project_story_graph(
@@ -303,23 +340,24 @@ def cluster_by_scene() -> ProjectedGraphProcessor:
         if not grouped:
             return projected_graph
 
-        groups = list(projected_graph.groups)
+        projected_graph = _writable(projected_graph)
         for group_id in sorted(grouped):
             bucket = grouped[group_id]
-            groups.append(
-                ProjectedGroup(
-                    id=group_id,
-                    label=bucket["label"],
-                    group_kind="cluster",
-                    member_node_ids=sorted(bucket["member_node_ids"]),
-                    source_id=bucket["source_id"],
-                    source_kind=bucket["source_kind"],
-                    synthetic=False,
-                    origin_node_ids=sorted(bucket["member_node_ids"]),
-                    attrs={},
-                )
+            group = ProjectedGroup(
+                id=group_id,
+                label=bucket["label"],
+                group_kind="cluster",
+                member_node_ids=sorted(bucket["member_node_ids"]),
+                source_id=bucket["source_id"],
+                source_kind=bucket["source_kind"],
+                synthetic=False,
+                origin_node_ids=sorted(bucket["member_node_ids"]),
+                attrs={},
             )
-        return _replace_projected_graph(projected_graph, groups=groups)
+            projected_graph.groups.append(group)
+            if projected_graph._index is not None:
+                projected_graph._index.add_group(group)
+        return projected_graph
 
     return processor
 
@@ -328,21 +366,19 @@ def attach_media_preview(media_role: str | None = None) -> ProjectedGraphProcess
     """Return one processor that annotates nodes with previewable media paths."""
 
     def processor(projected_graph: ProjectedGraph) -> ProjectedGraph:
-        updated_nodes: list[ProjectedNode] = []
-        changed = False
+        updates: dict[str, dict[str, object]] = {}
         for node in projected_graph.nodes:
             source = projected_graph._source_nodes_by_id.get(node.id)
             preview_attrs = _preview_attrs_for_source_node(source=source, media_role=media_role)
-            if not preview_attrs:
-                updated_nodes.append(node)
-                continue
-            attrs = dict(node.attrs)
-            attrs.update(preview_attrs)
-            updated_nodes.append(replace(node, attrs=attrs))
-            changed = True
-        if not changed:
+            if preview_attrs:
+                updates[node.id] = preview_attrs
+        if not updates:
             return projected_graph
-        return _replace_projected_graph(projected_graph, nodes=updated_nodes)
+        projected_graph = _writable(projected_graph)
+        for node in projected_graph.nodes:
+            if node.id in updates:
+                node.attrs.update(updates[node.id])
+        return projected_graph
 
     return processor
 
@@ -351,25 +387,24 @@ def mark_node_styles(style_policy: NodeStylePolicy) -> ProjectedGraphProcessor:
     """Return one processor that annotates projected nodes with style attrs."""
 
     def processor(projected_graph: ProjectedGraph) -> ProjectedGraph:
-        updated_nodes: list[ProjectedNode] = []
-        changed = False
+        updates: dict[str, dict[str, object]] = {}
         for node in projected_graph.nodes:
             source = projected_graph._source_nodes_by_id.get(node.id)
             additions = dict(style_policy(node, source) or {})
-            if not additions:
-                updated_nodes.append(node)
+            if additions:
+                updates[node.id] = additions
+        if not updates:
+            return projected_graph
+        projected_graph = _writable(projected_graph)
+        for node in projected_graph.nodes:
+            additions = updates.get(node.id)
+            if additions is None:
                 continue
-
-            attrs = dict(node.attrs)
             for key, value in sorted(additions.items()):
                 if value is None:
                     continue
-                attrs[key] = value
-            updated_nodes.append(replace(node, attrs=attrs))
-            changed = True
-        if not changed:
-            return projected_graph
-        return _replace_projected_graph(projected_graph, nodes=updated_nodes)
+                node.attrs[key] = value
+        return projected_graph
 
     return processor
 
@@ -382,46 +417,182 @@ def annotate_runtime(
     """Return one processor that stamps runtime attrs from one live ledger."""
 
     def processor(projected_graph: ProjectedGraph) -> ProjectedGraph:
-        current_projected_id = projected_graph._projected_node_id_by_source_id.get(
-            _stringify_identifier(ledger.cursor_id)
-        )
-        if current_projected_id is None:
+        if _projected_cursor_id(projected_graph, ledger) is None:
             return projected_graph
+        return refresh_runtime(
+            _writable(projected_graph),
+            ledger,
+            include_availability=include_availability,
+        )
+
+    return processor
 
-        node_updates: list[ProjectedNode] = []
-        for node in projected_graph.nodes:
-            source = projected_graph._source_nodes_by_id.get(node.id)
-            source_uid = getattr(source, "uid", None)
-            visit_count = get_visit_count(source_uid, ledger.cursor_history) if source_uid is not None else 0
-            visit_index = _first_visit_index(cursor_id=source_uid, history=ledger.cursor_history)
-            attrs = dict(node.attrs)
-            attrs["runtime.current"] = source_uid == ledger.cursor_id
-            attrs["runtime.visited"] = visit_count > 0
-            attrs["runtime.visit_index"] = visit_index
-            attrs["runtime.visit_count"] = visit_count
-            node_updates.append(replace(node, attrs=attrs))
-
-        followed_pairs = _followed_projected_pairs(ledger=ledger, projected_graph=projected_graph)
-        edge_updates: list[ProjectedEdge] = []
-        for edge in projected_graph.edges:
-            attrs = dict(edge.attrs)
-            attrs["runtime.followed"] = (edge.source_id, edge.target_id) in followed_pairs
-            attrs["runtime.current_outgoing"] = edge.source_id == current_projected_id
-            attrs["runtime.available"] = None
-            source_edge = projected_graph._source_edges_by_id.get(edge.id)
-            if include_availability and edge.source_id == current_projected_id and isinstance(
-                source_edge, TraversableEdge
-            ):
-                attrs["runtime.available"] = source_edge.available(ctx=None)
-            edge_updates.append(replace(edge, attrs=attrs))
 
-        return _replace_projected_graph(
+def refresh_runtime(
+    projected_graph: ProjectedGraph,
+    ledger: Ledger,
+    *,
+    include_availability: bool = True,
+    restyle: bool = False,
+) -> ProjectedGraph:
+    """Update runtime attrs on ``projected_graph`` in place and return it.
+
+    Project the static world once, then call this after each step.  Only the
+    nodes visited since the previous refresh and the edges around the old and
+    new cursor are touched; a different ledger, a rewound history, or a change
+    to the projection's shape falls back to one full pass.  With ``restyle``
+    the touched items also get :func:`mark_runtime_styles` styling.
+    """
+
+    current_projected_id = _projected_cursor_id(projected_graph, ledger)
+    if current_projected_id is None:
+        return projected_graph
+
+    history = ledger.cursor_history
+    state = projected_graph._runtime
+    if (
+        state is None
+        or state.ledger_id != ledger.uid
+        or state.history_len > len(history)
+        or (state.history_len and history[state.history_len - 1] != state.last_entry)
+    ):
+        _annotate_runtime_full(
             projected_graph,
-            nodes=node_updates,
-            edges=edge_updates,
+            ledger,
+            current_projected_id=current_projected_id,
+            include_availability=include_availability,
+            restyle=restyle,
         )
+        return projected_graph
+
+    index = _graph_index(projected_graph)
+    touched_node_ids = {state.current_projected_id, current_projected_id}
+    touched_edge_ids: set[str] = set()
+
+    new_entries = history[state.history_len:]
+    for offset, node_uid in enumerate(new_entries, start=state.history_len):
+        state.visit_counts[node_uid] += 1
+        state.first_visit.setdefault(node_uid, offset)
+        node_id = state.node_id_by_source_uid.get(node_uid)
+        if node_id is not None:
+            touched_node_ids.add(node_id)
+
+    for node_id in touched_node_ids:
+        node = index.node_by_id.get(node_id)
+        if node is not None:
+            _stamp_runtime_node(node, ledger=ledger, state=state)
+
+    # Pairs crossing from the last refreshed entry into the new ones.
+    boundary = history[max(state.history_len - 1, 0):]
+    for predecessor_id, successor_id in _projected_pairs(projected_graph, boundary):
+        for edge in index.outgoing.get(predecessor_id, []):
+            if edge.target_id == successor_id:
+                edge.attrs["runtime.followed"] = True
+                touched_edge_ids.add(edge.id)
+
+    for node_id in (state.current_projected_id, current_projected_id):
+        is_current = node_id == current_projected_id
+        for edge in index.outgoing.get(node_id, []):
+            _stamp_runtime_edge_cursor(
+                edge,
+                projected_graph=projected_graph,
+                is_current=is_current,
+                include_availability=include_availability,
+            )
+            touched_edge_ids.add(edge.id)
 
-    return processor
+    state.history_len = len(history)
+    state.last_entry = history[-1] if history else None
+    state.current_projected_id = current_projected_id
+
+    if restyle:
+        for node_id in touched_node_ids:
+            node = index.node_by_id.get(node_id)
+            if node is not None:
+                _apply_runtime_node_style(node)
+        for edge_id in touched_edge_ids:
+            _apply_runtime_edge_style(index.edge_by_id[edge_id])
+    return projected_graph
+
+
+def _annotate_runtime_full(
+    projected_graph: ProjectedGraph,
+    ledger: Ledger,
+    *,
+    current_projected_id: str,
+    include_availability: bool,
+    restyle: bool,
+) -> None:
+    history = ledger.cursor_history
+    first_visit: dict[Any, int] = {}
+    for position, node_uid in enumerate(history):
+        first_visit.setdefault(node_uid, position)
+    source_uid_by_node_id = {
+        node_id: source.uid
+        for node_id, source in projected_graph._source_nodes_by_id.items()
+        if getattr(source, "uid", None) is not None
+    }
+    state = _RuntimeOverlayState(
+        ledger_id=ledger.uid,
+        history_len=len(history),
+        last_entry=history[-1] if history else None,
+        current_projected_id=current_projected_id,
+        source_uid_by_node_id=source_uid_by_node_id,
+        node_id_by_source_uid={uid: node_id for node_id, uid in source_uid_by_node_id.items()},
+        visit_counts=Counter(history),
+        first_visit=first_visit,
+    )
+
+    for node in projected_graph.nodes:
+        _stamp_runtime_node(node, ledger=ledger, state=state)
+        if restyle:
+            _apply_runtime_node_style(node)
+
+    followed_pairs = set(_projected_pairs(projected_graph, history))
+    for edge in projected_graph.edges:
+        edge.attrs["runtime.followed"] = (edge.source_id, edge.target_id) in followed_pairs
+        _stamp_runtime_edge_cursor(
+            edge,
+            projected_graph=projected_graph,
+            is_current=edge.source_id == current_projected_id,
+            include_availability=include_availability,
+        )
+        if restyle:
+            _apply_runtime_edge_style(edge)
+
+    projected_graph._runtime = state
+
+
+def _stamp_runtime_node(node: ProjectedNode, *, ledger: Ledger, state: _RuntimeOverlayState) -> None:
+    source_uid = state.source_uid_by_node_id.get(node.id)
+    if source_uid is None:
+        visit_count, visit_index = 0, None
+    else:
+        visit_count, visit_index = state.visit_counts.get(source_uid, 0), state.first_visit.get(source_uid)
+    node.attrs["runtime.current"] = source_uid is not None and source_uid == ledger.cursor_id
+    node.attrs["runtime.visited"] = visit_count > 0
+    node.attrs["runtime.visit_index"] = visit_index
+    node.attrs["runtime.visit_count"] = visit_count
+
+
+def _stamp_runtime_edge_cursor(
+    edge: ProjectedEdge,
+    *,
+    projected_graph: ProjectedGraph,
+    is_current: bool,
+    include_availability: bool,
+) -> None:
+    edge.attrs["runtime.current_outgoing"] = is_current
+    edge.attrs["runtime.available"] = None
+    if not (include_availability and is_current):
+        return
+    source_edge = projected_graph._source_edges_by_id.get(edge.id)
+    if isinstance(source_edge, TraversableEdge):
+        edge.attrs["runtime.available"] = source_edge.available(ctx=None)
+
+
+def _projected_cursor_id(projected_graph: ProjectedGraph, ledger: Ledger) -> str | None:
+    return projected_graph._projected_node_id_by_source_id.get(_stringify_identifier(ledger.cursor_id))
 
 
 def focus_runtime_window(
@@ -434,13 +605,12 @@ def focus_runtime_window(
     """Return one processor that filters one projection to the active runtime slice."""
 
     def processor(projected_graph: ProjectedGraph) -> ProjectedGraph:
-        current_projected_id = projected_graph._projected_node_id_by_source_id.get(
-            _stringify_identifier(ledger.cursor_id)
-        )
+        current_projected_id = _projected_cursor_id(projected_graph, ledger)
         if current_projected_id is None:
             return projected_graph
 
-        index = _ProjectedGraphIndex.build(projected_graph)
+        projected_graph = _writable(projected_graph)
+        index = _graph_index(projected_graph)
         history_anchor_ids = _history_anchor_ids(
             ledger=ledger,
             projected_graph=projected_graph,
@@ -454,46 +624,33 @@ def focus_runtime_window(
         if include_current_predecessors:
             retained_node_ids.update(edge.source_id for edge in index.incoming.get(current_projected_id, []))
 
+        history_anchor_ids = set(history_anchor_ids)
         retained_nodes: list[ProjectedNode] = []
         for node in projected_graph.nodes:
             if node.id not in retained_node_ids:
                 continue
-            attrs = dict(node.attrs)
-            attrs["runtime.history_anchor"] = node.id in history_anchor_ids
-            retained_nodes.append(replace(node, attrs=attrs))
+            node.attrs["runtime.history_anchor"] = node.id in history_anchor_ids
+            retained_nodes.append(node)
 
         retained_edges = [
             edge
             for edge in projected_graph.edges
             if edge.source_id in retained_node_ids and edge.target_id in retained_node_ids
         ]
-        retained_groups = _filter_groups_to_retained_nodes(
+        retained_edge_ids = {edge.id for edge in retained_edges}
+        projected_graph.groups = _filter_groups_to_retained_nodes(
             projected_graph.groups,
             retained_node_ids,
             drop_empty=True,
             drop_single_member=False,
         )
-        return _replace_projected_graph(
-            projected_graph,
-            nodes=retained_nodes,
-            edges=retained_edges,
-            groups=retained_groups,
-            source_nodes_by_id={
-                node.id: projected_graph._source_nodes_by_id[node.id]
-                for node in retained_nodes
-                if node.id in projected_graph._source_nodes_by_id
-            },
-            source_edges_by_id={
-                edge.id: projected_graph._source_edges_by_id[edge.id]
-                for edge in retained_edges
-                if edge.id in projected_graph._source_edges_by_id
-            },
-            projected_node_id_by_source_id={
-                source_id: node_id
-                for source_id, node_id in projected_graph._projected_node_id_by_source_id.items()
-                if node_id in retained_node_ids
-            },
-        )
+        _set_projected_topology(projected_graph, nodes=retained_nodes, edges=retained_edges)
+        _retain_keys(projected_graph._source_nodes_by_id, retained_node_ids)
+        _retain_keys(projected_graph._source_edges_by_id, retained_edge_ids)
+        for source_id, node_id in list(projected_graph._projected_node_id_by_source_id.items()):
+            if node_id not in retained_node_ids:
+                del projected_graph._projected_node_id_by_source_id[source_id]
+        return projected_graph
 
     return processor
 
@@ -506,7 +663,7 @@ def collapse_linear_chains(
     """Return one processor that collapses eligible linear chains."""
 
     def processor(projected_graph: ProjectedGraph) -> ProjectedGraph:
-        index = _ProjectedGraphIndex.build(projected_graph)
+        index = _graph_index(projected_graph)
         collapsed: dict[str, dict[str, Any]] = {}
         chain_by_first_id: dict[str, dict[str, Any]] = {}
         seen: set[str] = set()
@@ -561,6 +718,8 @@ def collapse_linear_chains(
         if not chain_by_first_id:
             return projected_graph
 
+        # Chains were found against the caller's index; copy only now.
+        projected_graph = _writable(projected_graph)
         new_nodes: list[ProjectedNode] = []
         retained_node_ids: set[str] = set()
         for node in projected_graph.nodes:
@@ -624,15 +783,12 @@ def collapse_linear_chains(
             ):
                 projected_node_id_by_source_id[source_id] = chain["node"].id
 
-        return _replace_projected_graph(
-            projected_graph,
-            nodes=new_nodes,
-            edges=new_edges,
-            groups=new_groups,
-            source_nodes_by_id=source_nodes_by_id,
-            source_edges_by_id=source_edges_by_id,
-            projected_node_id_by_source_id=projected_node_id_by_source_id,
-        )
+        projected_graph.groups = new_groups
+        projected_graph._source_nodes_by_id = source_nodes_by_id
+        projected_graph._source_edges_by_id = source_edges_by_id
+        projected_graph._projected_node_id_by_source_id = projected_node_id_by_source_id
+        _set_projected_topology(projected_graph, nodes=new_nodes, edges=new_edges)
+        return projected_graph
 
     return processor
 
@@ -641,15 +797,14 @@ def mark_runtime_styles() -> ProjectedGraphProcessor:
     """Return one processor that converts runtime attrs into renderer style attrs."""
 
     def processor(projected_graph: ProjectedGraph) -> ProjectedGraph:
-        nodes = [_styled_runtime_node(node) for node in projected_graph.nodes]
-        edges = [_styled_runtime_edge(edge) for edge in projected_graph.edges]
-        groups = [replace(group, attrs=_without_style_attrs(group.attrs)) for group in projected_graph.groups]
-        return _replace_projected_graph(
-            projected_graph,
-            nodes=nodes,
-            edges=edges,
-            groups=groups,
-        )
+        projected_graph = _writable(projected_graph)
+        for node in projected_graph.nodes:
+            _apply_runtime_node_style(node)
+        for edge in projected_graph.edges:
+            _apply_runtime_edge_style(edge)
+        for group in projected_graph.groups:
+            group.attrs = _without_style_attrs(group.attrs)
+        return projected_graph
 
     return processor
 
@@ -794,30 +949,18 @@ def _filter_groups_to_retained_nodes(
     return filtered_groups
 
 
-def _first_visit_index(*, cursor_id: Any, history: list[Any]) -> int | None:
-    if cursor_id is None:
-        return None
-    for index, node_id in enumerate(history):
-        if node_id == cursor_id:
-            return index
-    return None
-
-
-def _followed_projected_pairs(
-    *,
-    ledger: Ledger,
+def _projected_pairs(
     projected_graph: ProjectedGraph,
-) -> set[tuple[str, str]]:
-    pairs: set[tuple[str, str]] = set()
+    history: list[Any],
+) -> Iterable[tuple[str, str]]:
     projected_ids = [
         projected_graph._projected_node_id_by_source_id.get(_stringify_identifier(node_id))
-        for node_id in ledger.cursor_history
+        for node_id in history
     ]
     for predecessor_id, successor_id in zip(projected_ids, projected_ids[1:], strict=False):
         if predecessor_id is None or successor_id is None:
             continue
-        pairs.add((predecessor_id, successor_id))
-    return pairs
+        yield predecessor_id, successor_id
 
 
 def _history_anchor_ids(
@@ -1022,25 +1165,23 @@ def _without_style_attrs(attrs: Mapping[str, object]) -> dict[str, object]:
     }
 
 
-def _styled_runtime_node(node: ProjectedNode) -> ProjectedNode:
+def _apply_runtime_node_style(node: ProjectedNode) -> None:
     attrs = _without_style_attrs(node.attrs)
     if node.attrs.get("runtime.current") is True:
         attrs["style.style"] = "filled"
         attrs["style.fillcolor"] = "#2563eb"
         attrs["style.fontcolor"] = "white"
         attrs["style.penwidth"] = 2
-        return replace(node, attrs=attrs)
-    if node.synthetic:
+    elif node.synthetic:
         attrs["style.style"] = "filled,dashed"
         attrs["style.fillcolor"] = "#dbeafe" if node.attrs.get("runtime.visited") is True else "#f1f5f9"
-        return replace(node, attrs=attrs)
-    if node.attrs.get("runtime.visited") is True:
+    elif node.attrs.get("runtime.visited") is True:
         attrs["style.style"] = "filled"
         attrs["style.fillcolor"] = "#dbeafe"
-    return replace(node, attrs=attrs)
+    node.attrs = attrs
 
 
-def _styled_runtime_edge(edge: ProjectedEdge) -> ProjectedEdge:
+def _apply_runtime_edge_style(edge: ProjectedEdge) -> None:
     attrs = _without_style_attrs(edge.attrs)
     if edge.attrs.get("runtime.current_outgoing") is True:
         available = edge.attrs.get("runtime.available")
@@ -1050,11 +1191,10 @@ def _styled_runtime_edge(edge: ProjectedEdge) -> ProjectedEdge:
         else:
             attrs["style.color"] = "#2563eb"
             attrs["style.style"] = "solid"
-        return replace(edge, attrs=attrs)
-    if edge.attrs.get("runtime.followed") is True:
+    elif edge.attrs.get("runtime.followed") is True:
         attrs["style.color"] = "#0d9488"
         attrs["style.penwidth"] = 2
-    return replace(edge, attrs=attrs)
+    edge.attrs = attrs
 
 
 def build_script_report(bundle_or_world: StoryTemplateBundle | World) -> ScriptGraphReport:
@@ -1231,17 +1371,17 @@ def render_basic_svg(report: ScriptGraphReport) -> str:
 
 
 def _projection_context(graph: StoryGraph) -> _ProjectionContext:
-    template_registry = graph.template_registry
-    template_by_hash: dict[bytes, EntityTemplate] = {}
-    if template_registry is not None:
-        for template in template_registry.values():
-            if isinstance(template, EntityTemplate):
-                template_by_hash[template.content_hash()] = template
-    return _ProjectionContext(
-        graph=graph,
-        template_registry=template_registry,
-        template_by_hash=template_by_hash,
-    )
+    return _ProjectionContext(graph=graph, template_registry=graph.template_registry)
+
+
+def _template_by_hash(context: _ProjectionContext) -> dict[bytes, EntityTemplate]:
+    if context.template_by_hash is None:
+        context.template_by_hash = {}
+        if context.template_registry is not None:
+            for template in context.template_registry.values():
+                if isinstance(template, EntityTemplate):
+                    context.template_by_hash[template.content_hash()] = template
+    return context.template_by_hash
 
 
 def _project_selected_items(
@@ -1334,47 +1474,68 @@ def _project_selected_items(
     )
 
 
-def _replace_projected_graph(
+def _graph_index(projected_graph: ProjectedGraph) -> _ProjectedGraphIndex:
+    if projected_graph._index is None:
+        projected_graph._index = _ProjectedGraphIndex.build(projected_graph)
+    return projected_graph._index
+
+
+def _set_projected_topology(
     projected_graph: ProjectedGraph,
     *,
-    nodes: list[ProjectedNode] | None = None,
-    edges: list[ProjectedEdge] | None = None,
-    groups: list[ProjectedGroup] | None = None,
-    source_nodes_by_id: dict[str, Any] | None = None,
-    source_edges_by_id: dict[str, Any] | None = None,
-    projected_node_id_by_source_id: dict[str, str] | None = None,
-    origin_source_nodes_by_id: dict[str, Any] | None = None,
-) -> ProjectedGraph:
+    nodes: list[ProjectedNode],
+    edges: list[ProjectedEdge],
+) -> None:
+    projected_graph.nodes = nodes
+    projected_graph.edges = edges
+    projected_graph._index = None
+    projected_graph._runtime = None
+
+
+def _retain_keys(mapping: dict[str, Any], keep: set[str]) -> None:
+    for key in [key for key in mapping if key not in keep]:
+        del mapping[key]
+
+
+def _writable(projected_graph: ProjectedGraph) -> ProjectedGraph:
+    """Return ``projected_graph`` if a pipeline owns it, else a private copy.
+
+    The copy is not marked owned, so a processor's result stays safe to keep
+    when the processor is called outside :func:`project_story_graph`.
+    """
+
+    if projected_graph._owned:
+        return projected_graph
     return ProjectedGraph(
-        nodes=list(projected_graph.nodes if nodes is None else nodes),
-        edges=list(projected_graph.edges if edges is None else edges),
-        groups=list(projected_graph.groups if groups is None else groups),
-        _source_nodes_by_id=dict(
-            projected_graph._source_nodes_by_id if source_nodes_by_id is None else source_nodes_by_id
-        ),
-        _source_edges_by_id=dict(
-            projected_graph._source_edges_by_id if source_edges_by_id is None else source_edges_by_id
-        ),
-        _projected_node_id_by_source_id=dict(
-            projected_graph._projected_node_id_by_source_id
-            if projected_node_id_by_source_id is None
-            else projected_node_id_by_source_id
-        ),
-        _origin_source_nodes_by_id=dict(
-            projected_graph._origin_source_nodes_by_id
-            if origin_source_nodes_by_id is None
-            else origin_source_nodes_by_id
-        ),
+        nodes=[
+            replace(node, origin_node_ids=list(node.origin_node_ids), attrs=dict(node.attrs))
+            for node in projected_graph.nodes
+        ],
+        edges=[
+            replace(edge, origin_edge_ids=list(edge.origin_edge_ids), attrs=dict(edge.attrs))
+            for edge in projected_graph.edges
+        ],
+        groups=[
+            replace(
+                group,
+                member_node_ids=list(group.member_node_ids),
+                origin_node_ids=list(group.origin_node_ids),
+                attrs=dict(group.attrs),
+            )
+            for group in projected_graph.groups
+        ],
+        _source_nodes_by_id=dict(projected_graph._source_nodes_by_id),
+        _source_edges_by_id=dict(projected_graph._source_edges_by_id),
+        _projected_node_id_by_source_id=dict(projected_graph._projected_node_id_by_source_id),
+        _origin_source_nodes_by_id=dict(projected_graph._origin_source_nodes_by_id),
     )
 
 
-def _sorted_projected_graph(projected_graph: ProjectedGraph) -> ProjectedGraph:
-    nodes = sorted(
-        projected_graph.nodes,
+def _sort_projected_graph(projected_graph: ProjectedGraph) -> None:
+    projected_graph.nodes.sort(
         key=lambda node: (node.id, node.label, node.source_kind or "", tuple(node.origin_node_ids)),
     )
-    edges = sorted(
-        projected_graph.edges,
+    projected_graph.edges.sort(
         key=lambda edge: (
             edge.source_id,
             edge.target_id,
@@ -1384,11 +1545,11 @@ def _sorted_projected_graph(projected_graph: ProjectedGraph) -> ProjectedGraph:
             edge.id,
         ),
     )
-    groups = sorted(
-        projected_graph.groups,
+    projected_graph.groups.sort(
         key=lambda group: (group.group_kind, group.label, group.id, tuple(group.member_node_ids)),
     )
-    return _replace_projected_graph(projected_graph, nodes=nodes, edges=edges, groups=groups)
+    # adjacency lists follow edge order, so rebuild on next use
+    projected_graph._index = None
 
 
 def _node_seed(node: Node, *, context: _ProjectionContext) -> _NodeSeed:
@@ -1455,7 +1616,7 @@ def _template_label_for_entity(*, entity: Any, context: _ProjectionContext) -> s
 
     templ_hash = getattr(entity, "templ_hash", None)
     if isinstance(templ_hash, bytes):
-        template = context.template_by_hash.get(templ_hash)
+        template = _template_by_hash(context).get(templ_hash)
         if isinstance(template, EntityTemplate):
             return template.get_label()
     return None
@@ -1639,11 +1800,26 @@ def _coerce_world(bundle_or_world: StoryTemplateBundle | World) -> World:
 
 
 def _make_projection_story(*, world: World, story_label: str) -> StoryGraph:
+    """Return a frozen inspection story for ``world``, reused across calls.
+
+    Inspection stories are never stepped, so one per world and label serves
+    every projection until ``world.revision`` changes (``apply_bundle`` bumps
+    it).  Template edits made without a revision bump are not seen.
+
+    The returned graph is shared by every caller: treat it as read-only and
+    project or copy it before changing anything.
+    """
+
+    stories = _PROJECTION_STORIES.setdefault(world, {})
+    cached = stories.get(story_label)
+    if cached is not None and cached[0] == world.revision:
+        return cached[1]
     result = world.create_story(
         story_label,
         init_mode=InitMode.EAGER,
         freeze_shape=True,
     )
+    stories[story_label] = (world.revision, result.graph)
     return result.graph
 
 
@@ -0,0 +1,487 @@
+"""Headless playthrough exploration for authored worlds.
+
+The explorer drives stories the same way a client does: build a story with
+:meth:`World.create_story`, seed the entry update, then repeatedly pick one of
+the available :class:`~tangl.journal.fragments.ChoiceFragment` entries from the
+newest journal update and hand its edge id to :meth:`Ledger.resolve_choice`.
+
+Two drivers are provided:
+
+- :func:`random_walks` runs many independently seeded walks.
+- :func:`exhaustive_walk` runs a bounded breadth- or depth-first search over
+  choice paths, deduplicating states by cursor, call stack and
+  ``graph.value_hash()``.
+
+Both return an :class:`ExplorationReport` with reachable blocks, endings, dead
+ends, unreachable block templates, a choice-frequency histogram and per-step
+latencies.  Passing ``workers`` spreads the work over a process pool.
+
+Both accept a :class:`World` or a zero-argument factory returning one.  Forked
+workers inherit the parent's world.  Under the ``spawn`` start method, workers
+rebuild the world from the factory, so it must be picklable, for example
+``functools.partial(resolve_world, "logic_demo")``.  Worlds are singletons, so
+the factory is called at most once per process.
+
+Example:
+    >>> from functools import partial
+    >>> script = {
+    ...     "label": "doc_explore",
+    ...     "metadata": {"title": "Doc", "author": "Tests", "start_at": "s.a"},
+    ...     "scenes": {"s": {"blocks": {
+    ...         "a": {"content": "A", "actions": [{"text": "go", "successor": "b"}]},
+    ...         "b": {"content": "B"},
+    ...     }}},
+    ... }
+    >>> report = random_walks(World.from_script_data(script_data=script), runs=3)
+    >>> sorted(report.block_visits), dict(report.endings)
+    (['s.a', 's.b'], {'s.b': 3})
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import multiprocessing
+import random
+import time
+from typing import Any, Callable, Literal
+
+from tangl.core import EntityTemplate
+from tangl.journal.fragments import ChoiceFragment
+from tangl.vm import Ledger
+
+from .episode import Block
+from .fabula import InitMode, World
+
+WorldFactory = Callable[[], World]
+SearchStrategy = Literal["bfs", "dfs"]
+WalkOutcome = Literal["ending", "dead_end", "truncated", "error"]
+
+
+@dataclass(slots=True)
+class ExplorationReport:
+    """Aggregated results from one or more exploration runs."""
+
+    world_label: str
+    mode: str
+    runs: int = 0
+    steps: int = 0
+    states: int = 0
+    block_visits: Counter = field(default_factory=Counter)
+    endings: Counter = field(default_factory=Counter)
+    dead_ends: Counter = field(default_factory=Counter)
+    truncated: int = 0
+    choice_counts: Counter = field(default_factory=Counter)
+    step_latencies: list[float] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    visited_templates: set[str] = field(default_factory=set)
+    block_templates: set[str] = field(default_factory=set)
+    elapsed: float = 0.0
+
+    @property
+    def unreachable_templates(self) -> list[str]:
+        """Block template paths never reached by any run."""
+        return sorted(self.block_templates - self.visited_templates)
+
+    def merge(self, other: "ExplorationReport") -> "ExplorationReport":
+        """Fold another partial report into this one and return ``self``."""
+        self.runs += other.runs
+        self.steps += other.steps
+        self.states += other.states
+        self.block_visits.update(other.block_visits)
+        self.endings.update(other.endings)
+        self.dead_ends.update(other.dead_ends)
+        self.truncated += other.truncated
+        self.choice_counts.update(other.choice_counts)
+        self.step_latencies.extend(other.step_latencies)
+        self.errors.extend(other.errors)
+        self.visited_templates |= other.visited_templates
+        self.block_templates |= other.block_templates
+        return self
+
+    def latency_summary(self) -> dict[str, float]:
+        """Return mean and p50/p90/p99/max step latency in milliseconds."""
+        if not self.step_latencies:
+            return {}
+        ordered = sorted(self.step_latencies)
+
+        def _pct(q: float) -> float:
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+        return {
+            "mean_ms": sum(ordered) / len(ordered) * 1000,
+            "p50_ms": _pct(0.50),
+            "p90_ms": _pct(0.90),
+            "p99_ms": _pct(0.99),
+            "max_ms": ordered[-1] * 1000,
+        }
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a JSON-friendly summary."""
+        return {
+            "world_label": self.world_label,
+            "mode": self.mode,
+            "runs": self.runs,
+            "steps": self.steps,
+            "states": self.states,
+            "elapsed_s": self.elapsed,
+            "steps_per_s": self.steps / self.elapsed if self.elapsed else None,
+            "reachable_blocks": dict(self.block_visits.most_common()),
+            "endings": dict(self.endings.most_common()),
+            "dead_ends": dict(self.dead_ends.most_common()),
+            "truncated": self.truncated,
+            "unreachable_templates": self.unreachable_templates,
+            "choice_counts": dict(self.choice_counts.most_common()),
+            "latency": self.latency_summary(),
+            "errors": list(self.errors),
+        }
+
+
+# ----------------------------------------------------------------------------
+# Session helpers
+# ----------------------------------------------------------------------------
+
+
+def _block_key(node: Any) -> str:
+    path = getattr(node, "path", None)
+    if isinstance(path, str) and path:
+        return path
+    return node.get_label()
+
+
+def _block_template_paths(world: World) -> set[str]:
+    return {
+        template.path
+        for template in world.templates.values()
+        if isinstance(template, EntityTemplate) and template.has_payload_kind(Block)
+    }
+
+
+def _template_path_for(ledger: Ledger, node: Any) -> str | None:
+    graph = ledger.graph
+    template_uid = getattr(graph, "template_by_entity_id", {}).get(node.uid)
+    registry = getattr(graph, "template_registry", None)
+    if template_uid is None or registry is None:
+        return None
+    template = registry.get(template_uid)
+    return getattr(template, "path", None)
+
+
+def _new_ledger(world: World, story_label: str) -> Ledger:
+    result = world.create_story(story_label, init_mode=InitMode.EAGER)
+    ledger = Ledger.from_graph(result.graph, entry_id=result.graph.initial_cursor_id)
+    ledger.prime_entry()
+    return ledger
+
+
+def _clone_ledger(ledger: Ledger) -> Ledger:
+    return Ledger.structure(ledger.unstructure())
+
+
+def _current_choices(ledger: Ledger, *, initial: bool = False) -> list[ChoiceFragment]:
+    fragments = ledger.get_journal() if initial else ledger.get_current_update()
+    return [fragment for fragment in fragments if isinstance(fragment, ChoiceFragment)]
+
+
+def _state_key(ledger: Ledger) -> tuple:
+    return ledger.cursor_id, tuple(ledger.call_stack_ids), ledger.graph.value_hash()
+
+
+class _Recorder:
+    """Accumulates one worker's observations into a report."""
+
+    def __init__(self, report: ExplorationReport) -> None:
+        self.report = report
+
+    def visit(self, ledger: Ledger, since: int = 0) -> None:
+        # one choice may pass through several blocks, count each of them
+        graph = ledger.graph
+        for node_id in ledger.cursor_history[since:]:
+            node = graph.get(node_id)
+            if node is None:
+                continue
+            self.report.block_visits[_block_key(node)] += 1
+            template_path = _template_path_for(ledger, node)
+            if template_path is not None:
+                self.report.visited_templates.add(template_path)
+
+    def choose(self, ledger: Ledger, choice: ChoiceFragment) -> int:
+        """Resolve ``choice`` and return the history index where this step began."""
+        self.report.choice_counts[f"{_block_key(ledger.cursor)}: {choice.text}"] += 1
+        mark = len(ledger.cursor_history)
+        started = time.perf_counter()
+        ledger.resolve_choice(choice.edge_id, choice_payload=choice.activation_payload)
+        self.report.step_latencies.append(time.perf_counter() - started)
+        self.report.steps += 1
+        return mark
+
+    def finish(self, ledger: Ledger, outcome: WalkOutcome, detail: str | None = None) -> None:
+        key = _block_key(ledger.cursor)
+        if outcome == "ending":
+            self.report.endings[key] += 1
+        elif outcome == "dead_end":
+            self.report.dead_ends[key] += 1
+        elif outcome == "truncated":
+            self.report.truncated += 1
+        else:
+            self.report.errors.append(f"{key}: {detail}")
+
+
+def _classify(choices: list[ChoiceFragment]) -> tuple[list[ChoiceFragment], WalkOutcome | None]:
+    available = [choice for choice in choices if choice.available]
+    if available:
+        return available, None
+    return available, "dead_end" if choices else "ending"
+
+
+# ----------------------------------------------------------------------------
+# Random walks
+# ----------------------------------------------------------------------------
+
+
+def _run_random_walks(
+    world: World,
+    *,
+    seeds: list[int],
+    max_steps: int,
+) -> ExplorationReport:
+    report = ExplorationReport(world_label=world.label, mode="random")
+    recorder = _Recorder(report)
+    for seed in seeds:
+        rand = random.Random(seed)
+        report.runs += 1
+        try:
+            ledger = _new_ledger(world, f"explore_{seed}")
+        except Exception as exc:  # surfaced in the report, not raised
+            report.errors.append(f"<init seed={seed}>: {exc!r}")
+            continue
+        recorder.visit(ledger)
+        choices = _current_choices(ledger, initial=True)
+        for _ in range(max_steps):
+            available, outcome = _classify(choices)
+            if outcome is not None:
+                recorder.finish(ledger, outcome)
+                break
+            try:
+                mark = recorder.choose(ledger, rand.choice(available))
+            except Exception as exc:
+                recorder.finish(ledger, "error", f"seed={seed}: {exc!r}")
+                break
+            report.states += 1
+            recorder.visit(ledger, mark)
+            choices = _current_choices(ledger)
+        else:
+            recorder.finish(ledger, "truncated")
+    return report
+
+
+# ----------------------------------------------------------------------------
+# Exhaustive search
+# ----------------------------------------------------------------------------
+
+
+def _run_exhaustive(
+    world: World,
+    *,
+    prefix: tuple[int, ...],
+    strategy: SearchStrategy,
+    max_depth: int,
+    max_states: int,
+) -> ExplorationReport:
+    report = ExplorationReport(world_label=world.label, mode=strategy)
+    recorder = _Recorder(report)
+    report.runs += 1
+
+    root = _new_ledger(world, "explore_exhaustive")
+    recorder.visit(root)
+    choices = _current_choices(root, initial=True)
+    for index in prefix:
+        available, _ = _classify(choices)
+        mark = recorder.choose(root, available[index])
+        recorder.visit(root, mark)
+        choices = _current_choices(root)
+
+    seen: set[tuple] = {_state_key(root)}
+    frontier: deque[tuple[Ledger, list[ChoiceFragment], int]] = deque([(root, choices, len(prefix))])
+    pop = frontier.popleft if strategy == "bfs" else frontier.pop
+
+    while frontier:
+        ledger, choices, depth = pop()
+        available, outcome = _classify(choices)
+        if outcome is not None:
+            recorder.finish(ledger, outcome)
+            continue
+        if depth >= max_depth or report.states >= max_states:
+            recorder.finish(ledger, "truncated")
+            continue
+        for choice in available:
+            child = _clone_ledger(ledger)
+            try:
+                mark = recorder.choose(child, choice)
+            except Exception as exc:
+                recorder.finish(child, "error", f"{choice.text!r}: {exc!r}")
+                continue
+            key = _state_key(child)
+            if key in seen:
+                continue
+            seen.add(key)
+            report.states += 1
+            recorder.visit(child, mark)
+            frontier.append((child, _current_choices(child), depth + 1))
+    return report
+
+
+# ----------------------------------------------------------------------------
+# Process pool plumbing
+# ----------------------------------------------------------------------------
+
+_WORKER_WORLD: World | None = None
+
+
+def _init_worker(world_factory: WorldFactory | None) -> None:
+    global _WORKER_WORLD
+    import tangl.story  # noqa: F401  # ensure story handlers are registered
+
+    # forked workers inherit the parent's world; worlds are singletons, so
+    # only spawned workers build their own
+    if _WORKER_WORLD is None:
+        if world_factory is None:
+            raise RuntimeError("Spawned exploration workers need a world factory")
+        _WORKER_WORLD = world_factory()
+
+
+def _resolve_world(world_or_factory: World | WorldFactory) -> tuple[World, WorldFactory | None]:
+    if isinstance(world_or_factory, World):
+        return world_or_factory, None
+    return world_or_factory(), world_or_factory
+
+
+def _make_pool(world: World, world_factory: WorldFactory | None, workers: int) -> ProcessPoolExecutor:
+    global _WORKER_WORLD
+    _WORKER_WORLD = world
+    try:
+        pool = ProcessPoolExecutor(
+            workers,
+            mp_context=multiprocessing.get_context(),
+            initializer=_init_worker,
+            initargs=(world_factory,),
+        )
+        # start the workers while the parent's world is still visible to fork
+        pool.submit(int).result()
+    finally:
+        _WORKER_WORLD = None
+    return pool
+
+
+def _worker_random_walks(seeds: list[int], max_steps: int) -> ExplorationReport:
+    return _run_random_walks(_WORKER_WORLD, seeds=seeds, max_steps=max_steps)
+
+
+def _worker_exhaustive(
+    prefix: tuple[int, ...],
+    strategy: SearchStrategy,
+    max_depth: int,
+    max_states: int,
+) -> ExplorationReport:
+    return _run_exhaustive(
+        _WORKER_WORLD,
+        prefix=prefix,
+        strategy=strategy,
+        max_depth=max_depth,
+        max_states=max_states,
+    )
+
+
+def _chunks(items: list[int], count: int) -> list[list[int]]:
+    count = max(1, min(count, len(items)))
+    return [items[i::count] for i in range(count)]
+
+
+# ----------------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------------
+
+
+def random_walks(
+    world: World | WorldFactory,
+    *,
+    runs: int = 100,
+    seed: int = 0,
+    max_steps: int = 200,
+    workers: int | None = None,
+) -> ExplorationReport:
+    """Run ``runs`` seeded random walks and aggregate the results.
+
+    Walk ``i`` picks choices with ``random.Random(seed + i)``, so results are
+    reproducible regardless of how walks are spread over ``workers``.
+    """
+    started = time.perf_counter()
+    world, world_factory = _resolve_world(world)
+    seeds = list(range(seed, seed + runs))
+
+    report = ExplorationReport(world_label=world.label, mode="random")
+    if workers and workers > 1:
+        with _make_pool(world, world_factory, workers) as pool:
+            parts = pool.map(_worker_random_walks, _chunks(seeds, workers), [max_steps] * workers)
+            for part in parts:
+                report.merge(part)
+    else:
+        report.merge(_run_random_walks(world, seeds=seeds, max_steps=max_steps))
+
+    report.block_templates = _block_template_paths(world)
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def exhaustive_walk(
+    world: World | WorldFactory,
+    *,
+    strategy: SearchStrategy = "bfs",
+    max_depth: int = 50,
+    max_states: int = 10_000,
+    workers: int | None = None,
+) -> ExplorationReport:
+    """Search every choice path up to ``max_depth`` or ``max_states``.
+
+    States reached by different paths are explored once.  With ``workers``,
+    each opening choice becomes its own subtree search in a worker process.
+    Dedup is then per subtree and ``max_states`` is split between them.
+    """
+    if strategy not in ("bfs", "dfs"):
+        raise ValueError(f"Unknown search strategy: {strategy}")
+    started = time.perf_counter()
+    world, world_factory = _resolve_world(world)
+    report = ExplorationReport(world_label=world.label, mode=strategy)
+
+    opening: list[ChoiceFragment] = []
+    if workers and workers > 1:
+        opening, _ = _classify(_current_choices(_new_ledger(world, "explore_probe"), initial=True))
+
+    if len(opening) > 1:
+        prefixes = [(index,) for index in range(len(opening))]
+        share = max(1, max_states // len(prefixes))
+        with _make_pool(world, world_factory, workers) as pool:
+            parts = pool.map(
+                _worker_exhaustive,
+                prefixes,
+                [strategy] * len(prefixes),
+                [max_depth] * len(prefixes),
+                [share] * len(prefixes),
+            )
+            for part in parts:
+                report.merge(part)
+    else:
+        report.merge(
+            _run_exhaustive(
+                world,
+                prefix=(),
+                strategy=strategy,
+                max_depth=max_depth,
+                max_states=max_states,
+            )
+        )
+
+    report.block_templates = _block_template_paths(world)
+    report.elapsed = time.perf_counter() - started
+    return report
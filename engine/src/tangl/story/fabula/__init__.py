@@ -38,6 +38,7 @@ factored into :class:`StoryMaterializer`.
 """
 
 from .compiler import StoryCompiler
+from .incremental import CompilePatch, IncrementalStoryCompiler
 from .builder import WorldBuilder
 from .materializer import StoryMaterializer
 from .types import (
@@ -57,8 +58,10 @@ from .world import World
 __all__ = [
     "AuthoredRef",
     "CompileIssue",
+    "CompilePatch",
     "CompileSeverity",
     "GraphInitializationError",
+    "IncrementalStoryCompiler",
     "InitMode",
     "InitReport",
     "ResolutionError",
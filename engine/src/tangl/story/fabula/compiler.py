@@ -66,6 +66,8 @@ class _CompileCollector:
     default_story_key: str | None = None
     declarations: list[_DeclaredTemplate] = field(default_factory=list)
     declarations_by_template_label: dict[str, list[_DeclaredTemplate]] = field(default_factory=dict)
+    # Declared kinds by template label and payload label, for reference checks.
+    candidate_kinds: dict[str, list[type[Entity]]] = field(default_factory=dict)
     pending: list[_PendingDiagnostic] = field(default_factory=list)
 
     @classmethod
@@ -133,8 +135,14 @@ class _CompileCollector:
                 label=template_label,
             ),
         )
+        self.add_declared(declared)
+
+    def add_declared(self, declared: _DeclaredTemplate) -> None:
         self.declarations.append(declared)
-        self.declarations_by_template_label.setdefault(template_label, []).append(declared)
+        self.declarations_by_template_label.setdefault(declared.template_label, []).append(declared)
+        for identifier in {declared.template_label, declared.payload_label}:
+            if identifier:
+                self.candidate_kinds.setdefault(identifier, []).append(declared.payload_kind)
 
     def add_pending(
         self,
@@ -159,14 +167,10 @@ class _CompileCollector:
         )
 
     def has_candidate(self, identifier: str, *, kind: type[Entity]) -> bool:
-        for declaration in self.declarations:
-            if not issubclass(declaration.payload_kind, kind):
-                continue
-            if identifier == declaration.template_label:
-                return True
-            if declaration.payload_label and identifier == declaration.payload_label:
-                return True
-        return False
+        return any(
+            issubclass(declared_kind, kind)
+            for declared_kind in self.candidate_kinds.get(identifier, ())
+        )
 
     def build_issues(
         self,
@@ -175,9 +179,22 @@ class _CompileCollector:
         entry_template_ids: list[str],
         resolution_strategy: str,
     ) -> list[CompileIssue]:
-        issues: list[CompileIssue] = []
-        issues.extend(self._build_duplicate_issues())
-        issues.extend(self._build_pending_issues())
+        return self.finish_issues(
+            [*self._build_duplicate_issues(), *self._build_pending_issues()],
+            story_label=story_label,
+            entry_template_ids=entry_template_ids,
+            resolution_strategy=resolution_strategy,
+        )
+
+    def finish_issues(
+        self,
+        issues: list[CompileIssue],
+        *,
+        story_label: str,
+        entry_template_ids: list[str],
+        resolution_strategy: str,
+    ) -> list[CompileIssue]:
+        issues = list(issues)
         entry_issue = self._build_entry_issue(
             story_label=story_label,
             entry_template_ids=entry_template_ids,
@@ -218,8 +235,11 @@ class _CompileCollector:
         return issues
 
     def _build_pending_issues(self) -> list[CompileIssue]:
+        return self.build_pending_issues(self.pending)
+
+    def build_pending_issues(self, pending_items: list[_PendingDiagnostic]) -> list[CompileIssue]:
         issues: list[CompileIssue] = []
-        for pending in self.pending:
+        for pending in pending_items:
             missing_identifier = next(iter(pending.related_identifiers), None)
             if missing_identifier is None:
                 continue
@@ -503,192 +523,27 @@ class StoryCompiler:
             registry=registry,
         )
 
-        self._compile_section(
-            parent=root,
-            items=data.get("templates"),
-            fallback_kind=TraversableNode,
-            collector=collector,
-            authored_path_prefix="templates",
-        )
-        self._compile_section(
-            parent=root,
-            items=data.get("actors"),
-            fallback_kind=Actor,
-            collector=collector,
-            authored_path_prefix="actors",
-        )
-        self._compile_section(
-            parent=root,
-            items=data.get("locations"),
-            fallback_kind=Location,
-            collector=collector,
-            authored_path_prefix="locations",
-        )
+        for section, items, fallback_kind in self._root_sections(data):
+            self._compile_section(
+                parent=root,
+                items=items,
+                fallback_kind=fallback_kind,
+                collector=collector,
+                authored_path_prefix=section,
+            )
 
         scenes = self._normalize_mapping(data.get("scenes"))
         root_scene_labels = {scene_label for _scene_index, scene_label, _scene_data in scenes}
         for scene_index, scene_label, scene_data in scenes:
-            scene_authored_path = _authored_item_path("scenes", scene_index, scene_label)
-            scene_payload = self._build_payload(
-                kind=self._resolve_kind(
-                    scene_data.get("kind"),
-                    fallback=Scene,
-                ),
-                payload={
-                    **scene_data,
-                    "label": scene_data.get("label") or scene_label,
-                    "title": scene_data.get("title") or scene_data.get("text") or "",
-                    "roles": self._normalize_list(scene_data.get("roles")),
-                    "settings": self._normalize_list(scene_data.get("settings")),
-                },
-                default_label=scene_label,
-            )
-            collector.add_declaration(
-                template_label=scene_label,
-                payload=scene_payload,
-                authored_path=scene_authored_path,
-            )
-            scene_templ = TemplateGroup(
-                label=scene_label,
-                payload=scene_payload,
-                registry=registry,
-            )
-            root.add_child(scene_templ)
-            self._collect_provider_ref_issues(
+            self._compile_scene(
+                root=root,
+                scene_index=scene_index,
+                scene_label=scene_label,
+                scene_data=scene_data,
+                root_scene_labels=root_scene_labels,
                 collector=collector,
-                specs=scene_payload.roles,
-                source_label=scene_label,
-                authored_path_prefix=f"{scene_authored_path}.roles",
-                field_name="roles",
-                issue_code=ISSUE_DANGLING_ACTOR_REF,
-                reference_keys=("actor_ref", "actor_template_ref"),
-            )
-            self._collect_provider_ref_issues(
-                collector=collector,
-                specs=scene_payload.settings,
-                source_label=scene_label,
-                authored_path_prefix=f"{scene_authored_path}.settings",
-                field_name="settings",
-                issue_code=ISSUE_DANGLING_LOCATION_REF,
-                reference_keys=("location_ref", "location_template_ref"),
             )
 
-            self._compile_section(
-                parent=scene_templ,
-                items=scene_data.get("templates"),
-                fallback_kind=TraversableNode,
-                collector=collector,
-                authored_path_prefix=f"{scene_authored_path}.templates",
-            )
-
-            blocks = self._normalize_mapping(scene_data.get("blocks"))
-            for block_index, block_label, block_data in blocks:
-                block_authored_path = _authored_item_path(
-                    f"{scene_authored_path}.blocks",
-                    block_index,
-                    block_label,
-                )
-                qualified_label = f"{scene_label}.{block_label}"
-                actions = self._canonicalize_action_specs(
-                    self._normalize_list(block_data.get("actions")),
-                    scene_label=scene_label,
-                    root_scene_labels=root_scene_labels,
-                )
-                continues = self._canonicalize_action_specs(
-                    self._normalize_list(block_data.get("continues")),
-                    scene_label=scene_label,
-                    root_scene_labels=root_scene_labels,
-                )
-                redirects = self._canonicalize_action_specs(
-                    self._normalize_list(block_data.get("redirects")),
-                    scene_label=scene_label,
-                    root_scene_labels=root_scene_labels,
-                )
-                next_qualified = self._next_block_label(blocks, block_index, scene_label)
-                for spec_list in (actions, continues, redirects):
-                    for spec in spec_list:
-                        if not spec.get("successor_ref") and next_qualified is not None:
-                            spec["successor_ref"] = next_qualified
-                            spec["successor_is_absolute"] = False
-                            spec["successor_is_inferred"] = True
-                self._collect_successor_issues(
-                    collector=collector,
-                    specs=actions,
-                    source_label=qualified_label,
-                    authored_path_prefix=f"{block_authored_path}.actions",
-                    field_name="actions",
-                )
-                self._collect_successor_issues(
-                    collector=collector,
-                    specs=continues,
-                    source_label=qualified_label,
-                    authored_path_prefix=f"{block_authored_path}.continues",
-                    field_name="continues",
-                )
-                self._collect_successor_issues(
-                    collector=collector,
-                    specs=redirects,
-                    source_label=qualified_label,
-                    authored_path_prefix=f"{block_authored_path}.redirects",
-                    field_name="redirects",
-                )
-
-                block_payload = self._build_payload(
-                    kind=self._resolve_kind(
-                        block_data.get("kind")
-                        or block_data.get("block_cls"),
-                        fallback=Block,
-                    ),
-                    payload={
-                        **block_data,
-                        "label": block_data.get("label") or block_label,
-                        "actions": actions,
-                        "continues": continues,
-                        "redirects": redirects,
-                        "roles": self._normalize_list(block_data.get("roles")),
-                        "settings": self._normalize_list(block_data.get("settings")),
-                        "media": self._normalize_list(block_data.get("media")),
-                    },
-                    default_label=block_label,
-                )
-                collector.add_declaration(
-                    template_label=qualified_label,
-                    payload=block_payload,
-                    authored_path=block_authored_path,
-                )
-                block_templ = TemplateGroup(
-                    label=qualified_label,
-                    payload=block_payload,
-                    registry=registry,
-                )
-                scene_templ.add_child(block_templ)
-                self._collect_provider_ref_issues(
-                    collector=collector,
-                    specs=block_payload.roles,
-                    source_label=qualified_label,
-                    authored_path_prefix=f"{block_authored_path}.roles",
-                    field_name="roles",
-                    issue_code=ISSUE_DANGLING_ACTOR_REF,
-                    reference_keys=("actor_ref", "actor_template_ref"),
-                )
-                self._collect_provider_ref_issues(
-                    collector=collector,
-                    specs=block_payload.settings,
-                    source_label=qualified_label,
-                    authored_path_prefix=f"{block_authored_path}.settings",
-                    field_name="settings",
-                    issue_code=ISSUE_DANGLING_LOCATION_REF,
-                    reference_keys=("location_ref", "location_template_ref"),
-                )
-
-                self._compile_section(
-                    parent=block_templ,
-                    items=block_data.get("templates"),
-                    fallback_kind=TraversableNode,
-                    collector=collector,
-                    authored_path_prefix=f"{block_authored_path}.templates",
-                )
-
         entry_template_ids, resolution_strategy = self._resolve_entry_template_ids(
             metadata=metadata,
             registry=registry,
@@ -804,6 +659,187 @@ class StoryCompiler:
                 data["templates"] = templates
         return data
 
+    def _compile_scene(
+        self,
+        *,
+        root: TemplateGroup,
+        scene_index: int,
+        scene_label: str,
+        scene_data: dict[str, Any],
+        root_scene_labels: set[str],
+        collector: _CompileCollector,
+    ) -> TemplateGroup:
+        """Compile one authored scene and its blocks beneath ``root``."""
+        scene_authored_path = _authored_item_path("scenes", scene_index, scene_label)
+        scene_payload = self._build_payload(
+            kind=self._resolve_kind(
+                scene_data.get("kind"),
+                fallback=Scene,
+            ),
+            payload={
+                **scene_data,
+                "label": scene_data.get("label") or scene_label,
+                "title": scene_data.get("title") or scene_data.get("text") or "",
+                "roles": self._normalize_list(scene_data.get("roles")),
+                "settings": self._normalize_list(scene_data.get("settings")),
+            },
+            default_label=scene_label,
+        )
+        collector.add_declaration(
+            template_label=scene_label,
+            payload=scene_payload,
+            authored_path=scene_authored_path,
+        )
+        scene_templ = TemplateGroup(
+            label=scene_label,
+            payload=scene_payload,
+            registry=root.registry,
+        )
+        root.add_child(scene_templ)
+        self._collect_provider_ref_issues(
+            collector=collector,
+            specs=scene_payload.roles,
+            source_label=scene_label,
+            authored_path_prefix=f"{scene_authored_path}.roles",
+            field_name="roles",
+            issue_code=ISSUE_DANGLING_ACTOR_REF,
+            reference_keys=("actor_ref", "actor_template_ref"),
+        )
+        self._collect_provider_ref_issues(
+            collector=collector,
+            specs=scene_payload.settings,
+            source_label=scene_label,
+            authored_path_prefix=f"{scene_authored_path}.settings",
+            field_name="settings",
+            issue_code=ISSUE_DANGLING_LOCATION_REF,
+            reference_keys=("location_ref", "location_template_ref"),
+        )
+
+        self._compile_section(
+            parent=scene_templ,
+            items=scene_data.get("templates"),
+            fallback_kind=TraversableNode,
+            collector=collector,
+            authored_path_prefix=f"{scene_authored_path}.templates",
+        )
+
+        blocks = self._normalize_mapping(scene_data.get("blocks"))
+        for block_index, block_label, block_data in blocks:
+            block_authored_path = _authored_item_path(
+                f"{scene_authored_path}.blocks",
+                block_index,
+                block_label,
+            )
+            qualified_label = f"{scene_label}.{block_label}"
+            actions = self._canonicalize_action_specs(
+                self._normalize_list(block_data.get("actions")),
+                scene_label=scene_label,
+                root_scene_labels=root_scene_labels,
+            )
+            continues = self._canonicalize_action_specs(
+                self._normalize_list(block_data.get("continues")),
+                scene_label=scene_label,
+                root_scene_labels=root_scene_labels,
+            )
+            redirects = self._canonicalize_action_specs(
+                self._normalize_list(block_data.get("redirects")),
+                scene_label=scene_label,
+                root_scene_labels=root_scene_labels,
+            )
+            next_qualified = self._next_block_label(blocks, block_index, scene_label)
+            for spec_list in (actions, continues, redirects):
+                for spec in spec_list:
+                    if not spec.get("successor_ref") and next_qualified is not None:
+                        spec["successor_ref"] = next_qualified
+                        spec["successor_is_absolute"] = False
+                        spec["successor_is_inferred"] = True
+            self._collect_successor_issues(
+                collector=collector,
+                specs=actions,
+                source_label=qualified_label,
+                authored_path_prefix=f"{block_authored_path}.actions",
+                field_name="actions",
+            )
+            self._collect_successor_issues(
+                collector=collector,
+                specs=continues,
+                source_label=qualified_label,
+                authored_path_prefix=f"{block_authored_path}.continues",
+                field_name="continues",
+            )
+            self._collect_successor_issues(
+                collector=collector,
+                specs=redirects,
+                source_label=qualified_label,
+                authored_path_prefix=f"{block_authored_path}.redirects",
+                field_name="redirects",
+            )
+
+            block_payload = self._build_payload(
+                kind=self._resolve_kind(
+                    block_data.get("kind")
+                    or block_data.get("block_cls"),
+                    fallback=Block,
+                ),
+                payload={
+                    **block_data,
+                    "label": block_data.get("label") or block_label,
+                    "actions": actions,
+                    "continues": continues,
+                    "redirects": redirects,
+                    "roles": self._normalize_list(block_data.get("roles")),
+                    "settings": self._normalize_list(block_data.get("settings")),
+                    "media": self._normalize_list(block_data.get("media")),
+                },
+                default_label=block_label,
+            )
+            collector.add_declaration(
+                template_label=qualified_label,
+                payload=block_payload,
+                authored_path=block_authored_path,
+            )
+            block_templ = TemplateGroup(
+                label=qualified_label,
+                payload=block_payload,
+                registry=root.registry,
+            )
+            scene_templ.add_child(block_templ)
+            self._collect_provider_ref_issues(
+                collector=collector,
+                specs=block_payload.roles,
+                source_label=qualified_label,
+                authored_path_prefix=f"{block_authored_path}.roles",
+                field_name="roles",
+                issue_code=ISSUE_DANGLING_ACTOR_REF,
+                reference_keys=("actor_ref", "actor_template_ref"),
+            )
+            self._collect_provider_ref_issues(
+                collector=collector,
+                specs=block_payload.settings,
+                source_label=qualified_label,
+                authored_path_prefix=f"{block_authored_path}.settings",
+                field_name="settings",
+                issue_code=ISSUE_DANGLING_LOCATION_REF,
+                reference_keys=("location_ref", "location_template_ref"),
+            )
+
+            self._compile_section(
+                parent=block_templ,
+                items=block_data.get("templates"),
+                fallback_kind=TraversableNode,
+                collector=collector,
+                authored_path_prefix=f"{block_authored_path}.templates",
+            )
+        return scene_templ
+
+    @staticmethod
+    def _root_sections(data: dict[str, Any]) -> list[tuple[str, Any, type[Entity]]]:
+        return [
+            ("templates", data.get("templates"), TraversableNode),
+            ("actors", data.get("actors"), Actor),
+            ("locations", data.get("locations"), Location),
+        ]
+
     def _compile_section(
         self,
         *,
@@ -251,6 +251,8 @@ class World(TraversableGraphFactory):
     modules: list[Any] = Field(default_factory=list)
     extra_authorities: list[Any] = Field(default_factory=list)
     story_info_projector: Any | None = None
+    # Bumped by :meth:`apply_bundle` so callers can drop derived caches.
+    revision: int = Field(default=0, exclude=True)
 
     @model_validator(mode="before")
     @classmethod
@@ -298,6 +300,25 @@ class World(TraversableGraphFactory):
 
         return payload
 
+    def apply_bundle(self, bundle: Any) -> None:
+        """Adopt a recompiled bundle that patched this world's template registry.
+
+        Used by incremental compilation, which updates ``templates`` in place
+        rather than building a new world under the same singleton label.
+        Stories already created keep their nodes; new stories see the patch.
+        """
+        if bundle.template_registry is not self.templates:
+            raise ValueError("Bundle does not share this world's template registry")
+        self.force_set("bundle", bundle)
+        self.force_set("metadata", dict(bundle.metadata))
+        self.force_set("locals", dict(bundle.locals))
+        self.force_set("entry_template_ids", list(bundle.entry_template_ids))
+        self.force_set("source_map", dict(bundle.source_map))
+        self.force_set("codec_state", dict(bundle.codec_state))
+        self.force_set("codec_id", bundle.codec_id)
+        self.force_set("issues", list(bundle.issues))
+        self.force_set("revision", self.revision + 1)
+
     def get_authorities(self) -> list[object]:
         """Return world-owned behavior authorities with stable declaration order."""
         authorities: list[object] = []
@@ -0,0 +1,120 @@
+"""Compiled journal text for block content, journal lines and blocker messages.
+
+Journal text is best-effort ``str.format`` templating against the gathered
+namespace: unknown fields render as themselves and malformed text is emitted
+verbatim.  Most block content has no fields at all, so each distinct string is
+classified once (:func:`compile_journal_text`) and rendering only touches the
+namespace when a field needs it:
+
+* ``STATIC`` text has no braces (or cannot be formatted at all) and never
+  gathers a namespace.
+* ``FORMAT`` text has only plain ``{name}`` fields, which are pre-parsed and
+  looked up one at a time.
+* ``JINJA`` text (``{{``, ``{%``, ``{#``) and format text with attribute,
+  index or nested fields keep the general ``format_map`` path.
+
+Both dynamic paths read through the namespace instead of copying it, so the
+cost follows the number of fields rather than the size of the namespace.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from string import Formatter
+from typing import Any
+
+_FORMATTER = Formatter()
+_JINJA_DELIMITERS = ("{{", "{%", "{#")
+_CONVERSIONS = (None, "s", "r", "a")
+
+
+class JournalTextKind(Enum):
+    STATIC = "static"
+    FORMAT = "format"
+    JINJA = "jinja"
+
+
+@dataclass(frozen=True, slots=True)
+class JournalText:
+    """Classified journal text with its pre-parsed fields."""
+
+    content: str
+    kind: JournalTextKind
+    parts: tuple[tuple[str, str | None, str, str | None], ...] | None = None
+    """``(literal, field, format spec, conversion)`` for simple format text."""
+
+    def render(self, get_ns: Callable[[], Mapping[str, Any]]) -> str:
+        """Render against the namespace returned by ``get_ns``, called only if needed."""
+        if self.kind is JournalTextKind.STATIC:
+            return self.content
+        try:
+            view = _SafeFormatView(get_ns())
+            if self.parts is None:
+                return self.content.format_map(view)
+            return "".join(_render_parts(self.parts, view))
+        except Exception:
+            return self.content
+
+
+class _SafeFormatView:
+    """Read-through ``format_map`` mapping that renders unknown fields as themselves."""
+
+    __slots__ = ("_ns",)
+
+    def __init__(self, ns: Mapping[str, Any]) -> None:
+        self._ns = ns
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._ns[key]
+        except KeyError:
+            return "{" + key + "}"
+
+
+def _render_parts(parts, view: _SafeFormatView):
+    for literal, field_name, format_spec, conversion in parts:
+        yield literal
+        if field_name is None:
+            continue
+        value = view[field_name]
+        if conversion == "s":
+            value = str(value)
+        elif conversion == "r":
+            value = repr(value)
+        elif conversion == "a":
+            value = ascii(value)
+        yield format(value, format_spec)
+
+
+@lru_cache(maxsize=4096)
+def compile_journal_text(content: str) -> JournalText:
+    """Classify ``content`` once; text that cannot be formatted is treated as static."""
+    if "{" not in content and "}" not in content:
+        return JournalText(content, JournalTextKind.STATIC)
+    try:
+        parts = tuple(_FORMATTER.parse(content))
+    except ValueError:
+        # ``format_map`` would raise too, and the fallback emits the text verbatim.
+        return JournalText(content, JournalTextKind.STATIC)
+
+    if any(delimiter in content for delimiter in _JINJA_DELIMITERS):
+        return JournalText(content, JournalTextKind.JINJA)
+    simple = all(
+        field_name is None
+        or (field_name.isidentifier() and "{" not in format_spec and conversion in _CONVERSIONS)
+        for _, field_name, format_spec, conversion in parts
+    )
+    return JournalText(content, JournalTextKind.FORMAT, parts if simple else None)
+
+
+def render_journal_text(content: str, get_ns: Callable[[], Mapping[str, Any]]) -> str:
+    """Render journal ``content``; ``get_ns`` is only called for dynamic text."""
+    if not content:
+        return ""
+    return compile_journal_text(content).render(get_ns)
+
+
+__all__ = ["JournalText", "JournalTextKind", "compile_journal_text", "render_journal_text"]
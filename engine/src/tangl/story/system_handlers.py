@@ -35,6 +35,7 @@ from tangl.journal.fragments import ChoiceFragment, ContentFragment, MediaFragme
 
 from .dispatch import on_compose_journal, on_find_edges, on_gather_ns, on_journal
 from .episode import Action, Block, MenuBlock
+from .journal_text import render_journal_text
 
 logger = logging.getLogger(__name__)
 
@@ -164,11 +165,6 @@ def project_menu_affordances(*, caller, ctx, **_kw):
     return None
 
 
-class _SafeFormatDict(dict):
-    def __missing__(self, key: str) -> str:  # pragma: no cover - defensive fallback
-        return "{" + key + "}"
-
-
 def _render_block_content(block: Block, *, ctx) -> str:
     """Best-effort templating for block content against the gathered namespace."""
     return _render_text(block.content or "", source=block, ctx=ctx)
@@ -180,11 +176,7 @@ def _render_text(content: str, *, source: object, ctx) -> str:
         return ""
     if ctx is None or not hasattr(ctx, "get_ns"):
         return content
-    try:
-        ns = dict(ctx.get_ns(source))
-        return content.format_map(_SafeFormatDict(ns))
-    except Exception:
-        return content
+    return render_journal_text(content, lambda: ctx.get_ns(source))
 
 
 def _hard_unresolved_dependencies(*, edge: Action) -> list[Dependency]:
@@ -762,6 +754,12 @@ def compose_dialog_markup(*, caller, ctx, fragments, **_kw):
     if ctx is not None and hasattr(ctx, "get_ns"):
         ns = dict(ctx.get_ns(caller))
 
+    # Speakers resolve once per block per pass; the memo is dropped with the
+    # namespace cache whenever the graph mutates.
+    speakers: dict[Any, Any] | None = None
+    if ctx is not None and hasattr(ctx, "memo"):
+        speakers = ctx.memo(("dialog_speakers", caller.uid), dict)
+
     composed: list[Record] = []
     changed = False
     for fragment in fragments:
@@ -776,6 +774,7 @@ def compose_dialog_markup(*, caller, ctx, fragments, **_kw):
                 source_id=getattr(fragment, "source_id", None),
                 ns=ns,
                 ctx=ctx,
+                speakers=speakers,
             )
             rendered = DialogHandler.render(mu_blocks)
             for rendered_fragment in rendered:
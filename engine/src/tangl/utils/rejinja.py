@@ -1,11 +1,91 @@
 import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass
+from types import CodeType
+from typing import Any
 
 import jinja2
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
+
+@dataclass(frozen=True)
+class TemplateCacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+
+
+class TemplateCache:
+    """
+    Bounded LRU of compiled templates, keyed by environment, template class and source.
+
+    ``Environment.from_string`` lexes, parses and compiles its source on every
+    call; this keeps the compiled code (and a globals-free template) for
+    recently seen sources.  Entries hold their template, and with it their
+    environment, so an environment's ``id`` cannot be reused while cached.
+    Cached templates are shared: do not mutate their ``globals``, pass
+    ``globals=`` for a private template instead.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[int, type, str], tuple[CodeType, jinja2.Template]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_template(
+        self,
+        environment: jinja2.Environment,
+        source: str,
+        *,
+        template_class: type[jinja2.Template] | None = None,
+        globals: Mapping[str, Any] | None = None,
+    ) -> jinja2.Template:
+        """Drop-in for ``environment.from_string(source, globals, template_class)``."""
+        cls = template_class or environment.template_class
+        key = (id(environment), cls, source)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            code = environment.compile(source)
+            entry = code, cls.from_code(environment, code, environment.make_globals(None))
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        code, template = entry
+        if globals is None:
+            return template
+        return cls.from_code(environment, code, environment.make_globals(globals))
+
+    def cache_info(self) -> TemplateCacheInfo:
+        with self._lock:
+            return TemplateCacheInfo(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+template_cache = TemplateCache()
+"""Process-wide cache shared by :class:`RecursiveTemplate` and ``tangl.prose`` rendering."""
+
 class RecursiveTemplate(jinja2.Template):
     """Must instantiate with env.from_str(source, globals={}) if including globals"""
 
@@ -19,9 +99,9 @@ class RecursiveTemplate(jinja2.Template):
         s = self.render_once(*args, **kwargs)
         logger.debug( s )
         if "{{" in s or "{%" in s:
-            templ = self.environment.from_string(s,
-                                                 globals=self.globals,
-                                                 template_class=self.__class__)
+            templ = template_cache.get_template(self.environment, s,
+                                                globals=self.globals,
+                                                template_class=self.__class__)
             return templ.render(*args, **kwargs)
         s = s.strip()
         return s
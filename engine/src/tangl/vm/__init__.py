@@ -80,6 +80,7 @@ from .traversable import (
 )
 from .factory import TraversableGraph, TraversableGraphFactory
 from .traversal import (
+    HistoryIndex,
     count_turns,
     get_call_depth,
     get_visit_count,
@@ -154,6 +155,7 @@ __all__ = [
     "Event",
     "BuildReceipt",
     "PlanningReceipt",
+    "HistoryIndex",
     "count_turns",
     "get_call_depth",
     "get_visit_count",
@@ -57,7 +57,7 @@ from contextlib import contextmanager
 from collections import ChainMap
 from dataclasses import dataclass, field
 from random import Random
-from typing import Any, Callable, Iterable, Mapping, Optional, TypeAlias
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional, TypeAlias, TypeVar
 from uuid import UUID
 
 from pydantic import ValidationError
@@ -85,6 +85,7 @@ from ..dispatch import (
     do_validate,
 )
 from ..resolution_phase import ResolutionPhase
+from ..traversal import HistoryIndex
 from ..traversable import (
     AnonymousEdge,
     AnyTraversableEdge,
@@ -97,6 +98,7 @@ logger = logging.getLogger(__name__)
 
 NS: TypeAlias = Mapping[str, Any]
 _UNSET = object()
+_T = TypeVar("_T")
 
 __all__ = ["PhaseCtx", "Frame"]
 
@@ -142,6 +144,7 @@ class PhaseCtx:
     - ``get_authorities()`` — authority registries for dispatch expansion.
     - ``get_inline_behaviors()`` — inline behaviors (empty for now).
     - ``get_ns(node)`` — cached assembled scoped namespace for a node.
+    - ``memo(key, compute)`` — per-context memo for derived handler state.
     - ``get_random()`` — deterministic RNG for this frame.
     - ``cursor`` — the current node (resolved from ``cursor_id``).
 
@@ -170,6 +173,7 @@ class PhaseCtx:
     injected_journal_fragments: list[Record] = field(default_factory=list)
 
     _ns_cache: dict[UUID, ChainMap[str, Any]] = field(default_factory=dict)
+    _memo: dict[Hashable, Any] = field(default_factory=dict, repr=False)
     _ns_inflight: set[UUID] = field(default_factory=set)
     _result_pipe_stack: list[list[Any]] = field(default_factory=lambda: [[]], repr=False)
 
@@ -334,6 +338,21 @@ class PhaseCtx:
         """Discard namespace views after an in-place UPDATE mutation."""
 
         self._ns_cache.clear()
+        self._memo.clear()
+
+    def memo(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """Return ``compute()``, cached under ``key`` for the lifetime of this context.
+
+        Lets several phase handlers share derived state (projection filters,
+        presence lists) within one pipeline pass.  Callers fold anything
+        that can change mid-pass into ``key``; like the namespace cache, the
+        memo dies with the context.
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
 
     def get_location_entity_groups(self) -> list[Iterable]:
         """Entity pools ordered by runtime location distance from cursor."""
@@ -541,6 +560,9 @@ class Frame:
     step_observer: Callable[[StepTrace], None] | None = None
     """Optional observer called once for each completed cursor hop."""
 
+    record_observer: Callable[[Any], None] | None = None
+    """Optional observer called with each record as JOURNAL or FINALIZE emits it."""
+
     _last_step_trace: StepTrace | None = field(default=None, init=False, repr=False)
 
     correlation_id: UUID | str | None = None
@@ -596,6 +618,9 @@ class Frame:
             combined_history.extend(self.cursor_trace)
         if combined_history:
             meta["cursor_history"] = combined_history
+        index = meta.get("history_index")
+        if isinstance(index, HistoryIndex) and self.cursor_trace:
+            meta["history_index"] = index.extended(self.cursor_trace)
         return PhaseCtx(
             graph=self.graph,
             cursor_id=self.cursor.uid,
@@ -836,6 +861,8 @@ class Frame:
             return
         record = self._with_step(values, step=step) if isinstance(values, Record) else values
         self.output_stream.append(record)
+        if self.record_observer is not None:
+            self.record_observer(record)
 
     def _run_journal_phase(self, *, ctx: VmPhaseCtx, entry_phase: ResolutionPhase) -> None:
         if entry_phase > ResolutionPhase.JOURNAL:
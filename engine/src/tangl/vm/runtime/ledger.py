@@ -28,11 +28,12 @@ import logging
 from typing import TYPE_CHECKING, Any, Optional, Self
 from uuid import UUID
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 
 from tangl.core import BaseFragment, BehaviorRegistry, Entity, Graph, OrderedRegistry, Selector
 from tangl.type_hints import UnstructuredData
 from tangl.vm.traversable import TraversableEdge, TraversableNode
+from tangl.vm.traversal import HistoryIndex
 
 from .causality import CausalityMode
 from .frame import Frame, PhaseCtx, StepTrace
@@ -103,12 +104,32 @@ class Ledger(Entity):
         if value is not None:
             self.cursor_id = value.uid
 
+    @property
+    def history_index(self) -> HistoryIndex:
+        """O(1) visit queries over :attr:`cursor_history`.
+
+        Kept in step with appends to the history; rebuilt when the list is
+        replaced or rewritten (rollback, reload), so it never goes stale.
+        """
+        history = self.cursor_history
+        index = self._history_index
+        if (
+            index is None
+            or self._history_index_source != id(history)
+            or index.length > len(history)
+            or (index.length and history[index.length - 1] != index.last_id)
+        ):
+            index = HistoryIndex(history)
+            self._history_index = index
+            self._history_index_source = id(history)
+        elif index.length < len(history):
+            index.extend(history[index.length:])
+        return index
+
     @property
     def turn(self) -> int:
         """Distinct position changes, ignoring self-loops."""
-        from tangl.vm.traversal import count_turns
-
-        return count_turns(self.cursor_history)
+        return self.history_index.count_turns()
 
     @property
     def step(self) -> int:
@@ -154,6 +175,11 @@ class Ledger(Entity):
     user: Optional[Entity] = Field(None, exclude=True)
     user_id: Optional[UUID] = None
     worker_dispatcher: Any = Field(default=None, exclude=True)
+    # handed to each frame as ``Frame.record_observer``; used for streaming output
+    record_observer: Any = Field(default=None, exclude=True)
+
+    _history_index: HistoryIndex | None = PrivateAttr(default=None)
+    _history_index_source: int | None = PrivateAttr(default=None)
 
     @classmethod
     def from_graph(
@@ -240,11 +266,13 @@ class Ledger(Entity):
             causality_mode=self.causality_mode,
             mark_soft_dirty_callback=self.mark_soft_dirty,
             escalate_to_hard_dirty_callback=self.escalate_to_hard_dirty,
+            record_observer=self.record_observer,
         )
 
     def _frame_meta(self) -> dict[str, Any]:
         meta: dict[str, Any] = {"causality_mode": self.causality_mode.value}
         meta["cursor_history"] = list(self.cursor_history)
+        meta["history_index"] = self.history_index
         if self.user is not None:
             meta["user"] = self.user
         if self.user_id is not None:
@@ -477,6 +505,28 @@ class Ledger(Entity):
         self._commit_frame_choice(frame=frame)
         self.current_update_start_step = update_start_step
 
+    def prime_entry(self) -> None:
+        """Seed entry JOURNAL output for a freshly created ledger.
+
+        Runs the entry node through the frame pipeline once, so the opening
+        content and choices are in the output stream before the first
+        :meth:`resolve_choice`.  Does nothing if the journal already has output.
+        """
+        if self.get_journal():
+            return
+
+        frame = self.get_frame()
+        frame.goto_node(self.cursor)
+
+        self._sync_reentrant_steps(frame=frame)
+        self.cursor_steps += frame.cursor_steps
+        self.cursor_id = frame.cursor.uid
+        self.cursor_history.extend(frame.cursor_trace)
+        self.call_stack_ids = [edge.uid for edge in frame.return_stack]
+        self.last_redirect = frame.last_redirect
+        self.redirect_trace = list(frame.redirect_trace)
+        self.save_snapshot(cadence=self.checkpoint_cadence)
+
     @staticmethod
     def _coerce_fragment_record(record: Any) -> BaseFragment | None:
         """Normalize mixed fragment record shapes into the canonical fragment base."""
@@ -934,6 +984,7 @@ class Ledger(Entity):
         self.cursor_steps = target_step
         self.choice_steps = choice_steps
         self.cursor_history = history
+        self._history_index = None
         self.reentrant_steps = reentrant_steps
         self.last_redirect = None
         self.redirect_trace = []
@@ -81,7 +81,7 @@ from .dispatch import (
     on_postreqs,
 )
 from .resolution_phase import ResolutionPhase
-from .traversal import get_visit_count, is_first_visit, steps_since_last_visit
+from .traversal import HistoryIndex
 from .runtime.causality import CausalityMode
 from .traversable import HasEffects, TraversableNode, TraversableEdge, AnonymousEdge
 
@@ -101,6 +101,16 @@ def _ctx_cursor_history(ctx: "PhaseCtx | None") -> list[object]:
     return list(history) if isinstance(history, list) else []
 
 
+def _ctx_history_index(ctx: "PhaseCtx | None") -> HistoryIndex:
+    """Prefer the ledger-maintained index; index a bare history list otherwise."""
+    meta = ctx.get_meta() if ctx is not None and hasattr(ctx, "get_meta") else None
+    if isinstance(meta, Mapping):
+        index = meta.get("history_index")
+        if isinstance(index, HistoryIndex):
+            return index
+    return HistoryIndex(_ctx_cursor_history(ctx))
+
+
 # ---------------------------------------------------------------------------
 # Namespace contributors
 # ---------------------------------------------------------------------------
@@ -276,15 +286,15 @@ def contribute_visit_stats(*, caller, ctx, **kw):
     VM surface. Richer completion semantics remain a story/mechanics concern.
     """
     _ = kw
-    history = _ctx_cursor_history(ctx)
-    visit_count = get_visit_count(caller.uid, history)
+    index = _ctx_history_index(ctx)
+    visit_count = index.get_visit_count(caller.uid)
     visited = visit_count > 0
     return {
         "node_visited": visited,
         "node_num_visits": visit_count,
-        "node_steps_since": steps_since_last_visit(caller.uid, history),
+        "node_steps_since": index.steps_since_last_visit(caller.uid),
         "node_completed": visited,
-        "is_first_visit": is_first_visit(caller.uid, history),
+        "is_first_visit": index.is_first_visit(caller.uid),
     }
 
 
@@ -3,13 +3,18 @@
 
 All functions are pure — they take immutable data (lists of UUIDs) and
 return derived facts. No side effects, no graph lookups.
+
+:class:`HistoryIndex` answers the same history queries in O(1) from counters
+kept up to date as the history grows; results match the functions exactly.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from uuid import UUID
 
 __all__ = [
+    "HistoryIndex",
     "get_visit_count",
     "is_first_visit",
     "steps_since_last_visit",
@@ -93,3 +98,82 @@ def in_subroutine(call_stack_ids: list[UUID]) -> bool:
 def get_call_depth(call_stack_ids: list[UUID]) -> int:
     """Current call stack depth (0 = top-level)."""
     return len(call_stack_ids)
+
+
+class HistoryIndex:
+    """Incremental visit counts, last positions and current run over a cursor history.
+
+    Build from an existing history, then :meth:`append` each new cursor id.
+    With ``base`` the index is an overlay: it reads through to ``base`` and
+    records only its own appends, so a frame can extend the ledger's index
+    with its in-flight trace without copying or mutating it.
+
+    Example:
+        >>> a, b = UUID(int=1), UUID(int=2)
+        >>> index = HistoryIndex([a, b, b])
+        >>> index.get_visit_count(b), index.get_round(b), index.steps_since_last_visit(a)
+        (2, 2, 2)
+        >>> index.extended([a]).is_self_loop(), index.is_self_loop()
+        (False, True)
+    """
+
+    __slots__ = ("base", "length", "last_id", "run_length", "turns", "_counts", "_last_seen")
+
+    def __init__(self, history: Iterable[UUID] = (), *, base: HistoryIndex | None = None) -> None:
+        self.base = base
+        self.length = base.length if base is not None else 0
+        self.last_id = base.last_id if base is not None else None
+        self.run_length = base.run_length if base is not None else 0
+        self.turns = base.turns if base is not None else 0
+        self._counts: dict[UUID, int] = {}
+        self._last_seen: dict[UUID, int] = {}
+        self.extend(history)
+
+    def append(self, cursor_id: UUID) -> None:
+        self._counts[cursor_id] = self._counts.get(cursor_id, 0) + 1
+        self._last_seen[cursor_id] = self.length
+        if self.length and cursor_id == self.last_id:
+            self.run_length += 1
+        else:
+            self.run_length = 1
+            self.turns += 1
+        self.last_id = cursor_id
+        self.length += 1
+
+    def extend(self, cursor_ids: Iterable[UUID]) -> None:
+        for cursor_id in cursor_ids:
+            self.append(cursor_id)
+
+    def extended(self, cursor_ids: Iterable[UUID]) -> HistoryIndex:
+        """Overlay this index with further entries, leaving it unchanged."""
+        return HistoryIndex(cursor_ids, base=self)
+
+    def _last_position(self, cursor_id: UUID) -> int:
+        position = self._last_seen.get(cursor_id)
+        if position is None:
+            return self.base._last_position(cursor_id) if self.base is not None else -1
+        return position
+
+    def get_visit_count(self, cursor_id: UUID) -> int:
+        count = self._counts.get(cursor_id, 0)
+        if self.base is not None:
+            count += self.base.get_visit_count(cursor_id)
+        return count
+
+    def is_first_visit(self, cursor_id: UUID) -> bool:
+        return self.length > 0 and cursor_id == self.last_id and self.get_visit_count(cursor_id) == 1
+
+    def steps_since_last_visit(self, cursor_id: UUID) -> int:
+        position = self._last_position(cursor_id)
+        return -1 if position < 0 else self.length - 1 - position
+
+    def get_round(self, cursor_id: UUID) -> int:
+        if not self.length or cursor_id != self.last_id:
+            return 0
+        return self.run_length
+
+    def is_self_loop(self) -> bool:
+        return self.run_length >= 2
+
+    def count_turns(self) -> int:
+        return self.turns
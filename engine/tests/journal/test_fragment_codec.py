@@ -0,0 +1,170 @@
+"""Tests for the compiled fragment DTO encoder.
+
+Every encoder output is checked against the reference ``fragment_to_dto``
+projection, key order included, for each fragment family and for the
+fragments the bundled worlds actually emit.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from enum import Enum
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from tangl.journal.fragment_codec import FragmentEncoder, encode_json, fragment_encoder
+from tangl.journal.fragments import (
+    AttributedFragment,
+    ChoiceFragment,
+    ContentFragment,
+    ControlFragment,
+    DialogFragment,
+    GroupFragment,
+    KvFragment,
+    KvRow,
+    MediaFragment,
+    PresentationHints,
+    fragment_to_dto,
+)
+from tangl.journal.intent import Blocker, CostPreview, UIHints
+
+_WORLDS_ROOT = Path(__file__).resolve().parents[3] / "worlds"
+
+
+class _Zone(Enum):
+    HAND = "hand"
+
+
+def _reference(fragment) -> dict:
+    return json.loads(json.dumps(fragment_to_dto(fragment)))
+
+
+def _assert_matches_reference(fragment) -> None:
+    expected = _reference(fragment)
+    payload = fragment_encoder.to_dto(fragment)
+    assert payload == expected
+    assert list(payload) == list(expected)
+    assert json.loads(encode_json(payload)) == expected
+
+
+def _sample_fragments() -> list:
+    speaker_line = AttributedFragment(content="Halt!", who="guard", how="shouting", media="avatar")
+    return [
+        ContentFragment(
+            content="The lamp gutters.",
+            source_id=uuid4(),
+            format="markdown",
+            hints=PresentationHints(style_name="narration", style_tags=["dim"]),
+            tags={"channel:journal"},
+            step=3,
+        ),
+        ChoiceFragment(
+            edge_id=uuid4(),
+            text="Buy the lamp.",
+            available=False,
+            blockers=[Blocker(code="poor", message="Too expensive.", refs=["purse"])],
+            ui_hints=UIHints(cost_previews=[CostPreview(ledger_key="purse", delta=-40)]),
+            payload={"quantity": 1, "target": uuid4()},
+        ),
+        DialogFragment(content=[speaker_line], member_ids=[uuid4()], group_type="dialog"),
+        GroupFragment(group_type=_Zone.HAND, member_ids=[uuid4(), uuid4()], zone_role="hand"),
+        KvFragment(content=[KvRow(key="hp", value=3, max=5, hint="bar"), KvRow(key="gold", value=12)]),
+        ControlFragment(ref_type=_Zone.HAND, ref_id=uuid4(), payload={"content": "updated"}),
+        ControlFragment(fragment_type="delete", ref_id="line-1"),
+        MediaFragment(content="images/lamp.svg", content_format="url", media_role="illustration"),
+        speaker_line,
+    ]
+
+
+@pytest.mark.parametrize("fragment", _sample_fragments(), ids=lambda fragment: type(fragment).__name__)
+def test_encoder_matches_reference_projection(fragment) -> None:
+    _assert_matches_reference(fragment)
+
+
+def test_encoder_compiles_one_plan_per_class() -> None:
+    encoder = FragmentEncoder()
+    first, second = ChoiceFragment(edge_id=uuid4()), ChoiceFragment(edge_id=uuid4(), text="Go")
+
+    encoder.to_dto(first)
+    plan = encoder.dto_plan(ChoiceFragment)
+    encoder.to_dto(second)
+
+    assert encoder.dto_plan(ChoiceFragment) is plan
+    assert "step" not in {attribute for attribute, _ in plan.fields}
+    # MediaFragment customizes its content serializer, so it uses the reference path.
+    assert encoder.dto_plan(MediaFragment) is None
+
+
+def test_encode_json_writes_compact_utf8() -> None:
+    edge_id = uuid4()
+    body = encode_json({"edge_id": edge_id, "text": "Café", "zone": _Zone.HAND})
+
+    assert body == f'{{"edge_id":"{edge_id}","text":"Café","zone":"hand"}}'.encode("utf-8")
+
+
+def _bundled_world_fragments(labels: tuple[str, ...], steps: int = 2) -> list:
+    from tangl.persistence import PersistenceManagerFactory
+    from tangl.service import ServiceManager
+    from tangl.service.response import DirectEdgeRequest
+    from tangl.service.user.user import User
+    from tangl.service.world_registry import WorldRegistry
+    from tangl.story import InitMode
+
+    registry = WorldRegistry([_WORLDS_ROOT])
+    persistence = PersistenceManagerFactory.native_in_mem()
+    manager = ServiceManager(persistence)
+    fragments = []
+    for label in labels:
+        world = registry.get_world(label)
+        user = User(label=f"codec-{label}")
+        persistence.save(user)
+        envelope = manager.create_story(
+            user_id=user.uid,
+            world_id=world.label,
+            world=world,
+            init_mode=InitMode.EAGER.value,
+        )
+        fragments.extend(envelope.fragments)
+        for _ in range(steps):
+            choices = [
+                fragment
+                for fragment in envelope.fragments
+                if isinstance(fragment, ChoiceFragment) and fragment.available and fragment.accepts is None
+            ]
+            if not choices:
+                break
+            envelope = manager.resolve_choice(
+                user_id=user.uid,
+                request=DirectEdgeRequest(edge_id=choices[0].edge_id),
+            )
+            fragments.extend(envelope.fragments)
+    return fragments
+
+
+def test_encoder_matches_reference_on_bundled_worlds() -> None:
+    fragments = _bundled_world_fragments(("logic_demo", "reference", "twine_reference"))
+
+    assert fragments
+    for fragment in fragments:
+        _assert_matches_reference(fragment)
+
+
+@pytest.mark.skip(reason="only for benchmarking")
+def test_encoder_performance() -> None:
+    labels = tuple(path.name for path in sorted(_WORLDS_ROOT.iterdir()) if (path / "world.yaml").exists())
+    fragments = _bundled_world_fragments(labels, steps=3)
+
+    start_time = time.perf_counter()
+    for _ in range(50):
+        json.dumps([fragment_to_dto(fragment) for fragment in fragments], default=str)
+    reference_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for _ in range(50):
+        encode_json([fragment_encoder.to_dto(fragment) for fragment in fragments])
+    encoder_time = time.perf_counter() - start_time
+
+    print(f"{len(fragments)} fragments x50: reference {reference_time:.3f}s, encoder {encoder_time:.3f}s")
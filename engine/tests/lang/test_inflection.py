@@ -0,0 +1,86 @@
+import itertools
+import time
+from types import SimpleNamespace
+
+import jinja2
+import pytest
+
+from tangl.lang import inflection
+from tangl.lang.inflection import InflectionTable
+from tangl.lang.pronoun import Gens, PoV, PT, Pronoun
+from tangl.lang.thesaurus import PartOfSpeech, Synset
+
+
+@pytest.fixture
+def verb_synset():
+    yield Synset(label="swing", pos=PartOfSpeech.VB, synonyms={"slash"})
+    Synset.clear_instances()
+
+
+@pytest.mark.parametrize(("pt", "pov", "gens"), list(itertools.product(PT, PoV, Gens)))
+def test_pronoun_table_matches_rules(pt, pov, gens):
+    assert InflectionTable().pronoun(pt, pov, gens) == Pronoun.pronoun(pt, pov, gens)
+
+
+def test_conjugate_computes_each_key_once(monkeypatch):
+    calls = []
+
+    def counting_conjugate(lemma, pov, tense, aspect):
+        calls.append((lemma, pov, tense, aspect))
+        return f"{lemma}:{pov.name}:{tense}:{aspect}"
+
+    monkeypatch.setattr(inflection, "conjugate", counting_conjugate)
+    table = InflectionTable()
+
+    assert table.conjugate("run") == table.conjugate("run") == "run:_3s:present:imperfective"
+    table.conjugate("run", PoV._1s)
+
+    assert calls == [("run", PoV._3s, "present", "imperfective"), ("run", PoV._1s, "present", "imperfective")]
+
+
+def test_conjugate_matches_pattern_helper():
+    table = InflectionTable()
+
+    assert table.conjugate("run") == "runs"
+    assert table.conjugate("be", PoV._1s) == "am"
+    assert table.conjugate("run", tense="past") == "ran"
+    assert table.conjugate("run", aspect="progressive") == "running"
+
+
+def test_warm_from_vocabulary_prefills_synset_verbs(verb_synset):
+    table = InflectionTable()
+
+    added = table.warm_from_vocabulary()
+
+    assert added == 2 * (len(PoV) + 2)
+    assert len(table) == len(PT) * len(PoV) * len(Gens) + added
+    assert table.warm_verbs(["swing", "slash"]) == 0
+    assert table.conjugate("slash") in verb_synset.synonyms_conjugated()
+
+
+@pytest.mark.skip(reason="only for benchmarking")
+def test_inflection_performance():
+    env = jinja2.Environment()
+    Pronoun.register_pronoun_filters(env)
+    passage = env.from_string(
+        "{{ a|She }} drew {{ a|her_ }} blade and {{ b|he }} raised {{ b|his_ }} shield; "
+        "{{ a|her }} eyes met {{ b|him }} as {{ b|he }} braced {{ b|himself }}. " * 20
+    )
+    a, b = SimpleNamespace(is_xx=True), SimpleNamespace(is_xx=False)
+
+    start_time = time.perf_counter()
+    for _ in range(2000):
+        passage.render(a=a, b=b)
+    render_time = time.perf_counter() - start_time
+
+    synset = Synset(label="swing", pos=PartOfSpeech.VB, synonyms={"flail", "slash", "chop", "hack"})
+    inflection.inflections.warm_from_vocabulary()
+    start_time = time.perf_counter()
+    for _ in range(2000):
+        synset.synonyms_conjugated()
+        synset.synonyms_vbn()
+        synset.synonyms_vbg()
+    conjugate_time = time.perf_counter() - start_time
+    Synset.clear_instances()
+
+    print(f"filter-heavy passage x2000: {render_time:.3f}s, synset conjugations x2000: {conjugate_time:.3f}s")
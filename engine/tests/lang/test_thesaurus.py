@@ -48,3 +48,27 @@ def test_no_repeated_synonyms(sample_thesaurus):
     # This test assumes that replace method has logic to avoid immediate repetition
     assert first_replacement != second_replacement or len(swing_synset.synonyms_) == 1
 
+
+
+def test_thesaurus_prepare_marks_every_form_in_one_pass(sample_thesaurus):
+    prepared = sample_thesaurus.prepare("Swinging the Saber, he slashes; the blades sword-fight.")
+
+    assert prepared == (
+        "{{Synset[swing].replace(Swinging)}} the {{Synset[sword].replace(Saber)}}, "
+        "he {{Synset[swing].replace(slashes)}}; the blades {{Synset[sword].replace(sword)}}-fight."
+    )
+
+
+def test_synset_replace_keeps_the_matched_inflection(sample_thesaurus):
+    swing_synset = sample_thesaurus.synsets[0]
+
+    assert swing_synset.replace("flailing") in swing_synset.forms["vbg"]
+    assert swing_synset.replace("slashes") in swing_synset.forms["vbz"]
+
+
+def test_thesaurus_matcher_tracks_synset_list(sample_thesaurus):
+    assert sample_thesaurus.prepare("a dagger") == "a dagger"
+
+    sample_thesaurus.synsets.append(Synset(label="dagger", pos=PartOfSpeech.NN, synonyms={"dirk"}))
+
+    assert sample_thesaurus.prepare("a dagger") == "a {{Synset[dagger].replace(dagger)}}"
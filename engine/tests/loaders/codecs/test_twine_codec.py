@@ -7,6 +7,9 @@ Organized by behavior:
 """
 from __future__ import annotations
 
+import time
+import tracemalloc
+from io import StringIO
 from pathlib import Path
 
 import pytest
@@ -23,6 +26,7 @@ from tangl.loaders.codecs.twine import (
     ISSUE_SLUG_COLLISION,
     TwineCodec,
     _classify_macro,
+    _iter_twee_passages,
     _parse_twee,
     _slugify,
 )
@@ -148,6 +152,28 @@ Goodbye.
         assert passages[0].body == "Hello there."
         assert passages[1].name == "Next"
 
+    def test_iter_twee_passages_buffers_only_kept_bodies(self) -> None:
+        source = StringIO(
+            ":: StoryTitle\nTower\n\n:: Start [entry]\nHello.\n:: Next\nBye.\n[[Start]]"
+        )
+
+        passages = list(
+            _iter_twee_passages(
+                source,
+                path=Path("story.twee"),
+                start_ordinal=4,
+                keep_body=lambda name, _ordinal: name == "StoryTitle",
+            )
+        )
+
+        assert [(passage.name, passage.ordinal) for passage in passages] == [
+            ("StoryTitle", 4),
+            ("Start", 5),
+            ("Next", 6),
+        ]
+        assert [passage.body for passage in passages] == ["Tower", "", ""]
+        assert passages[1].tags == ["entry"]
+
     def test_classify_macro_groups_if_family(self) -> None:
         assert _classify_macro("<<elseif $torch>>") == FEATURE_MACROS_IF
 
@@ -225,6 +251,39 @@ New text.
         assert result.story_data["scenes"]["world"]["blocks"]["start"]["content"] == "New text."
         assert any(record.feature == ISSUE_DUPLICATE_PASSAGE for record in result.loss_records)
 
+    def test_decode_streams_scripts_with_cross_file_duplicates(self, tmp_path: Path) -> None:
+        bundle = _write_bundle(
+            tmp_path,
+            scripts={
+                "a.twee": """
+:: Start
+Old start.
+
+:: Hall
+Hall. [[Start]]
+                """,
+                "b.twee": """
+:: StoryData
+{"start":"Start"}
+
+:: Start
+New start. [[Hall]]
+                """,
+            },
+        )
+
+        result = _decode_bundle(bundle)
+        blocks = result.story_data["scenes"]["world"]["blocks"]
+
+        assert list(blocks) == ["hall", "start"]
+        assert blocks["start"]["content"] == "New start."
+        assert [(entry["name"], entry["ordinal"]) for entry in result.codec_state["passages"]] == [
+            ("Hall", 1),
+            ("Start", 3),
+        ]
+        assert result.codec_state["passages"][1]["path"].endswith("b.twee")
+        assert [record.feature for record in result.loss_records] == [ISSUE_DUPLICATE_PASSAGE]
+
     def test_decode_suffixes_slug_collisions_for_distinct_surviving_names(self, tmp_path: Path) -> None:
         bundle = _write_bundle(
             tmp_path,
@@ -767,3 +826,30 @@ Inside.
                 story_key=None,
                 codec_state=_simple_codec_state(),
             )
+
+
+def _synthetic_twee(passage_count: int) -> str:
+    lines = [":: StoryTitle", "Synthetic", "", ":: StoryData", '{"start":"Room 0"}', ""]
+    for index in range(passage_count):
+        lines.append(f":: Room {index} [generated]")
+        lines.append(f"Room {index}. <<set $visits += 1>>")
+        lines.append(f"[[Onward->Room {(index + 1) % passage_count}]]")
+        lines.append(f"<<if $visits gt 3>>[[Rest->Room 0]]<<else>>[[Room {index // 2}]]<<endif>>")
+        lines.append("")
+    return "\n".join(lines)
+
+
+@pytest.mark.skip(reason="only for benchmarking")
+def test_decode_performance(tmp_path: Path) -> None:
+    passage_count = 50_000
+    bundle = _write_bundle(tmp_path, scripts={"story.twee": _synthetic_twee(passage_count)})
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = _decode_bundle(bundle)
+    decode_time = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert result.codec_state["passage_count"] == passage_count
+    print(f"{passage_count} passages: decode {decode_time:.3f}s, peak {peak / 2**20:.1f} MiB")
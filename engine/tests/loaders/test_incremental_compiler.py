@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tangl.loaders import IncrementalWorldCompiler, WorldBundle
+from tangl.loaders.codec import NearNativeYamlCodec
+from tangl.story import InitMode
+
+
+def _write_bundle(root: Path) -> None:
+    (root / "scripts").mkdir(parents=True)
+    (root / "world.yaml").write_text("label: patched_world\n", encoding="utf-8")
+    (root / "scripts" / "a_meta.yaml").write_text(
+        "label: patched_world\nmetadata:\n  title: Patched\n  author: Tests\n",
+        encoding="utf-8",
+    )
+    (root / "scripts" / "b_scenes.yaml").write_text(
+        "\n".join(
+            [
+                "scenes:",
+                "  intro:",
+                "    blocks:",
+                "      start:",
+                "        content: Hello.",
+                "        actions:",
+                "          - text: Onward",
+                "            successor: hall.room",
+                "  hall:",
+                "    blocks:",
+                "      room:",
+                "        content: A room.",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_update_patches_live_world_from_changed_file(tmp_path: Path) -> None:
+    root = tmp_path / "patched_world"
+    _write_bundle(root)
+    compiler = IncrementalWorldCompiler()
+    world = compiler.compile(WorldBundle.load(root))
+    registry = world.templates
+    revision = world.revision
+
+    assert compiler.update(world).is_empty
+    assert world.revision == revision
+
+    scenes = root / "scripts" / "b_scenes.yaml"
+    scenes.write_text(scenes.read_text(encoding="utf-8").replace("A room.", "A bigger room."), encoding="utf-8")
+    patch = compiler.update(world)
+
+    assert patch.changed == ["scenes.hall"]
+    assert world.templates is registry
+    assert world.revision == revision + 1
+    room = next(t for t in registry.values() if t.get_label() == "hall.room")
+    assert room.payload.content == "A bigger room."
+
+    result = world.create_story("patched_story", init_mode=InitMode.EAGER)
+    assert result.graph.initial_cursor_id is not None
+
+
+def test_failed_update_is_retried_on_next_call(tmp_path: Path, monkeypatch) -> None:
+    root = tmp_path / "patched_world"
+    _write_bundle(root)
+    compiler = IncrementalWorldCompiler()
+    world = compiler.compile(WorldBundle.load(root))
+    revision = world.revision
+
+    scenes = root / "scripts" / "b_scenes.yaml"
+    scenes.write_text(scenes.read_text(encoding="utf-8").replace("A room.", "A bigger room."), encoding="utf-8")
+
+    def failing_load(self, path):
+        raise RuntimeError("boom")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(NearNativeYamlCodec, "load_script", failing_load)
+        with pytest.raises(RuntimeError, match="boom"):
+            compiler.update(world)
+    assert world.revision == revision
+
+    patch = compiler.update(world)
+    assert patch.changed == ["scenes.hall"]
+    assert world.revision == revision + 1
@@ -5,6 +5,7 @@ import pytest
 from pydantic import BaseModel
 
 from tangl.mechanics.demographics import (
+    AliasTable,
     DemographicData,
     DemographicSampler,
     HasDemographic,
@@ -300,3 +301,52 @@ def test_demographic_sampling_with_explicit_rng_is_reproducible(test_data):
     assert left.subtype.label == right.subtype.label
     assert left.gender == right.gender
     assert left.age_range == right.age_range
+
+
+def test_alias_table_matches_weights_exactly():
+    class EvenRandom:
+        def __init__(self, steps):
+            self.values = iter((k + 0.5) / steps for k in range(steps))
+
+        def random(self):
+            return next(self.values)
+
+    table = AliasTable(["a", "b", "c", "d"], [1, 2, 3, 0])
+    rng = EvenRandom(600)
+    draws = [table.sample(rng) for _ in range(600)]
+
+    assert {label: draws.count(label) for label in "abcd"} == {"a": 100, "b": 200, "c": 300, "d": 0}
+    assert AliasTable(["x", "y"], [0, 0]).sample(random.Random(1)) in {"x", "y"}
+    with pytest.raises(IndexError):
+        AliasTable([], [])
+
+
+def test_sample_many_is_seeded_and_tracks_new_countries(test_data):
+    left = DemographicSampler.sample_many(20, rng=11)
+    right = DemographicSampler.sample_many(20, rng=random.Random(11))
+
+    assert len(left) == 20
+    assert [d.given_name for d in left] == [d.given_name for d in right]
+    assert [d.country.label for d in left] == [d.country.label for d in right]
+
+    asia = test_data["regions"][1]
+    korea = Country(label="korea", name="Korea", demonym="Korean", population=10**12)
+    asia.countries.add(korea)
+    NameBank(label="korea", female=["Ji-woo"], male=["Min-jun"], surname=["Kim"])
+
+    crowd = DemographicSampler.sample_many(10, region=asia, rng=3)
+    assert {d.country.label for d in crowd} == {"korea"}
+    assert {d.family_name for d in crowd} == {"Kim"}
+
+
+def test_region_table_is_reused_until_regions_change(test_data):
+    regions, table = DemographicSampler._regions()
+    assert DemographicSampler._regions()[1] is table
+
+    Region(label="oceania", name="Oceania", demonym="Oceanian", eth_mix={"asian": 1})
+    rebuilt_regions, rebuilt = DemographicSampler._regions()
+    assert rebuilt is not table
+    assert len(rebuilt_regions) == len(regions) + 1
+
+    DemographicSampler.reset_tables()
+    assert DemographicSampler._regions()[1] is not rebuilt
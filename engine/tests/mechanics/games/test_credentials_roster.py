@@ -18,10 +18,13 @@ from tangl.mechanics.games import (
     Restrictions,
     RestrictionLevel,
     ScenarioOffer,
+    RosterCache,
     ShiftSpec,
     derive_disposition,
     generate_roster,
     materialize,
+    prepare_roster,
+    roster_cache,
 )
 
 D = CredentialDisposition
@@ -194,3 +197,63 @@ class TestGameWalksOffers:
         # The shift summary counts the offers (3), not the default roster (2).
         summary = " ".join(f.content for f in handler.get_journal_fragments(game))
         assert "of 3" in summary
+
+
+class TestPreparedRoster:
+    def test_prepared_roster_is_cached_by_scenario_seed_and_index(self) -> None:
+        cache = RosterCache()
+        spec = _spec(encounters=4, seed=9)
+        prepared = prepare_roster(spec, scenario="checkpoint", cache=cache)
+        cases = prepared.wait()
+
+        assert prepared.done
+        assert len(cache) == 4
+        assert [case.disposition for case in cases] == [o.target_disposition for o in prepared.offers]
+        assert [o.target_disposition for o in prepared.offers] == [
+            o.target_disposition for o in generate_roster(spec)
+        ]
+
+        again = prepare_roster(spec, scenario="checkpoint", cache=cache, background=False)
+        assert [again.case(i) for i in range(4)] == cases
+        fresh = again.case(0).fresh_case()
+        assert fresh is not cases[0].case
+        assert derive_disposition(fresh.packet_manager, RULES) is cases[0].disposition
+
+        with pytest.raises(ValueError, match="seeded"):
+            prepare_roster(_spec(seed=None), scenario="checkpoint", cache=cache)
+
+    def test_game_reuses_prepared_cases_and_memoizes_defects(self) -> None:
+        spec = _spec(
+            encounters=2,
+            origin_distribution={Region.LOCAL: 1.0},
+            purpose_pool=[IND.WORK],
+            disposition_distribution={D.DENY: 1.0},
+            seed=17,
+        )
+        prepared = prepare_roster(spec, scenario="test-reuse")
+        prepared.wait()
+        try:
+            game = CredentialsGame(restriction_map=RULES, **prepared.game_kwargs())
+            handler = CredentialsGameHandler()
+            handler.setup(game)
+
+            case = game.active_case
+            assert case is not prepared.case(0).case
+            assert case.packet_manager.bearer_id == prepared.case(0).case.packet_manager.bearer_id
+            assert game.case_defects() == list(prepared.case(0).defects)
+            assert game.expected_disposition(case) is D.DENY
+
+            for _ in range(2):
+                _ = game.active_case
+                handler.receive_move(game, ("inspect", handler.get_available_inspect_targets(game)[0]))
+                handler.receive_move(game, ("decide", "deny"))
+            assert game.correct_count == 2
+
+            # A different rule set is not served from the cache.
+            other = CredentialsGame(
+                restriction_map=Restrictions.from_map({Region.LOCAL: {IND.WORK: L.WITH_PERMIT}}),
+                **prepared.game_kwargs(),
+            )
+            assert other.active_case.packet_manager.bearer_id != case.packet_manager.bearer_id
+        finally:
+            roster_cache.clear()
@@ -0,0 +1,82 @@
+"""Tests for transposition-table game-tree search."""
+
+from __future__ import annotations
+
+from tangl.mechanics.games import (
+    BlackjackGame,
+    BlackjackGameHandler,
+    BlackjackMove,
+    GameTreeSearch,
+    NimGame,
+    NimGameHandler,
+    PlayingCard,
+    SearchNode,
+    run_tournament,
+    search_best_move,
+    search_hints,
+)
+from tangl.mechanics.games.nim_game import NimSearchModel
+
+
+def test_nim_values_match_modular_theory() -> None:
+    search = GameTreeSearch(NimSearchModel(min_take=1, max_take=3))
+
+    for heap in range(1, 30):
+        expected = -1.0 if heap % 4 == 0 else 1.0
+        assert search.value((heap, SearchNode.PLAYER)) == expected
+
+    assert search.hits > 0
+    assert (12, SearchNode.OPPONENT) in search.table
+
+
+def test_misere_nim_and_depth_limit() -> None:
+    misere = GameTreeSearch(NimSearchModel(max_take=3, last_token_wins=False))
+    assert misere.value((5, SearchNode.PLAYER)) == -1.0
+    assert misere.best_move((6, SearchNode.PLAYER)) == 1
+
+    shallow = GameTreeSearch(NimSearchModel(max_take=3), max_depth=2)
+    assert shallow.value((40, SearchNode.PLAYER)) == 0.0
+    assert (40, SearchNode.PLAYER) not in shallow.table
+
+
+def test_nim_hints_for_live_game() -> None:
+    game = NimGame(opening_heap_size=10, max_take=3)
+    NimGameHandler().setup(game)
+
+    assert search_hints(game) == {1: -1.0, 2: 1.0, 3: -1.0}
+    assert search_best_move(game) == 2
+
+
+def test_blackjack_hints_stand_only_at_21() -> None:
+    game = BlackjackGame(shuffle_seed=3)
+    BlackjackGameHandler().setup(game)
+
+    hints = search_hints(game)
+    assert set(hints) == {BlackjackMove.HIT, BlackjackMove.STAND}
+    assert all(-1.0 <= value <= 1.0 for value in hints.values())
+
+    game.player_hand = [PlayingCard(rank=1, suit="S"), PlayingCard(rank=13, suit="H")]
+    assert list(search_hints(game)) == [BlackjackMove.STAND]
+
+
+def test_blackjack_hints_prefer_standing_on_hard_20() -> None:
+    game = BlackjackGame(shuffle_seed=1)
+    BlackjackGameHandler().setup(game)
+    game.player_hand = [PlayingCard(rank=10, suit="S"), PlayingCard(rank=12, suit="H")]
+
+    hints = search_hints(game)
+    assert hints[BlackjackMove.STAND] > hints[BlackjackMove.HIT]
+
+
+def test_solved_nim_opponent_beats_random_play() -> None:
+    report = run_tournament(
+        NimGameHandler,
+        player_strategies=["random", "search"],
+        strategies=["nim_search"],
+        seeds=20,
+        game_kwargs={"opening_heap_size": 13, "opponent_revision_strategy": "nim_search"},
+    )
+
+    assert report.get("random", "nim_search").win_rate < 0.2
+    # heap 13 is a first-player win, so solved play takes it every time
+    assert report.get("search", "nim_search").win_rate == 1.0
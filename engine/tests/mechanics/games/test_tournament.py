@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tangl.mechanics.games import NimGameHandler, player_policies, run_tournament
+from tangl.mechanics.games.rps_game import RpsGameHandler
+
+
+def test_constant_strategies_have_deterministic_results() -> None:
+    report = run_tournament(
+        RpsGameHandler,
+        strategies=["rps_rock", "rps_paper", "rps_scissors"],
+        seeds=5,
+    )
+
+    paper_vs_rock = report.get("rps_paper", "rps_rock")
+    assert paper_vs_rock.games == 5
+    assert paper_vs_rock.win_rate == 1.0
+    assert report.get("rps_rock", "rps_paper").loss_rate == 1.0
+    assert report.get("rps_rock", "rps_rock").draw_rate == 1.0
+    assert sum(paper_vs_rock.length_histogram.values()) == 5
+    assert report.games == 45
+    assert report.rounds == sum(m.rounds for m in report.matchups)
+
+
+def test_tournament_is_seeded_and_restores_global_random() -> None:
+    random.seed(1234)
+    expected_next = random.Random(1234).random()
+
+    first = run_tournament(RpsGameHandler, strategies=["rps_random", "rps_cycle"], seeds=20)
+    assert random.random() == expected_next
+
+    second = run_tournament(RpsGameHandler, strategies=["rps_random", "rps_cycle"], seeds=20)
+    assert first.win_rates() == second.win_rates()
+    assert [m.length_histogram for m in first.matchups] == [m.length_histogram for m in second.matchups]
+
+
+def test_process_pool_matches_serial_results() -> None:
+    kwargs = dict(strategies=["nim_random", "nim_safe"], player_strategies=["random", "nim_safe"], seeds=10)
+    serial = run_tournament(NimGameHandler, **kwargs)
+    pooled = run_tournament(NimGameHandler, workers=2, **kwargs)
+
+    assert serial.win_rates() == pooled.win_rates()
+    assert [m.length_histogram for m in serial.matchups] == [m.length_histogram for m in pooled.matchups]
+
+
+def test_player_policies_and_unknown_names() -> None:
+    assert {"random", "first", "last"} <= set(player_policies.names())
+    with pytest.raises(KeyError):
+        run_tournament(RpsGameHandler, strategies=["rps_rock"], player_strategies=["nope"], seeds=1)
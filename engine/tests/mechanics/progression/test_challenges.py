@@ -5,6 +5,8 @@ import pytest
 from tangl.mechanics.progression.challenges import (
     ChallengePayout,
     StatChallenge,
+    challenge_odds,
+    challenge_odds_many,
     resolve_challenge,
 )
 from tangl.mechanics.progression.definition import CanonicalSlot, StatDef, StatSystemDefinition
@@ -524,3 +526,57 @@ def test_situational_effect_remaps_are_immutable_and_serializable():
 
     assert effect.model_dump()["cost_currency_remap"] == {"stamina": "mana"}
     assert effect.model_copy(deep=True).cost_currency_remap == {"stamina": "mana"}
+
+
+def test_challenge_odds_agree_with_resolution_and_expected_payout():
+    challenge = StatChallenge(
+        name="Smash warded door",
+        domain="strength",
+        difficulty="good",
+        cost={"stamina": 2},
+        payout=ChallengePayout(
+            by_outcome={
+                Outcome.SUCCESS: {"mana": 1},
+                Outcome.MAJOR_SUCCESS: {"mana": 2},
+            }
+        ),
+    )
+    actor = _adventure_actor(stamina=1000)
+    odds = challenge_odds(challenge, actor)
+
+    rolls = [(i + 0.5) / 400 for i in range(400)]
+    results = [resolve_challenge(challenge, actor, wallet=actor, roll=roll) for roll in rolls]
+    observed_success = sum(result.outcome >= Outcome.SUCCESS for result in results) / len(rolls)
+    observed_mana = sum(result.payout_granted.get("mana", 0) for result in results) / len(rolls)
+
+    assert odds.success_likelihood == pytest.approx(results[0].success_likelihood)
+    assert odds.success_chance == pytest.approx(observed_success, abs=0.01)
+    assert odds.expected_payout["mana"] == pytest.approx(observed_mana, abs=0.01)
+    assert odds.expected_wallet_delta["stamina"] == -2
+    # previews never touch the wallet
+    assert actor.wallet["stamina"] == 1000 - 2 * len(rolls)
+
+
+def test_challenge_odds_many_reports_forced_and_gated_challenges():
+    system = _social_system()
+    stats = HasStats.from_system(system, overrides={"strength": 10.0, "wealth": "high"}).stats
+    actor = Adventurer(stat_system=system, stats=stats, wallet={})
+    cursed = SimpleEffectDonor(
+        SituationalEffect(name="cursed", applies_to_tags={"#x"}, forced_outcome=Outcome.DISASTER)
+    )
+
+    open_odds, forced_odds, gated_odds = challenge_odds_many(
+        [
+            StatChallenge(domain="strength", difficulty=10.0),
+            StatChallenge(domain="strength", difficulty=10.0, tags={"#x"}),
+            StatChallenge(domain="strength", difficulty=10.0, requirements={"wealth": {"maximum": "poor"}}),
+        ],
+        actor,
+        effect_donors=[cursed],
+    )
+
+    assert open_odds.success_chance == pytest.approx(0.5)
+    assert forced_odds.probabilities[Outcome.DISASTER] == 1.0
+    assert forced_odds.success_chance == 0.0
+    assert not gated_odds.available
+    assert gated_odds.unmet_requirements
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from tangl.mechanics.progression.outcomes import Outcome, sample_outcome
+import pytest
+
+from tangl.mechanics.progression.outcomes import Outcome, outcome_distribution, sample_outcome
 
 
 def test_sample_outcome_bounds_and_types():
@@ -21,3 +23,13 @@ def test_sample_outcome_monotone_in_p_for_fixed_roll():
             o = sample_outcome(p, roll=roll)
             assert o.value >= last.value
             last = o
+
+
+def test_outcome_distribution_matches_sample_outcome_bands():
+    rolls = [(i + 0.5) / 2000 for i in range(2000)]
+    for p in [0.0, 0.05, 0.3, 0.5, 0.9, 1.0]:
+        dist = outcome_distribution(p)
+        assert sum(dist.values()) == pytest.approx(1.0)
+        for outcome, probability in dist.items():
+            observed = sum(sample_outcome(p, roll=roll) is outcome for roll in rolls) / len(rolls)
+            assert observed == pytest.approx(probability, abs=1e-3)
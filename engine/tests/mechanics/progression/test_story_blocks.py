@@ -70,7 +70,7 @@ TrialBlock.model_rebuild(_types_namespace={"UUID": UUID})
 DrillBlock.model_rebuild(_types_namespace={"UUID": UUID})
 
 
-def _challenge_world(hero: Hero, challenge: StatChallenge):
+def _challenge_world(hero: Hero, challenge: StatChallenge, roll: float | None = None):
     graph = StoryGraph(label="trial")
     graph.add(hero)
 
@@ -78,6 +78,7 @@ def _challenge_world(hero: Hero, challenge: StatChallenge):
     graph.add(start)
     trial = TrialBlock(label="trial", content="Face the trial")
     object.__setattr__(trial, "_challenge", challenge)
+    object.__setattr__(trial, "_roll", roll)
     graph.add(trial)
     won = Block(label="won", content="You prevailed")
     lost = Block(label="lost", content="You fell")
@@ -143,6 +144,44 @@ class TestChallengeBlockBranches:
         assert trial.locals["challenge_quality"]
 
 
+class TestChallengeChoiceHints:
+    def test_choice_into_challenge_carries_success_chance(self) -> None:
+        from tangl.journal.fragments import ChoiceFragment
+
+        hero = _hero(level=10.0)
+        challenge = StatChallenge(name="Even Trial", domain="grit", difficulty=10.0)
+        ledger, begin = _challenge_world(hero, challenge)
+
+        ledger.prime_entry()
+
+        choice = next(
+            record
+            for record in ledger.records.values()
+            if isinstance(record, ChoiceFragment) and record.edge_id == begin.uid
+        )
+        assert choice.ui_hints is not None
+        assert choice.ui_hints.success_chance == pytest.approx(0.5)
+
+    @pytest.mark.parametrize(("roll", "expected"), [(0.1, 1.0), (0.9, 0.0)])
+    def test_pinned_roll_reports_its_certain_result(self, roll: float, expected: float) -> None:
+        from tangl.journal.fragments import ChoiceFragment
+
+        hero = _hero(level=10.0)
+        challenge = StatChallenge(name="Even Trial", domain="grit", difficulty=10.0)
+        ledger, begin = _challenge_world(hero, challenge, roll=roll)
+
+        ledger.prime_entry()
+
+        choice = next(
+            record
+            for record in ledger.records.values()
+            if isinstance(record, ChoiceFragment) and record.edge_id == begin.uid
+        )
+        assert choice.ui_hints.success_chance == expected
+        ledger.resolve_choice(begin.uid)
+        assert ledger.cursor.label == ("won" if expected else "lost")
+
+
 class TestTrainingBlockGrows:
     def test_training_raises_the_skill(self) -> None:
         hero = _hero(level=8.0)
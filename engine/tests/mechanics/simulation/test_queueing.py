@@ -18,6 +18,8 @@ from tangl.mechanics.simulation import (
     QueueSimulationHandler,
     QueueStationSpec,
     SimulationEvent,
+    run_replications,
+    sweep_stations,
 )
 from tangl.story import Action, Block
 from tangl.vm import Frame, Ledger, TraversableEdge as ChoiceEdge
@@ -98,6 +100,57 @@ def test_event_calendar_peeks_and_pops_by_turn_then_sequence() -> None:
     assert calendar.pop_next() is None
 
 
+def test_event_calendar_reindexes_after_invalidated_registry_edits() -> None:
+    calendar = EventCalendar()
+    late = calendar.push(SimulationEvent(label="late", at_turn=9, kind="x"))
+    early = calendar.push(SimulationEvent(label="early", at_turn=2, kind="x"))
+    assert calendar.peek_next() is early
+
+    calendar.registry.remove(early.uid)
+    sooner = SimulationEvent(label="sooner", at_turn=1, kind="x")
+    calendar.registry.add(sooner)
+    calendar.invalidate()
+
+    assert calendar.pop_next() is sooner
+    assert calendar.pop_next() is late
+    assert calendar.pop_next() is None
+
+
+def test_event_calendar_cancel_and_invalidate_cover_same_size_edits() -> None:
+    calendar = EventCalendar()
+    late = calendar.push(SimulationEvent(label="late", at_turn=9, kind="x"))
+    early = calendar.push(SimulationEvent(label="early", at_turn=2, kind="x"))
+    middle = calendar.push(SimulationEvent(label="middle", at_turn=5, kind="x"))
+    assert calendar.peek_next() is early
+
+    assert calendar.cancel(early.uid) is early
+    assert calendar.cancel(early.uid) is None
+    assert calendar.peek_next() is middle
+
+    # Same-size swap plus an in-place edit behind the head: invisible until invalidated.
+    calendar.registry.remove(middle.uid)
+    swapped = SimulationEvent(label="swapped", at_turn=7, kind="x")
+    calendar.registry.add(swapped)
+    late.at_turn = 1
+    calendar.invalidate()
+
+    assert [calendar.pop_next() for _ in range(3)] == [late, swapped, None]
+
+
+def test_event_calendar_indexes_a_prepopulated_registry() -> None:
+    calendar = EventCalendar()
+    for turn in (5, 1, 3, 1):
+        calendar.push(SimulationEvent(label=f"t{turn}", at_turn=turn, kind="x"))
+    expected = [event.label for event in calendar.events()]
+
+    restored = EventCalendar(registry=calendar.registry)
+    popped = []
+    while (event := restored.pop_next()) is not None:
+        popped.append(event.label)
+
+    assert popped == expected
+
+
 def test_queueing_run_processes_events_in_order_and_completes_patients() -> None:
     game = _ed_game()
     _run_to_completion(game)
@@ -229,3 +282,27 @@ def test_queueing_hasgame_provisions_self_loop_and_journals_fragments() -> None:
     ]
     assert any("P1 arrives and enters triage" in item for item in content)
     assert any("P1 starts triage" in item for item in content)
+
+
+def test_queue_replications_are_seeded_and_pool_independent() -> None:
+    base = _ed_game()
+
+    fixed = run_replications(base, 3)
+    assert fixed.distribution("completed_turn") == [25.0, 25.0, 25.0]
+
+    jittered = run_replications(base, [7, 8, 9, 10], arrival_spread=2)
+    again = run_replications(base, [7, 8, 9, 10], arrival_spread=2, workers=2)
+    assert again.runs == jittered.runs
+    assert sum(jittered.bottleneck_counts().values()) == 4
+    assert base.metrics is None
+
+
+def test_queue_station_sweep_relieves_the_bottleneck() -> None:
+    results = sweep_stations(_ed_game(), 2, capacity={"imaging": [1, 2]})
+
+    assert list(results) == [
+        (("triage", 1, 3), ("imaging", 1, 5), ("disposition", 1, 2)),
+        (("triage", 1, 3), ("imaging", 2, 5), ("disposition", 1, 2)),
+    ]
+    single, double = results.values()
+    assert double.describe("mean_wait")["mean"] < single.describe("mean_wait")["mean"]
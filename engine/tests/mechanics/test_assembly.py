@@ -14,9 +14,11 @@ from tangl.mechanics.assembly import (
     Connector,
     ConnectorPolarity,
     HasSlottedContainer,
+    LoadoutSolver,
     Slot,
     SlotGroup,
     SlottedContainer,
+    solve_loadout,
 )
 
 
@@ -433,6 +435,122 @@ def test_get_aggregate_raises_for_non_numeric_present_values() -> None:
         container.get_aggregate("status_text")
 
 
+def test_aggregates_track_assign_and_unassign() -> None:
+    container = TestContainer(owner=TestHost(label="owner", max_power=5.0))
+    visor = TestComponent(label="visor", tags={"alpha"}, power_cost=1.0, defense_bonus=2.0, capabilities={"vision"})
+    scanner = TestComponent(label="scanner", tags={"beta"}, power_cost=2.0, capabilities={"vision", "mapping"})
+    container.assign("alpha", visor)
+
+    assert container.get_aggregate("defense_bonus") == 2.0
+    assert container.get_aggregate_tags("capabilities") == {"vision"}
+
+    container.assign("beta", scanner)
+    assert container.get_aggregate_cost("power") == 3.0
+    assert container.get_aggregate_tag_counts("capabilities") == {"vision": 2, "mapping": 1}
+    assert container.budgets.budgets["power"].consumed == 3.0
+
+    container.unassign("alpha", visor)
+    assert container.get_aggregate("defense_bonus") == 0.0
+    assert container.get_aggregate_tags("capabilities") == {"vision", "mapping"}
+    assert container.budgets.budgets["power"].consumed == 2.0
+
+    scanner.power_cost = 4.0
+    container.refresh_aggregates()
+    assert container.get_aggregate_cost("power") == 4.0
+    assert container.validate() == ["Required slot empty: alpha"]
+
+
+def test_unassign_leaves_no_float_residue_in_totals() -> None:
+    container = TestContainer(owner=TestHost(label="owner", max_power=1.0))
+    light = TestComponent(label="light", tags={"alpha"}, power_cost=0.1)
+    heavy = TestComponent(label="heavy", tags={"beta"}, power_cost=0.2)
+    container.assign("alpha", light)
+    assert container.get_aggregate_cost("power") == 0.1
+    container.assign("beta", heavy)
+    container.unassign("beta", heavy)
+
+    # 0.1 + 0.2 - 0.2 would be 0.10000000000000003
+    assert container.get_aggregate_cost("power") == 0.1
+    assert container.budgets.budgets["power"].consumed == 0.1
+
+
+def test_preview_assignments_evaluates_candidates_against_budgets() -> None:
+    container = TestContainer(owner=TestHost(label="owner", max_power=2.0))
+    current = TestComponent(label="current", tags={"alpha"}, power_cost=1.5)
+    container.assign("alpha", current)
+    cheap = TestComponent(label="cheap", tags={"beta"}, power_cost=0.5)
+    pricey = TestComponent(label="pricey", tags={"beta"}, power_cost=1.0)
+    upgrade = TestComponent(label="upgrade", tags={"alpha"}, power_cost=2.0)
+
+    previews = container.preview_assignments(
+        [("beta", cheap), ("beta", pricey), ("alpha", upgrade), ("gamma", cheap)],
+    )
+
+    assert [preview.allowed for preview in previews] == [True, False, False, False]
+    assert previews[0].remaining == {"power": 0.0}
+    assert previews[1].reason.startswith("Insufficient power")
+    assert previews[2].reason == "Slot full (1/1)"
+    assert previews[3].reason == "No such slot: gamma"
+    assert all(preview.allowed == container.can_assign(preview.slot_name, preview.component)[0] for preview in previews)
+
+    swap = container.preview_assignments([("alpha", upgrade)], allow_replace=True)[0]
+    assert swap.allowed
+    assert swap.replaces == (current,)
+    assert swap.remaining == {"power": 0.0}
+    assert container.get_slot("alpha") == [current]
+
+
+def test_loadout_solver_maximizes_aggregate_within_budget() -> None:
+    container = TestContainer(owner=TestHost(label="owner", max_power=2.0))
+    heavy = TestComponent(label="heavy", tags={"alpha"}, power_cost=2.0, defense_bonus=3.0)
+    light = TestComponent(label="light", tags={"alpha"}, power_cost=0.5, defense_bonus=1.0)
+    plate = TestComponent(label="plate", tags={"beta"}, power_cost=1.0, defense_bonus=2.0)
+    mesh = TestComponent(label="mesh", tags={"beta"}, power_cost=0.5, defense_bonus=2.0)
+    lamp = TestComponent(label="lamp", tags={"beta", "lit"}, power_cost=0.5, defense_bonus=1.0)
+    catalog = [heavy, light, plate, mesh, lamp]
+
+    solution = solve_loadout(container, catalog, maximize="defense_bonus")
+
+    assert solution.feasible and solution.optimal
+    assert solution.score == 5.0
+    assert solution.assignments == {"alpha": (light,), "beta": (plate, mesh)}
+    assert container.all_components() == []
+
+    solution.apply(container)
+    assert container.validate() == []
+    assert container.get_aggregate("defense_bonus") == 5.0
+
+    lit = LoadoutSolver(catalog, maximize="defense_bonus", required_tags={"lit"})
+    other = TestContainer(owner=TestHost(label="other", max_power=2.0))
+    tagged = lit.solve(other)
+    assert tagged.score == 4.0
+    assert lamp in tagged.assignments["beta"]
+
+    broke = TestContainer(owner=TestHost(label="broke", max_power=0.25))
+    assert not lit.solve(broke).feasible
+    with pytest.raises(ValueError):
+        lit.solve(broke).apply(broke)
+
+
+def test_loadout_solver_respects_prerequisites_and_existing_assignments() -> None:
+    container = PrerequisiteContainer()
+    frame = TestComponent(label="frame", tags={"chassis"})
+    container.assign("chassis", frame)
+    catalog = [
+        TestComponent(label="turret", tags={"turret"}),
+        TestComponent(label="motor", tags={"powerplant"}),
+        TestComponent(label="spare", tags={"chassis"}),
+    ]
+
+    solution = solve_loadout(container, catalog, required_tags={"turret"})
+
+    assert solution.feasible
+    assert list(solution.assignments) == ["powerplant", "turret"]
+    solution.apply(container)
+    assert container.get_slot("chassis") == [frame]
+    assert container.validate() == []
+
+
 def test_slot_prerequisite_rejects_missing_direct_dependency() -> None:
     container = PrerequisiteContainer()
 
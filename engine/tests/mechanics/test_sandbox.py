@@ -39,14 +39,17 @@ from tangl.mechanics.sandbox import (
     advance_world_turn,
     current_world_time,
     normalize_sandbox_direction,
+    sandbox_presence_timeline,
+    sandbox_projection_state,
 )
+from tangl.mechanics.sandbox import handlers as sandbox_handlers
 from tangl.mechanics.sandbox import incremental as sandbox_incremental
 from tangl.story import Action, Block, StoryGraph
 from tangl.story.concepts import Actor, Role
 from tangl.story.concepts.asset import AssetTransactionManager, AssetType
 from tangl.story.fragments import ChoiceFragment, ContentFragment
 from tangl.story.system_handlers import render_block_choices
-from tangl.vm import Ledger, Requirement
+from tangl.vm import Ledger, Requirement, ResolutionPhase
 from tangl.vm.dispatch import do_provision
 from tangl.vm.runtime.frame import PhaseCtx
 
@@ -236,6 +239,64 @@ def test_schedule_matches_time_location_and_presence() -> None:
     assert [entry.label for entry in matches] == ["traveler"]
 
 
+def test_schedule_index_matches_linear_scan_and_tracks_entry_changes() -> None:
+    entries = [
+        ScheduleEntry(label="dawn_road", location="road", period=1),
+        ScheduleEntry(label="anywhere_monday", day=1),
+        ScheduleEntry(label="road_always", location="road"),
+        ScheduleEntry(label="guarded", location="road", actor="guard", period=1, day=1),
+        ScheduleEntry(label="summer", season=2, period=2),
+    ]
+    schedule = Schedule(entries=entries)
+
+    for turn in range(0, 4 * 7 * 28 * 4, 13):
+        world_time = WorldTime.from_turn(turn)
+        for location in ("road", "building", None):
+            expected = [
+                entry.label
+                for entry in entries
+                if entry.matches(world_time, location=location, actors_present=["guard"])
+            ]
+            actual = schedule.matching(world_time, location=location, actors_present=["guard"])
+            assert [entry.label for entry in actual] == expected
+
+    index = schedule.index
+    assert schedule.index is index
+    schedule.entries.append(ScheduleEntry(label="late", location="road"))
+    assert schedule.index is not index
+    assert "late" in {entry.label for entry in schedule.matching(WorldTime.from_turn(0), location="road")}
+
+    index = schedule.index
+    schedule.entries[0] = ScheduleEntry(label="swapped", location="road")
+    assert schedule.index is index
+    schedule.invalidate()
+    assert schedule.index is not index
+    assert "swapped" in {entry.label for entry in schedule.matching(WorldTime.from_turn(0), location="road")}
+
+
+def test_presence_timeline_reports_who_is_where() -> None:
+    pirate = SandboxMob(
+        label="pirate",
+        name="pirate",
+        location="road",
+        schedule=Schedule(entries=[ScheduleEntry(location="building", period=2)]),
+    )
+    scope = SandboxScope(
+        label="timeline_scope",
+        mobs=[pirate],
+        scheduled_presence=[
+            ScheduledPresence(actor="merchant", location="building", period=1),
+            ScheduledPresence(actor="ghost", period=1),
+        ],
+    )
+
+    timeline = sandbox_presence_timeline(scope, range(3))
+
+    assert timeline[0] == {"building": ["merchant"], "road": ["pirate"]}
+    assert timeline[1] == {"building": ["pirate"]}
+    assert timeline[2] == {"road": ["pirate"]}
+
+
 def test_scheduled_mob_presence_follows_world_time() -> None:
     graph = Graph(label="tiny_cave")
     pirate = SandboxMob(
@@ -1139,6 +1200,71 @@ def test_hidden_mob_does_not_project_scheduled_events() -> None:
     assert _dynamic_sandbox_actions_with_tag(cave, "event") == []
 
 
+def test_projection_state_is_shared_across_handlers_within_a_pass(monkeypatch) -> None:
+    calls = []
+    compute = sandbox_handlers._compute_projection_state
+
+    def counting_compute(location, ctx):
+        calls.append(ctx.current_phase)
+        return compute(location, ctx)
+
+    monkeypatch.setattr(sandbox_handlers, "_compute_projection_state", counting_compute)
+    graph = Graph(label="tiny_cave")
+    scope = SandboxScope(
+        label="tiny_cave_scope",
+        locals={"world_turn": 0},
+        visibility_rules=[SandboxVisibilityRule()],
+    )
+    cave = SandboxLocation(label="dark_cave", location_name="Dark Cave")
+    graph.add(scope)
+    graph.add(cave)
+    scope.add_child(cave)
+    ctx = PhaseCtx(graph=graph, cursor_id=cave.uid, current_phase=ResolutionPhase.PLANNING)
+
+    do_provision(cave, ctx=ctx)
+    assert sandbox_projection_state(cave, ctx).suppress_location_description
+    assert calls == [ResolutionPhase.PLANNING]
+
+    # UPDATE may change what is lit; later phases see a fresh projection
+    cave.light = True
+    ctx.current_phase = ResolutionPhase.JOURNAL
+    assert not sandbox_projection_state(cave, ctx).suppress_location_description
+    assert sandbox_projection_state(cave, ctx) is sandbox_projection_state(cave, ctx)
+    assert calls == [ResolutionPhase.PLANNING, ResolutionPhase.JOURNAL]
+
+
+def test_projection_revision_is_scoped_to_the_mutated_story(monkeypatch) -> None:
+    calls = []
+    compute = sandbox_handlers._compute_projection_state
+
+    def counting_compute(location, ctx):
+        calls.append(location.get_label())
+        return compute(location, ctx)
+
+    monkeypatch.setattr(sandbox_handlers, "_compute_projection_state", counting_compute)
+
+    def tiny_cave(label: str) -> tuple[SandboxLocation, PhaseCtx]:
+        graph = Graph(label=label)
+        scope = SandboxScope(label=f"{label}_scope", locals={"world_turn": 0})
+        cave = SandboxLocation(label=label)
+        graph.add(scope)
+        graph.add(cave)
+        scope.add_child(cave)
+        return cave, PhaseCtx(graph=graph, cursor_id=cave.uid, current_phase=ResolutionPhase.JOURNAL)
+
+    cave, ctx = tiny_cave("cave")
+    other_cave, _ = tiny_cave("other_cave")
+    sandbox_projection_state(cave, ctx)
+
+    sandbox_handlers._bump_projection_revision(other_cave)
+    sandbox_projection_state(cave, ctx)
+    assert calls == ["cave"]
+
+    sandbox_handlers._bump_projection_revision(cave)
+    sandbox_projection_state(cave, ctx)
+    assert calls == ["cave", "cave"]
+
+
 def test_suppressed_carried_asset_affordances_do_not_project_scheduled_events() -> None:
     graph = Graph(label="tiny_cave")
     scope = SandboxScope(
@@ -1987,7 +2113,7 @@ def test_scope_presence_can_gate_scheduled_events() -> None:
     ]
 
     scope.scheduled_presence = []
-    do_provision(road, ctx=ctx)
+    do_provision(road, ctx=PhaseCtx(graph=graph, cursor_id=road.uid))
     assert _dynamic_sandbox_actions_with_tag(road, "event") == []
 
 
@@ -0,0 +1,147 @@
+# tests/persistence/test_file_storage.py
+"""
+Tests specific to FileStorage backend.
+
+The generic storage tests in conftest.py parametrize over all backends,
+these cover the sharded layout, the manifest and atomic writes.
+"""
+import os
+import uuid
+
+import pytest
+
+from tangl.persistence.storage.file_storage import FileStorage
+
+
+class TestFileStorageLayout:
+
+    def test_records_are_sharded(self, tmp_path):
+        storage = FileStorage(base_path=tmp_path, ext="pkl", binary_rw=True)
+        key = uuid.uuid4()
+        storage[key] = b"data"
+
+        fp = storage.get_path(key)
+        assert fp.is_file()
+        assert fp.relative_to(tmp_path).parts[:2] == storage.get_shard(key).relative_to(tmp_path).parts
+        assert len(fp.relative_to(tmp_path).parts) == 3
+
+    def test_flat_layout(self, tmp_path):
+        storage = FileStorage(base_path=tmp_path, shard_depth=0)
+        storage["k"] = "v"
+        assert (tmp_path / "k.txt").is_file()
+        assert list(storage) == ["k"]
+
+    def test_legacy_flat_files_are_adopted(self, tmp_path):
+        key = uuid.uuid4()
+        (tmp_path / f"{key}.json").write_text("{}")
+        (tmp_path / "other.yaml").write_text("x")
+
+        storage = FileStorage(base_path=tmp_path, ext="json")
+        assert storage[key] == "{}"
+        assert not (tmp_path / f"{key}.json").exists()
+        assert (tmp_path / "other.yaml").exists()
+        assert list(storage) == [key]
+
+    def test_write_leaves_no_temp_files(self, tmp_path):
+        storage = FileStorage(base_path=tmp_path)
+        key = uuid.uuid4()
+        storage[key] = "first"
+        storage[key] = "second"
+        leftovers = [p for p in storage.get_shard(key).iterdir() if p.name.startswith(".tmp-")]
+        assert leftovers == []
+        assert storage[key] == "second"
+
+    def test_failed_write_keeps_previous_record(self, tmp_path):
+        storage = FileStorage(base_path=tmp_path, binary_rw=True)
+        key = uuid.uuid4()
+        storage[key] = b"good"
+        with pytest.raises(TypeError):
+            storage[key] = "not bytes"
+        assert storage[key] == b"good"
+
+
+class TestFileStorageManifest:
+
+    def test_iter_yields_uuid_keys(self, tmp_path):
+        storage = FileStorage(base_path=tmp_path)
+        keys = {uuid.uuid4() for _ in range(5)}
+        for key in keys:
+            storage[key] = "x"
+        assert set(storage) == keys
+        assert len(storage) == 5
+
+        del storage[keys.pop()]
+        assert set(storage) == keys
+
+    def test_overwrite_does_not_double_count(self, tmp_path):
+        storage = FileStorage(base_path=tmp_path)
+        key = uuid.uuid4()
+        storage[key] = "a"
+        storage[key] = "b"
+        assert len(storage) == 1
+
+    def test_reopen_and_second_writer(self, tmp_path):
+        first = FileStorage(base_path=tmp_path)
+        key = uuid.uuid4()
+        first[key] = "a"
+
+        second = FileStorage(base_path=tmp_path)
+        assert list(second) == [key]
+        other = uuid.uuid4()
+        second[other] = "b"
+
+        # first instance replays the journal it did not write
+        assert set(first) == {key, other}
+
+    def test_manifest_compaction(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(FileStorage, "manifest_compact_slack", 4)
+        storage = FileStorage(base_path=tmp_path)
+        key = uuid.uuid4()
+        for _ in range(10):
+            storage[key] = "x"
+            del storage[key]
+        storage[key] = "x"
+
+        lines = storage.manifest_path.read_text().splitlines()
+        assert len(lines) <= 2 * len(storage) + 4
+        assert list(FileStorage(base_path=tmp_path)) == [key]
+
+    def test_missing_manifest_is_rebuilt(self, tmp_path):
+        storage = FileStorage(base_path=tmp_path)
+        key = uuid.uuid4()
+        storage[key] = "x"
+        os.unlink(storage.manifest_path)
+        assert len(storage) == 1
+        assert list(storage) == [key]
+
+    def test_manifest_is_not_a_record(self, tmp_path):
+        storage = FileStorage(base_path=tmp_path, ext="pkl", shard_depth=0)
+        key = uuid.uuid4()
+        storage[key] = "café"
+        assert storage.manifest_path.name == ".pkl-manifest.log"
+        assert storage[key] == "café"
+        storage.rebuild_index()
+        assert list(storage) == [key]
+
+    def test_clear(self, tmp_path):
+        storage = FileStorage(base_path=tmp_path)
+        key = uuid.uuid4()
+        storage[key] = "x"
+        storage.clear()
+        assert not storage
+        assert key not in storage
+
+
+def test_mmap_reads(tmp_path):
+    storage = FileStorage(base_path=tmp_path, binary_rw=True, mmap_threshold=16)
+    small, large = uuid.uuid4(), uuid.uuid4()
+    storage[small] = b"tiny"
+    storage[large] = b"\x80" * 1024
+    assert storage[small] == b"tiny"
+
+    view = storage[large]
+    assert isinstance(view, memoryview) and view.readonly
+    storage[large] = b"\x00" * 1024
+    assert view == b"\x80" * 1024
+    view.release()
+    assert storage[large] == b"\x00" * 1024
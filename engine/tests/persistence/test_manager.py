@@ -62,3 +62,8 @@ def test_json_persistence_round_trip_preserves_entity_templ_hash_bytes(tmp_path)
     assert isinstance(loaded, Entity)
     assert loaded.templ_hash == entity.templ_hash
     assert isinstance(loaded.templ_hash, bytes)
+
+def test_get_returns_default_for_missing(manager, test_obj):
+    assert manager.get(test_obj.uid) is None
+    manager.save(test_obj)
+    assert manager.get(test_obj.uid) == test_obj
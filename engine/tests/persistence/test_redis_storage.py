@@ -0,0 +1,130 @@
+# tests/persistence/test_redis_storage.py
+"""
+Tests specific to RedisStorage backend.
+
+These run against fakeredis, an in-process stand-in, so they do not need a
+live server or ``service.apis.redis.enabled``.
+"""
+import asyncio
+import pickle
+import uuid
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from tangl.persistence import PersistenceManager
+from tangl.persistence.serializers import PickleSerializationHandler
+from tangl.persistence.storage.redis_storage import (
+    AsyncRedisStorage,
+    COMPRESSED_MAGIC,
+    RedisStorage,
+)
+
+
+@pytest.fixture
+def storage():
+    return RedisStorage(client=fakeredis.FakeRedis())
+
+
+class TestRedisStorageBasics:
+    """Mapping behavior over an injected client."""
+
+    def test_roundtrip(self, storage):
+        key = uuid.uuid4()
+        storage[key] = b"data"
+        assert key in storage
+        assert storage[key] == b"data"
+        assert len(storage) == 1
+        assert list(storage) == [key.bytes]
+
+        del storage[key]
+        assert key not in storage
+        assert not storage
+
+    def test_missing_key(self, storage):
+        key = uuid.uuid4()
+        assert storage.get(key) is None
+        assert storage.get(key, b"default") == b"default"
+        with pytest.raises(KeyError):
+            _ = storage[key]
+        with pytest.raises(KeyError):
+            del storage[key]
+
+    def test_ping_on_request(self):
+        assert RedisStorage(client=fakeredis.FakeRedis(), ping=True).ping()
+
+
+class TestRedisStorageBatched:
+
+    def test_get_many_preserves_order_and_misses(self, storage):
+        keys = [uuid.uuid4() for _ in range(3)]
+        storage.set_many({keys[0]: b"a", keys[2]: b"c"})
+        assert storage.get_many(keys) == [b"a", None, b"c"]
+        assert storage.get_many([]) == []
+
+    def test_delete_many(self, storage):
+        keys = [uuid.uuid4() for _ in range(3)]
+        storage.set_many({k: b"x" for k in keys})
+        assert storage.delete_many(keys[:2] + [uuid.uuid4()]) == 2
+        assert len(storage) == 1
+
+
+class TestRedisStorageCompression:
+
+    def test_large_values_are_compressed(self):
+        client = fakeredis.FakeRedis()
+        storage = RedisStorage(client=client, compress_threshold=64)
+        small, large = uuid.uuid4(), uuid.uuid4()
+        payload = b"ledger " * 100
+
+        storage[small] = b"tiny"
+        storage[large] = payload
+
+        assert client.get(small.bytes) == b"tiny"
+        raw = client.get(large.bytes)
+        assert raw.startswith(COMPRESSED_MAGIC)
+        assert len(raw) < len(payload)
+        assert storage[large] == payload
+        assert storage.get_many([small, large]) == [b"tiny", payload]
+
+    def test_compressed_values_readable_without_threshold(self):
+        client = fakeredis.FakeRedis()
+        RedisStorage(client=client, compress_threshold=1)[uuid.UUID(int=1)] = "text"
+        assert RedisStorage(client=client).get(uuid.UUID(int=1)) == b"text"
+
+
+def test_manager_batched_load_and_save(storage):
+    manager = PersistenceManager(serializer=PickleSerializationHandler, storage=storage)
+    records = [{"uid": uuid.uuid4(), "n": i} for i in range(3)]
+    manager.save_many(records)
+
+    missing = uuid.uuid4()
+    loaded = manager.load_many([records[1]["uid"], missing, records[0]["uid"]])
+    assert loaded == [records[1], None, records[0]]
+    assert manager.get(records[2]["uid"]) == records[2]
+    assert manager.get(missing) is None
+
+
+def test_async_storage_shares_layout():
+    server = fakeredis.FakeServer()
+    sync_storage = RedisStorage(client=fakeredis.FakeRedis(server=server),
+                                compress_threshold=16)
+    key, other = uuid.uuid4(), uuid.uuid4()
+    sync_storage[key] = pickle.dumps({"value": "x" * 64})
+
+    async def exercise():
+        storage = AsyncRedisStorage(client=fakeredis.FakeAsyncRedis(server=server),
+                                    compress_threshold=16)
+        assert await storage.contains(key)
+        assert pickle.loads(await storage.get(key)) == {"value": "x" * 64}
+        await storage.set_many({other: b"y" * 32})
+        assert await storage.get_many([other, uuid.uuid4()]) == [b"y" * 32, None]
+        assert await storage.length() == 2
+        await storage.delete(other)
+        with pytest.raises(KeyError):
+            await storage.delete(other)
+        await storage.aclose()
+
+    asyncio.run(exercise())
+    assert other not in sync_storage
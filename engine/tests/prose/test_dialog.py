@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from tangl.prose import DialogHandler
+from tangl.prose import dialog
+from tangl.prose.dialog import DialogLine, compile_dialog
+
+_CONVERSATION = (
+    "> [!spoken] Guide\n> Welcome.\n\n"
+    "The door creaks.\n\n"
+    "> [!NPC.annoyed] guide\n> You are late.\n> Again.\n\n"
+    "> [!spoken] Guide\n> Sit down."
+)
+
+
+@dataclass
+class _Speaker:
+    name: str
+    uid: str = "guide-uid"
+
+    def get_label(self) -> str:
+        return "guide_actor"
+
+
+def test_compile_dialog_caches_immutable_lines_by_content() -> None:
+    script = compile_dialog(_CONVERSATION)
+
+    assert compile_dialog(_CONVERSATION) is script
+    assert script == (
+        DialogLine(text="Welcome.", label="Guide", dialog_class="spoken"),
+        DialogLine(text="The door creaks."),
+        DialogLine(text="You are late. Again.", label="guide", dialog_class="NPC.annoyed"),
+        DialogLine(text="Sit down.", label="Guide", dialog_class="spoken"),
+    )
+    with pytest.raises(ValueError, match="Invalid dialog syntax"):
+        compile_dialog("> no header here")
+
+
+def test_parse_resolves_each_speaker_voice_once(monkeypatch) -> None:
+    calls = []
+    resolve = dialog.resolve_dialog_speaker
+
+    def counting_resolve(label, dialog_class, **kwargs):
+        calls.append((label, dialog_class))
+        return resolve(label, dialog_class, **kwargs)
+
+    monkeypatch.setattr(dialog, "resolve_dialog_speaker", counting_resolve)
+    speakers: dict = {}
+    ns = {"guide": _Speaker(name="Guide")}
+
+    mu_blocks = DialogHandler.parse(_CONVERSATION, ns=ns, speakers=speakers)
+    DialogHandler.parse(_CONVERSATION, ns=ns, speakers=speakers)
+
+    assert calls == [("Guide", "spoken"), (None, "narration"), ("guide", "NPC.annoyed")]
+    assert [mu_block.speaker_key for mu_block in mu_blocks] == ["guide", None, "guide", "guide"]
+    assert mu_blocks[0].presentation_hints is mu_blocks[3].presentation_hints
+
+    fragments = DialogHandler.render(mu_blocks)
+    assert [fragment.who for fragment in fragments] == ["Guide", "narrator", "Guide", "Guide"]
+    assert fragments[2].tags == {
+        "dialog_class:npc_annoyed",
+        "dialog_mode:npc",
+        "speaker:guide_actor",
+        "speaker_key:guide",
+        "attitude:annoyed",
+    }
+
+
+@pytest.mark.skip(reason="only for benchmarking")
+def test_dialog_parse_performance() -> None:
+    text = "\n\n".join([_CONVERSATION] * 20)
+    ns = {f"extra_{index}": _Speaker(name=f"Extra {index}") for index in range(50)}
+    ns["guide"] = _Speaker(name="Guide")
+
+    start_time = time.perf_counter()
+    for _ in range(500):
+        DialogHandler.render(
+            [
+                dialog.DialogMuBlock(text=line.text, label=line.label, dialog_class=line.dialog_class).bind(ns=ns)
+                for line in compile_dialog.__wrapped__(text)
+            ]
+        )
+    per_line_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for _ in range(500):
+        DialogHandler.render(DialogHandler.parse(text, ns=ns))
+    batched_time = time.perf_counter() - start_time
+
+    print(f"{len(compile_dialog(text))} lines x500: per-line {per_line_time:.3f}s, cached {batched_time:.3f}s")
@@ -7,6 +7,7 @@ import jinja2
 import pytest
 
 from tangl.prose import RecursiveRenderError, TextRenderSession, render_text
+from tangl.utils.rejinja import template_cache
 
 
 class _Ctx:
@@ -150,3 +151,14 @@ def test_render_text_accepts_an_explicit_permissive_environment() -> None:
     session = TextRenderSession(ctx=_Ctx({}), environment=jinja2.Environment())
 
     assert session.render("A {{ missing }} arrives.") == "A  arrives."
+
+
+def test_default_sessions_share_compiled_templates() -> None:
+    content = "Cached {{ name }} {{ discourse | length }}"
+    render_text(content, ctx=_Ctx({"name": "once"}))
+    before = template_cache.cache_info()
+
+    assert render_text(content, ctx=_Ctx({"name": "twice"})) == "Cached twice 0"
+    after = template_cache.cache_info()
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
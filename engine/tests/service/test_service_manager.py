@@ -195,6 +195,34 @@ def test_story_methods_return_typed_runtime_payloads(
     assert isinstance(projected, ProjectedState)
 
 
+def test_resolve_choice_relays_fragments_as_they_are_emitted(
+    manager: ServiceManager,
+    persistence,
+    user: User,
+) -> None:
+    world = World.from_script_data(script_data=_story_script())
+    manager.create_story(
+        user_id=user.uid,
+        world_id=world.label,
+        world=world,
+        init_mode=InitMode.EAGER.value,
+        story_label="svc_manager_stream",
+    )
+    ledger = persistence[user.current_ledger_id]
+    choice = _first_choice_edge(ledger)
+
+    seen: list[tuple[BaseFragment, dict]] = []
+    updated = manager.resolve_choice(
+        user_id=user.uid,
+        request=DirectEdgeRequest(edge_id=choice.uid),
+        fragment_observer=lambda fragment, metadata: seen.append((fragment, metadata)),
+    )
+
+    assert [fragment.uid for fragment, _ in seen] == [fragment.uid for fragment in updated.fragments]
+    assert seen[0][1] == {"ledger_id": updated.metadata["ledger_id"], "world_id": world.label}
+    assert persistence[user.current_ledger_id].record_observer is None
+
+
 def test_find_edge_request_resolves_command_or_returns_transient_guidance(
     manager: ServiceManager,
     user: User,
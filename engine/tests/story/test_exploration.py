@@ -0,0 +1,146 @@
+"""Tests for headless world exploration.
+
+Covers the random-walk and exhaustive drivers in
+``tangl.story.exploration``: block coverage, ending vs dead-end
+classification, unreachable templates, seeded reproducibility, state dedup
+and the process-pool path.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+
+import pytest
+
+from tangl.story import World
+from tangl.story.exploration import ExplorationReport, exhaustive_walk, random_walks
+
+import tangl.story  # noqa: F401 – ensure story journal/phase handlers are registered
+
+
+def _script(label: str) -> dict:
+    return {
+        "label": label,
+        "metadata": {"title": "Explore", "author": "Tests", "start_at": "s.start"},
+        "scenes": {
+            "s": {
+                "blocks": {
+                    "start": {
+                        "content": "Choose.",
+                        "actions": [
+                            {"text": "Left", "successor": "left"},
+                            {"text": "Right", "successor": "right"},
+                        ],
+                    },
+                    "left": {
+                        "content": "A locked door.",
+                        "actions": [
+                            {"text": "Open", "successor": "start", "conditions": ["False"]},
+                        ],
+                    },
+                    "right": {
+                        "content": "A loop.",
+                        "actions": [
+                            {"text": "Back", "successor": "start"},
+                            {"text": "Finish", "successor": "end"},
+                        ],
+                    },
+                    "end": {"content": "Done."},
+                    "orphan": {"content": "Nobody links here."},
+                }
+            }
+        },
+    }
+
+
+def _factory(label: str):
+    return partial(World.from_script_data, script_data=_script(label))
+
+
+def _world(label: str) -> World:
+    return World.from_script_data(script_data=_script(label))
+
+
+class TestRandomWalks:
+    def test_reports_coverage_and_outcomes(self) -> None:
+        report = random_walks(_factory("explore_random"), runs=30, seed=1, max_steps=20)
+
+        assert report.runs == 30
+        assert set(report.block_visits) >= {"s.start", "s.left", "s.right", "s.end"}
+        assert "s.orphan" not in report.block_visits
+        assert set(report.endings) == {"s.end"}
+        assert set(report.dead_ends) == {"s.left"}
+        assert sum(report.endings.values()) + sum(report.dead_ends.values()) + report.truncated == 30
+        assert [path for path in report.unreachable_templates if path.endswith("orphan")]
+        assert not [path for path in report.unreachable_templates if path.endswith(".end")]
+        assert report.choice_counts["s.start: Left"] + report.choice_counts["s.start: Right"] >= 30
+        assert len(report.step_latencies) == report.steps
+        assert report.latency_summary()["max_ms"] >= report.latency_summary()["p50_ms"]
+        assert not report.errors
+
+    def test_seeded_walks_are_reproducible(self) -> None:
+        first = random_walks(_world("explore_seed_a"), runs=10, seed=7)
+        second = random_walks(_world("explore_seed_b"), runs=10, seed=7)
+        assert first.choice_counts == second.choice_counts
+        assert first.endings == second.endings
+
+    def test_walks_are_truncated_at_max_steps(self) -> None:
+        report = random_walks(_factory("explore_trunc"), runs=5, max_steps=0)
+        assert report.truncated == 5
+        assert report.steps == 0
+
+    def test_process_pool_matches_in_process(self) -> None:
+        world = _world("explore_pool")
+        pooled = random_walks(world, runs=8, seed=3, workers=2)
+        local = random_walks(world, runs=8, seed=3)
+        assert pooled.runs == 8
+        assert pooled.choice_counts == local.choice_counts
+
+
+class TestExhaustiveWalk:
+    @pytest.mark.parametrize("strategy", ["bfs", "dfs"])
+    def test_search_reaches_every_linked_block(self, strategy: str) -> None:
+        report = exhaustive_walk(_factory(f"explore_{strategy}"), strategy=strategy, max_depth=10)
+
+        assert set(report.block_visits) == {"s.start", "s.left", "s.right", "s.end"}
+        assert set(report.endings) == {"s.end"}
+        assert set(report.dead_ends) == {"s.left"}
+        assert [path for path in report.unreachable_templates if path.endswith("orphan")]
+
+    def test_process_pool_splits_opening_choices(self) -> None:
+        report = exhaustive_walk(_factory("explore_pool_bfs"), max_depth=10, workers=2)
+        assert report.runs == 2
+        assert set(report.block_visits) == {"s.start", "s.left", "s.right", "s.end"}
+
+    def test_revisited_states_are_deduplicated(self) -> None:
+        report = exhaustive_walk(_factory("explore_dedup"), max_depth=25)
+        # start -> right -> start loops forever without dedup, bounded by
+        # depth it would still take thousands of states
+        assert report.states < 50
+        assert report.truncated == 0
+
+    def test_state_budget(self) -> None:
+        report = exhaustive_walk(_factory("explore_budget"), max_states=1)
+        assert report.states <= 2
+        assert report.truncated >= 1
+
+    def test_unknown_strategy(self) -> None:
+        with pytest.raises(ValueError):
+            exhaustive_walk(_factory("explore_bad"), strategy="astar")
+
+
+def test_report_merge_and_dict() -> None:
+    a = ExplorationReport(world_label="w", mode="random", runs=1, steps=2, step_latencies=[0.001, 0.002])
+    a.block_visits["x"] += 1
+    b = ExplorationReport(world_label="w", mode="random", runs=2, steps=1, step_latencies=[0.003])
+    b.block_visits["x"] += 2
+    b.block_templates = {"w.x", "w.y"}
+    b.visited_templates = {"w.x"}
+
+    merged = a.merge(b)
+    assert merged.runs == 3
+    assert merged.block_visits["x"] == 3
+    assert merged.unreachable_templates == ["w.y"]
+    payload = merged.to_dict()
+    assert payload["reachable_blocks"] == {"x": 3}
+    assert payload["latency"]["max_ms"] == pytest.approx(3.0)
@@ -22,6 +22,7 @@ from tangl.story import (
     project_story_graph,
     project_world_graph,
     projected_graph_to_dict,
+    refresh_runtime,
 )
 from tangl.vm import Ledger
 
@@ -233,3 +234,61 @@ def test_full_adder_projection_is_invariant_after_runtime_execution() -> None:
     after = projected_graph_to_dict(project_story_graph(graph, selector=episode_only_selector()))
 
     assert before == after
+
+
+def test_refresh_runtime_incremental_matches_full_annotation() -> None:
+    world = _compile_logic_world()
+    ledger = _make_ledger(world, story_label="phase3_runtime_refresh")
+    base = project_story_graph(ledger.graph, selector=episode_only_selector())
+
+    refresh_runtime(base, ledger, restyle=True)
+    for text in ("Inspect the full adder", "A = 1", "B = 1"):
+        ledger.resolve_choice(_choice_by_text(ledger, text).uid)
+        assert refresh_runtime(base, ledger, restyle=True) is base
+
+    expected = project_story_graph(
+        ledger.graph,
+        selector=episode_only_selector(),
+        processors=(annotate_runtime(ledger), mark_runtime_styles()),
+    )
+    assert projected_graph_to_dict(base) == projected_graph_to_dict(expected)
+
+
+def test_processors_leave_returned_projections_untouched() -> None:
+    world = _compile_logic_world()
+    ledger = _make_ledger(world, story_label="phase3_runtime_copy")
+    ledger.resolve_choice(_choice_by_text(ledger, "Inspect the full adder").uid)
+
+    base = project_story_graph(ledger.graph, selector=episode_only_selector())
+    before = projected_graph_to_dict(base)
+
+    annotated = annotate_runtime(ledger)(base)
+    collapsed = collapse_linear_chains()(annotated)
+
+    assert annotated is not base
+    assert collapsed is not annotated
+    assert projected_graph_to_dict(base) == before
+    assert all("runtime.current" in node.attrs for node in annotated.nodes)
+
+
+def test_project_world_graph_reuses_inspection_story() -> None:
+    world = _compile_logic_world()
+
+    first = project_world_graph(world, selector=episode_only_selector())
+    second = project_world_graph(world, selector=episode_only_selector())
+
+    assert projected_graph_to_dict(first) == projected_graph_to_dict(second)
+    assert all(
+        first._source_nodes_by_id[node_id] is second._source_nodes_by_id[node_id]
+        for node_id in first._source_nodes_by_id
+    )
+
+    # a revision bump (as apply_bundle does) gets a fresh story
+    world.force_set("revision", world.revision + 1)
+    third = project_world_graph(world, selector=episode_only_selector())
+
+    assert {node.id for node in third.nodes} == {node.id for node in first.nodes}
+    assert not any(
+        first._source_nodes_by_id[node_id] is third._source_nodes_by_id[node_id]
+        for node_id in first._source_nodes_by_id
+    )
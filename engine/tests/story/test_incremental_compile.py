@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import copy
+
+from tangl.story.fabula import IncrementalStoryCompiler, StoryCompiler
+
+
+def _script() -> dict:
+    return {
+        "label": "incremental_demo",
+        "metadata": {"title": "Incremental Demo", "author": "Tests"},
+        "actors": {"guide": {"name": "Guide"}},
+        "scenes": {
+            "intro": {
+                "blocks": {
+                    "start": {
+                        "content": "Hello.",
+                        "actions": [{"text": "Go on", "successor": "middle.hall"}],
+                    },
+                },
+            },
+            "middle": {
+                "blocks": {
+                    "hall": {
+                        "content": "A hall.",
+                        "actions": [{"text": "Leave", "successor": "outro.end"}],
+                    },
+                },
+            },
+            "outro": {"blocks": {"end": {"content": "Bye."}}},
+        },
+    }
+
+
+def _same_as_full(incremental: IncrementalStoryCompiler, script: dict) -> None:
+    full = StoryCompiler()
+    expected_bundle = full.compile(copy.deepcopy(script))
+    bundle = incremental.bundle
+
+    assert full.decompile(bundle) == full.decompile(expected_bundle)
+    assert [issue.code for issue in bundle.issues] == [issue.code for issue in expected_bundle.issues]
+    assert bundle.entry_template_ids == expected_bundle.entry_template_ids
+
+
+def test_incremental_compile_patches_registry_in_place() -> None:
+    script = _script()
+    compiler = IncrementalStoryCompiler()
+    bundle = compiler.compile(copy.deepcopy(script))
+    registry = bundle.template_registry
+    intro_ids = {t.uid for t in registry.values() if t.get_label().startswith("intro")}
+
+    script["scenes"]["middle"]["blocks"]["hall"]["content"] = "A long hall."
+    assert compiler.compile(copy.deepcopy(script)) is bundle
+    assert bundle.template_registry is registry
+    assert compiler.last_patch.changed == ["scenes.middle"]
+    assert intro_ids <= {t.uid for t in registry.values()}
+    _same_as_full(compiler, script)
+
+    # Unchanged input is a no-op patch
+    compiler.compile(copy.deepcopy(script))
+    assert compiler.last_patch.is_empty
+
+
+def test_incremental_compile_tracks_added_and_removed_scenes() -> None:
+    script = _script()
+    compiler = IncrementalStoryCompiler()
+    compiler.compile(copy.deepcopy(script))
+
+    script["scenes"]["epilogue"] = {"blocks": {"coda": {"content": "Later."}}}
+    compiler.compile(copy.deepcopy(script))
+    assert compiler.last_patch.added == ["scenes.epilogue"]
+    _same_as_full(compiler, script)
+
+    del script["scenes"]["outro"]
+    compiler.compile(copy.deepcopy(script))
+    assert compiler.last_patch.removed == ["scenes.outro"]
+    # epilogue moved up a slot and was recompiled; intro references nothing
+    # that changed, so its diagnostics are reused
+    assert compiler.last_patch.rechecked == ["scenes.middle", "scenes.epilogue"]
+    assert any("outro" in issue.message for issue in compiler.bundle.issues)
+    _same_as_full(compiler, script)
+
+
+def test_incremental_compile_keeps_authored_order_for_entry_fallback() -> None:
+    script = _script()
+    compiler = IncrementalStoryCompiler()
+    compiler.compile(copy.deepcopy(script))
+
+    script["scenes"]["intro"]["blocks"]["start"]["content"] = "Hello again."
+    bundle = compiler.compile(copy.deepcopy(script))
+    assert bundle.entry_template_ids == ["intro.start"]
+    _same_as_full(compiler, script)
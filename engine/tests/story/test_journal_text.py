@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import time
+from collections import ChainMap
+from collections.abc import Mapping
+
+import pytest
+
+from tangl.core import Graph
+from tangl.story.episode import Block
+from tangl.story.journal_text import JournalTextKind, compile_journal_text, render_journal_text
+from tangl.story.system_handlers import render_block_content
+from tangl.vm.runtime.frame import PhaseCtx
+
+
+class _LookupOnlyNamespace(Mapping):
+    """Namespace that fails if anything tries to copy it."""
+
+    def __init__(self, values: dict[str, object]) -> None:
+        self.values = values
+
+    def __getitem__(self, key: str) -> object:
+        return self.values[key]
+
+    def __iter__(self):
+        raise AssertionError("namespace was copied")
+
+    def __len__(self) -> int:
+        raise AssertionError("namespace was copied")
+
+
+class _Guide:
+    name = "Ada"
+
+
+_EQUIVALENCE_NS = ChainMap({"name": "Joe", "gold": 3.5, "items": [1, 2], "guide": _Guide()}, {"name": "Shadow"})
+
+
+class _LegacySafeFormatDict(dict):
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def _legacy_render(content: str, ns: Mapping[str, object]) -> str:
+    """The copy-then-``format_map`` renderer journal text used before compilation."""
+    try:
+        return content.format_map(_LegacySafeFormatDict(dict(ns)))
+    except Exception:
+        return content
+
+
+def _unexpected_ns():
+    raise AssertionError("static text gathered a namespace")
+
+
+@pytest.mark.parametrize(
+    ("content", "kind"),
+    [
+        ("The lamp gutters.", JournalTextKind.STATIC),
+        ("Unbalanced } brace", JournalTextKind.STATIC),
+        ("Hello {name}!", JournalTextKind.FORMAT),
+        ("{guide.name} waves", JournalTextKind.FORMAT),
+        ("{{ guide|she }} waves", JournalTextKind.JINJA),
+    ],
+)
+def test_compile_journal_text_classifies_content(content: str, kind: JournalTextKind) -> None:
+    compiled = compile_journal_text(content)
+
+    assert compiled.kind is kind
+    assert compile_journal_text(content) is compiled
+
+
+def test_static_text_skips_namespace_gathering() -> None:
+    assert render_journal_text("The lamp gutters.", _unexpected_ns) == "The lamp gutters."
+    assert render_journal_text("Unbalanced } brace", _unexpected_ns) == "Unbalanced } brace"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "plain text",
+        "{name}",
+        "{name}{gold}{missing}",
+        "{gold:.2f} and {gold:>8}",
+        "{name!r} {name!s} {name!a} {name!x}",
+        "{guide.name} {items[0]} {guide.missing}",
+        "{gold:{name}}",
+        "{{escaped}} {name}",
+        "{{ jinja|filter }}",
+        "{% if x %}{name}{% endif %}",
+        "{0} {} positional",
+        "{name",
+        "name}",
+        "}{",
+        "{gold:d}",
+        "{é} {name:%}",
+    ],
+)
+def test_render_matches_legacy_copying_renderer(content: str) -> None:
+    assert render_journal_text(content, lambda: _EQUIVALENCE_NS) == _legacy_render(content, _EQUIVALENCE_NS)
+
+
+def test_format_fields_read_through_namespace_without_copying() -> None:
+    ns = _LookupOnlyNamespace({"name": "Joe", "gold": 3.5, "guide": type("Guide", (), {"name": "Ada"})()})
+
+    assert render_journal_text("Hi {name}, {gold:.2f} gold; {missing}!", lambda: ns) == "Hi Joe, 3.50 gold; {missing}!"
+    assert render_journal_text("{guide.name} and {name!r}", lambda: ns) == "Ada and 'Joe'"
+    assert render_journal_text("{{ literal }} {name}", lambda: ns) == "{ literal } Joe"
+    assert render_journal_text("{0} positional", lambda: ns) == "{0} positional"
+
+
+@pytest.mark.skip(reason="only for benchmarking")
+def test_render_block_content_performance() -> None:
+    graph = Graph()
+    static_block = Block(label="static", content="The corridor stretches on into the dark. " * 5)
+    format_block = Block(label="format", content="Hello {name}, you carry {gold} gold.")
+    graph.add(static_block)
+    graph.add(format_block)
+
+    for size in (10, 1_000, 10_000):
+        ns = {f"symbol_{index}": index for index in range(size)} | {"name": "Joe", "gold": 3}
+        ctx = PhaseCtx(graph=graph, cursor_id=static_block.uid)
+        ctx._ns_cache[static_block.uid] = ns
+        ctx._ns_cache[format_block.uid] = ns
+
+        start_time = time.perf_counter()
+        for _ in range(2_000):
+            render_block_content(caller=static_block, ctx=ctx)
+            render_block_content(caller=format_block, ctx=ctx)
+        print(f"namespace {size}: 2000 static + format blocks in {time.perf_counter() - start_time:.3f}s")
@@ -1,7 +1,7 @@
 import pytest
 import jinja2
 
-from tangl.utils.rejinja import RecursiveTemplate
+from tangl.utils.rejinja import RecursiveTemplate, TemplateCache
 
 def test_recursive_template():
     # Create a Jinja2 environment
@@ -24,3 +24,26 @@ def test_recursive_template():
     template.globals['bar'] = '{{ baz }}'
     template.globals['baz'] = 'Deep recursion!'
     assert template.render() == 'Deep recursion!'
+
+
+def test_template_cache_reuses_compiled_templates():
+    env = jinja2.Environment()
+    other_env = jinja2.Environment()
+    cache = TemplateCache(maxsize=2)
+
+    first = cache.get_template(env, 'Hi {{ name }}', template_class=RecursiveTemplate)
+    assert cache.get_template(env, 'Hi {{ name }}', template_class=RecursiveTemplate) is first
+    assert first.render(name='Ada') == 'Hi Ada'
+    assert cache.get_template(other_env, 'Hi {{ name }}') is not first
+
+    private = cache.get_template(env, 'Hi {{ name }}', template_class=RecursiveTemplate,
+                                 globals={'name': 'Bea'})
+    assert private is not first
+    assert private.render() == 'Hi Bea'
+
+    cache.get_template(env, 'Bye')
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (2, 3, 1, 2)
+
+    cache.clear()
+    assert cache.cache_info().currsize == 0
@@ -79,3 +79,22 @@ def test_phase_ctx_derive_shares_injected_journal_fragments() -> None:
     derived.injected_journal_fragments.append(fragment)
 
     assert ctx.injected_journal_fragments == [fragment]
+
+
+def test_phase_ctx_memo_is_cleared_with_namespaces() -> None:
+    graph = Graph()
+    node = TraversableNode(label="n")
+    graph.add(node)
+    ctx = PhaseCtx(graph=graph, cursor_id=node.uid)
+    calls = []
+
+    def compute() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert ctx.memo("k", compute) == 1
+    assert ctx.memo("k", compute) == 1
+    assert ctx.derive().memo("k", compute) == 2
+
+    ctx.invalidate_namespaces()
+    assert ctx.memo("k", compute) == 3
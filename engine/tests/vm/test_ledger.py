@@ -678,6 +678,29 @@ class TestLedgerReplayRollback:
         assert step_records
         assert all(record.step <= 1 for record in step_records)
 
+    def test_history_index_tracks_steps_rollback_and_reload(self) -> None:
+        g = Graph()
+        a = _node(g, label="a")
+        b = _node(g, label="b")
+        c = _node(g, label="c")
+        _edge(g, predecessor_id=a.uid, successor_id=b.uid)
+        _edge(g, predecessor_id=b.uid, successor_id=c.uid)
+
+        ledger = Ledger.from_graph(graph=g, entry_id=a.uid)
+        index = ledger.history_index
+        ledger.resolve_choice(next(a.edges_out()).uid)
+        ledger.resolve_choice(next(b.edges_out()).uid)
+
+        assert ledger.history_index is index
+        assert index.length == len(ledger.cursor_history)
+        assert index.steps_since_last_visit(a.uid) == len(ledger.cursor_history) - 1
+
+        ledger.rollback_to_step(1)
+        assert ledger.history_index.get_visit_count(c.uid) == get_visit_count(c.uid, ledger.cursor_history)
+
+        restored = Ledger.structure(ledger.unstructure())
+        assert restored.history_index.count_turns() == ledger.turn
+
     def test_rollback_allows_rebranch_after_truncation(self) -> None:
         g = Graph()
         a = _node(g, label="a")
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import random
 from uuid import uuid4
 
 from tangl.vm.traversal import (
+    HistoryIndex,
     count_turns,
     get_call_depth,
     get_round,
@@ -158,3 +160,34 @@ class TestGetCallDepth:
 
     def test_nested(self) -> None:
         assert get_call_depth([uuid4(), uuid4(), uuid4()]) == 3
+
+
+class TestHistoryIndex:
+    def test_matches_pure_queries_at_every_prefix(self) -> None:
+        nodes = [uuid4() for _ in range(4)]
+        rng = random.Random(7)
+        history = [rng.choice(nodes) for _ in range(60)]
+        index = HistoryIndex()
+
+        for length in range(len(history) + 1):
+            prefix = history[:length]
+            for node in [*nodes, uuid4()]:
+                assert index.get_visit_count(node) == get_visit_count(node, prefix)
+                assert index.is_first_visit(node) == is_first_visit(node, prefix)
+                assert index.steps_since_last_visit(node) == steps_since_last_visit(node, prefix)
+                assert index.get_round(node) == get_round(node, prefix)
+            assert index.is_self_loop() == is_self_loop(prefix)
+            assert index.count_turns() == count_turns(prefix)
+            if length < len(history):
+                index.append(history[length])
+
+    def test_overlay_reads_through_without_mutating_base(self) -> None:
+        a, b = uuid4(), uuid4()
+        base = HistoryIndex([a, b])
+        overlay = base.extended([b, a])
+
+        assert overlay.get_visit_count(a) == 2
+        assert overlay.steps_since_last_visit(b) == 1
+        assert overlay.count_turns() == count_turns([a, b, b, a])
+        assert base.get_visit_count(a) == 1
+        assert base.length == 2